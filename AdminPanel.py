@@ -8,7 +8,7 @@ import sys
 import os
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QTabWidget, QLabel, QPushButton, 
-                             QMessageBox, QSystemTrayIcon, QMenu, QAction)
+                             QMessageBox, QSystemTrayIcon, QMenu, QAction, QComboBox)
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QThread
 from PyQt5.QtGui import QFont, QIcon
 
@@ -22,9 +22,12 @@ from modules.ui.styles import *
 
 # 유틸리티 임포트
 from modules.utils.utils import SettingsManager, MasterDataManager, SerialConnectionThread, BackupManager
+from modules.utils.log_manager import LOG_LEVELS, get_log_level, set_log_level
+from modules.utils.modules.port_inventory import PortInventoryService
 
 # 탭 클래스들 임포트
-from modules.ui.tabs import PLCCommunicationTab, BarcodeScannerTab, NutRunnerTab, BarcodePrinterTab, MasterDataTab
+from modules.ui.tabs import (PLCCommunicationTab, BarcodeScannerTab, NutRunnerTab, BarcodePrinterTab, MasterDataTab,
+                            ProductionReportTab)
 
 # 다이얼로그 임포트
 from modules.ui.dialogs import BarcodeAnalysisDialog, ScanHistoryDialog
@@ -66,6 +69,10 @@ class AdminPanel(QMainWindow):
         # 포트 사용 추적 (포트명 -> 탭명 매핑)
         self.port_usage = {}  # 예: {"COM3": "PLC 통신", "COM4": "바코드 스캐너"}
         
+        # 공용 포트 목록 서비스 - 탭에서 연결한 포트는 열기 테스트 대상에서 제외
+        self.port_inventory = PortInventoryService.shared()
+        self.port_inventory.add_owner_source(self.owned_ports)
+        
         self.init_ui()
         self.setup_tray_icon()
         self.load_settings()
@@ -107,6 +114,17 @@ class AdminPanel(QMainWindow):
         # 하단 버튼
         button_layout = QHBoxLayout()
         
+        # 로그 레벨 (현장 점검 시 DEBUG로 전환, 설정 파일에 저장됨)
+        button_layout.addWidget(QLabel("로그 레벨:"))
+        self.log_level_combo = QComboBox()
+        self.log_level_combo.addItems(LOG_LEVELS)
+        current_level = get_log_level()
+        if current_level in LOG_LEVELS:
+            self.log_level_combo.setCurrentText(current_level)
+        self.log_level_combo.currentTextChanged.connect(self.on_log_level_changed)
+        button_layout.addWidget(self.log_level_combo)
+        button_layout.addStretch()
+        
         # 최소화 버튼
         minimize_btn = QPushButton("최소화")
         minimize_btn.clicked.connect(self.showMinimized)
@@ -143,6 +161,10 @@ class AdminPanel(QMainWindow):
         self.master_data_tab = MasterDataTab(self.settings_manager)
         self.tab_widget.addTab(self.master_data_tab, "기준정보")
         
+        # 생산 실적 탭 (근무조/시간대별 OK·NG)
+        self.production_report_tab = ProductionReportTab(self.settings_manager)
+        self.tab_widget.addTab(self.production_report_tab, "생산 실적")
+        
         # 각 탭에 admin_panel 참조 설정
         self.plc_tab.admin_panel = self
         self.plc_tab.tab_name = "PLC 통신"
@@ -154,6 +176,8 @@ class AdminPanel(QMainWindow):
         self.nutrunner_tab.tab_name = "너트 런너"
         self.master_data_tab.admin_panel = self
         self.master_data_tab.tab_name = "기준정보"
+        self.production_report_tab.admin_panel = self
+        self.production_report_tab.tab_name = "생산 실적"
         
         # 바코드 스캐너 탭에 메인 화면 참조 설정
         if hasattr(self.scanner_tab, 'set_main_screen_reference'):
@@ -219,10 +243,18 @@ class AdminPanel(QMainWindow):
         except Exception as e:
             print(f"⚠️ 설정 저장 실패: {e}")
     
+    def on_log_level_changed(self, level):
+        """로그 레벨 변경 - 실행 중인 모든 모듈에 즉시 적용"""
+        try:
+            set_log_level(level, self.settings_manager)
+        except Exception as e:
+            print(f"⚠️ 로그 레벨 변경 실패: {e}")
+    
     def closeEvent(self, event):
         """창 닫기 이벤트"""
         try:
             self.save_settings()
+            self.port_inventory.remove_owner_source(self.owned_ports)
             # 인스턴스 참조 제거 (다시 실행 가능하도록)
             AdminPanel._instance = None
             event.accept()
@@ -278,6 +310,10 @@ class AdminPanel(QMainWindow):
             return True, using_tab
         return False, None
     
+    def owned_ports(self):
+        """탭에서 연결 중인 포트 {포트명: 탭명} - 포트 목록 서비스용"""
+        return dict(self.port_usage)
+    
     def register_port(self, port_name, tab_name):
         """포트 등록 및 모든 탭의 포트 목록 새로고침"""
         self.port_usage[port_name] = tab_name
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 가짜 장비 (스캐너 / PLC / 프린터)
+실제 시리얼 포트 없이 메모리에서 생산 라인 트래픽을 만든다.
+- FakeScanner: HKMC 형식 하위부품 바코드 (부품별 일련번호 증가)
+- FakePLC: 완료신호 + FRONT/LH, REAR/RH 구분값 프레임 (예: b"1\\x00\\x00\\x004\\x00\\x00\\x007\\r\\n")
+- FakePrinter: pyserial Serial 과 같은 write/is_open 인터페이스, 받은 ZPL 을 보관
+"""
+
+from datetime import datetime
+
+GS = "\x1d"
+RS = "\x1e"
+EOT = "\x04"
+
+
+def hkmc_barcode(part_number, serial, supplier_code="2812", fourm="S1B1", date_str=None):
+    """HKMC 2D 바코드 문자열 (스캐너가 보내는 원본과 같은 제어문자 포함)"""
+    date_str = date_str or datetime.now().strftime("%y%m%d")
+    return (f"[)>{RS}06{GS}V{supplier_code}{GS}P{part_number}{GS}S{GS}E{GS}"
+            f"T{date_str}{fourm}A{serial:07d}{GS}M{GS}{RS}{EOT}")
+
+
+def synthetic_master_data(parent_count=4, children_per_parent=3):
+    """가짜 기준정보 - 부모 부품 N개, 부모마다 하위부품 M개 (사용/출력포함 Y)"""
+    master_data = []
+    for parent_index in range(parent_count):
+        children = [{
+            "part_number": f"88{parent_index:02d}{child_index:02d}CU000",
+            "part_name": f"CHILD {parent_index}-{child_index}",
+            "use_status": "Y",
+            "print_include": "Y",
+        } for child_index in range(children_per_parent)]
+        master_data.append({
+            "supplier_code": "2812",
+            "division": str(parent_index + 1),
+            "part_number": f"8913{parent_index}CU2{'LH' if parent_index % 2 == 0 else 'RH'}",
+            "part_name": f"BENCH PART {parent_index}",
+            "sequence_code": "",
+            "eo_number": "",
+            "fourm_info": "S1B1",
+            "use_status": "Y",
+            "initial_sample": "N",
+            "child_parts": children,
+        })
+    return master_data
+
+
+class FakeScanner:
+    """하위부품 바코드를 순서대로 만들어 주는 가짜 스캐너"""
+
+    def __init__(self):
+        self._serials = {}
+        self.scanned = 0
+
+    def scan_child(self, part_number):
+        serial = self._serials.get(part_number, 0) + 1
+        self._serials[part_number] = serial
+        self.scanned += 1
+        return hkmc_barcode(part_number, serial) + "\r\n"
+
+    def scan_main(self, part_number):
+        self.scanned += 1
+        return part_number + "\r\n"
+
+
+class FakePLC:
+    """사이클마다 완료신호가 0 ↔ 1 로 바뀌는 PLC 프레임 생성기"""
+
+    def __init__(self, front_division="1", rear_division="2"):
+        self.front_division = front_division
+        self.rear_division = rear_division
+        self.frames = 0
+
+    def frame(self, cycle):
+        self.frames += 1
+        completion = cycle % 2
+        return f"{completion}\x00\x00\x00{self.front_division}\x00\x00\x00{self.rear_division}\r\n".encode('utf-8')
+
+
+class FakePrinter:
+    """pyserial 연결 대신 쓰는 가짜 프린터 - 받은 ZPL 라벨 수/바이트만 기록"""
+
+    def __init__(self, port="FAKE-PRINTER", keep_last=10):
+        self.port = port
+        self.is_open = True
+        self.labels = 0
+        self.bytes_written = 0
+        self.keep_last = keep_last
+        self.last_labels = []
+
+    def write(self, data):
+        self.labels += 1
+        self.bytes_written += len(data)
+        self.last_labels.append(data)
+        if len(self.last_labels) > self.keep_last:
+            self.last_labels.pop(0)
+        return len(data)
+
+    def close(self):
+        self.is_open = False
+
+
+class FakeMainWindow:
+    """AutoPrintManager 가 메인 화면에서 쓰는 속성만 제공"""
+
+    def __init__(self, master_data, printer):
+        self.master_data = master_data
+        self.panel_titles = {"front_lh": "FRONT/LH", "rear_rh": "REAR/RH"}
+        self._printer = printer
+
+    def get_serial_connection(self, device_name):
+        return self._printer if device_name == "프린터" else None
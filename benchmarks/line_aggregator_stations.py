@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+라인 집계 서버 다중 스테이션 시험 (한 PC, Linux/Windows)
+집계 서버 1개 + 스테이션 프로세스 N개(각자 outbox)를 띄워 라벨 기록을 보내고,
+중간에 서버를 강제 종료/재시작해도 재전송으로 빠짐/중복 없이 모두 모이는지 확인한다.
+
+사용법 (프로젝트 루트에서):
+    python benchmarks/line_aggregator_stations.py                       # 스테이션 3개 x 500건, 서버 재시작 1회
+    python benchmarks/line_aggregator_stations.py --stations 6 --labels 2000 --rate 200 --no-restart
+
+모든 파일(집계 DB, outbox, 로그)은 임시 작업 폴더에 만들고 끝나면 지운다.
+"""
+
+import os
+import sys
+import time
+import shutil
+import socket
+import argparse
+import tempfile
+import subprocess
+import multiprocessing
+from datetime import date
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, PROJECT_ROOT)
+
+PARENT_BARCODE = "[)>\x1e06\x1dV2812\x1dP89131CU214\x1dS\x1dE\x1dT{date}S1B2A{serial:07d}\x1dM\x1d\x1e\x04"
+CHILD_BARCODE = "[)>\x1e06\x1dV2812\x1dP{part}\x1dS\x1dE\x1dT{date}A0000C{serial:07d}\x1dM\x1d\x1e\x04"
+CHILD_PARTS = ("89131CU100", "89131CU200")
+DRAIN_TIMEOUT = 60.0
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workspace, port):
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    process = subprocess.Popen([sys.executable, "-m", "modules.core.line_aggregator", "--port", str(port),
+                                "--db", os.path.join(workspace, "line_aggregate.db")], cwd=workspace, env=env)
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("집계 서버 시작 실패")
+
+
+def station_worker(index, workspace, port, labels, rate, result_queue):
+    """스테이션 1개 - 라벨 기록을 rate 건/초로 outbox 에 넣고, 모두 전송될 때까지 대기"""
+    from modules.core.line_aggregator import AggregatorClient
+
+    station_dir = os.path.join(workspace, f"station{index + 1}")
+    os.makedirs(station_dir, exist_ok=True)
+    os.chdir(station_dir)
+    client = AggregatorClient(f"ST{index + 1}", port=port, outbox_path="outbox.db", flush_interval=0.2)
+    client.start()
+    today = date.today().strftime("%y%m%d")
+    started = time.monotonic()
+    for number in range(labels):
+        serial = (index + 1) * 1_000_000 + number
+        children = [(part, CHILD_BARCODE.format(part=part, date=today, serial=serial)) for part in CHILD_PARTS]
+        client.push_label("FRONT/LH" if number % 2 else "REAR/RH", "89131CU214",
+                          PARENT_BARCODE.format(date=today, serial=serial), children, number % 50 != 0)
+        if rate:
+            time.sleep(1.0 / rate)
+    pushed = time.monotonic() - started
+    deadline = time.monotonic() + DRAIN_TIMEOUT
+    while client.pending() and time.monotonic() < deadline:
+        time.sleep(0.1)
+    pending = client.pending()
+    client.stop()
+    result_queue.put((index, pushed, time.monotonic() - started, pending))
+
+
+def run(workspace, stations, labels, rate, restart):
+    from modules.core.line_aggregator import AggregatorQuery
+
+    port = free_port()
+    server = start_server(workspace, port)
+    result_queue = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=station_worker, args=(index, workspace, port, labels, rate, result_queue))
+               for index in range(stations)]
+    try:
+        for worker in workers:
+            worker.start()
+        if restart:
+            # 전송 도중 서버 강제 종료 → 스테이션은 outbox 에 쌓아 두고 재연결 후 재전송
+            time.sleep(max(0.5, labels / rate / 2 if rate else 0.5))
+            server.kill()
+            server.wait()
+            print("집계 서버 강제 종료 - 3초 후 재시작")
+            time.sleep(3)
+            server = start_server(workspace, port)
+        results = sorted(result_queue.get(timeout=DRAIN_TIMEOUT + labels) for _ in workers)
+        for worker in workers:
+            worker.join()
+
+        query = AggregatorQuery(port=port)
+        received = query.labels("2000-01-01", "2999-12-31", limit=stations * labels * 2)
+        source_rows = {row["station"]: row for row in query.stations()}
+        shift_rows = query.shift_totals(received[0]["work_date"]) if received else []
+        print(f"스테이션 {stations}개 x {labels}건 = {stations * labels}건 → 서버 {len(received)}건")
+        for index, pushed, total, pending in results:
+            row = source_rows.get(f"ST{index + 1}", {})
+            print(f"  ST{index + 1}: 기록 {pushed:.1f}초, 전송 완료까지 {total:.1f}초, "
+                  f"미전송 {pending}건, 서버 확인 순번 {row.get('last_seq')}")
+        for row in shift_rows:
+            print(f"  {row['work_date']} {row['shift']} {row['station']} {row['panel']}: OK {row['OK']} NG {row['NG']}")
+        sample = received[len(received) // 2] if received else None
+        if sample:
+            trace = query.lookup(sample["barcode"])
+            print(f"  추적 조회 {sample['parent_trace']}: 부모 {len(trace['parents'])}건, "
+                  f"하위부품 {len(query.children_of(trace['parents'][0]['id'])) if trace['parents'] else 0}건")
+        ok = len(received) == stations * labels and all(pending == 0 for _, _, _, pending in results)
+        print("결과: " + ("정상 (빠짐/중복 없음)" if ok else "불일치"))
+        return 0 if ok else 1
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+        server.kill()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="라인 집계 서버 다중 스테이션 시험")
+    parser.add_argument("--stations", type=int, default=3, help="스테이션 프로세스 수")
+    parser.add_argument("--labels", type=int, default=500, help="스테이션당 라벨 기록 수")
+    parser.add_argument("--rate", type=float, default=250.0, help="스테이션당 초당 기록 수 (0 = 최대)")
+    parser.add_argument("--no-restart", dest="restart", action="store_false", help="서버 재시작 없이 실행")
+    args = parser.parse_args()
+
+    workspace = tempfile.mkdtemp(prefix="barcode_aggregator_")
+    original_cwd = os.getcwd()
+    try:
+        os.chdir(workspace)
+        return run(workspace, args.stations, args.labels, args.rate, args.restart)
+    finally:
+        os.chdir(original_cwd)
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
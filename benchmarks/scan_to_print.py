@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스캔 → 출력 성능 벤치마크 (가짜 장비, 화면 없는 Qt 이벤트 루프)
+가상 근무조 N사이클 동안 단계별/전체 지연시간과 처리량을 재고 JSON 보고서로 저장한다.
+
+사이클 1회 = PLC 프레임 처리 → 공정부품 스캔 → 하위부품 스캔(바코드 파싱 포함)
+           → 자동 출력(ZPL 생성 + 가짜 프린터 전송) → 기록(저널/카운터/실적/중복/추적)
+
+사용법 (프로젝트 루트에서):
+    python benchmarks/scan_to_print.py                         # 10,000 사이클, benchmarks/baseline.json 저장
+    python benchmarks/scan_to_print.py --cycles 2000 --output result.json --compare benchmarks/baseline.json
+    python benchmarks/scan_to_print.py --engine --cycles 100000 --output engine.json   # 작업 흐름 엔진만 (Qt 불필요)
+
+--compare 를 주면 단계별 p95 가 기준보다 --tolerance 이상 느려졌을 때 종료 코드 1.
+실행은 임시 작업 폴더에서 하므로 실제 data/, logs/, tracking_data_*.json 은 건드리지 않는다.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+from datetime import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from fake_devices import FakeScanner, FakePLC, FakePrinter, FakeMainWindow, synthetic_master_data
+
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_CYCLES = 10000
+DEFAULT_TOLERANCE = 0.20    # 기준 대비 p95 20% 이상 느려지면 회귀
+MIN_COMPARE_SAMPLES = 30
+
+PANELS = (("front_lh", "FRONT/LH"), ("rear_rh", "REAR/RH"))
+
+
+class StageTimer:
+    """단계별 소요시간 수집 (ns)"""
+
+    def __init__(self):
+        self.samples = {}
+
+    def measure(self, stage, func, *args):
+        start = time.perf_counter_ns()
+        result = func(*args)
+        self.samples.setdefault(stage, []).append(time.perf_counter_ns() - start)
+        return result
+
+    def add(self, stage, elapsed_ns):
+        self.samples.setdefault(stage, []).append(elapsed_ns)
+
+
+def summarize(samples):
+    """ns 목록 → ms 통계 (평균/분위수/최대/초당 처리량)"""
+    ordered = sorted(samples)
+    count = len(ordered)
+    if not count:
+        return {"count": 0}
+
+    def percentile(ratio):
+        return ordered[min(count - 1, int(count * ratio))] / 1e6
+
+    total = sum(ordered)
+    return {
+        "count": count,
+        "mean_ms": round(total / count / 1e6, 4),
+        "p50_ms": round(percentile(0.50), 4),
+        "p95_ms": round(percentile(0.95), 4),
+        "p99_ms": round(percentile(0.99), 4),
+        "max_ms": round(ordered[-1] / 1e6, 4),
+        "ops_per_sec": round(count / (total / 1e9), 1) if total else None,
+    }
+
+
+def prepare_workspace():
+    """임시 작업 폴더 (config 복사) - 벤치마크가 만드는 파일은 모두 이 안에 생김"""
+    workspace = tempfile.mkdtemp(prefix="barcode_bench_")
+    shutil.copytree(os.path.join(PROJECT_ROOT, "config"), os.path.join(workspace, "config"))
+    return workspace
+
+
+def run(cycles, children_per_part, printer_settle):
+    from PyQt5.QtCore import QCoreApplication
+    from modules.utils.log_manager import setup_logging, shutdown_logging
+    from modules.hardware.hkmc_barcode_utils import HKMCBarcodeUtils
+    from modules.hardware.barcode_scan_workflow import BarcodeScanWorkflow
+    from modules.hardware.auto_print_manager import AutoPrintManager
+    from modules.hardware.plc_data_manager import PLCDataManager
+    from modules.core.scan_session import ScanRecord
+    from modules.core.scan_journal import ScanJournal
+    from modules.core.production_counter import ProductionCounterService
+    from modules.core.production_rollup import ProductionRollupStore, RESULT_OK, RESULT_SCAN_OK
+    from modules.core.duplicate_index import DuplicateSerialIndex
+    from modules.core.traceability_index import TraceabilityIndex
+
+    setup_logging()
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+
+    master_data = synthetic_master_data(children_per_parent=children_per_part)
+    scanner, plc, printer = FakeScanner(), FakePLC(), FakePrinter()
+
+    barcode_utils = HKMCBarcodeUtils()
+    workflow = BarcodeScanWorkflow()
+    auto_print = AutoPrintManager(FakeMainWindow(master_data, printer))
+    auto_print.print_config["settle_seconds"] = printer_settle
+    plc_manager = PLCDataManager(main_screen=None)
+
+    journal = ScanJournal()
+    counter = ProductionCounterService()
+    rollup = ProductionRollupStore()
+    duplicate_index = DuplicateSerialIndex()
+    trace_index = TraceabilityIndex()
+
+    timer = StageTimer()
+    run_start = time.perf_counter_ns()
+    for cycle in range(cycles):
+        cycle_start = time.perf_counter_ns()
+        panel_type, panel_name = PANELS[cycle % len(PANELS)]
+        part = master_data[cycle % len(master_data)]
+        child_numbers = [child["part_number"] for child in part["child_parts"]]
+
+        # 1. PLC 프레임
+        timer.measure("plc_frame", plc_manager._process_plc_data, plc.frame(cycle))
+
+        # 2. 공정부품 스캔 (바코드 수신 → 버퍼 처리, 100ms 묶음 타이머는 기다리지 않음)
+        workflow.reset_workflow()
+        workflow.start_workflow(part["part_number"], child_numbers)
+        start = time.perf_counter_ns()
+        workflow.on_barcode_received(scanner.scan_main(part["part_number"]))
+        workflow.barcode_timer.stop()
+        workflow.process_barcode_buffer()
+        timer.add("scan_main", time.perf_counter_ns() - start)
+
+        # 3. 하위부품 스캔 + 바코드 파싱
+        child_barcodes = [scanner.scan_child(number) for number in child_numbers]
+        for barcode in child_barcodes:
+            timer.measure("parse_barcode", barcode_utils.parse_barcode, barcode.strip())
+            start = time.perf_counter_ns()
+            workflow.on_barcode_received(barcode)
+            workflow.barcode_timer.stop()
+            workflow.process_barcode_buffer()
+            timer.add("scan_child", time.perf_counter_ns() - start)
+        app.processEvents()
+        if len(workflow.scanned_sub_parts) != len(child_numbers):
+            raise RuntimeError(f"하위부품 스캔 검증 실패 (사이클 {cycle}): {workflow.get_workflow_status()['state']}")
+
+        # 4. 자동 출력
+        scanned = [{"part_number": number, "raw_data": barcode.strip()}
+                   for number, barcode in zip(child_numbers, child_barcodes)]
+        auto_print.reset_print_status(panel_type)
+        if not timer.measure("auto_print", auto_print.execute_auto_print, panel_type, part, scanned):
+            raise RuntimeError(f"자동 출력 실패 (사이클 {cycle})")
+
+        # 5. 기록
+        start = time.perf_counter_ns()
+        now = datetime.now()
+        for child in scanned:
+            journal.record_scan(ScanRecord(now.strftime("%H:%M:%S"), child["part_number"], True,
+                                           child["raw_data"], panel_name))
+            rollup.record(panel_name, part["part_number"], RESULT_SCAN_OK, now)
+            duplicate_index.add(child["raw_data"], child["part_number"])
+        journal.record_complete(panel_name)
+        counter.increment(panel_name, part["part_number"], now)
+        rollup.record(panel_name, part["part_number"], RESULT_OK, now)
+        trace_index.record(printer.last_labels[-1].decode('utf-8', errors='ignore'), part["part_number"],
+                           [(child["part_number"], child["raw_data"]) for child in scanned], panel_name, now)
+        timer.add("log_writers", time.perf_counter_ns() - start)
+
+        timer.add("end_to_end", time.perf_counter_ns() - cycle_start)
+    wall_ns = time.perf_counter_ns() - run_start
+
+    # 남은 저장 작업 마무리 시간도 따로 측정
+    timer.measure("shutdown_flush", lambda: (journal.close(), counter.close(), rollup.close(),
+                                             duplicate_index.close(), trace_index.close()))
+    shutdown_logging()
+
+    return {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mode": "full",
+        "cycles": cycles,
+        "children_per_part": children_per_part,
+        "printer_settle_seconds": printer_settle,
+        "labels_printed": printer.labels,
+        "zpl_bytes": printer.bytes_written,
+        "wall_seconds": round(wall_ns / 1e9, 3),
+        "cycles_per_sec": round(cycles / (wall_ns / 1e9), 1),
+        "stages": {stage: summarize(samples) for stage, samples in timer.samples.items()},
+    }
+
+
+def run_engine(cycles, children_per_part):
+    """작업 흐름 엔진(ProductionLineEngine)만 측정 - 화면/Qt/파일 기록 없이 상태 머신 처리량 확인
+    사이클 1회 = PLC 작업중 → 공정부품 스캔 → 하위부품 스캔 → PLC 완료신호 → 가짜 프린터 출력 → 대기"""
+    from modules.core.production_engine import ProductionLineEngine, STATE_IDLE
+
+    master_data = synthetic_master_data(children_per_parent=children_per_part)
+    scanner, printer = FakeScanner(), FakePrinter()
+    engine = ProductionLineEngine(master_data, printer=lambda cycle: printer.write(cycle.part_number.encode()) > 0,
+                                  require_all_children=True)
+    transitions = []
+    engine.subscribe(transitions.append)
+
+    # 패널 i 의 구분값 = 기준정보 i 번째 부품 (FRONT/LH=1, REAR/RH=2)
+    divisions = (master_data[0]["division"], master_data[1]["division"])
+    engine.on_plc(0, *divisions)
+
+    timer = StageTimer()
+    run_start = time.perf_counter_ns()
+    for cycle in range(cycles):
+        panel_index = cycle % 2
+        panel = engine.panels[panel_index]
+        part = master_data[panel_index]
+        cycle_start = time.perf_counter_ns()
+
+        timer.measure("engine_plc", engine.on_plc, 0, *divisions)
+        timer.measure("engine_scan_main", engine.on_scan, scanner.scan_main(part["part_number"]))
+        for child in part["child_parts"]:
+            timer.measure("engine_scan_child", engine.on_scan, scanner.scan_child(child["part_number"]))
+        timer.measure("engine_complete", engine.on_plc, panel_index + 1, *divisions)
+        if engine.states[panel] != STATE_IDLE:
+            raise RuntimeError(f"작업 흐름 엔진 사이클 실패 (사이클 {cycle}): {engine.snapshot()[panel]}")
+
+        timer.add("end_to_end", time.perf_counter_ns() - cycle_start)
+        transitions.clear()
+    wall_ns = time.perf_counter_ns() - run_start
+
+    return {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mode": "engine",
+        "cycles": cycles,
+        "children_per_part": children_per_part,
+        "labels_printed": printer.labels,
+        "engine_stats": dict(engine.stats),
+        "wall_seconds": round(wall_ns / 1e9, 3),
+        "cycles_per_sec": round(cycles / (wall_ns / 1e9), 1),
+        "stages": {stage: summarize(samples) for stage, samples in timer.samples.items()},
+    }
+
+
+def compare(report, baseline, tolerance):
+    """기준 보고서 대비 단계별 p95 변화 출력 - 회귀 단계 목록 반환
+    측정 방식(mode)이 다른 보고서끼리는 단계가 달라 비교하지 않고 실패로 처리"""
+    report_mode, baseline_mode = report.get("mode", "full"), baseline.get("mode", "full")
+    if report_mode != baseline_mode:
+        print(f"  측정 방식이 다름 (보고서 {report_mode}, 기준 {baseline_mode}) - "
+              f"같은 방식으로 기록한 기준 보고서와 비교하세요")
+        return ["mode"]
+    regressions = []
+    for stage, stats in report["stages"].items():
+        base = baseline.get("stages", {}).get(stage)
+        # 표본이 적은 단계(종료 시 저장 등)는 p95 가 의미 없으므로 비교하지 않음
+        if not base or not base.get("p95_ms") or stats["count"] < MIN_COMPARE_SAMPLES:
+            continue
+        ratio = stats["p95_ms"] / base["p95_ms"] - 1.0
+        mark = "회귀" if ratio > tolerance else ""
+        print(f"  {stage:<15} p95 {base['p95_ms']:>9.4f} → {stats['p95_ms']:>9.4f} ms ({ratio:+.1%}) {mark}")
+        if ratio > tolerance:
+            regressions.append(stage)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스캔 → 출력 성능 벤치마크 (가짜 장비)")
+    parser.add_argument("--cycles", type=int, default=DEFAULT_CYCLES, help="가상 근무조 사이클 수")
+    parser.add_argument("--children", type=int, default=3, help="공정부품당 하위부품 수")
+    parser.add_argument("--printer-settle", type=float, default=0.0, help="프린터 전송 후 대기 (초)")
+    parser.add_argument("--engine", action="store_true", help="작업 흐름 엔진만 측정 (Qt/파일 기록 없음)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="보고서 JSON 경로")
+    parser.add_argument("--compare", help="비교할 기준 보고서 JSON")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="허용 p95 증가 비율")
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output)
+    baseline_path = os.path.abspath(args.compare) if args.compare else None
+    workspace = prepare_workspace()
+    original_cwd = os.getcwd()
+    try:
+        os.chdir(workspace)
+        if args.engine:
+            report = run_engine(args.cycles, args.children)
+        else:
+            report = run(args.cycles, args.children, args.printer_settle)
+    finally:
+        os.chdir(original_cwd)
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"{report['cycles']}사이클 - {report['wall_seconds']}초, {report['cycles_per_sec']} 사이클/초")
+    for stage, stats in report["stages"].items():
+        print(f"  {stage:<15} mean {stats['mean_ms']:>9.4f}  p95 {stats['p95_ms']:>9.4f}  "
+              f"max {stats['max_ms']:>9.4f} ms")
+    print(f"보고서 저장: {output}")
+
+    if baseline_path:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"기준 비교: {baseline_path}")
+        if compare(report, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+가상 시리얼 장비 시뮬레이터 (Linux pty)
+PLC / 스캐너 / 프린터 / 너트1 / 너트2 를 pty 가상 포트로 만들고,
+기록된 생산 트래픽을 원래 시간 간격대로(또는 N배속으로) 다시 보낸다.
+프린터 포트는 ZPL 수신기로 동작해 받은 라벨(^XA ... ^XZ)을 기록한다.
+
+캡처 파일 (JSON Lines, 한 줄 = 장비 송신 1건):
+    {"t": 12.5, "device": "스캐너", "data": "89131CU217\\r\\n"}
+    - t: 캡처 시작부터의 초, device: AutoSerialConnector 장비명, data: 보낼 문자열
+
+사용법 (프로젝트 루트에서):
+    # 스캔 로그(scan_logs JSON) + 디버그 로그의 수신 데이터 줄에서 캡처 만들기
+    python benchmarks/serial_simulator.py extract --log-root logs --log serial_connection.log -o capture.jsonl
+
+    # 가상 포트 생성 + 10배속 재생, 포트 경로를 넣은 설정 파일 생성 (메인 화면/AdminPanel 에서 사용)
+    python benchmarks/serial_simulator.py run capture.jsonl --speed 10 --write-config /tmp/sim_config.json
+
+    # AutoSerialConnector 로 가상 포트에 실제 연결해 수신 지연/처리량 측정 (pyserial 필요)
+    python benchmarks/serial_simulator.py run capture.jsonl --speed 10 --load-test
+"""
+
+import os
+import re
+import sys
+import ast
+import json
+import time
+import tty
+import select
+import argparse
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, PROJECT_ROOT)
+
+DEVICES = ("PLC", "스캐너", "프린터", "너트1", "너트2")
+INPUT_DEVICES = ("PLC", "스캐너", "너트1", "너트2")    # 시뮬레이터 → 프로그램 방향
+PRINTER = "프린터"
+
+DEFAULT_SCAN_GAP = 1.5      # 스캔 로그 재구성 시 바코드 간격 (초)
+DEFAULT_PLC_HOLD = 2.0      # 완료신호 유지 시간 (초)
+DEFAULT_MAX_GAP = 30.0      # 이보다 긴 무작업 구간은 잘라냄 (초)
+
+ZPL_END = b"^XZ"
+
+# 로그 줄 앞 시각: "2025-09-24 13:14:13,413" 또는 "13:14:13"
+_LOG_TIME = re.compile(r'^(?:(\d{4}-\d{2}-\d{2}) )?(\d{2}:\d{2}:\d{2})(?:[,.](\d{3}))?')
+_PLC_RAW = re.compile(r'PLC 원시 데이터 \(bytes\): (b[\'"].*[\'"])\s*$')
+_SCANNER_RAW = re.compile(r'스캐너 (?:폴링 )?데이터 수신 ===== (.*)$')
+
+
+class CaptureEvent:
+    """캡처 1건 - offset(초), 장비명, 보낼 바이트"""
+
+    __slots__ = ('offset', 'device', 'data')
+
+    def __init__(self, offset, device, data):
+        self.offset = offset
+        self.device = device
+        self.data = data if isinstance(data, bytes) else str(data).encode('utf-8')
+
+    def to_json(self):
+        return json.dumps({"t": round(self.offset, 3), "device": self.device,
+                           "data": self.data.decode('utf-8', errors='replace')}, ensure_ascii=False)
+
+
+def plc_frame(completion, front_division, rear_division):
+    """PLC 송신 프레임 (예: 완료신호 1, 구분값 4/7 → b"1\\x00\\x00\\x004\\x00\\x00\\x007\\r\\n")"""
+    return f"{completion}\x00\x00\x00{front_division}\x00\x00\x00{rear_division}\r\n".encode('utf-8')
+
+
+# ===== 캡처 만들기 =====
+
+def _timeline(stamped, max_gap):
+    """(시각, 장비, 데이터) 목록 → offset 순 CaptureEvent (긴 무작업 구간은 max_gap 으로 줄임)"""
+    stamped.sort(key=lambda item: item[0])
+    events = []
+    offset = 0.0
+    previous = None
+    for when, device, data in stamped:
+        if previous is not None:
+            offset += min(max(0.0, (when - previous).total_seconds()), max_gap)
+        previous = when
+        events.append(CaptureEvent(offset, device, data))
+    return events
+
+
+def stamped_from_scan_logs(log_root, scan_gap=DEFAULT_SCAN_GAP, plc_hold=DEFAULT_PLC_HOLD):
+    """scan_logs JSON (날짜/시간/공정부품/하위부품N_바코드) → 사이클별 스캐너/PLC 송신 재구성
+    사이클 = 공정부품 스캔 → 하위부품 바코드 스캔 → 완료신호(FRONT/LH=1, REAR/RH=2) → 0 복귀"""
+    stamped = []
+    divisions = {"FRONT/LH": "0", "REAR/RH": "0"}
+    records = []
+    for directory, _, file_names in os.walk(log_root):
+        if os.path.basename(directory) != "scan_logs":
+            continue
+        for file_name in file_names:
+            if not file_name.endswith(".json") or "_print_" in file_name:
+                continue
+            try:
+                with open(os.path.join(directory, file_name), 'r', encoding='utf-8') as f:
+                    logs = json.load(f)
+            except Exception as e:
+                print(f"⚠️ 스캔 로그 읽기 실패: {file_name} - {e}")
+                continue
+            for log in logs if isinstance(logs, list) else []:
+                try:
+                    when = datetime.strptime(f"{log['날짜']} {log['시간']}", "%Y-%m-%d %H:%M:%S")
+                except Exception:
+                    continue    # 이전 형식(timestamp/panel_name) 로그는 하위부품 바코드가 없음
+                records.append((when, log))
+
+    for when, log in sorted(records, key=lambda item: item[0]):
+        panel_name = log.get("패널명", "FRONT/LH")
+        divisions[panel_name] = str(log.get("공정코드", divisions.get(panel_name, "0")))[:1] or "0"
+        stamped.append((when, "스캐너", f"{log.get('공정부품', '')}\r\n"))
+        index = 1
+        step = when
+        while f"하위부품{index}" in log:
+            barcode = log.get(f"하위부품{index}_바코드") or log.get(f"하위부품{index}")
+            step = when + timedelta(seconds=scan_gap * index)
+            stamped.append((step, "스캐너", f"{barcode}\r\n"))
+            index += 1
+        done = step + timedelta(seconds=scan_gap)
+        completion = 1 if panel_name == "FRONT/LH" else 2
+        stamped.append((done, "PLC", plc_frame(completion, divisions["FRONT/LH"], divisions["REAR/RH"])))
+        stamped.append((done + timedelta(seconds=plc_hold), "PLC",
+                        plc_frame(0, divisions["FRONT/LH"], divisions["REAR/RH"])))
+    return stamped
+
+
+def stamped_from_log_file(path):
+    """디버그 로그의 수신 데이터 줄 → (시각, 장비, 데이터)
+    - "PLC 원시 데이터 (bytes): b'...'" / "스캐너 데이터 수신 ===== ..." (로그 레벨 DEBUG 로 기록된 경우)
+    - serial_connection.log 처럼 연결 이벤트만 있는 파일은 0건"""
+    stamped = []
+    base_date = datetime.now().date()
+    previous = None
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            plc = _PLC_RAW.search(line)
+            scanner = None if plc else _SCANNER_RAW.search(line)
+            if not plc and not scanner:
+                continue
+            match = _LOG_TIME.match(line)
+            if not match:
+                continue
+            day = datetime.strptime(match.group(1), "%Y-%m-%d").date() if match.group(1) else base_date
+            when = datetime.combine(day, datetime.strptime(match.group(2), "%H:%M:%S").time())
+            when += timedelta(milliseconds=int(match.group(3) or 0))
+            # 날짜 없는 로그(HH:MM:SS)가 자정을 넘긴 경우
+            if not match.group(1) and previous is not None and when < previous:
+                base_date += timedelta(days=1)
+                when += timedelta(days=1)
+            previous = when
+            if plc:
+                try:
+                    stamped.append((when, "PLC", ast.literal_eval(plc.group(1))))
+                except (ValueError, SyntaxError):
+                    continue
+            else:
+                stamped.append((when, "스캐너", scanner.group(1).rstrip("\r\n") + "\r\n"))
+    return stamped
+
+
+def load_capture(path):
+    events = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                item = json.loads(line)
+                events.append(CaptureEvent(float(item["t"]), item["device"], item["data"]))
+    events.sort(key=lambda event: event.offset)
+    return events
+
+
+def save_capture(events, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        for event in events:
+            f.write(event.to_json() + "\n")
+
+
+# ===== 가상 포트 =====
+
+class VirtualSerialPort:
+    """pty 한 쌍 - 프로그램은 path(/dev/pts/N)를 일반 시리얼 포트처럼 연다"""
+
+    def __init__(self, device_name):
+        self.device_name = device_name
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.slave_fd)          # 에코/줄바꿈 변환 없이 바이트 그대로
+        self.path = os.ttyname(self.slave_fd)
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def write(self, data):
+        view = memoryview(data)
+        while view:
+            written = os.write(self.master_fd, view)
+            view = view[written:]
+        self.bytes_sent += len(data)
+
+    def read(self, timeout=0.1):
+        ready, _, _ = select.select([self.master_fd], [], [], timeout)
+        if not ready:
+            return b""
+        try:
+            data = os.read(self.master_fd, 65536)
+        except OSError:
+            return b""
+        self.bytes_received += len(data)
+        return data
+
+    def close(self):
+        for fd in (self.master_fd, self.slave_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class ZplSink:
+    """프린터 포트 수신 스레드 - ^XZ 단위로 라벨을 잘라 기록"""
+
+    def __init__(self, port, output_path=None):
+        self.port = port
+        self.output_path = output_path
+        self.labels = 0
+        self.label_times = []
+        self._buffer = b""
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ZplSink", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _run(self):
+        output = open(self.output_path, 'ab') if self.output_path else None
+        try:
+            while not self._stop.is_set():
+                data = self.port.read(0.1)
+                if not data:
+                    continue
+                self._buffer += data
+                while ZPL_END in self._buffer:
+                    label, self._buffer = self._buffer.split(ZPL_END, 1)
+                    self.labels += 1
+                    self.label_times.append(time.monotonic())
+                    if output:
+                        output.write(label + ZPL_END + b"\n")
+                        output.flush()
+        finally:
+            if output:
+                output.close()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+
+
+class LineSimulator:
+    """가상 포트 묶음 + 캡처 재생기"""
+
+    def __init__(self, events, speed=1.0, loop=False, zpl_output=None):
+        self.events = events
+        self.speed = max(speed, 0.001)
+        self.loop = loop
+        self.ports = {device: VirtualSerialPort(device) for device in DEVICES}
+        self.zpl_sink = ZplSink(self.ports[PRINTER], zpl_output)
+        self.sent = {device: 0 for device in INPUT_DEVICES}
+        self.send_times = {device: deque() for device in INPUT_DEVICES}   # 송신 시각 - 부하 시험 지연시간 계산용
+        self.max_lag = 0.0          # 예정 시각보다 늦게 보낸 최대 시간 (초)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._replay, name="LineSimulator", daemon=True)
+
+    def port_map(self):
+        return {device: port.path for device, port in self.ports.items()}
+
+    def write_config(self, source, target):
+        """설정 파일 복사본에 가상 포트 경로 기록 (USB 프로파일 제거 - 포트명으로만 연결)"""
+        from modules.utils.modules.port_resolver import DEVICE_CONFIG_KEYS
+        with open(source, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        for device, path in self.port_map().items():
+            section, port_key, profile_key = DEVICE_CONFIG_KEYS[device]
+            device_config = config.setdefault(section, {})
+            device_config[port_key] = path
+            device_config.pop(profile_key, None)
+        with open(target, 'w', encoding='utf-8') as f:
+            json.dump(config, f, ensure_ascii=False, indent=2)
+        return config
+
+    def start(self):
+        self.zpl_sink.start()
+        self._thread.start()
+
+    def _replay(self):
+        while not self._stop.is_set():
+            start = time.monotonic()
+            for event in self.events:
+                due = start + event.offset / self.speed
+                delay = due - time.monotonic()
+                if delay > 0 and self._stop.wait(delay):
+                    return
+                port = self.ports.get(event.device)
+                if port is None or event.device == PRINTER:
+                    continue
+                now = time.monotonic()
+                self.max_lag = max(self.max_lag, now - due)
+                port.write(event.data)
+                self.sent[event.device] += 1
+                self.send_times[event.device].append(now)
+            if not self.loop:
+                return
+
+    def wait(self, timeout=None):
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        self.zpl_sink.stop()
+        for port in self.ports.values():
+            port.close()
+
+
+# ===== 부하 시험 (실제 AutoSerialConnector 경로) =====
+
+def load_test(simulator, config):
+    """AutoSerialConnector 로 가상 포트에 연결 → 스캐너/PLC 수신 지연 측정, 완료신호마다 프린터로 ZPL 전송"""
+    from modules.utils.modules.serial_connection_manager import AutoSerialConnector
+
+    connector = AutoSerialConnector(config, config_file=os.devnull)
+    results = connector.auto_connect_all_devices()
+    if not results.get("PLC") or not results.get("스캐너"):
+        print(f"❌ 가상 포트 연결 실패: {results}")
+        return None
+
+    latencies = []
+    printer = connector.get_serial_connection(PRINTER)
+    pending = {}        # 장비 → 수신 중인 바이트
+    received = 0
+    simulator.start()
+    while True:
+        for device in ("PLC", "스캐너"):
+            connection = connector.get_serial_connection(device)
+            waiting = connection.in_waiting
+            if not waiting:
+                continue
+            pending[device] = pending.get(device, b"") + connection.read(waiting)
+            while b"\n" in pending[device]:
+                line, pending[device] = pending[device].split(b"\n", 1)
+                if simulator.send_times[device]:
+                    latencies.append(time.monotonic() - simulator.send_times[device].popleft())
+                received += 1
+                if device == "PLC" and line[:1] in (b"1", b"2") and printer:
+                    printer.write(b"^XA^FO15,15^FDSIM^FS^XZ")
+        if simulator.wait(0.001) and not any(connector.get_serial_connection(d).in_waiting for d in ("PLC", "스캐너")):
+            break
+
+    time.sleep(0.3)     # 마지막 라벨 수신 대기
+    connector.disconnect_all_devices()
+    latencies.sort()
+    return {
+        "lines": received,
+        "labels": simulator.zpl_sink.labels,
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 3) if latencies else None,
+        "p95_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000, 3)
+        if latencies else None,
+        "max_lag_ms": round(simulator.max_lag * 1000, 3),
+    }
+
+
+# ===== 명령 =====
+
+def cmd_extract(args):
+    stamped = stamped_from_scan_logs(args.log_root, args.scan_gap, args.plc_hold) if args.log_root else []
+    for path in args.log or []:
+        lines = stamped_from_log_file(path)
+        print(f"{path}: 수신 데이터 {len(lines)}건")
+        stamped.extend(lines)
+    events = _timeline(stamped, args.max_gap)
+    save_capture(events, args.output)
+    duration = events[-1].offset if events else 0
+    print(f"캡처 저장: {args.output} ({len(events)}건, {duration:.1f}초)")
+    return 0
+
+
+def cmd_run(args):
+    events = load_capture(args.capture)
+    simulator = LineSimulator(events, args.speed, args.loop, args.zpl_out)
+    print("가상 포트:")
+    for device, path in simulator.port_map().items():
+        print(f"  {device:<4} {path}")
+    config_source = os.path.join(PROJECT_ROOT, "config", "admin_panel_config.json")
+    try:
+        if args.write_config:
+            simulator.write_config(config_source, args.write_config)
+            print(f"설정 파일 생성: {args.write_config}")
+
+        if args.load_test:
+            config = simulator.write_config(config_source, os.devnull)
+            result = load_test(simulator, config)
+            print(f"부하 시험 결과 ({args.speed}배속): {result}")
+            return 0 if result else 1
+
+        duration = events[-1].offset / args.speed if events else 0
+        print(f"재생 시작 - {len(events)}건, {args.speed}배속, 약 {duration:.1f}초 (Ctrl+C 중지)")
+        simulator.start()
+        while not simulator.wait(1.0):
+            pass
+        if args.hold:
+            input("재생 완료 - Enter 를 누르면 가상 포트를 닫습니다")
+        print(f"송신: {simulator.sent}, 라벨 수신: {simulator.zpl_sink.labels}, "
+              f"최대 지연: {simulator.max_lag * 1000:.1f}ms")
+        return 0
+    except KeyboardInterrupt:
+        print(f"중지 - 송신: {simulator.sent}, 라벨 수신: {simulator.zpl_sink.labels}")
+        return 0
+    finally:
+        simulator.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가상 시리얼 장비 시뮬레이터 (Linux pty)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    extract = commands.add_parser("extract", help="로그에서 캡처 파일 만들기")
+    extract.add_argument("--log-root", help="scan_logs 폴더를 찾을 로그 루트 (예: logs)")
+    extract.add_argument("--log", action="append", help="수신 데이터 줄이 있는 로그 파일 (여러 개 가능)")
+    extract.add_argument("--scan-gap", type=float, default=DEFAULT_SCAN_GAP, help="바코드 간격 (초)")
+    extract.add_argument("--plc-hold", type=float, default=DEFAULT_PLC_HOLD, help="완료신호 유지 (초)")
+    extract.add_argument("--max-gap", type=float, default=DEFAULT_MAX_GAP, help="무작업 구간 최대 길이 (초)")
+    extract.add_argument("-o", "--output", default="capture.jsonl")
+    extract.set_defaults(func=cmd_extract)
+
+    run = commands.add_parser("run", help="가상 포트 생성 + 캡처 재생")
+    run.add_argument("capture", help="캡처 파일 (JSON Lines)")
+    run.add_argument("--speed", type=float, default=1.0, help="재생 배속 (예: 10)")
+    run.add_argument("--loop", action="store_true", help="끝나면 처음부터 반복")
+    run.add_argument("--zpl-out", help="받은 ZPL 라벨을 기록할 파일")
+    run.add_argument("--write-config", help="가상 포트 경로를 넣은 admin_panel_config.json 복사본 경로")
+    run.add_argument("--hold", action="store_true", help="재생이 끝나도 Enter 전까지 포트 유지")
+    run.add_argument("--load-test", action="store_true", help="AutoSerialConnector 로 연결해 수신 지연 측정")
+    run.set_defaults(func=cmd_run)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
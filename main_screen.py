@@ -1,6 +1,13 @@
 import sys
+import logging
 import os
 import json
+import importlib
+
+# 시작 시간 측정은 무거운 import 보다 먼저 시작 (BARCODE_STARTUP_REPORT=1 이면 import 시간까지 기록)
+from modules.utils.startup import StartupReport
+startup_report = StartupReport.begin()
+
 import serial
 import threading
 import time
@@ -14,18 +21,36 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
 from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
 from PyQt5.QtGui import QFont, QPalette, QColor, QPixmap, QPainter
 
-from AdminPanel import AdminPanel
-from modules.hardware.print_module import PrintManager
 from modules.hardware.auto_print_manager import AutoPrintManager
 from modules.utils.modules.serial_connection_manager import AutoSerialConnector
+from modules.utils.modules.port_inventory import PortInventoryService
 from modules.hardware.barcode_scan_workflow import BarcodeScanWorkflow, LabelColorManager
 from modules.hardware.hkmc_barcode_utils import HKMCBarcodeUtils
 from modules.hardware.plc_data_manager import PLCDataManager
 from modules.ui.styles import *
 from modules.utils.font_manager import FontManager
 from modules.core.production_panel import ProductionPanel
-from modules.ui.scan_status_dialog import ScanStatusDialog
-from modules.ui.plc_simulation_dialog import PLCSimulationDialog
+from modules.core.station_config import StationLayout, DEFAULT_PRINTER
+from modules.ui.title_image_label import TitleImageLabel
+from modules.core.scan_session import ScanSessionStore
+from modules.core.scan_journal import ScanJournal, LEGACY_TEMP_FILE, remove_legacy_temp_files
+from modules.core.production_counter import ProductionCounterService
+from modules.core.throughput_metrics import ThroughputMetrics
+from modules.core.duplicate_index import DuplicateSerialIndex
+from modules.core.traceability_index import TraceabilityIndex
+from modules.core.tightening_store import TighteningStore
+from modules.core.production_engine import (ProductionLineEngine, STATE_LABELS, EVENT_STATE, EVENT_SCAN,
+                                            EVENT_BLOCKED, EVENT_TIGHTENING, EVENT_IGNORED, STATE_SCANNING,
+                                            STATE_PRINTING, REASON_PRINTED)
+from modules.core.line_aggregator import AggregatorClient
+from modules.hardware.nutrunner_ingest import NutrunnerIngestService, NUTRUNNER_DEVICES
+from modules.core.production_rollup import (ProductionRollupStore, RESULT_OK, RESULT_NG,
+                                            RESULT_SCAN_OK, RESULT_SCAN_NG)
+from modules.utils.utils import MasterDataManager
+from modules.utils.log_manager import get_logger
+
+logger = get_logger("main_screen")
+
 # login_dialog는 프로젝트 루트 또는 modules/ui/에 있을 수 있음
 try:
     from modules.ui.login_dialog import LoginDialog
@@ -34,7 +59,7 @@ except ImportError:
         from login_dialog import LoginDialog
     except ImportError:
         LoginDialog = None
-        print("경고: LoginDialog를 찾을 수 없습니다.")
+        logger.warning("경고: LoginDialog를 찾을 수 없습니다.")
 # 상대경로 기반으로 modules 폴더 사용
 
 
@@ -49,7 +74,7 @@ class BarcodeMainScreen(QMainWindow):
         if cls._instance is not None:
             # 이미 실행 중인 인스턴스가 있으면 기존 인스턴스 반환
             if hasattr(cls._instance, '_initialized') and cls._instance._initialized:
-                print("⚠️ 메인 화면이 이미 실행 중입니다. 기존 창을 활성화합니다.")
+                logger.warning("⚠️ 메인 화면이 이미 실행 중입니다. 기존 창을 활성화합니다.")
                 return cls._instance
         cls._instance = super().__new__(cls)
         return cls._instance
@@ -74,49 +99,53 @@ class BarcodeMainScreen(QMainWindow):
                 # get_current_user() 메서드 사용 (모듈 레벨 변수도 확인)
                 if hasattr(LoginDialog, 'get_current_user'):
                     self.current_user = LoginDialog.get_current_user()
-                    print(f"DEBUG: 로그인 사용자 정보 (get_current_user): {self.current_user}")
+                    logger.debug("로그인 사용자 정보 (get_current_user): %s", self.current_user)
                 elif hasattr(LoginDialog, 'current_user'):
                     self.current_user = LoginDialog.current_user
-                    print(f"DEBUG: 로그인 사용자 정보 (current_user): {self.current_user}")
+                    logger.debug("로그인 사용자 정보 (current_user): %s", self.current_user)
                 else:
-                    print(f"DEBUG: LoginDialog에 current_user 속성 또는 get_current_user 메서드가 없음")
+                    logger.debug("LoginDialog에 current_user 속성 또는 get_current_user 메서드가 없음")
             else:
-                print(f"DEBUG: LoginDialog가 None입니다")
-            
-            self.scanned_parts = []
+                logger.debug("LoginDialog가 None입니다")
             
             # ===== 프로그램 시작 시 기본 데이터 초기화 =====
             # print(f"DEBUG: 프로그램 시작 - 기본 데이터 초기화")
             
-            # 프로그램 시작 시에는 기본 초기화만 (과도한 파일 삭제 방지)
-            self.scanned_parts = []  # 스캔된 부품 목록
-            self.temp_scan_data = []  # 하위부품 스캔 데이터 임시보관
-            self.scan_history = []   # 스캔 히스토리 관리
+            # 스캔 세션 저장소 (패널별 현재 작업/최근 부품/히스토리를 deque로 일원화)
+            # scanned_parts / temp_scan_data / scan_history / global_scan_data 는 읽기 전용 뷰 속성
+            self.scan_session = ScanSessionStore()
             
             # 스캔현황 다이얼로그 데이터 저장 (다이얼로그가 닫힌 후에도 유지)
             self.scan_status_data = {
-                'real_time_scanned_data': [],
+                'real_time_scanned_data': self.scan_session.current,
                 'child_parts_info': [],
                 'current_panel_title': ''
             }
             
-            # 전역 스캔 데이터 저장 (확실한 방법) - 기존 호환성 유지
-            self.global_scan_data = []
-            
-            # 프로그램 시작 시 temp_scan_data.json 파일 초기화 (안전을 위해)
-            self.clear_temp_file_on_startup()
-            
             # print(f"DEBUG: 프로그램 시작 - 기본 데이터 초기화 완료")
             
             # 설정 파일 로드 (먼저 로드)
             try:
-                self.config = self.load_config()
+                with startup_report.phase("설정 로드"):
+                    self.config = self.load_config()
             except Exception as e:
-                print(f"설정 파일 로드 실패: {e}")
+                logger.error("설정 파일 로드 실패: %s", e)
                 self.config = {}
             
+            # 생산 스테이션(패널) 구성 - 설정 stations 항목 (없으면 기존 FRONT/LH, REAR/RH 2패널)
+            self.station_layout = StationLayout.from_config(self.config)
+            self.panels = {}  # 패널명 → ProductionPanel (create_production_panels 에서 생성)
+            
             # 공용 시리얼 연결 관리자 초기화 (config 로드 후)
             self.serial_connector = AutoSerialConnector(self.config)
+            for printer_name in self.station_layout.printers():
+                if printer_name != DEFAULT_PRINTER:
+                    self.serial_connector.add_printer_device(printer_name)
+            # 메인 화면이 연결한 포트는 관리자 패널 포트 목록 조회 시 열기 테스트하지 않음
+            PortInventoryService.shared().add_owner_source(self.serial_connector.owned_ports)
+            
+            # 장비 포트 열기는 작업 스레드에서 바로 시작 (화면 구성과 동시에 진행, 결과 반영은 화면 표시 후)
+            self.start_background_serial_connection()
             
             # 공통 장비 연결 상태 저장 (실제 연결 상태)
             self.device_connection_status = {
@@ -134,50 +163,53 @@ class BarcodeMainScreen(QMainWindow):
             # 시리얼 연결 객체 저장 (serial_connector에서 가져옴)
             self.serial_connections = {}
             
-            # 기준정보 로드
-            try:
-                self.master_data = self.load_master_data()
-            except Exception as e:
-                print(f"기준정보 로드 실패: {e}")
-                self.master_data = []
-            
-            # 패널 타이틀 로드
-            try:
-                self.panel_titles = self.load_panel_titles()
-                # print(f"DEBUG: 로드된 패널 타이틀: {self.panel_titles}")
-            except Exception as e:
-                print(f"패널 타이틀 로드 실패: {e}")
-                self.panel_titles = {
-                    "front_lh": "FRONT/LH",
-                    "rear_rh": "REAR/RH"
-                }
-            
-            # 생산 카운터 데이터 (일자별, 부품코드별) - 최초 시작: 0
-            self.production_data = {
-                "daily_total": {},  # {date: {panel_title: count}} - 최초 시작: 0
-                "part_counts": {}   # {part_number: {panel_title: count}} - 최초 시작: 0
+            # 생산 카운터 (작업일/근무조/패널/부품코드별, 저장은 모아서)
+            self.production_counter = ProductionCounterService.from_config(self.config)
+            
+            # 생산 속도 지표 (UPH/사이클타임/비가동) - 작업완료 이벤트로 집계
+            self.throughput_metrics = ThroughputMetrics.from_config(self.config)
+            
+            # 하위부품 시리얼 중복 투입 인덱스 (정책: duplicate_check.policy = off / warn / reject)
+            self.duplicate_index = DuplicateSerialIndex.from_config(self.config)
+            
+            # 서로 독립적인 파일 로드는 작업 스레드에서 동시에 실행 (시작 시간 = 가장 느린 작업 시간)
+            # - 스캔 세션 저널 재생 (비정상 종료 직전 스캔 현황 복원) 후 저널 연결
+            # - 시간대/근무조별 OK·NG 실적 집계, 부모 라벨 ↔ 하위부품 추적 인덱스 (관리자 패널과 공용)
+            loaded = startup_report.run_parallel({
+                "스캔 세션 복원": self.restore_scan_session_on_startup,
+                "기준정보": self.load_master_data,
+                "패널 타이틀": self.load_panel_titles,
+                "생산 카운터": self.production_counter.load,
+                "생산 실적 집계": lambda: ProductionRollupStore.shared(self.config),
+                "중복 투입 인덱스": self.duplicate_index.load,
+                "추적 인덱스": TraceabilityIndex.shared,
+                "체결 결과 저장소": TighteningStore.shared,
+            }, progress=kwargs.get("startup_progress"))
+            
+            self.master_data = loaded["기준정보"] or []
+            self.panel_titles = loaded["패널 타이틀"] or {
+                station.key: station.title for station in self.station_layout
             }
+            self.production_rollup = loaded["생산 실적 집계"] or ProductionRollupStore.shared(self.config)
+            self.traceability_index = loaded["추적 인덱스"] or TraceabilityIndex.shared()
             
-            # 생산수량 데이터 로드 (파일에서 기존 데이터 복원)
-            self.load_production_data()
+            # 너트런너 체결 결과 수집 (해석/저장은 읽기 스레드, 화면은 해석된 결과만 받음)
+            self.nutrunner_ingest = NutrunnerIngestService.from_config(
+                self.config, loaded["체결 결과 저장소"] or TighteningStore.shared())
+            
+            # 라인 집계 서버 전송 (aggregator.enabled 일 때만) - 사이클/라벨 기록은 outbox 에 넣고 전송 스레드가 보냄
+            self.aggregator_client = AggregatorClient.from_config(self.config)
+            if self.aggregator_client:
+                self.aggregator_client.start()
             
             # 프로그램 시작 시 마지막 생산수량 표시
             self.display_initial_production_counts()
             
-            # 현재 작업일
-            self.current_date = date.today()
-            
-            # 스캔 로그 데이터
-            self.scan_logs = {
-                "front_lh": [],  # 첫 번째 패널 스캔 로그
-                "rear_rh": []    # 두 번째 패널 스캔 로그
-            }
+            # 스캔 로그 데이터 (스테이션 키별)
+            self.scan_logs = {station.key: [] for station in self.station_layout}
             
-            # 출력 로그 데이터
-            self.print_logs = {
-                "front_lh": [],  # 첫 번째 패널 출력 로그
-                "rear_rh": []    # 두 번째 패널 출력 로그
-            }
+            # 출력 로그 데이터 (스테이션 키별)
+            self.print_logs = {station.key: [] for station in self.station_layout}
             
             # 로그 디렉토리 생성
             try:
@@ -185,16 +217,16 @@ class BarcodeMainScreen(QMainWindow):
                 if not os.path.exists(self.log_dir):
                     os.makedirs(self.log_dir)
             except Exception as e:
-                print(f" 로그 디렉토리 생성 실패: {e}")
+                logger.error("로그 디렉토리 생성 실패: %s", e)
                 self.log_dir = "."
             
             # 프린트 매니저 초기화 (새로운 HKMC 출력 매니저)
             try:
                 from modules.hardware.print_manager import PrintManager
                 self.print_manager = PrintManager(self)
-                print("PrintManager 초기화 완료")
+                logger.info("PrintManager 초기화 완료")
             except Exception as e:
-                print(f"프린트 매니저 초기화 실패: {e}")
+                logger.error("프린트 매니저 초기화 실패: %s", e)
                 self.print_manager = None
             
             # 자동 출력 매니저 초기화
@@ -203,9 +235,9 @@ class BarcodeMainScreen(QMainWindow):
                 self.auto_print_manager.print_started.connect(self.on_print_started)
                 self.auto_print_manager.print_completed.connect(self.on_print_completed)
                 self.auto_print_manager.print_failed.connect(self.on_print_failed)
-                print("AutoPrintManager 초기화 완료")
+                logger.info("AutoPrintManager 초기화 완료")
             except Exception as e:
-                print(f"자동 출력 매니저 초기화 실패: {e}")
+                logger.error("자동 출력 매니저 초기화 실패: %s", e)
                 self.auto_print_manager = None
             
             # PLC 데이터 매니저 초기화 (시뮬레이션 모드 옵션)
@@ -213,7 +245,7 @@ class BarcodeMainScreen(QMainWindow):
                 # 시뮬레이션 모드 설정 (환경변수 또는 설정으로 제어)
                 simulation_mode = os.getenv('PLC_SIMULATION', 'false').lower() == 'true'
                 if simulation_mode:
-                    print("🎭 PLC 시뮬레이션 모드 활성화")
+                    logger.info("🎭 PLC 시뮬레이션 모드 활성화")
                 
                 self.plc_data_manager = PLCDataManager(self, simulation_mode=simulation_mode)
                 self.plc_data_manager.set_serial_connections(self.serial_connections)
@@ -226,9 +258,9 @@ class BarcodeMainScreen(QMainWindow):
                     self.plc_data_manager.set_device_connection_status(self.device_connection_status)
                     self.plc_data_manager.start_simulation()
                 
-                print("PLC 데이터 매니저 초기화 완료")
+                logger.info("PLC 데이터 매니저 초기화 완료")
             except Exception as e:
-                print(f"PLC 데이터 매니저 초기화 실패: {e}")
+                logger.error("PLC 데이터 매니저 초기화 실패: %s", e)
                 self.plc_data_manager = None
             
             
@@ -241,16 +273,31 @@ class BarcodeMainScreen(QMainWindow):
             # PLC 시뮬레이션 다이얼로그 초기화
             self.plc_simulation_dialog = None
             
-            # 부모바코드 스캔 시점의 패널 정보 저장 (완료신호 검증용)
-            self.pending_print_panel = None
-            
             # 하위부품 바코드 검증기 초기화
             try:
                 self.child_part_validator = HKMCBarcodeUtils()
             except Exception as e:
-                print(f" 바코드 검증기 초기화 실패: {e}")
+                logger.error("바코드 검증기 초기화 실패: %s", e)
                 self.child_part_validator = None
             
+            # 패널별 작업 흐름 상태 머신 (Qt 없음) - 스캔/PLC/출력 결과를 받아 상태 변경 이벤트를 화면에 전달
+            self.production_engine = ProductionLineEngine(
+                self.master_data,
+                panels=self.station_layout.names(),
+                signals={station.completion_signal: station.name for station in self.station_layout},
+                tools={station.nutrunner: station.name for station in self.station_layout if station.nutrunner},
+                validator=self.child_part_validator.validate_child_part_barcode if self.child_part_validator else None,
+                duplicate_index=self.duplicate_index,
+                block_on_nok=self.nutrunner_ingest.block_on_nok)
+            for station in self.station_layout:
+                self.production_engine.set_panel_part(station.name, station.part_number)
+            # 저널에서 복원한 진행 중 사이클을 엔진에 이어 붙임 (재시작 후 남은 하위부품 스캔/완료신호를 같은 사이클로 처리)
+            if self.scan_session.open_cycle:
+                panel_name, part_number, expected = self.scan_session.open_cycle
+                self.production_engine.restore_cycle(panel_name, part_number, expected,
+                                                     reversed(self.scan_session.panel_view(panel_name)))
+            self.production_engine.subscribe(self.on_engine_event)
+            
             # 바코드 스캔 워크플로우 통합
             try:
                 self.workflow_manager = BarcodeScanWorkflow()
@@ -262,9 +309,9 @@ class BarcodeMainScreen(QMainWindow):
                     self.workflow_manager.workflow_status_changed.connect(self.on_workflow_status_changed)
                 if hasattr(self.workflow_manager, 'scan_result'):
                     self.workflow_manager.scan_result.connect(self.on_workflow_scan_result)
-                print("바코드 스캔 워크플로우 통합 완료")
+                logger.info("바코드 스캔 워크플로우 통합 완료")
             except Exception as e:
-                print(f"바코드 스캔 워크플로우 통합 실패: {e}")
+                logger.error("바코드 스캔 워크플로우 통합 실패: %s", e)
                 self.workflow_manager = None
             
             # AdminPanel 인스턴스
@@ -276,22 +323,23 @@ class BarcodeMainScreen(QMainWindow):
             
             # UI 초기화
             try:
-                self.init_ui()
+                with startup_report.phase("화면 구성"):
+                    self.init_ui()
             except Exception as e:
-                print(f" UI 초기화 실패: {e}")
+                logger.error("UI 초기화 실패: %s", e)
                 raise
             
             # 타이머 설정
             try:
                 self.setup_timer()
             except Exception as e:
-                print(f" 타이머 설정 실패: {e}")
+                logger.error("타이머 설정 실패: %s", e)
             
             # 시리얼 포트 자동 연결을 지연 실행 (메인화면 표시 후)
             self.setup_delayed_serial_connection()
                 
         except Exception as e:
-            print(f" 메인 화면 초기화 실패: {e}")
+            logger.error("메인 화면 초기화 실패: %s", e)
             import traceback
             traceback.print_exception(type(e), e, e.__traceback__)
             raise
@@ -307,11 +355,11 @@ class BarcodeMainScreen(QMainWindow):
             
             with open(config_file, 'r', encoding='utf-8') as f:
                 config = json.load(f)
-                print(f"설정 파일 로드 성공 - {config_file}")
+                logger.info("설정 파일 로드 성공 - %s", config_file)
                 # print(f"DEBUG: 로드된 설정 키: {list(config.keys())}")
                 return config
         except Exception as e:
-            print(f"설정 파일 로드 실패: {e}")
+            logger.error("설정 파일 로드 실패: %s", e)
             # print(f"DEBUG: 현재 작업 디렉토리: {os.getcwd()}")
             # print(f"DEBUG: 프로젝트 루트: {os.path.dirname(os.path.dirname(os.path.abspath(__file__)))}")
             return {}
@@ -319,59 +367,45 @@ class BarcodeMainScreen(QMainWindow):
     def load_master_data(self):
         """기준정보 로드"""
         try:
-            # 상대 경로로 마스터 데이터 파일 로드
-            master_data_file = os.path.join("config", "master_data.json")
-            
-            # print(f"DEBUG: 마스터 데이터 파일 경로: {master_data_file}")
-            # print(f"DEBUG: 마스터 데이터 파일 존재 여부: {os.path.exists(master_data_file)}")
-            
-            with open(master_data_file, 'r', encoding='utf-8') as f:
-                master_data = json.load(f)
-                # print(f"DEBUG: 마스터 데이터 로드 성공 - {len(master_data)}개 항목")
-                return master_data
+            # 기준정보 저장소(data/master_data.db)에서 로드 - 처음이면 config/master_data.json 을 가져옴
+            master_data_manager = MasterDataManager()
+            master_data = master_data_manager.get_master_data()
+            # print(f"DEBUG: 마스터 데이터 로드 성공 - {len(master_data)}개 항목")
+            if master_data_manager.store is not None:
+                master_data_manager.store.close()
+            return master_data
         except Exception as e:
-            print(f"기준정보 로드 오류: {e}")
+            logger.error("기준정보 로드 오류: %s", e)
             return []
     
     def load_panel_titles(self):
-        """패널 타이틀 로드"""
+        """패널 타이틀 로드 - 파일의 줄 순서 = 스테이션 순서 (없는 줄은 스테이션 기본 타이틀)"""
+        titles = {station.key: station.title for station in self.station_layout}
         try:
             titles_file = 'program/etc/panel_titles.txt'
             if os.path.exists(titles_file):
                 with open(titles_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    lines = content.split('\n')
-                    # print(f"DEBUG: 파일 내용: {repr(content)}")
-                    # print(f"DEBUG: 라인 수: {len(lines)}")
+                    lines = [line.strip() for line in f.read().strip().split('\n')]
                     
-                    # 최소 2개 라인이 있어야 함
-                    if len(lines) >= 2:
-                        result = {
-                            "front_lh": lines[0].strip(),
-                            "rear_rh": lines[1].strip()
-                        }
-                        # print(f"DEBUG: 파일에서 로드된 패널 타이틀: {result}")
-                        return result
-            
-            # 기본값 반환
-            return {
-                "front_lh": "FRONT/LH",
-                "rear_rh": "REAR/RH"
-            }
+                    # 최소 2개 라인이 있어야 함 (기존 형식)
+                    if len(lines) >= min(2, len(self.station_layout)):
+                        for station, line in zip(self.station_layout, lines):
+                            if line:
+                                titles[station.key] = line
+            return titles
         except Exception as e:
-            print(f"패널 타이틀 로드 오류: {e}")
-            return {
-                "front_lh": "FRONT/LH",
-                "rear_rh": "REAR/RH"
-            }
+            logger.error("패널 타이틀 로드 오류: %s", e)
+            return titles
     
-    def auto_connect_serial_ports(self):
-        """시리얼포트 자동연결 - 문제 있는 장비는 패스하고 나중에 재연결 가능"""
+    def auto_connect_serial_ports(self, connection_results=None):
+        """시리얼포트 자동연결 - 문제 있는 장비는 패스하고 나중에 재연결 가능
+        connection_results 가 있으면 작업 스레드에서 이미 포트를 연 결과만 반영한다"""
         try:
-            print("🔌 시리얼 포트 자동 연결 시작...")
+            logger.info("🔌 시리얼 포트 자동 연결 시작...")
             
             # 공용 시리얼 연결 관리자를 사용하여 모든 장비 연결 (실패해도 프로그램 계속 실행)
-            connection_results = self.serial_connector.auto_connect_all_devices()
+            if connection_results is None:
+                connection_results = self.serial_connector.auto_connect_all_devices()
             
             # 연결 결과를 내부 상태에 반영
             self.device_connection_status.update(connection_results)
@@ -417,6 +451,9 @@ class BarcodeMainScreen(QMainWindow):
                 # print("DEBUG: 스캐너가 연결되지 않았거나 연결 객체가 없음")
                 pass
             
+            # 너트런너 체결 결과 수집 시작 (연결된 너트런너만)
+            self.start_nutrunner_ingest()
+            
             # UI에 연결 상태 업데이트
             self.update_all_device_status_ui(connection_results)
             
@@ -426,32 +463,32 @@ class BarcodeMainScreen(QMainWindow):
                     if self.plc_data_manager:
                         self.plc_data_manager.start_plc_data_thread()
                         self.plc_data_manager.start_plc_connection_monitor()
-                        print(" PLC 데이터 읽기 스레드 시작")
+                        logger.info("PLC 데이터 읽기 스레드 시작")
                     else:
-                        print(" PLC 데이터 매니저가 초기화되지 않음")
+                        logger.info("PLC 데이터 매니저가 초기화되지 않음")
                 except Exception as e:
-                    print(f" PLC 데이터 스레드 시작 실패: {e}")
+                    logger.error("PLC 데이터 스레드 시작 실패: %s", e)
             else:
-                print(" PLC가 연결되지 않아 데이터 읽기 스레드 시작 안함")
+                logger.info("PLC가 연결되지 않아 데이터 읽기 스레드 시작 안함")
             
             # 연결 결과 요약
             successful_connections = sum(1 for result in connection_results.values() if result)
             total_devices = len(connection_results)
             
-            print(f" 자동 연결 결과: {successful_connections}/{total_devices} 장비 연결 성공")
+            logger.info("자동 연결 결과: %s/%s 장비 연결 성공", successful_connections, total_devices)
             
             if successful_connections == 0:
-                print(" 모든 장비 연결 실패 - 나중에 수동으로 연결하세요")
+                logger.error("모든 장비 연결 실패 - 나중에 수동으로 연결하세요")
             elif successful_connections < total_devices:
                 failed_devices = [device for device, connected in connection_results.items() if not connected]
-                print(f" 일부 장비 연결 실패: {', '.join(failed_devices)} - 나중에 수동으로 연결하세요")
+                logger.error("일부 장비 연결 실패: %s - 나중에 수동으로 연결하세요", ', '.join(failed_devices))
             else:
-                print(" 모든 장비 자동 연결 성공")
+                logger.info("모든 장비 자동 연결 성공")
                 
             return connection_results
                 
         except Exception as e:
-            print(f" 시리얼 포트 자동 연결 중 오류: {e}")
+            logger.error("시리얼 포트 자동 연결 중 오류: %s", e)
             # 오류가 발생해도 프로그램은 계속 실행
             return {}
     
@@ -464,11 +501,44 @@ class BarcodeMainScreen(QMainWindow):
         """장비 시리얼 연결 객체 반환 - 공용 모듈 사용"""
         return self.serial_connector.get_serial_connection(device_name)
     
+    def get_station(self, panel):
+        """패널명/스테이션 키/패널 타이틀 → 스테이션 (없으면 None)"""
+        station = self.station_layout.get(panel)
+        if station is None and panel:
+            for key, title in getattr(self, 'panel_titles', {}).items():
+                if title == panel:
+                    return self.station_layout.get(key)
+        return station
+    
+    def guess_working_station(self, plc_data):
+        """작업중(완료신호 0) 패널 추정 - 구분값이 있는 패널, 여러 개면 work_status=1 인 뒤쪽 패널, 그래도 없으면 마지막 패널
+        구분값이 있는 패널이 없으면 첫 번째 패널"""
+        division_stations = [station for station in self.station_layout if plc_data.get(station.division_field)]
+        if not division_stations:
+            return next(iter(self.station_layout))
+        if len(division_stations) > 1:
+            for station in reversed(division_stations):
+                if getattr(self.panels.get(station.name), 'work_status', None) == 1:
+                    return station
+        return division_stations[-1]
+    
+    def get_panel(self, panel):
+        """패널명/스테이션 키 → ProductionPanel (없으면 None)"""
+        station = self.station_layout.get(panel)
+        return self.panels.get(station.name) if station else None
+    
+    def iter_panels(self):
+        """(스테이션, ProductionPanel) - 스테이션 순서, 생성된 패널만"""
+        for station in self.station_layout:
+            panel = self.panels.get(station.name)
+            if panel is not None:
+                yield station, panel
+    
     
     def closeEvent(self, event):
         """프로그램 종료 시 리소스 정리"""
         try:
-            print("프로그램 종료 - 리소스 정리 시작")
+            logger.info("프로그램 종료 - 리소스 정리 시작")
             
             # 인스턴스 참조 제거 (다시 실행 가능하도록)
             BarcodeMainScreen._instance = None
@@ -476,76 +546,91 @@ class BarcodeMainScreen(QMainWindow):
             # 연결 상태 모니터링 중지
             self.stop_connection_monitoring()
             
+            # 너트런너 읽기 스레드 중지 (포트 닫기 전)
+            if getattr(self, 'nutrunner_ingest', None):
+                self.nutrunner_ingest.stop()
+            
             # 시리얼 연결 정리
             for device_name, connection in self.serial_connections.items():
                 if connection and connection.is_open:
                     try:
                         connection.close()
-                        print(f"{device_name} 시리얼 연결 종료")
+                        logger.info("%s 시리얼 연결 종료", device_name)
                     except Exception as e:
-                        print(f" {device_name} 시리얼 연결 종료 실패: {e}")
+                        logger.error("%s 시리얼 연결 종료 실패: %s", device_name, e)
             
             # 프린트 매니저 정리
             if hasattr(self, 'print_manager') and self.print_manager:
                 try:
                     if hasattr(self.print_manager, 'close_connection'):
                         self.print_manager.close_connection()
-                        print("프린트 매니저 연결 종료")
+                        logger.info("프린트 매니저 연결 종료")
                     else:
-                        print("PrintManager에 close_connection 메서드 없음 - 스킵")
+                        logger.info("PrintManager에 close_connection 메서드 없음 - 스킵")
                 except Exception as e:
-                    print(f" 프린트 매니저 정리 실패: {e}")
+                    logger.error("프린트 매니저 정리 실패: %s", e)
             
             # PLC 데이터 매니저 정리
             if hasattr(self, 'plc_data_manager') and self.plc_data_manager:
                 try:
                     self.plc_data_manager.cleanup()
-                    print("PLC 데이터 매니저 정리 완료")
+                    logger.info("PLC 데이터 매니저 정리 완료")
                 except Exception as e:
-                    print(f" PLC 데이터 매니저 정리 실패: {e}")
+                    logger.error("PLC 데이터 매니저 정리 실패: %s", e)
             
             # 로그 저장 (프로그램 종료 시 메모리에 남아있는 모든 로그 저장)
             try:
-                # 스캔 로그 확인 및 저장
-                front_log_count = len(self.scan_logs.get("front_lh", []))
-                rear_log_count = len(self.scan_logs.get("rear_rh", []))
-                print(f"DEBUG: 프로그램 종료 시 로그 저장 - FRONT/LH: {front_log_count}개, REAR/RH: {rear_log_count}개")
-                
-                # 로그가 있는 패널만 저장
-                if front_log_count > 0:
-                    self.save_logs_to_file(panel_name="FRONT/LH")
-                    print(f"DEBUG: 프로그램 종료 시 FRONT/LH 로그 저장 완료 ({front_log_count}개 항목)")
-                
-                if rear_log_count > 0:
-                    self.save_logs_to_file(panel_name="REAR/RH")
-                    print(f"DEBUG: 프로그램 종료 시 REAR/RH 로그 저장 완료 ({rear_log_count}개 항목)")
+                # 스캔 로그 확인 및 저장 (로그가 있는 패널만)
+                saved_count = 0
+                for station in self.station_layout:
+                    log_count = len(self.scan_logs.get(station.key, []))
+                    if log_count > 0:
+                        self.save_logs_to_file(panel_name=station.name)
+                        logger.debug("프로그램 종료 시 %s 로그 저장 완료 (%s개 항목)", station.name, log_count)
+                        saved_count += log_count
                 
                 # 로그가 없으면 메시지만 출력
-                if front_log_count == 0 and rear_log_count == 0:
-                    print("DEBUG: 프로그램 종료 시 저장할 스캔 로그가 없음")
+                if saved_count == 0:
+                    logger.debug("프로그램 종료 시 저장할 스캔 로그가 없음")
                 else:
-                    print("로그 파일 저장 완료")
+                    logger.info("로그 파일 저장 완료")
             except Exception as e:
-                print(f" 로그 저장 실패: {e}")
+                logger.error("로그 저장 실패: %s", e)
                 import traceback
                 traceback.print_exception(type(e), e, e.__traceback__)
             
-            print("리소스 정리 완료")
+            # 스캔 세션 저널 마무리 (남은 이벤트 기록)
+            if getattr(self, 'scan_journal', None):
+                self.scan_journal.close()
+            
+            # 생산수량 저장 (예약된 저장이 남아 있으면 즉시 기록)
+            if getattr(self, 'production_counter', None):
+                self.production_counter.close()
+            if getattr(self, 'production_rollup', None):
+                self.production_rollup.close()
+            if getattr(self, 'duplicate_index', None):
+                self.duplicate_index.close()
+            if getattr(self, 'traceability_index', None):
+                self.traceability_index.release()   # 같은 프로세스의 이력 화면이 쓰는 중이면 닫지 않음
+            if getattr(self, 'aggregator_client', None):
+                self.aggregator_client.stop()
+            
+            logger.info("리소스 정리 완료")
             event.accept()
             
         except Exception as e:
-            print(f" 프로그램 종료 중 오류: {e}")
+            logger.error("프로그램 종료 중 오류: %s", e)
             event.accept()  # 오류가 있어도 종료는 진행
         
         # 초기 UI 상태 설정 (PLC 연결 끊김 상태로 시작)
-        self.front_panel.update_plc_connection_display('disconnected')
-        self.rear_panel.update_plc_connection_display('disconnected')
+        for panel in self.panels.values():
+            panel.update_plc_connection_display('disconnected')
     
     
     
     def update_division_status(self, panel_name, division_value):
         """구분값 매칭 상태 업데이트"""
-        print(f"구분값 업데이트 - 패널: {panel_name}, 구분값: '{division_value}'")
+        logger.debug("구분값 업데이트 - 패널: %s, 구분값: '%s'", panel_name, division_value)
         
         # 기준정보에서 해당 구분값이 있는지 확인
         has_division = False
@@ -558,47 +643,34 @@ class BarcodeMainScreen(QMainWindow):
                 matched_part_data = part_data
                 break
         
-        print(f"구분값 매칭 결과 - {panel_name}: {has_division}")
+        logger.debug("구분값 매칭 결과 - %s: %s", panel_name, has_division)
         
         # 패널 상태 업데이트 (구분값과 함께)
-        if panel_name == "FRONT/LH":
-            self.front_panel.update_division_status(has_division, division_value)
-            
-            # 구분값이 매칭되면 부품정보도 업데이트 (기준정보에서 구분값 4에 해당하는 코드)
-            if has_division and matched_part_data:
-                part_number = matched_part_data.get("part_number", "")
-                part_name = matched_part_data.get("part_name", "")
-                self.front_panel.update_part_info(part_number, part_name, division_value)
-                
-                # FRONT/LH 패널의 하위부품 정보 업데이트 (스캔현황에 표시)
-                child_parts = matched_part_data.get("child_parts", [])
-                child_count = len(child_parts)
-                self.front_panel.update_child_parts_count(child_count)
-                self.front_panel.reset_child_parts_status()
-                
-                # 구분값 변경 시 레이블 색상 업데이트
-                self.update_panel_icons_after_division_change("FRONT/LH")
-        elif panel_name == "REAR/RH":
-            self.rear_panel.update_division_status(has_division, division_value)
-            
-            # 구분값이 매칭되면 부품정보도 업데이트 (기준정보에서 구분값 7에 해당하는 코드)
-            if has_division and matched_part_data:
-                part_number = matched_part_data.get("part_number", "")
-                part_name = matched_part_data.get("part_name", "")
-                self.rear_panel.update_part_info(part_number, part_name, division_value)
-                
-                # REAR/RH 패널의 하위부품 정보 업데이트 (스캔현황에 표시)
-                child_parts = matched_part_data.get("child_parts", [])
-                child_count = len(child_parts)
-                self.rear_panel.update_child_parts_count(child_count)
-                self.rear_panel.reset_child_parts_status()
-                
-                # 구분값 변경 시 레이블 색상 업데이트
-                self.update_panel_icons_after_division_change("REAR/RH")
+        station = self.get_station(panel_name)
+        panel = self.panels.get(station.name) if station else None
+        if panel is None:
+            return
+        panel.update_division_status(has_division, division_value)
+        
+        # 구분값이 매칭되면 부품정보도 업데이트 (기준정보에서 구분값에 해당하는 코드)
+        if has_division and matched_part_data:
+            part_number = matched_part_data.get("part_number", "")
+            part_name = matched_part_data.get("part_name", "")
+            panel.update_part_info(part_number, part_name, division_value)
+            
+            # 패널의 하위부품 정보 업데이트 (스캔현황에 표시) - 같은 부품번호도 구분값마다 하위부품이 다름
+            child_parts = matched_part_data.get("child_parts", [])
+            self.production_engine.set_panel_part(station.name, part_number, child_parts)
+            child_count = len(child_parts)
+            panel.update_child_parts_count(child_count)
+            panel.reset_child_parts_status()
+            
+            # 구분값 변경 시 레이블 색상 업데이트
+            self.update_panel_icons_after_division_change(station.name)
     
     def update_panel_icons_after_division_change(self, panel_name):
         """구분값 변경 시 패널 아이콘 색상 업데이트"""
-        print(f"DEBUG: 구분값 변경 시 패널 아이콘 색상 업데이트 - {panel_name}")
+        logger.debug("구분값 변경 시 패널 아이콘 색상 업데이트 - %s", panel_name)
         
         # 스캔 데이터에서 해당 패널의 스캔된 하위부품 개수 계산
         scanned_count = 0
@@ -607,248 +679,102 @@ class BarcodeMainScreen(QMainWindow):
                 if scan_data.get('panel') == panel_name and scan_data.get('status') in ['OK', 'NG']:
                     scanned_count += 1
         
-        print(f"DEBUG: {panel_name} 패널 스캔된 하위부품 개수: {scanned_count}")
+        logger.debug("%s 패널 스캔된 하위부품 개수: %s", panel_name, scanned_count)
         
         # 해당 패널의 아이콘 색상 업데이트
-        if panel_name == "FRONT/LH" and hasattr(self, 'front_panel') and self.front_panel:
-            if hasattr(self.front_panel, 'child_parts_icons') and self.front_panel.child_parts_icons:
-                print(f"DEBUG: FRONT/LH 패널 아이콘 색상 업데이트 시작: {len(self.front_panel.child_parts_icons)}개 아이콘")
-                
-                for i, icon in enumerate(self.front_panel.child_parts_icons):
-                    if icon:
-                        if i < scanned_count:
-                            # 스캔된 개수만큼 녹색으로 변경
-                            icon.setStyleSheet(get_scanned_icon_style())
-                            print(f"DEBUG: FRONT/LH 아이콘 {i+1} 색상 변경: 적색 → 녹색 (스캔됨)")
-                        else:
-                            # 스캔되지 않은 개수는 적색 유지
-                            icon.setStyleSheet(get_unscanned_icon_style())
-                            print(f"DEBUG: FRONT/LH 아이콘 {i+1} 색상 유지: 적색 (미스캔)")
-                            
-        elif panel_name == "REAR/RH" and hasattr(self, 'rear_panel') and self.rear_panel:
-            if hasattr(self.rear_panel, 'child_parts_icons') and self.rear_panel.child_parts_icons:
-                print(f"DEBUG: REAR/RH 패널 아이콘 색상 업데이트 시작: {len(self.rear_panel.child_parts_icons)}개 아이콘")
-                
-                for i, icon in enumerate(self.rear_panel.child_parts_icons):
-                    if icon:
-                        if i < scanned_count:
-                            # 스캔된 개수만큼 녹색으로 변경
-                            icon.setStyleSheet(get_scanned_icon_style())
-                            print(f"DEBUG: REAR/RH 아이콘 {i+1} 색상 변경: 적색 → 녹색 (스캔됨)")
-                        else:
-                            # 스캔되지 않은 개수는 적색 유지
-                            icon.setStyleSheet(get_unscanned_icon_style())
-                            print(f"DEBUG: REAR/RH 아이콘 {i+1} 색상 유지: 적색 (미스캔)")
-        
-        print(f"DEBUG: 구분값 변경 시 패널 아이콘 색상 업데이트 완료 - {panel_name}")
+        panel = self.get_panel(panel_name)
+        if panel is not None and getattr(panel, 'child_parts_icons', None):
+            logger.debug("%s 패널 아이콘 색상 업데이트 시작: %s개 아이콘", panel_name, len(panel.child_parts_icons))
+            
+            for i, icon in enumerate(panel.child_parts_icons):
+                if icon:
+                    # 스캔된 개수만큼 녹색, 나머지는 적색 유지
+                    panel.update_child_part_status(i, i < scanned_count)
+                    logger.debug("%s 아이콘 %s 색상: %s", panel_name, i+1, "녹색 (스캔됨)" if i < scanned_count else "적색 (미스캔)")
+        
+        logger.debug("구분값 변경 시 패널 아이콘 색상 업데이트 완료 - %s", panel_name)
     
     def update_production_counters(self, part_number, panel_name):
-        """생산카운터 업데이트 (일자별, 부품코드별)"""
-        today = date.today()
-        
-        # 일자가 변경되면 0으로 초기화
-        if today != self.current_date:
-            self.production_data["daily_total"] = {}
-            self.production_data["part_counts"] = {}
-            self.current_date = today
-        print(f"새로운 작업일 시작 - {today}")
-        
-        # 일자별 누적수량 증가 (공정부분 없이 누적)
-        if today not in self.production_data["daily_total"]:
-            self.production_data["daily_total"][today] = {"FRONT/LH": 0, "REAR/RH": 0}
-        
-        self.production_data["daily_total"][today][panel_name] += 1
-        
-        # 부품코드별 생산수량 증가 (같은 부품코드 누적)
-        if part_number not in self.production_data["part_counts"]:
-            self.production_data["part_counts"][part_number] = {"FRONT/LH": 0, "REAR/RH": 0}
-        
-        self.production_data["part_counts"][part_number][panel_name] += 1
+        """생산카운터 업데이트 (작업일/근무조별, 부품코드별) - 파일 저장은 카운터 서비스가 모아서 처리"""
+        counter = self.production_counter
+        panel_total = counter.increment(panel_name, part_number)
+        self.throughput_metrics.record_completion(panel_name)
         
         # UI 업데이트
         self.update_production_ui(part_number, panel_name)
         
-        print(f"생산카운터 업데이트 - {panel_name}, Part_No: {part_number}")
-        print(f"  - 일자별 누적수량: {self.production_data['daily_total'][today][panel_name]}")
-        print(f"  - 부품코드별 생산수량: {self.production_data['part_counts'][part_number][panel_name]}")
-        
-        # 생산수량 데이터 파일로 저장
-        self.save_production_data()
-    
-    def save_production_data(self):
-        """생산수량 데이터를 파일로 저장"""
-        try:
-            import json
-            from datetime import date
-            
-            # 생산수량 데이터 파일 경로
-            production_file = "data/production_data.json"
-            
-            # 디렉토리 생성
-            os.makedirs("data", exist_ok=True)
-            
-            # 저장할 데이터 구성
-            save_data = {
-                "current_date": self.current_date.isoformat(),
-                "daily_total": {},
-                "part_counts": {}
-            }
-            
-            # 일자별 데이터 변환 (date 객체를 문자열로)
-            for date_key, data in self.production_data["daily_total"].items():
-                save_data["daily_total"][date_key.isoformat()] = data
-            
-            # 부품코드별 데이터 복사
-            save_data["part_counts"] = self.production_data["part_counts"].copy()
-            
-            # 파일로 저장
-            with open(production_file, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
-            
-            print(f"생산수량 데이터 저장 완료 - {production_file}")
-            
-        except Exception as e:
-            print(f"생산수량 데이터 저장 오류: {e}")
-    
-    def load_production_data(self):
-        """생산수량 데이터를 파일에서 로드"""
-        try:
-            import json
-            from datetime import date
-            
-            production_file = "data/production_data.json"
-            
-            if os.path.exists(production_file):
-                with open(production_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # 현재 날짜 확인
-                saved_date = date.fromisoformat(data.get("current_date", date.today().isoformat()))
-                current_date = date.today()
-                
-                # 같은 날짜면 데이터 로드
-                if saved_date == current_date:
-                    self.current_date = current_date
-                    
-                    # 일자별 데이터 복원
-                    self.production_data["daily_total"] = {}
-                    for date_str, data_dict in data.get("daily_total", {}).items():
-                        self.production_data["daily_total"][date.fromisoformat(date_str)] = data_dict
-                    
-                    # 부품코드별 데이터 복원
-                    self.production_data["part_counts"] = data.get("part_counts", {})
-                    
-                    print(f"생산수량 데이터 로드 완료 - {production_file}")
-                    print(f"로드된 일자별 데이터: {len(self.production_data['daily_total'])}개")
-                    print(f"로드된 부품코드별 데이터: {len(self.production_data['part_counts'])}개")
-                else:
-                    print(f"날짜가 다름 - 저장된 날짜: {saved_date}, 현재 날짜: {current_date}")
-                    print(f"생산수량 데이터 초기화")
-            else:
-                print(f"생산수량 데이터 파일 없음 - 새로 시작")
-                
-        except Exception as e:
-            print(f"생산수량 데이터 로드 오류: {e}")
+        logger.debug("생산카운터 업데이트 - %s, Part_No: %s (%s %s)", panel_name, part_number, counter.work_date, counter.shift)
+        logger.debug("  - 작업일 누적수량: %s", panel_total)
+        logger.debug("  - 부품코드별 생산수량: %s", counter.part_total(part_number, panel_name))
     
     def display_initial_production_counts(self):
         """프로그램 시작 시 마지막 생산수량 표시"""
         try:
-            from datetime import date
-            today = date.today()
-            
-            # FRONT/LH 패널 생산수량 표시
-            front_count = self.production_data["daily_total"].get(today, {}).get("FRONT/LH", 0)
-            if hasattr(self, 'front_panel') and self.front_panel:
-                self.front_panel.update_accumulated_count(front_count)
-                print(f"FRONT/LH 패널 초기 생산수량: {front_count}")
-            
-            # REAR/RH 패널 생산수량 표시
-            rear_count = self.production_data["daily_total"].get(today, {}).get("REAR/RH", 0)
-            if hasattr(self, 'rear_panel') and self.rear_panel:
-                self.rear_panel.update_accumulated_count(rear_count)
-                print(f"REAR/RH 패널 초기 생산수량: {rear_count}")
-            
-            print(f"프로그램 시작 시 생산수량 표시 완료 - FRONT/LH: {front_count}, REAR/RH: {rear_count}")
+            counts = {}
+            for station in self.station_layout:
+                counts[station.name] = self.production_counter.panel_total(station.name)
+                panel = self.panels.get(station.name)
+                if panel:
+                    panel.update_accumulated_count(counts[station.name])
+                    logger.debug("%s 패널 초기 생산수량: %s", station.name, counts[station.name])
             
+            logger.info("프로그램 시작 시 생산수량 표시 완료 - %s", counts)
+        
         except Exception as e:
-            print(f"초기 생산수량 표시 오류: {e}")
+            logger.error("초기 생산수량 표시 오류: %s", e)
     
     def update_production_counts_on_cycle_start(self):
         """새로운 작업 사이클 시작 시 생산수량 표시"""
         try:
-            from datetime import date
-            today = date.today()
-            
-            # FRONT/LH 패널 생산수량 표시
-            front_count = self.production_data["daily_total"].get(today, {}).get("FRONT/LH", 0)
-            if hasattr(self, 'front_panel') and self.front_panel:
-                self.front_panel.update_accumulated_count(front_count)
-                print(f"FRONT/LH 패널 사이클 시작 시 생산수량: {front_count}")
-            
-            # REAR/RH 패널 생산수량 표시
-            rear_count = self.production_data["daily_total"].get(today, {}).get("REAR/RH", 0)
-            if hasattr(self, 'rear_panel') and self.rear_panel:
-                self.rear_panel.update_accumulated_count(rear_count)
-                print(f"REAR/RH 패널 사이클 시작 시 생산수량: {rear_count}")
-            
-            print(f"사이클 시작 시 생산수량 표시 완료 - FRONT/LH: {front_count}, REAR/RH: {rear_count}")
+            counts = {}
+            for station, panel in self.iter_panels():
+                counts[station.name] = self.production_counter.panel_total(station.name)
+                panel.update_accumulated_count(counts[station.name])
+                logger.debug("%s 패널 사이클 시작 시 생산수량: %s", station.name, counts[station.name])
             
+            logger.debug("사이클 시작 시 생산수량 표시 완료 - %s", counts)
+        
         except Exception as e:
-            print(f"사이클 시작 시 생산수량 표시 오류: {e}")
+            logger.error("사이클 시작 시 생산수량 표시 오류: %s", e)
     
     def display_production_counts_on_work_start(self):
         """작업 시작 시 생산수량 표시 (완료신호 0일 때) - 구분값이 있는 패널만"""
         try:
-            from datetime import date
-            today = date.today()
-            
             # 구분값이 있는 패널만 확인
-            front_division = None
-            rear_division = None
-            
+            plc_data = {}
             if hasattr(self, 'plc_data_manager') and self.plc_data_manager:
                 plc_data = self.plc_data_manager.get_plc_data()
-                front_division = plc_data.get("front_lh_division")
-                rear_division = plc_data.get("rear_rh_division")
+            divisions = {station.name: plc_data.get(station.division_field) for station in self.station_layout}
             
-            print(f"구분값 확인 - FRONT/LH: {front_division}, REAR/RH: {rear_division}")
+            logger.debug("구분값 확인 - %s", divisions)
             
             # 생산수량 데이터에서 직접 가져오기 (구분값 변경 후 초기화된 값을 유지하기 위해)
-            front_count = self.production_data["daily_total"].get(today, {}).get("FRONT/LH", 0)
-            rear_count = self.production_data["daily_total"].get(today, {}).get("REAR/RH", 0)
+            counts = {station.name: self.production_counter.panel_total(station.name) for station in self.station_layout}
             
-            print(f"DEBUG: display_production_counts_on_work_start - 생산수량 데이터에서 가져온 값: FRONT/LH={front_count}, REAR/RH={rear_count}")
+            logger.debug("display_production_counts_on_work_start - 생산수량 데이터에서 가져온 값: %s", counts)
             
             # 총 누적수량 계산
-            total_accumulated = front_count + rear_count
-            
-            # FRONT/LH 패널에 구분값이 있으면 표시
-            if front_division and front_division != "0":
-                if hasattr(self, 'front_panel') and self.front_panel:
-                    self.front_panel.update_production_count(front_count)
-                    self.front_panel.update_accumulated_count(total_accumulated)
-                    self.front_panel.update()
-                    print(f"DEBUG: FRONT/LH 패널 작업 시작 시 생산수량 업데이트: {front_count} (생산수량 데이터에서 직접 가져옴)")
-            
-            # REAR/RH 패널에 구분값이 있으면 표시
-            if rear_division and rear_division != "0":
-                if hasattr(self, 'rear_panel') and self.rear_panel:
-                    self.rear_panel.update_production_count(rear_count)
-                    self.rear_panel.update_accumulated_count(total_accumulated)
-                    self.rear_panel.update()
-                    print(f"DEBUG: REAR/RH 패널 작업 시작 시 생산수량 업데이트: {rear_count} (생산수량 데이터에서 직접 가져옴)")
+            total_accumulated = sum(counts.values())
+            
+            # 구분값이 있는 패널만 표시
+            for station, panel in self.iter_panels():
+                division = divisions.get(station.name)
+                if division and division != "0":
+                    panel.update_production_count(counts[station.name])
+                    panel.update_accumulated_count(total_accumulated)
+                    panel.update()
+                    logger.debug("%s 패널 작업 시작 시 생산수량 업데이트: %s (생산수량 데이터에서 직접 가져옴)", station.name, counts[station.name])
             
             # 메인 윈도우 UI 강제 업데이트
             if hasattr(self, 'update'):
                 self.update()
-                
+        
         except Exception as e:
-            print(f"작업 시작 시 생산수량 표시 오류: {e}")
+            logger.error("작업 시작 시 생산수량 표시 오류: %s", e)
     
     def get_current_serial_number(self, panel_name):
         """현재 시리얼번호 가져오기 (tracking_data 파일에서)"""
         try:
-            from datetime import date
             today = date.today()
             date_str = today.strftime("%y%m%d")
             tracking_file = f'tracking_data_{date_str}.json'
@@ -857,66 +783,53 @@ class BarcodeMainScreen(QMainWindow):
                 with open(tracking_file, 'r', encoding='utf-8') as f:
                     tracking_data = json.load(f)
                 
-                # 패널별 시리얼번호 가져오기
-                if panel_name == "FRONT/LH":
-                    # FRONT/LH 패널의 부품번호로 추적번호 찾기
+                # 패널별 시리얼번호 가져오기 (자동 출력이 '<스테이션 키>_serial' 로 기록)
+                station = self.get_station(panel_name)
+                if station:
                     for key, value in tracking_data.items():
-                        if "FRONT" in key.upper() or "front" in key.lower():
-                            serial = value
-                            print(f"FRONT/LH 시리얼번호: {serial}")
-                            return serial
-                elif panel_name == "REAR/RH":
-                    # REAR/RH 패널의 부품번호로 추적번호 찾기
-                    for key, value in tracking_data.items():
-                        if "REAR" in key.upper() or "rear" in key.lower() or "89131CU217" in key:
-                            serial = value
-                            print(f"REAR/RH 시리얼번호: {serial}")
-                            return serial
+                        if key.lower() == f"{station.key}_serial" or station.key in key.lower():
+                            logger.debug("%s 시리얼번호: %s", station.name, value)
+                            return value
                 
                 # 패널별 시리얼번호가 없으면 0 반환 (작업하지 않은 패널)
-                print(f"{panel_name} 패널 작업하지 않음 - 시리얼번호 0 반환")
+                logger.debug("%s 패널 작업하지 않음 - 시리얼번호 0 반환", panel_name)
                 return 0
             
-            print(f"{panel_name} 시리얼번호 파일 없음 또는 오류")
+            logger.error("%s 시리얼번호 파일 없음 또는 오류", panel_name)
             return 0
         except Exception as e:
-            print(f"시리얼번호 가져오기 오류: {e}")
+            logger.error("시리얼번호 가져오기 오류: %s", e)
             return 0
     
     def update_production_ui(self, part_number, panel_name):
         """생산수량 UI 업데이트 (구분값 매칭 시에만 표시)"""
-        today = date.today()
         
         # 구분값 매칭 상태 확인
-        has_division = False
-        if panel_name == "FRONT/LH":
-            has_division = getattr(self.front_panel, 'has_division_match', False)
-        elif panel_name == "REAR/RH":
-            has_division = getattr(self.rear_panel, 'has_division_match', False)
+        panel = self.get_panel(panel_name)
+        has_division = getattr(panel, 'has_division_match', False)
         
         # 공정별 누적수량 (해당 패널의 총 누적)
-        panel_accumulated_count = self.production_data["daily_total"].get(today, {}).get(panel_name, 0)
+        panel_accumulated_count = self.production_counter.panel_total(panel_name)
         
         # 총 누적수량 (오늘 하루종일 생산한 총 누적)
         total_accumulated_count = 0
-        for panel in ["FRONT/LH", "REAR/RH"]:
-            total_accumulated_count += self.production_data["daily_total"].get(today, {}).get(panel, 0)
+        for station in self.station_layout:
+            total_accumulated_count += self.production_counter.panel_total(station.name)
         
-        print(f"생산수량 UI 업데이트 - {panel_name}: 공정별 누적 {panel_accumulated_count}, 총 누적: {total_accumulated_count}")
+        logger.debug("생산수량 UI 업데이트 - %s: 공정별 누적 %s, 총 누적: %s", panel_name, panel_accumulated_count, total_accumulated_count)
         
         # 패널 업데이트
-        if panel_name == "FRONT/LH":
-            self.front_panel.update_production_count(panel_accumulated_count)  # 공정별 누적수량
-            self.front_panel.update_accumulated_count(total_accumulated_count)  # 총 누적수량
+        if panel is not None:
+            panel.update_production_count(panel_accumulated_count)  # 공정별 누적수량
+            panel.update_accumulated_count(total_accumulated_count)  # 총 누적수량
     
     def reset_production_count_for_division_change(self, panel_name, division):
         """구분값 변경 시 해당 부모 부품번호의 최종 생산수량을 가져오기"""
         try:
-            from datetime import date
             today = date.today()
             
-            print(f"DEBUG: ===== 구분값 변경으로 인한 생산수량 업데이트 시작 =====")
-            print(f"DEBUG: 패널: {panel_name}, 구분값: {division}")
+            logger.debug("===== 구분값 변경으로 인한 생산수량 업데이트 시작 =====")
+            logger.debug("패널: %s, 구분값: %s", panel_name, division)
             
             # 해당 구분값의 부ក번호 찾기
             part_number = None
@@ -924,35 +837,21 @@ class BarcodeMainScreen(QMainWindow):
                 for part_data in self.master_data:
                     if part_data.get('division') == division:
                         part_number = part_data.get('part_number', '')
-                        print(f"DEBUG: 구분값 {division}에 해당하는 부품번호: {part_number}")
+                        logger.debug("구분값 %s에 해당하는 부품번호: %s", division, part_number)
                         break
             
             # 해당 부품번호의 최종 생산수량 가져오기
-            production_count = 0
-            if part_number and part_number in self.production_data["part_counts"]:
-                if panel_name in self.production_data["part_counts"][part_number]:
-                    production_count = self.production_data["part_counts"][part_number][panel_name]
-                    print(f"DEBUG: 부품번호 {part_number}의 최종 생산수량: {production_count}")
-                else:
-                    print(f"DEBUG: 부품번호 {part_number}에 패널 {panel_name} 데이터 없음")
-            else:
-                print(f"DEBUG: 부품번호 {part_number}의 생산수량 데이터 없음 - 0으로 설정")
-            
-            # 일자별 생산수량을 해당 부품번호의 최종 생산수량으로 업데이트
-            if today not in self.production_data["daily_total"]:
-                self.production_data["daily_total"][today] = {}
+            counter = self.production_counter
+            production_count = counter.part_total(part_number, panel_name) if part_number else 0
+            logger.debug("부품번호 %s의 최종 생산수량: %s", part_number, production_count)
             
             # 업데이트 전 생산수량 확인
-            before_count = self.production_data["daily_total"].get(today, {}).get(panel_name, 0)
-            print(f"DEBUG: 업데이트 전 일자별 생산수량: {before_count}")
-            
-            # 해당 패널의 생산수량을 해당 부품번호의 최종 생산수량으로 업데이트
-            self.production_data["daily_total"][today][panel_name] = production_count
+            before_count = counter.panel_total(panel_name)
+            logger.debug("업데이트 전 작업일 생산수량: %s", before_count)
             
-            # 업데이트 후 생산수량 확인
-            after_count = self.production_data["daily_total"].get(today, {}).get(panel_name, 0)
-            print(f"DEBUG: 업데이트 후 일자별 생산수량: {after_count}")
-            print(f"DEBUG: 생산수량 데이터 확인 - daily_total[{today}][{panel_name}] = {self.production_data['daily_total'][today][panel_name]}")
+            # 해당 패널의 작업일 생산수량을 해당 부품번호의 최종 생산수량으로 업데이트 (저장은 카운터 서비스가 처리)
+            counter.set_panel_total(panel_name, production_count)
+            logger.debug("업데이트 후 작업일 생산수량: %s (%s)", counter.panel_total(panel_name), counter.work_date)
             
             # 시리얼번호(tracking_data)도 동기화 - 생산수량과 일치시킴
             if part_number:
@@ -975,108 +874,85 @@ class BarcodeMainScreen(QMainWindow):
                     tracking_data[tracking_key] = production_count
                     
                     # 패널별 시리얼번호도 업데이트
-                    if panel_name == "FRONT/LH":
-                        tracking_data["front_lh_serial"] = production_count
-                    elif panel_name == "REAR/RH":
-                        tracking_data["rear_rh_serial"] = production_count
+                    station = self.get_station(panel_name)
+                    if station:
+                        tracking_data[f"{station.key}_serial"] = production_count
                     
                     # tracking_data 파일 저장
                     with open(tracking_file, 'w', encoding='utf-8') as f:
                         json.dump(tracking_data, f, ensure_ascii=False, indent=2)
                     
-                    print(f"DEBUG: 시리얼번호(tracking_data) 동기화 완료 - 키: {tracking_key}, 이전: {before_serial}, 현재: {production_count}")
+                    logger.debug("시리얼번호(tracking_data) 동기화 완료 - 키: %s, 이전: %s, 현재: %s", tracking_key, before_serial, production_count)
                 except Exception as e:
-                    print(f"DEBUG: 시리얼번호 동기화 오류: {e}")
-            
-            # 생산수량 데이터 파일로 저장
-            self.save_production_data()
+                    logger.error("시리얼번호 동기화 오류: %s", e)
             
             # 패널 UI 업데이트 (해당 부품번호의 최종 생산수량으로 표시)
-            if panel_name == "FRONT/LH" and hasattr(self, 'front_panel') and self.front_panel:
-                self.front_panel.update_production_count(production_count)
-                # 총 누적수량은 다른 패널 포함하므로 다시 계산
-                total_accumulated = self.production_data["daily_total"].get(today, {}).get("FRONT/LH", 0) + \
-                                   self.production_data["daily_total"].get(today, {}).get("REAR/RH", 0)
-                self.front_panel.update_accumulated_count(total_accumulated)
-                self.front_panel.update()
-                print(f"DEBUG: FRONT/LH 패널 생산수량 UI 업데이트 완료: {production_count}")
-            elif panel_name == "REAR/RH" and hasattr(self, 'rear_panel') and self.rear_panel:
-                self.rear_panel.update_production_count(production_count)
+            panel = self.get_panel(panel_name)
+            if panel is not None:
+                panel.update_production_count(production_count)
                 # 총 누적수량은 다른 패널 포함하므로 다시 계산
-                total_accumulated = self.production_data["daily_total"].get(today, {}).get("FRONT/LH", 0) + \
-                                   self.production_data["daily_total"].get(today, {}).get("REAR/RH", 0)
-                self.rear_panel.update_accumulated_count(total_accumulated)
-                self.rear_panel.update()
-                print(f"DEBUG: REAR/RH 패널 생산수량 UI 업데이트 완료: {production_count}")
+                total_accumulated = sum(counter.panel_total(station.name) for station in self.station_layout)
+                panel.update_accumulated_count(total_accumulated)
+                panel.update()
+                logger.debug("%s 패널 생산수량 UI 업데이트 완료: %s", panel_name, production_count)
                 
         except Exception as e:
-            print(f"DEBUG: 구분값 변경 시 생산수량 업데이트 오류: {e}")
+            logger.error("구분값 변경 시 생산수량 업데이트 오류: %s", e)
     
     def update_child_parts_from_master_data(self, part_number):
         """기준정보에서 하위부품 정보 업데이트"""
-        print(f"하위부품 정보 업데이트 - Part_No: {part_number}")
+        logger.debug("하위부품 정보 업데이트 - Part_No: %s", part_number)
         
         for part_data in self.master_data:
             if part_data.get("part_number") == part_number:
                 child_parts = part_data.get("child_parts", [])
                 child_count = len(child_parts)
-                print(f"하위부품 정보 발견 - Part_No: {part_number}, 하위부품 수: {child_count}")
-                print(f"하위부품 목록: {child_parts}")
+                logger.debug("하위부품 정보 발견 - Part_No: %s, 하위부품 수: %s", part_number, child_count)
+                logger.debug("하위부품 목록: %s", child_parts)
                 
                 # 해당 부품번호가 어느 패널에 속하는지 확인
-                if hasattr(self.front_panel, 'part_number') and self.front_panel.part_number == part_number:
-                    # FRONT/LH 패널의 하위부품
-                    self.front_panel.update_child_parts_count(child_count)
-                    self.front_panel.reset_child_parts_status()
-                    print(f"FRONT/LH 패널에 하위부품 {child_count}개 표시")
-                elif hasattr(self.rear_panel, 'part_number') and self.rear_panel.part_number == part_number:
-                    # REAR/RH 패널의 하위부품
-                    self.rear_panel.update_child_parts_count(child_count)
-                    self.rear_panel.reset_child_parts_status()
-                    print(f"REAR/RH 패널에 하위부품 {child_count}개 표시")
+                for station, panel in self.iter_panels():
+                    if getattr(panel, 'part_number', None) == part_number:
+                        panel.update_child_parts_count(child_count)
+                        panel.reset_child_parts_status()
+                        logger.debug("%s 패널에 하위부품 %s개 표시", station.name, child_count)
+                        break
                 
                 return
         
-        print(f"하위부품 정보를 찾을 수 없음 - Part_No: {part_number}")
+        logger.debug("하위부품 정보를 찾을 수 없음 - Part_No: %s", part_number)
     
-    def check_child_part_match(self, scanned_part_number):
-        """하위부품 매칭 확인 - 현재 작업 중인 패널에만 적용"""
-        print(f"하위부품 매칭 확인 - 스캔된 부품: {scanned_part_number}")
-        
-        # 현재 작업 중인 패널 확인 (완료신호에 따라)
-        current_panel = None
-        if self.plc_data_manager and self.plc_data_manager.get_plc_data().get("completion_signal") == 1:
-            # FRONT/LH 완료
-            current_panel = self.front_panel
-            print(f"현재 작업 패널 - FRONT/LH")
-        elif self.plc_data_manager and self.plc_data_manager.get_plc_data().get("completion_signal") == 2:
-            # REAR/RH 완료
-            current_panel = self.rear_panel
-            print(f"현재 작업 패널 - REAR/RH")
-        else:
-            print(f"작업 완료 신호 없음 - 하위부품 매칭 생략")
+    def check_child_part_match(self, scanned_part_number, panel_name):
+        """하위부품 매칭 확인 - 작업 흐름 엔진이 스캔을 넣은 패널에만 적용"""
+        logger.debug("하위부품 매칭 확인 - 스캔된 부품: %s", scanned_part_number)
+        
+        station = self.get_station(panel_name)
+        current_panel = self.panels.get(station.name) if station else None
+        if current_panel is None:
+            logger.debug("작업 중인 패널 없음 - 하위부품 매칭 생략")
             return False
+        logger.debug("현재 작업 패널 - %s", station.name)
         
         # 현재 패널의 부품번호로 기준정보에서 하위부품 찾기
         current_part_number = current_panel.part_number
-        print(f"현재 패널 부품번호: {current_part_number}")
+        logger.debug("현재 패널 부품번호: %s", current_part_number)
         
         for part_data in self.master_data:
             if part_data.get("part_number") == current_part_number:
                 child_parts = part_data.get("child_parts", [])
-                print(f"기준정보에서 하위부품 {len(child_parts)}개 발견")
+                logger.debug("기준정보에서 하위부품 %s개 발견", len(child_parts))
                 
                 for i, child_part in enumerate(child_parts):
                     child_part_number = child_part.get("part_number")
-                    print(f"하위부품[{i}]: {child_part_number}")
+                    logger.debug("하위부품[%s]: %s", i, child_part_number)
                     if child_part_number == scanned_part_number:
                         # 매칭된 하위부품 상태 업데이트 (현재 패널에만)
                         current_panel.update_child_part_status(i, True)
-                        print(f"하위부품 매칭 성공 - 패널: {current_panel.title}, 인덱스: {i}")
+                        logger.debug("하위부품 매칭 성공 - 패널: %s, 인덱스: %s", current_panel.title, i)
                         return True
                 break
         
-        print(f"하위부품 매칭 실패 - {scanned_part_number}")
+        logger.error("하위부품 매칭 실패 - %s", scanned_part_number)
         return False
         
     def init_ui(self):
@@ -1087,7 +963,8 @@ class BarcodeMainScreen(QMainWindow):
         
         self.setWindowTitle(f"Data Matrix 바코드 생성 프로그램 v{self.version}")
         self.setGeometry(50, 50, 570, 850)  # 기본창 크기 절반으로 축소 (1140→570, 760→380)
-        self.setStyleSheet(get_main_window_style())
+        # 상태 라벨(장비/작업/구분/하위부품)은 role/state 속성으로 색상 변경 - 테마 규칙은 여기서 한 번만 적용
+        self.setStyleSheet(get_main_window_style() + get_main_state_theme_style())
         
         # 키보드 포커스 설정
         self.setFocusPolicy(Qt.StrongFocus)
@@ -1106,21 +983,21 @@ class BarcodeMainScreen(QMainWindow):
         
         # 헤더 생성 후 사용자 권한 재확인 (디버깅)
         if hasattr(self, 'sim_dialog_btn'):
-            print(f"DEBUG: init_ui 완료 후 권한 재확인 - current_user: {self.current_user}")
+            logger.debug("init_ui 완료 후 권한 재확인 - current_user: %s", self.current_user)
             # LoginDialog에서 사용자 정보 다시 가져오기
             if LoginDialog is not None:
                 if hasattr(LoginDialog, 'get_current_user'):
                     latest_user = LoginDialog.get_current_user()
-                    print(f"DEBUG: LoginDialog.get_current_user(): {latest_user}")
+                    logger.debug("LoginDialog.get_current_user(): %s", latest_user)
                     if latest_user:
                         self.current_user = latest_user
-                        print(f"DEBUG: 사용자 정보 동기화 완료 (get_current_user): {self.current_user}")
+                        logger.debug("사용자 정보 동기화 완료 (get_current_user): %s", self.current_user)
                         self.update_simulation_button_visibility()
                 elif hasattr(LoginDialog, 'current_user'):
-                    print(f"DEBUG: LoginDialog.current_user: {LoginDialog.current_user}")
+                    logger.debug("LoginDialog.current_user: %s", LoginDialog.current_user)
                     if not self.current_user and LoginDialog.current_user:
                         self.current_user = LoginDialog.current_user
-                        print(f"DEBUG: 사용자 정보 동기화 완료: {self.current_user}")
+                        logger.debug("사용자 정보 동기화 완료: %s", self.current_user)
                         self.update_simulation_button_visibility()
         
         # 생산 패널들
@@ -1128,14 +1005,6 @@ class BarcodeMainScreen(QMainWindow):
         
         # 스캔 현황 버튼
         
-        # 창 크기 변경 이벤트 연결
-        self.resizeEvent = self.on_resize_event
-        
-        # 타이머를 사용한 이미지 크기 업데이트 (안전하게)
-        self.image_timer = QTimer()
-        self.image_timer.timeout.connect(self.safe_update_title_image)
-        self.image_timer.start(1000)  # 1초마다 체크 (빈도 감소)
-        
         # 상태바 추가
         self.create_status_bar()
     
@@ -1146,11 +1015,10 @@ class BarcodeMainScreen(QMainWindow):
         header_layout.setContentsMargins(0, 0, 0, 0)
         
         # 제목 이미지 (프레임 없이)
-        self.title_label = QLabel()
         # 상대 경로로 이미지 파일 로드
         image_path = os.path.join("assets", "img", "label_barcodesystem.jpg")
-        print(f"이미지 경로: {image_path}")
-        print(f"파일 존재 여부: {os.path.exists(image_path)}")
+        logger.debug("이미지 경로: %s", image_path)
+        logger.debug("파일 존재 여부: %s", os.path.exists(image_path))
         
         # 대안 경로들도 시도
         alt_paths = [
@@ -1161,12 +1029,12 @@ class BarcodeMainScreen(QMainWindow):
         
         for alt_path in alt_paths:
             if os.path.exists(alt_path):
-                print(f"대안 경로 발견: {alt_path}")
+                logger.debug("대안 경로 발견: %s", alt_path)
                 image_path = alt_path
                 break
         
-        self.title_pixmap = QPixmap(image_path)
-        self.update_title_image()
+        # 원본은 한 번만 로드, 창 크기에 맞춘 축소 이미지는 크기별로 캐시 (크기 조절이 멈춘 뒤 한 번만 다시 그림)
+        self.title_label = TitleImageLabel(image_path, "바코드 시스템 모니터링")
         header_layout.addWidget(self.title_label)
         
         
@@ -1225,8 +1093,8 @@ class BarcodeMainScreen(QMainWindow):
     def update_simulation_button_visibility(self):
         """시뮬레이션 버튼 표시/숨김 제어 (권한에 따라)"""
         try:
-            print(f"DEBUG: 시뮬레이션 버튼 표시 제어 시작")
-            print(f"DEBUG: self.current_user: {self.current_user}")
+            logger.debug("시뮬레이션 버튼 표시 제어 시작")
+            logger.debug("self.current_user: %s", self.current_user)
             
             # LoginDialog에서 사용자 정보 가져오기 (여러 방법 시도)
             user_info = None
@@ -1236,40 +1104,40 @@ class BarcodeMainScreen(QMainWindow):
             if self.current_user:
                 user_info = self.current_user
                 user_role = user_info.get('role')
-                print(f"DEBUG: self.current_user에서 사용자 정보 가져옴: {user_info}")
+                logger.debug("self.current_user에서 사용자 정보 가져옴: %s", user_info)
             # 2. get_current_user() 메서드 사용
             elif LoginDialog is not None and hasattr(LoginDialog, 'get_current_user'):
                 user_info = LoginDialog.get_current_user()
                 if user_info:
                     user_role = user_info.get('role')
                     self.current_user = user_info  # 동기화
-                    print(f"DEBUG: LoginDialog.get_current_user()에서 가져옴: {user_info}")
+                    logger.debug("LoginDialog.get_current_user()에서 가져옴: %s", user_info)
             # 3. 클래스 변수 직접 확인
             elif LoginDialog is not None and hasattr(LoginDialog, 'current_user'):
                 user_info = LoginDialog.current_user
                 if user_info:
                     user_role = user_info.get('role')
                     self.current_user = user_info  # 동기화
-                    print(f"DEBUG: LoginDialog.current_user에서 직접 가져옴: {user_info}")
+                    logger.debug("LoginDialog.current_user에서 직접 가져옴: %s", user_info)
             
-            print(f"DEBUG: 최종 user_role: {user_role}")
-            print(f"DEBUG: 최종 user_info: {user_info}")
+            logger.debug("최종 user_role: %s", user_role)
+            logger.debug("최종 user_info: %s", user_info)
             
             # admin 권한인 경우에만 버튼 표시
             if user_role == 'admin':
                 if hasattr(self, 'sim_dialog_btn'):
                     self.sim_dialog_btn.setVisible(True)
-                    print("DEBUG: ✅ admin 권한 - 시뮬레이션 버튼 표시")
+                    logger.debug("✅ admin 권한 - 시뮬레이션 버튼 표시")
                 else:
-                    print("DEBUG: ⚠️ sim_dialog_btn 속성이 없습니다")
+                    logger.warning("⚠️ sim_dialog_btn 속성이 없습니다")
             else:
                 if hasattr(self, 'sim_dialog_btn'):
                     self.sim_dialog_btn.setVisible(False)
-                    print(f"DEBUG: ❌ user 권한 또는 권한 없음 (role: {user_role}) - 시뮬레이션 버튼 숨김")
+                    logger.error("❌ user 권한 또는 권한 없음 (role: %s) - 시뮬레이션 버튼 숨김", user_role)
                 else:
-                    print("DEBUG: ⚠️ sim_dialog_btn 속성이 없습니다")
+                    logger.warning("⚠️ sim_dialog_btn 속성이 없습니다")
         except Exception as e:
-            print(f"DEBUG: 시뮬레이션 버튼 표시 제어 오류: {e}")
+            logger.error("시뮬레이션 버튼 표시 제어 오류: %s", e)
             import traceback
             traceback.print_exc()
             # 오류 발생 시 안전하게 숨김
@@ -1303,7 +1171,7 @@ class BarcodeMainScreen(QMainWindow):
     
     def increment_build_number(self):
         """빌드 번호 증가 (개발용) - 비활성화"""
-        print("빌드 번호 증가 기능이 비활성화되었습니다.")
+        logger.info("빌드 번호 증가 기능이 비활성화되었습니다.")
     
     def get_build_info(self):
         """현재 빌드 정보 반환 - 기본 정보"""
@@ -1318,6 +1186,7 @@ class BarcodeMainScreen(QMainWindow):
     def open_plc_simulation_dialog(self):
         """PLC 시뮬레이션 다이얼로그 열기"""
         if not hasattr(self, 'plc_simulation_dialog') or self.plc_simulation_dialog is None:
+            from modules.ui.plc_simulation_dialog import PLCSimulationDialog
             self.plc_simulation_dialog = PLCSimulationDialog(self)
             # 시그널 연결
             self.plc_simulation_dialog.signal_sent.connect(self.handle_plc_simulation_signal)
@@ -1326,14 +1195,14 @@ class BarcodeMainScreen(QMainWindow):
         self.plc_simulation_dialog.raise_()
         self.plc_simulation_dialog.activateWindow()
         
-    def handle_plc_simulation_signal(self, completion_signal, front_division, rear_division):
-        """PLC 시뮬레이션 신호 처리"""
-        print(f"PLC 시뮬레이션 신호 수신: 신호={completion_signal}, FRONT/LH={front_division}, REAR/RH={rear_division}")
+    def handle_plc_simulation_signal(self, completion_signal, *divisions):
+        """PLC 시뮬레이션 신호 처리 - 구분값은 스테이션 순서"""
+        logger.debug("PLC 시뮬레이션 신호 수신: 신호=%s, 구분값=%s", completion_signal, divisions)
         
         # PLC 데이터 매니저가 시뮬레이션 모드인지 확인
         if hasattr(self, 'plc_data_manager') and self.plc_data_manager:
             if not self.plc_data_manager.simulation_mode:
-                print("시뮬레이션 모드로 전환 중...")
+                logger.info("시뮬레이션 모드로 전환 중...")
                 # 시뮬레이션 모드로 재초기화
                 self.plc_data_manager = PLCDataManager(self, simulation_mode=True)
                 self.plc_data_manager.set_serial_connections(self.serial_connections)
@@ -1342,70 +1211,66 @@ class BarcodeMainScreen(QMainWindow):
             # 시뮬레이션 모드에서는 PLC 연결 상태를 True로 설정
             self.device_connection_status["PLC"] = True
             self.plc_data_manager.set_device_connection_status(self.device_connection_status)
-            print("시뮬레이션 모드: PLC 연결 상태를 True로 설정")
+            logger.info("시뮬레이션 모드: PLC 연결 상태를 True로 설정")
             
             # 시뮬레이션 데이터 설정
             simulation_data = {
                 "completion_signal": completion_signal,
-                "front_lh_division": front_division,
-                "rear_rh_division": rear_division,
                 "cycle_count": getattr(self.plc_data_manager, 'simulation_data', {}).get('cycle_count', 0) + 1
             }
+            for station, division in zip(self.station_layout, divisions):
+                simulation_data[station.division_field] = division
             
             self.plc_data_manager.set_simulation_data(simulation_data)
             
             # PLC 데이터 업데이트
             self.plc_data_manager._update_plc_data_from_simulation()
             
-            # UI 업데이트
+            # UI 업데이트 (작업 흐름 엔진에 PLC 이벤트 전달 - 작업완료/출력은 엔진 이벤트로 처리)
             self.plc_data_manager._update_plc_ui()
             
-            # 출력 확인 및 실행
-            self.check_and_execute_print()
+            # 작업중(0) 신호면 출력 상태 초기화
+            self.check_work_start_signal()
             
-            print("PLC 시뮬레이션 신호가 메인 화면에 적용되었습니다.")
+            logger.info("PLC 시뮬레이션 신호가 메인 화면에 적용되었습니다.")
         else:
-            print("PLC 데이터 매니저가 초기화되지 않았습니다.")
+            logger.info("PLC 데이터 매니저가 초기화되지 않았습니다.")
     
     def set_plc_simulation_data(self, data):
         """PLC 시뮬레이션 데이터 수동 설정"""
         if hasattr(self, 'plc_data_manager') and self.plc_data_manager:
             self.plc_data_manager.set_simulation_data(data)
         else:
-            print("PLC 데이터 매니저가 초기화되지 않았습니다.")
+            logger.info("PLC 데이터 매니저가 초기화되지 않았습니다.")
     
     def create_production_panels(self, layout):
         """생산 패널들 생성"""
-        print(f"create_production_panels 호출됨")
-        print(f"현재 패널 타이틀: {self.panel_titles}")
+        logger.debug("create_production_panels 호출됨")
+        logger.debug("현재 패널 타이틀: %s", self.panel_titles)
         
         # 생산 패널들
         panels_layout = QHBoxLayout()
         panels_layout.setSpacing(20)
         
-        # FRONT/LH 패널
-        print(f"front_panel 생성 - 타이틀: {self.panel_titles['front_lh']}")
-        self.front_panel = ProductionPanel(
-            self.panel_titles["front_lh"], 
-            "123456789", 
-            "프론트 도어 핸들", 
-            "A001",
-            self.device_press_callback
-        )
-        self.front_panel.main_window = self  # main_window 참조 설정
-        panels_layout.addWidget(self.front_panel)
-        
-        # REAR/RH 패널
-        print(f"rear_panel 생성 - 타이틀: {self.panel_titles['rear_rh']}")
-        self.rear_panel = ProductionPanel(
-            self.panel_titles["rear_rh"], 
-            "987654321", 
-            "리어 도어 핸들", 
-            "B001",
-            self.device_press_callback
-        )
-        self.rear_panel.main_window = self  # main_window 참조 설정
-        panels_layout.addWidget(self.rear_panel)
+        # 스테이션별 패널
+        for station in self.station_layout:
+            logger.debug("%s 패널 생성 - 타이틀: %s", station.name, self.panel_titles.get(station.key, station.title))
+            panel = ProductionPanel(
+                self.panel_titles.get(station.key, station.title), 
+                station.part_number, 
+                station.part_name, 
+                station.division,
+                self.device_press_callback,
+                max_children=station.max_children
+            )
+            panel.main_window = self  # main_window 참조 설정
+            self.panels[station.name] = panel
+            panels_layout.addWidget(panel)
+        
+        # 기존 2패널 참조 (첫 번째/두 번째 스테이션)
+        panel_list = list(self.panels.values())
+        self.front_panel = panel_list[0] if len(panel_list) > 0 else None
+        self.rear_panel = panel_list[1] if len(panel_list) > 1 else None
         
         layout.addLayout(panels_layout)
     
@@ -1422,30 +1287,71 @@ class BarcodeMainScreen(QMainWindow):
         self.timer.timeout.connect(self.update_datetime)
         self.timer.start(1000)  # 1초마다 업데이트
         self.update_datetime()
+        
+        # 생산 속도 지표 표시 (완료 이벤트마다가 아니라 일정 주기로만 갱신)
+        refresh_ms = int(self.config.get("production_metrics", {}).get("refresh_ms", 2000))
+        self.throughput_timer = QTimer()
+        self.throughput_timer.timeout.connect(self.update_throughput_display)
+        self.throughput_timer.start(refresh_ms)
+    
+    def update_throughput_display(self):
+        """패널별 생산 속도 지표(UPH, 사이클타임, 비가동) 표시 갱신"""
+        try:
+            for panel_name, panel in self.panels.items():
+                panel.update_throughput(self.throughput_metrics.snapshot(panel_name))
+        except Exception as e:
+            logger.error("생산 속도 지표 표시 오류: %s", e)
+    
+    def start_background_serial_connection(self):
+        """장비 포트 열기를 작업 스레드에서 시작 (Qt 객체는 건드리지 않음 - 결과는 화면 표시 후 반영)"""
+        self._serial_connect_results = None
+        
+        def connect_all():
+            with startup_report.phase("장비 포트 연결"):
+                self._serial_connect_results = self.serial_connector.auto_connect_all_devices()
+        
+        self._serial_connect_thread = threading.Thread(target=connect_all, name="startup-serial", daemon=True)
+        self._serial_connect_thread.start()
     
     def setup_delayed_serial_connection(self):
-        """지연된 시리얼 연결 설정 - 메인화면 표시 후 실행"""
-        # 2초 후에 시리얼 연결 시도
+        """시리얼 연결 결과 반영 - 메인화면 표시 후 작업 스레드가 끝나면 실행"""
         self.serial_connection_timer = QTimer()
         self.serial_connection_timer.timeout.connect(self.delayed_auto_connect_serial_ports)
-        self.serial_connection_timer.setSingleShot(True)
-        self.serial_connection_timer.start(2000)  # 2초 후 실행
-        print("지연된 시리얼 연결 타이머 설정 완료 (2초 후 실행)")
+        self.serial_connection_timer.start(100)  # 100ms마다 작업 스레드 완료 확인
+        logger.info("시리얼 연결 결과 확인 타이머 설정 완료")
+        
+        # 스캔현황 다이얼로그 모듈은 화면 표시 직후 미리 import (첫 스캔 지연 방지)
+        QTimer.singleShot(0, self.warm_up_deferred_modules)
+    
+    def warm_up_deferred_modules(self):
+        """화면 표시 후 자주 쓰는 다이얼로그 모듈 미리 로드 + 시작 보고서 마무리"""
+        startup_report.mark("메인 화면 표시")
+        try:
+            with startup_report.phase("스캔현황 다이얼로그 import"):
+                importlib.import_module("modules.ui.scan_status_dialog")
+        except Exception as e:
+            logger.error("스캔현황 다이얼로그 모듈 로드 실패: %s", e)
     
     def delayed_auto_connect_serial_ports(self):
-        """지연된 시리얼 포트 자동 연결"""
+        """작업 스레드의 시리얼 포트 자동 연결 결과 반영"""
+        thread = getattr(self, '_serial_connect_thread', None)
+        if thread is not None and thread.is_alive():
+            return
+        self.serial_connection_timer.stop()
         try:
-            print("지연된 시리얼 포트 자동 연결 시작")
-            self.auto_connect_serial_ports()
+            logger.info("시리얼 포트 자동 연결 결과 반영")
+            self.auto_connect_serial_ports(getattr(self, '_serial_connect_results', None))
+            startup_report.mark("장비 연결 반영")
         except Exception as e:
-            print(f" 지연된 시리얼 포트 자동 연결 실패: {e}")
+            logger.error("지연된 시리얼 포트 자동 연결 실패: %s", e)
             # 시리얼 연결 실패 시에도 모든 장비를 연결 끊김 상태로 설정
             self.set_all_devices_disconnected()
+        startup_report.finish()
     
     def set_all_devices_disconnected(self):
         """모든 장비를 연결 끊김 상태로 설정"""
         try:
-            print("모든 장비를 연결 끊김 상태로 설정")
+            logger.debug("모든 장비를 연결 끊김 상태로 설정")
             
             # 장비 연결 상태를 모두 False로 설정
             for device_name in self.device_connection_status.keys():
@@ -1457,44 +1363,36 @@ class BarcodeMainScreen(QMainWindow):
                     self.serial_connector.device_connection_status[device_name] = False
             
             # 모든 패널의 장비 상태를 연결 끊김으로 업데이트
-            for device_name in self.device_connection_status.keys():
-                self.front_panel.update_device_status(device_name, False)
-                self.rear_panel.update_device_status(device_name, False)
-            
-            # PLC 연결 상태를 끊김으로 표시
-            self.front_panel.update_plc_connection_display('disconnected')
-            self.rear_panel.update_plc_connection_display('disconnected')
+            for panel in self.panels.values():
+                for device_name in self.device_connection_status.keys():
+                    panel.update_device_status(device_name, False)
+                
+                # PLC 연결 상태를 끊김으로 표시
+                panel.update_plc_connection_display('disconnected')
             
-            print("모든 장비 연결 끊김 상태 설정 완료")
+            logger.debug("모든 장비 연결 끊김 상태 설정 완료")
             
         except Exception as e:
-            print(f" 장비 상태 설정 실패: {e}")
+            logger.error("장비 상태 설정 실패: %s", e)
     
     def update_all_device_status_ui(self, connection_results):
         """모든 장비의 연결 상태를 UI에 업데이트"""
         try:
-            print("모든 장비 상태 UI 업데이트 시작")
+            logger.debug("모든 장비 상태 UI 업데이트 시작")
             
             for device_name, is_connected in connection_results.items():
-                print(f"{device_name} 상태 업데이트 - 연결됨: {is_connected}")
-                
-                # 각 패널의 장비 상태 업데이트
-                self.front_panel.update_device_status(device_name, is_connected)
-                self.rear_panel.update_device_status(device_name, is_connected)
+                logger.debug("%s 상태 업데이트 - 연결됨: %s", device_name, is_connected)
                 
-                # PLC 연결 상태에 따른 특별 처리
-                if device_name == "PLC":
-                    if is_connected:
-                        self.front_panel.update_plc_connection_display('connected')
-                        self.rear_panel.update_plc_connection_display('connected')
-                    else:
-                        self.front_panel.update_plc_connection_display('disconnected')
-                        self.rear_panel.update_plc_connection_display('disconnected')
+                # 각 패널의 장비 상태 업데이트 (PLC 는 연결 상태 표시도 함께)
+                for panel in self.panels.values():
+                    panel.update_device_status(device_name, is_connected)
+                    if device_name == "PLC":
+                        panel.update_plc_connection_display('connected' if is_connected else 'disconnected')
             
-            print("모든 장비 상태 UI 업데이트 완료")
+            logger.debug("모든 장비 상태 UI 업데이트 완료")
             
         except Exception as e:
-            print(f" 장비 상태 UI 업데이트 실패: {e}")
+            logger.error("장비 상태 UI 업데이트 실패: %s", e)
     
     def update_datetime(self):
         """날짜/시간 업데이트"""
@@ -1506,451 +1404,59 @@ class BarcodeMainScreen(QMainWindow):
         self.date_label.setText(date_str)
         self.time_label.setText(time_str)
     
-    def update_title_image(self):
-        """타이틀 이미지 크기 업데이트 - 레이아웃 변경 방지"""
-        if not self.title_pixmap.isNull():
-            # 이미지만 업데이트하고 크기는 변경하지 않음
-            self.title_label.setPixmap(self.title_pixmap)
-            self.title_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            # setFixedSize 제거 - 레이아웃 변경 방지
-            print(f"타이틀 이미지 업데이트 (크기 변경 없음)")
-        else:
-            # 이미지 로드 실패 시 텍스트로 대체
-            self.title_label.setText("바코드 시스템 모니터링")
-            self.title_label.setFont(FontManager.get_dialog_title_font())
-            self.title_label.setStyleSheet(get_main_scan_title_style())
-    
-    def on_resize_event(self, event):
-        """창 크기 변경 이벤트 핸들러 - 레이아웃 변경 방지"""
-        super().resizeEvent(event)
-        # 이미지 크기 업데이트 (레이아웃 변경 없이)
-        try:
-            self.update_title_image()
-        except Exception as e:
-            print(f"타이틀 이미지 업데이트 오류: {e}")
-    
-    def safe_update_title_image(self):
-        """안전한 타이틀 이미지 업데이트 - 레이아웃 변경 방지"""
-        try:
-            # 이미지가 로드되었고 현재 라벨에 이미지가 없을 때만 업데이트
-            if not self.title_pixmap.isNull() and self.title_label.pixmap().isNull():
-                self.title_label.setPixmap(self.title_pixmap)
-                self.title_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                print(f"안전한 타이틀 이미지 업데이트")
-        except Exception as e:
-            print(f"안전한 타이틀 이미지 업데이트 오류: {e}")
-    
-    def check_duplicate_part(self, part_number):
-        """중복 투입 방지 - 과거 스캔 데이터에서 중복 체크"""
-        print(f"중복 투입 방지 체크 시작 - 부품번호: {part_number}")
+    def add_scanned_part(self, scan_data):
+        """하위부품 스캔 결과 반영 - 검증/중복/패널 판단은 작업 흐름 엔진이 한 결과(ScanRecord)를 기록·표시만 함"""
+        logger.debug("===== 하위부품 스캔 반영 ===== %s (%s, 패널: %s)", scan_data.part_number, scan_data.status, scan_data.panel)
+        logger.debug("원본 바코드 데이터: %s", scan_data.raw_data)
         
-        # TODO: 나중에 실제 중복 방지를 활성화하려면 아래 변수를 False로 변경
-        ALWAYS_ALLOW_DUPLICATE = True  # 하드코딩: 항상 중복 허용 (테스트 편의성)
+        # 하위부품 매칭 표시 (엔진이 정한 패널에만)
+        if scan_data.is_ok:
+            self.check_child_part_match(scan_data.part_number, scan_data.panel)
         
-        if ALWAYS_ALLOW_DUPLICATE:
-            print(f"🔧 중복 체크 하드코딩 모드 - 항상 중복 허용 (테스트 편의성)")
-            
-            # 하드코딩 모드에서도 실제 중복 체크 과정을 시뮬레이션
-            self.simulate_duplicate_check_process(part_number)
-            return False  # 항상 중복이 아님 (통과)
+        # ===== 스캔 세션 저장소에 1회 추가 =====
+        # 최근 부품/현재 작업(임시보관·전역·스캔현황)/히스토리/패널별 뷰가 같은 레코드를 공유
+        self.scan_session.add(scan_data)
+        logger.debug("스캔 세션 저장: %s (현재 작업 %s개 항목)", scan_data, len(self.scan_session.current))
         
-        # 실제 중복 체크 로직 (현재는 비활성화)
-        try:
-            # 1. 현재 세션의 스캔된 부품 목록에서 체크
-            for scanned_part, _ in self.scanned_parts:
-                if scanned_part == part_number:
-                    print(f"DEBUG: ⚠️ 현재 세션에서 중복 발견: {part_number}")
-                    return True
-            
-            # 2. 파일에서 과거 스캔 데이터 체크
-            import json
-            try:
-                with open('data/scan_data_backup.json', 'r', encoding='utf-8') as f:
-                    file_data = json.load(f)
-                
-                for scan_data in file_data:
-                    if scan_data.get('part_number') == part_number:
-                        print(f"DEBUG: ⚠️ 과거 데이터에서 중복 발견: {part_number}")
-                        return True
-                        
-            except FileNotFoundError:
-                print(f"DEBUG: 스캔 데이터 파일이 없음 - 중복 체크 불가")
-            except Exception as e:
-                print(f"DEBUG: 파일 읽기 오류: {e}")
-            
-            print(f"DEBUG: ✅ 중복 없음 - 부품번호 '{part_number}'은(는) 새로 스캔된 부품입니다.")
-            return False
-            
-        except Exception as e:
-            print(f"DEBUG: 중복 체크 오류: {e}")
-            return False  # 오류 시 중복이 아닌 것으로 처리
-    
-    def simulate_duplicate_check_process(self, part_number):
-        """하드코딩 모드에서 중복 체크 과정 시뮬레이션"""
-        try:
-            print(f"🔍 중복 체크 시뮬레이션 시작 - 부품번호: {part_number}")
-            
-            # 1. 현재 세션 체크 시뮬레이션
-            current_session_count = 0
-            for scanned_part, _ in self.scanned_parts:
-                if scanned_part == part_number:
-                    current_session_count += 1
-            
-            if current_session_count > 0:
-                print(f"📋 현재 세션에서 {current_session_count}번 스캔됨 (시뮬레이션)")
-            else:
-                print(f"📋 현재 세션에서 중복 없음 (시뮬레이션)")
-            
-            # 2. 과거 데이터 체크 시뮬레이션
-            import json
-            try:
-                with open('data/scan_data_backup.json', 'r', encoding='utf-8') as f:
-                    file_data = json.load(f)
-                
-                past_scan_count = 0
-                for scan_data in file_data:
-                    if scan_data.get('part_number') == part_number:
-                        past_scan_count += 1
-                        scan_time = scan_data.get('time', '알 수 없음')
-                        scan_status = scan_data.get('status', '알 수 없음')
-                        print(f"📁 과거 데이터에서 발견 - 시간: {scan_time}, 상태: {scan_status} (시뮬레이션)")
-                
-                if past_scan_count > 0:
-                    print(f"📁 과거 데이터에서 총 {past_scan_count}번 스캔됨 (시뮬레이션)")
-                else:
-                    print(f"📁 과거 데이터에서 중복 없음 (시뮬레이션)")
-                    
-            except FileNotFoundError:
-                print(f"📁 스캔 데이터 파일이 없음 - 과거 데이터 체크 불가 (시뮬레이션)")
-            except Exception as e:
-                print(f"📁 파일 읽기 오류: {e} (시뮬레이션)")
-            
-            print(f"🔍 중복 체크 시뮬레이션 완료 - 부품번호: {part_number}")
-            
-        except Exception as e:
-            print(f"중복 체크 시뮬레이션 오류: {e}")
-    
-    def add_scanned_part(self, part_number, is_ok=True, raw_barcode_data=None):
-        """하위부품 스캔 추가 (선행조건) - HKMC 바코드 검증 방식 적용"""
-        print(f"===== 하위부품 스캔 처리 시작 ===== {part_number}")
-        print(f"원본 바코드 데이터: {raw_barcode_data}")
-        
-        # ===== 중복 투입 방지 로직 (현재는 항상 통과) =====
-        # TODO: 나중에 실제 중복 방지 기능을 활성화하려면 아래 변수를 False로 변경
-        DUPLICATE_CHECK_ENABLED = True  # 하드코딩: 항상 참 (테스트 편의성)
-        
-        if DUPLICATE_CHECK_ENABLED:
-            # 중복 투입 방지 체크 (현재는 항상 통과)
-            is_duplicate = self.check_duplicate_part(part_number)
-            if is_duplicate:
-                print(f"DEBUG: ⚠️ 중복 투입 방지 - 부품번호 '{part_number}'이 이미 스캔되었습니다!")
-                # TODO: 나중에 실제 중복 방지를 활성화하려면 아래 주석을 해제
-                # return  # 중복이면 스캔 처리 중단
-            else:
-                print(f"DEBUG: ✅ 중복 체크 통과 - 부품번호 '{part_number}'은(는) 새로 스캔된 부품입니다.")
-        else:
-            print(f"DEBUG: 중복 투입 방지 기능이 비활성화되어 있습니다.")
-        
-        # 하위부품 바코드 검증 (HKMC 방식) - 원본 바코드 데이터 사용
-        barcode_to_validate = raw_barcode_data if raw_barcode_data else part_number
-        print(f"DEBUG: 검증할 바코드: {barcode_to_validate}")
-        is_valid, errors, barcode_info = self.child_part_validator.validate_child_part_barcode(barcode_to_validate)
-        
-        if not is_valid:
-            print(f"DEBUG: 하위부품 바코드 검증 실패 - {part_number}")
-            print(f"DEBUG: 검증 오류: {errors}")
-            is_ok = False
-        else:
-            print(f"DEBUG: 하위부품 바코드 검증 성공 - {part_number}")
-            print(f"DEBUG: 바코드 정보: {barcode_info}")
-            # HKMC 바코드에서 추출된 부품번호 사용
-            extracted_part_number = barcode_info.get('part_number', part_number)
-            print(f"DEBUG: 추출된 부품번호: {extracted_part_number}")
-            is_ok = True
-        
-        # 추출된 부품번호로 스캔된 부품 목록에 추가
-        final_part_number = barcode_info.get('part_number', part_number) if is_ok else part_number
-        self.scanned_parts.insert(0, (final_part_number, is_ok))
-        
-        # 최대 20개까지만 유지
-        if len(self.scanned_parts) > 20:
-            self.scanned_parts = self.scanned_parts[:20]
-        
-        # 하위부품 매칭 확인
-        if is_ok:
-            self.check_child_part_match(final_part_number)
-        
-        # 스캔 데이터를 전역 변수로 저장 (확실한 방법)
-        from datetime import datetime
-        scan_time = datetime.now().strftime("%H:%M:%S")
-        
-        # 현재 작업 중인 패널 확인 (PLC 데이터 직접 확인 - 가장 정확)
-        current_panel = None
-        
-        # PLC 데이터를 직접 확인하여 정확한 패널 구분
-        if hasattr(self, 'plc_data_manager') and self.plc_data_manager:
-            plc_data = self.plc_data_manager.get_plc_data()
-            completion_signal = plc_data.get("completion_signal", 0)
-            front_lh_division = plc_data.get("front_lh_division", "")
-            rear_rh_division = plc_data.get("rear_rh_division", "")
-            
-            print(f"DEBUG: PLC 데이터 확인 - completion_signal: {completion_signal}, front_lh_division: {front_lh_division}, rear_rh_division: {rear_rh_division}")
-            
-            if completion_signal == 1:
-                # FRONT/LH 완료 상태
-                current_panel = "FRONT/LH"
-                print(f"DEBUG: ✅ PLC 완료신호 1 → FRONT/LH")
-            elif completion_signal == 2:
-                # REAR/RH 완료 상태
-                current_panel = "REAR/RH"
-                print(f"DEBUG: ✅ PLC 완료신호 2 → REAR/RH")
-            elif completion_signal == 0:
-                # 작업 중 상태 - 스캔 현황 다이얼로그 제목을 최우선 확인 (가장 정확함)
-                if hasattr(self, 'scan_status_dialog') and self.scan_status_dialog:
-                    dialog_title = self.scan_status_dialog.windowTitle()
-                    print(f"DEBUG: 스캔 현황 다이얼로그 제목: {dialog_title}")
-                    if "FRONT" in dialog_title or "LH" in dialog_title:
-                        current_panel = "FRONT/LH"
-                        print(f"DEBUG: ✅ 스캔 현황 다이얼로그 제목에서 FRONT/LH 확인 → FRONT/LH")
-                    elif "REAR" in dialog_title or "RH" in dialog_title:
-                        current_panel = "REAR/RH"
-                        print(f"DEBUG: ✅ 스캔 현황 다이얼로그 제목에서 REAR/RH 확인 → REAR/RH")
-                
-                # 다이얼로그 제목으로 판단할 수 없는 경우, 스캔된 하위부품이 어느 패널의 기준정보에 속하는지 확인
-                if not current_panel:
-                    print(f"DEBUG: ⚠️ 다이얼로그 제목으로 판단 불가 - 스캔된 하위부품으로 패널 판단 시도")
-                    scanned_part_found = False
-                    
-                    # 스캔된 하위부품이 어느 패널의 기준정보에 속하는지 확인
-                    if hasattr(self, 'master_data') and self.master_data and final_part_number:
-                        # FRONT/LH 패널의 부품번호 가져오기
-                        front_part_number = None
-                        if hasattr(self, 'front_panel') and self.front_panel:
-                            front_part_number = getattr(self.front_panel, 'part_number', None)
-                        
-                        # REAR/RH 패널의 부품번호 가져오기
-                        rear_part_number = None
-                        if hasattr(self, 'rear_panel') and self.rear_panel:
-                            rear_part_number = getattr(self.rear_panel, 'part_number', None)
-                        
-                        print(f"DEBUG: 스캔된 하위부품: {final_part_number}")
-                        print(f"DEBUG: FRONT/LH 부품번호: {front_part_number}")
-                        print(f"DEBUG: REAR/RH 부품번호: {rear_part_number}")
-                        
-                        # 기준정보에서 각 패널의 하위부품 확인
-                        for part_data in self.master_data:
-                            part_number = part_data.get('part_number', '')
-                            child_parts = part_data.get('child_parts', [])
-                            
-                            # 하위부품 목록에서 스캔된 부품 확인
-                            for child_part in child_parts:
-                                child_part_number = child_part.get('part_number', '')
-                                if child_part_number == final_part_number:
-                                    # 스캔된 하위부품이 이 부품의 하위부품인 경우
-                                    if part_number == front_part_number:
-                                        current_panel = "FRONT/LH"
-                                        scanned_part_found = True
-                                        print(f"DEBUG: ✅ 스캔된 하위부품 {final_part_number}이 FRONT/LH 부품 {part_number}의 하위부품임 → FRONT/LH")
-                                        break
-                                    elif part_number == rear_part_number:
-                                        current_panel = "REAR/RH"
-                                        scanned_part_found = True
-                                        print(f"DEBUG: ✅ 스캔된 하위부품 {final_part_number}이 REAR/RH 부품 {part_number}의 하위부품임 → REAR/RH")
-                                        break
-                            
-                            if scanned_part_found:
-                                break
-                
-                # 여전히 판단할 수 없는 경우, 구분값으로 판단
-                if not current_panel:
-                    if rear_rh_division and not front_lh_division:
-                        current_panel = "REAR/RH"
-                        print(f"DEBUG: ⚠️ 구분값으로 판단 - REAR/RH 구분값만 있음 → REAR/RH")
-                    elif front_lh_division and not rear_rh_division:
-                        current_panel = "FRONT/LH"
-                        print(f"DEBUG: ⚠️ 구분값으로 판단 - FRONT/LH 구분값만 있음 → FRONT/LH")
-                    elif rear_rh_division and front_lh_division:
-                        # 두 패널 모두 구분값이 있는 경우, 패널 객체의 work_status 확인
-                        if hasattr(self, 'rear_panel') and self.rear_panel and hasattr(self.rear_panel, 'work_status'):
-                            if self.rear_panel.work_status == 1:  # REAR/RH 완료 또는 작업 중
-                                current_panel = "REAR/RH"
-                                print(f"DEBUG: ⚠️ work_status로 판단 - REAR/RH work_status=1 → REAR/RH")
-                        if not current_panel and hasattr(self, 'front_panel') and self.front_panel and hasattr(self.front_panel, 'work_status'):
-                            if self.front_panel.work_status == 1:  # FRONT/LH 완료 또는 작업 중
-                                current_panel = "FRONT/LH"
-                                print(f"DEBUG: ⚠️ work_status로 판단 - FRONT/LH work_status=1 → FRONT/LH")
-                        
-                        # 여전히 판단 불가능한 경우, rear_rh 우선 (더 일반적)
-                        if not current_panel:
-                            current_panel = "REAR/RH"
-                            print(f"DEBUG: ⚠️ 모든 판단 방법 실패 → REAR/RH (기본값)")
-                    else:
-                        # 구분값이 없는 경우 기본값
-                        current_panel = "FRONT/LH"
-                        print(f"DEBUG: ⚠️ 작업중 - 구분값 없음 → FRONT/LH (기본값)")
-        
-        # PLC 데이터로 패널을 확인할 수 없는 경우에만 패널 객체 기반 확인
-        if not current_panel:
-            # FRONT/LH 패널 확인
-            if hasattr(self, 'front_panel') and self.front_panel and hasattr(self.front_panel, 'part_number') and self.front_panel.part_number:
-                current_panel = "FRONT/LH"
-                print(f"DEBUG: ⚠️ 패널 객체 기반 - FRONT/LH 작업 중 - 부품번호: {self.front_panel.part_number}")
-            
-            # REAR/RH 패널 확인
-            if hasattr(self, 'rear_panel') and self.rear_panel and hasattr(self.rear_panel, 'part_number') and self.rear_panel.part_number:
-                current_panel = "REAR/RH"
-                print(f"DEBUG: ⚠️ 패널 객체 기반 - REAR/RH 작업 중 - 부품번호: {self.rear_panel.part_number}")
-        
-        print(f"DEBUG: ✅ 최종 결정된 현재 작업 중인 패널: {current_panel}")
-        
-        scan_data = {
-            'time': scan_time,
-            'part_number': final_part_number,
-            'is_ok': is_ok,
-            'status': 'OK' if is_ok else 'NG',
-            'raw_data': raw_barcode_data,  # 원본 바코드 데이터 그대로 보존 (ASCII 제어문자 포함)
-            'panel': current_panel  # 패널 구분 정보 추가
-        }
-        
-        # ===== 새로운 데이터 관리 방식 =====
-        # 1. 임시보관 데이터에 추가 (현재 작업용)
-        self.add_to_temp_scan_data(scan_data)
-        
-        # 2. 히스토리 데이터에 추가 (영구 저장)
-        self.add_to_scan_history(scan_data)
-        
-        # 3. 기존 호환성을 위한 전역 데이터도 업데이트
-        self.global_scan_data.insert(0, scan_data)
-        print(f"DEBUG: 전역 스캔 데이터 저장: {scan_data}")
-        print(f"DEBUG: 전역 저장된 데이터: {len(self.global_scan_data)}개 항목")
-        
-        # 저장된 데이터 상세 확인
-        for i, data in enumerate(self.global_scan_data):
-            print(f"DEBUG: 전역 저장된 데이터 {i}: {data}")
-        
-        # 4. 파일로도 저장 (확실한 방법)
-        import json
-        try:
-            with open('data/scan_data_backup.json', 'w', encoding='utf-8') as f:
-                json.dump(self.global_scan_data, f, ensure_ascii=False, indent=2)
-            print(f"DEBUG: 스캔 데이터 파일 저장 완료")
-        except Exception as e:
-            print(f"DEBUG: 스캔 데이터 파일 저장 실패: {e}")
-        
-        # 5. 프린트용 데이터 저장 (공정바코드 + 하위부품 데이터)
+        # 프린트용 데이터 저장 (공정바코드 + 하위부품 데이터)
         self.save_print_data(scan_data)
         
-        # 6. scan_status_data에도 저장 (기존 방식 유지)
-        if not hasattr(self, 'scan_status_data'):
-            self.scan_status_data = {
-                'real_time_scanned_data': [],
-                'child_parts_info': [],
-                'current_panel_title': ''
-            }
-        
-        self.scan_status_data['real_time_scanned_data'].insert(0, scan_data)
-        print(f"DEBUG: 스캔 데이터 임시 저장: {scan_data}")
-        print(f"DEBUG: 임시 저장된 데이터: {len(self.scan_status_data['real_time_scanned_data'])}개 항목")
-        
-        # 스캔 로그 저장 (스캔된 데이터에서 패널 정보 추출) - UI 업데이트와 분리
+        # 스캔 로그 저장 - UI 업데이트와 분리
         try:
-            # 스캔 데이터의 panel 정보를 우선 사용 (가장 정확함)
-            scan_panel = scan_data.get('panel', '')
-            print(f"DEBUG: 스캔 데이터 패널 정보: {scan_panel}")
-            
-            # 스캔 로그 저장 시점의 완료신호 확인 (스캔 시점과 다를 수 있음)
-            log_panel = None
-            if hasattr(self, 'plc_data_manager') and self.plc_data_manager:
-                plc_data = self.plc_data_manager.get_plc_data()
-                completion_signal = plc_data.get("completion_signal", 0)
-                if completion_signal == 1:
-                    log_panel = "FRONT/LH"
-                    print(f"DEBUG: ✅ 스캔 로그 저장 시점 - 완료신호 1 → FRONT/LH")
-                elif completion_signal == 2:
-                    log_panel = "REAR/RH"
-                    print(f"DEBUG: ✅ 스캔 로그 저장 시점 - 완료신호 2 → REAR/RH")
-            
-            # 패널 결정 우선순위: 완료신호 > 스캔 데이터 패널 > 기타
-            if log_panel:
-                # 완료신호가 있으면 우선 사용 (가장 정확함)
-                current_panel = log_panel
-                print(f"DEBUG: ✅ 완료신호 기반 패널 사용: {current_panel}")
-            elif scan_panel:
-                # 스캔 데이터에서 패널 정보가 있으면 사용
-                current_panel = scan_panel
-                print(f"DEBUG: ✅ 스캔 데이터에서 패널 정보 사용: {current_panel}")
-            else:
-                # 스캔 데이터에 패널 정보가 없으면 현재 패널명 확인
-                current_panel = self.get_current_panel_name()
-                print(f"DEBUG: ⚠️ 현재 패널명 확인: {current_panel}")
-                if not current_panel:
-                    # 패널명을 가져올 수 없으면 기본값 사용
-                    current_panel = "FRONT/LH"  # 기본값
-                    print(f"DEBUG: ⚠️ 기본값 사용: {current_panel}")
-            
-            print(f"DEBUG: 스캔 로그 저장 호출 - 부품번호: {final_part_number}, 결과: {is_ok}, 패널: {current_panel}")
-            self.save_scan_log(final_part_number, is_ok, current_panel, raw_barcode_data)
-            
-            print(f"DEBUG: 하위부품 스캔 추가 완료 - {final_part_number} ({'OK' if is_ok else 'NG'})")
+            self.save_scan_log(scan_data.part_number, scan_data.is_ok, scan_data.panel, scan_data.raw_data)
+            logger.debug("하위부품 스캔 추가 완료 - %s (%s)", scan_data.part_number, scan_data.status)
         except Exception as e:
-            print(f"DEBUG: 스캔 로그 저장 과정에서 오류 발생: {e}")
-            # 오류가 발생해도 기본 로그 저장 시도
-            try:
-                self.save_scan_log(final_part_number, is_ok, "FRONT/LH", raw_barcode_data)
-                print(f"DEBUG: 기본 패널로 스캔 로그 저장 완료")
-            except Exception as e2:
-                print(f"DEBUG: 기본 패널로도 스캔 로그 저장 실패: {e2}")
+            logger.error("스캔 로그 저장 실패: %s", e)
         
         # 스캔 현황 다이얼로그가 열려있다면 하위부품 상태 업데이트 (UI 업데이트는 별도 처리)
         try:
-            print(f"DEBUG: ===== 스캔현황 다이얼로그 업데이트 시작 =====")
-            print(f"DEBUG: 스캔현황 다이얼로그 상태 확인 - hasattr: {hasattr(self, 'scan_status_dialog')}, dialog: {getattr(self, 'scan_status_dialog', None)}")
-            print(f"DEBUG: is_ok: {is_ok}, barcode_info: {barcode_info}")
-            print(f"DEBUG: final_part_number: {final_part_number}")
-            
             if hasattr(self, 'scan_status_dialog') and self.scan_status_dialog:
-                print(f"DEBUG: 스캔현황 다이얼로그가 존재함 - 업데이트 시도")
-                # 변환된 바코드에서 부품번호 추출하여 매칭 시도
-                if is_ok and barcode_info.get('part_number'):
-                    extracted_part_number = barcode_info.get('part_number')
-                    print(f"DEBUG: 스캔현황 다이얼로그 업데이트 시도 - 추출된 부품번호: {extracted_part_number}, 상태: {is_ok}")
-                    # 추출된 부품번호만 전달 (바코드 전체가 아닌)
-                    self.scan_status_dialog.update_child_part_scan_status(extracted_part_number, is_ok, raw_barcode_data)
-                else:
-                    print(f"DEBUG: 스캔현황 다이얼로그 업데이트 시도 - 원본 부품번호: {final_part_number}, 상태: {is_ok}")
-                    # 원본 부품번호도 정리하여 전달
-                    clean_part_number = final_part_number if not final_part_number.startswith('[)>') else part_number
-                    self.scan_status_dialog.update_child_part_scan_status(clean_part_number, is_ok, raw_barcode_data)
-                print(f"DEBUG: 스캔현황 다이얼로그 업데이트 완료")
+                self.scan_status_dialog.update_child_part_scan_status(scan_data.part_number, scan_data.is_ok, scan_data.raw_data)
+                logger.debug("스캔현황 다이얼로그 업데이트 완료")
             else:
-                print(f"DEBUG: 스캔현황 다이얼로그가 열려있지 않음 - 임시 저장만 완료")
-            print(f"DEBUG: ===== 스캔현황 다이얼로그 업데이트 끝 =====")
+                logger.debug("스캔현황 다이얼로그가 열려있지 않음 - 임시 저장만 완료")
         except Exception as e:
-            print(f"ERROR: 바코드 스캔 처리 오류: {e}")
+            logger.error("바코드 스캔 처리 오류: %s", e)
             # UI 업데이트 오류는 무시하고 계속 진행
     
     def save_print_data(self, scan_data):
         """프린트용 데이터 저장 (공정바코드 + 하위부품 데이터)"""
-        print(f"DEBUG: ===== 프린트용 데이터 저장 시작 =====")
+        logger.debug("===== 프린트용 데이터 저장 시작 =====")
         
         # 현재 공정바코드 정보 가져오기
         current_part_number = None
         current_division = None
         
-        # FRONT/LH 패널에서 공정바코드 정보 확인
-        if hasattr(self, 'front_panel') and self.front_panel and hasattr(self.front_panel, 'part_number') and self.front_panel.part_number:
-            current_part_number = self.front_panel.part_number
-            current_division = getattr(self.front_panel, 'division', '')
-            print(f"DEBUG: FRONT/LH 패널에서 공정바코드 확인: {current_part_number}, Division: {current_division}")
-        
-        # REAR/RH 패널에서 공정바코드 정보 확인
-        elif hasattr(self, 'rear_panel') and self.rear_panel and hasattr(self.rear_panel, 'part_number') and self.rear_panel.part_number:
-            current_part_number = self.rear_panel.part_number
-            current_division = getattr(self.rear_panel, 'division', '')
-            print(f"DEBUG: REAR/RH 패널에서 공정바코드 확인: {current_part_number}, Division: {current_division}")
+        # 패널 순서대로 공정바코드 정보 확인 (부품번호가 있는 첫 번째 패널)
+        for station, panel in self.iter_panels():
+            if getattr(panel, 'part_number', None):
+                current_part_number = panel.part_number
+                current_division = getattr(panel, 'division', '')
+                logger.debug("%s 패널에서 공정바코드 확인: %s, Division: %s", station.name, current_part_number, current_division)
+                break
         
         if not current_part_number:
-            print(f"DEBUG: ⚠️ 현재 공정바코드가 없어서 프린트 데이터 저장 불가")
+            logger.warning("⚠️ 현재 공정바코드가 없어서 프린트 데이터 저장 불가")
             return
         
         # 기존 프린트 데이터 로드
@@ -1961,11 +1467,11 @@ class BarcodeMainScreen(QMainWindow):
             import json
             with open(print_data_file, 'r', encoding='utf-8') as f:
                 existing_data = json.load(f)
-            print(f"DEBUG: 기존 프린트 데이터 로드: {len(existing_data)}개 항목")
+            logger.debug("기존 프린트 데이터 로드: %s개 항목", len(existing_data))
         except FileNotFoundError:
-            print(f"DEBUG: 프린트 데이터 파일이 없음 - 새로 생성")
+            logger.debug("프린트 데이터 파일이 없음 - 새로 생성")
         except Exception as e:
-            print(f"DEBUG: 프린트 데이터 로드 실패: {e}")
+            logger.error("프린트 데이터 로드 실패: %s", e)
         
         # 현재 공정바코드에 해당하는 데이터 찾기
         process_data = None
@@ -1984,7 +1490,7 @@ class BarcodeMainScreen(QMainWindow):
                 'last_scan_time': scan_data.get('time', '')
             }
             existing_data.append(process_data)
-            print(f"DEBUG: 새로운 공정바코드 데이터 생성: {current_part_number}")
+            logger.debug("새로운 공정바코드 데이터 생성: %s", current_part_number)
         
         # 하위부품 데이터 추가
         child_part_data = {
@@ -2001,12 +1507,12 @@ class BarcodeMainScreen(QMainWindow):
                 # 기존 데이터 업데이트
                 existing_part.update(child_part_data)
                 part_exists = True
-                print(f"DEBUG: 기존 하위부품 데이터 업데이트: {child_part_data['part_number']}")
+                logger.debug("기존 하위부품 데이터 업데이트: %s", child_part_data['part_number'])
                 break
         
         if not part_exists:
             process_data['child_parts'].append(child_part_data)
-            print(f"DEBUG: 새로운 하위부품 데이터 추가: {child_part_data['part_number']}")
+            logger.debug("새로운 하위부품 데이터 추가: %s", child_part_data['part_number'])
         
         # 마지막 스캔 시간 업데이트
         process_data['last_scan_time'] = scan_data.get('time', '')
@@ -2019,24 +1525,24 @@ class BarcodeMainScreen(QMainWindow):
         try:
             with open(print_data_file, 'w', encoding='utf-8') as f:
                 json.dump(existing_data, f, ensure_ascii=False, indent=2)
-            print(f"DEBUG: 프린트 데이터 파일 저장 완료: {print_data_file}")
+            logger.debug("프린트 데이터 파일 저장 완료: %s", print_data_file)
         except Exception as e:
-            print(f"DEBUG: 프린트 데이터 파일 저장 실패: {e}")
+            logger.error("프린트 데이터 파일 저장 실패: %s", e)
         
-        print(f"DEBUG: ===== 프린트용 데이터 저장 완료 =====")
+        logger.debug("===== 프린트용 데이터 저장 완료 =====")
     
     def generate_print_string(self, process_data):
         """프린트용 문자열 생성 (# 구분기호로 연결)"""
-        print(f"DEBUG: ===== 프린트용 문자열 생성 시작 =====")
+        logger.debug("===== 프린트용 문자열 생성 시작 =====")
         
         # 공정바코드
         process_barcode = process_data.get('process_barcode', '')
         division = process_data.get('division', '')
         child_parts = process_data.get('child_parts', [])
         
-        print(f"DEBUG: 공정바코드: {process_barcode}")
-        print(f"DEBUG: Division: {division}")
-        print(f"DEBUG: 하위부품 수: {len(child_parts)}")
+        logger.debug("공정바코드: %s", process_barcode)
+        logger.debug("Division: %s", division)
+        logger.debug("하위부품 수: %s", len(child_parts))
         
         # 프린트용 문자열 구성
         print_parts = [process_barcode]  # 공정바코드부터 시작
@@ -2064,11 +1570,11 @@ class BarcodeMainScreen(QMainWindow):
             # 사용유무가 Y이고 출력포함여부가 Y인 하위부품만 포함
             if use_status == 'Y' and print_include == 'Y':
                 print_include_parts.append(child)
-                print(f"DEBUG: - {child.get('part_number', '')} (사용유무: {use_status}, 출력포함: {print_include})")
+                logger.debug("- %s (사용유무: %s, 출력포함: %s)", child.get('part_number', ''), use_status, print_include)
             else:
-                print(f"DEBUG: - {child.get('part_number', '')} 제외 (사용유무: {use_status}, 출력포함: {print_include})")
+                logger.debug("- %s 제외 (사용유무: %s, 출력포함: %s)", child.get('part_number', ''), use_status, print_include)
         
-        print(f"DEBUG: 사용유무 Y이고 출력포함여부 Y인 하위부품: {len(print_include_parts)}개")
+        logger.debug("사용유무 Y이고 출력포함여부 Y인 하위부품: %s개", len(print_include_parts))
         
         for child_part in child_parts:
             part_number = child_part.get('part_number', '')
@@ -2082,112 +1588,93 @@ class BarcodeMainScreen(QMainWindow):
                     break
             
             if not is_print_include:
-                print(f"DEBUG: 하위부품 {part_number} 사용유무 N 또는 출력포함여부 N - 바코드에서 제외")
+                logger.debug("하위부품 %s 사용유무 N 또는 출력포함여부 N - 바코드에서 제외", part_number)
                 continue
             
             if part_number:
                 # 부품번호 + 상태를 # 구분기호로 연결
                 print_parts.append(f"{part_number}#{status}")
-                print(f"DEBUG: 하위부품 추가: {part_number}#{status}")
+                logger.debug("하위부품 추가: %s#%s", part_number, status)
         
         # 최종 프린트 문자열 생성
         print_string = '#'.join(print_parts)
         
-        print(f"DEBUG: 최종 프린트 문자열: {print_string}")
-        print(f"DEBUG: ===== 프린트용 문자열 생성 완료 =====")
+        logger.debug("최종 프린트 문자열: %s", print_string)
+        logger.debug("===== 프린트용 문자열 생성 완료 =====")
         
         return print_string
     
     def on_workflow_status_changed(self, status: str, message: str):
         """워크플로우 상태 변경 처리"""
-        print(f"DEBUG: 워크플로우 상태 변경 - {status}: {message}")
+        logger.debug("워크플로우 상태 변경 - %s: %s", status, message)
         
         # 워크플로우 상태에 따른 UI 업데이트
         if status == "part_selected":
-            print("DEBUG: 부품정보 선택됨 - 워크플로우 시작")
+            logger.debug("부품정보 선택됨 - 워크플로우 시작")
         elif status == "process_validated":
-            print("DEBUG: 공정 확인 완료 - 하위바코드 스캔 대기")
+            logger.debug("공정 확인 완료 - 하위바코드 스캔 대기")
         elif status == "sub_barcode_validated":
-            print("DEBUG: 하위바코드 검증 완료")
+            logger.debug("하위바코드 검증 완료")
         elif status == "show_scan_dialog":
-            print("DEBUG: 스캔현황 다이얼로그 표시 요청")
+            logger.debug("스캔현황 다이얼로그 표시 요청")
             # 스캔현황 다이얼로그 표시
             self.show_scan_status_dialog()
         elif status == "no_sub_parts":
-            print("DEBUG: 하위자재 없음 - 다이얼로그 표시 안함")
+            logger.debug("하위자재 없음 - 다이얼로그 표시 안함")
         elif status == "error":
-            print(f"DEBUG: 워크플로우 오류: {message}")
+            logger.error("워크플로우 오류: %s", message)
     
     def on_workflow_scan_result(self, is_success: bool, message: str, barcode_info: dict):
-        """워크플로우 스캔 결과 처리"""
-        print(f"DEBUG: 워크플로우 스캔 결과 - 성공: {is_success}, 메시지: {message}")
-        
-        if is_success and barcode_info:
-            # 기존 하위부품 스캔 로직과 통합
-            part_number = barcode_info.get('part_number', '')
-            if part_number:
-                self.add_scanned_part(part_number, is_success)
+        """워크플로우 스캔 결과 처리 - 로그만 (하위부품 스캔 기록은 작업 흐름 엔진 이벤트에서만 처리)"""
+        logger.debug("워크플로우 스캔 결과 - 성공: %s, 메시지: %s", is_success, message)
     
     def start_barcode_workflow(self, part_number: str, expected_sub_parts: list = None):
         """바코드 스캔 워크플로우 시작"""
         try:
             if self.workflow_manager:
                 self.workflow_manager.start_workflow(part_number, expected_sub_parts)
-                print(f"DEBUG: 바코드 워크플로우 시작 - 부품번호: {part_number}")
+                logger.debug("바코드 워크플로우 시작 - 부품번호: %s", part_number)
             else:
-                print("DEBUG: 워크플로우 매니저가 초기화되지 않음")
+                logger.debug("워크플로우 매니저가 초기화되지 않음")
         except Exception as e:
-            print(f"ERROR: 바코드 워크플로우 시작 오류: {e}")
+            logger.error("바코드 워크플로우 시작 오류: %s", e)
     
     def reset_barcode_workflow(self):
         """바코드 스캔 워크플로우 리셋"""
         try:
             if self.workflow_manager:
                 self.workflow_manager.reset_workflow()
-                print("DEBUG: 바코드 워크플로우 리셋됨")
+                logger.debug("바코드 워크플로우 리셋됨")
             else:
-                print("DEBUG: 워크플로우 매니저가 초기화되지 않음")
+                logger.debug("워크플로우 매니저가 초기화되지 않음")
         except Exception as e:
-            print(f"ERROR: 바코드 워크플로우 리셋 오류: {e}")
+            logger.error("바코드 워크플로우 리셋 오류: %s", e)
     
     def show_scan_status_dialog(self, scanned_barcode=None):
         """스캔현황 다이얼로그 표시 - 스캔된 바코드에 해당하는 패널의 하위부품 정보 사용"""
         try:
-            # 현재 활성화된 패널 확인 (FRONT/LH 또는 REAR/RH)
+            # 현재 활성화된 패널 확인
             current_panel = None
             current_panel_title = ""
             
             # 스캔된 바코드가 있는 경우, 해당 바코드와 일치하는 패널 찾기
             if scanned_barcode:
-                print(f"DEBUG: 스캔된 바코드로 패널 찾기 - {scanned_barcode}")
-                
-                # FRONT/LH 패널 확인
-                if hasattr(self, 'front_panel') and self.front_panel:
-                    if hasattr(self.front_panel, 'part_number') and self.front_panel.part_number == scanned_barcode:
-                        current_panel = self.front_panel
-                        current_panel_title = self.front_panel.title
-                        print(f"DEBUG: FRONT/LH 패널 매칭 - {self.front_panel.part_number}")
+                logger.debug("스캔된 바코드로 패널 찾기 - %s", scanned_barcode)
                 
-                # REAR/RH 패널 확인
-                if not current_panel and hasattr(self, 'rear_panel') and self.rear_panel:
-                    if hasattr(self.rear_panel, 'part_number') and self.rear_panel.part_number == scanned_barcode:
-                        current_panel = self.rear_panel
-                        current_panel_title = self.rear_panel.title
-                        print(f"DEBUG: REAR/RH 패널 매칭 - {self.rear_panel.part_number}")
-            
-            # 스캔된 바코드가 없거나 매칭되지 않은 경우, 기존 로직 사용
+                for station, panel in self.iter_panels():
+                    if getattr(panel, 'part_number', None) == scanned_barcode:
+                        current_panel = panel
+                        current_panel_title = panel.title
+                        logger.debug("%s 패널 매칭 - %s", station.name, panel.part_number)
+                        break
+            
+            # 스캔된 바코드가 없거나 매칭되지 않은 경우, 부품번호가 있는 첫 번째 패널
             if not current_panel:
-                # FRONT/LH 패널 확인
-                if hasattr(self, 'front_panel') and self.front_panel:
-                    if hasattr(self.front_panel, 'part_number') and self.front_panel.part_number:
-                        current_panel = self.front_panel
-                        current_panel_title = self.front_panel.title
-                
-                # REAR/RH 패널 확인 (FRONT/LH가 없거나 비어있는 경우)
-                if not current_panel and hasattr(self, 'rear_panel') and self.rear_panel:
-                    if hasattr(self.rear_panel, 'part_number') and self.rear_panel.part_number:
-                        current_panel = self.rear_panel
-                        current_panel_title = self.rear_panel.title
+                for station, panel in self.iter_panels():
+                    if getattr(panel, 'part_number', None):
+                        current_panel = panel
+                        current_panel_title = panel.title
+                        break
             
             if current_panel:
                 # 현재 패널의 하위부품 정보 가져오기
@@ -2198,16 +1685,11 @@ class BarcodeMainScreen(QMainWindow):
                     self.scan_status_dialog.raise_()
                     self.scan_status_dialog.activateWindow()
                 else:
-                    # 스캔현황 다이얼로그 생성 시 현재 메모리 데이터만 사용
-                    initial_data = []
+                    # 스캔현황 다이얼로그는 스캔 세션 저장소의 뷰를 사용 (임시 파일 로드 안함)
+                    initial_data = self.temp_scan_data.copy()
                     
-                    # 메인 윈도우의 temp_scan_data만 사용 (임시 파일 로드 안함)
-                    if hasattr(self, 'temp_scan_data') and self.temp_scan_data:
-                        initial_data = self.temp_scan_data.copy()
-                    else:
-                        initial_data = []
-                    
-                    # 스캔현황 다이얼로그 생성 및 표시
+                    # 스캔현황 다이얼로그 생성 및 표시 (모듈은 화면 표시 후 미리 import 해 둠)
+                    from modules.ui.scan_status_dialog import ScanStatusDialog
                     self.scan_status_dialog = ScanStatusDialog(initial_data, self, child_parts_info)
                     self.scan_status_dialog.setWindowTitle(f"{current_panel_title} - 스캔 현황")
                     
@@ -2216,276 +1698,51 @@ class BarcodeMainScreen(QMainWindow):
                     self.scan_status_dialog.raise_()
                     self.scan_status_dialog.activateWindow()
                     
-                    # 데이터가 있으면 복원 시도
-                    if self.scan_status_dialog.real_time_scanned_data:
-                        print(f"DEBUG: 메인화면 - 데이터가 있으므로 복원 시도")
-                        from PyQt5.QtCore import QTimer
-                        QTimer.singleShot(100, lambda: self.scan_status_dialog.restore_child_parts_status())
-                        
-                        # 추가 복원 시도 (더 강력한 복원)
-                        QTimer.singleShot(500, lambda: self.force_restore_scan_data())
-                        
-                        # 최종 복원 시도 (매우 강력한 복원)
-                        QTimer.singleShot(1000, lambda: self.ultimate_restore_scan_data())
-                    else:
-                        print(f"DEBUG: 메인화면 - 데이터가 없으므로 대기 상태로 시작")
-                        # 데이터가 없어도 임시 파일에서 로드 시도
-                        from PyQt5.QtCore import QTimer
-                        QTimer.singleShot(200, lambda: self.scan_status_dialog.load_scan_data_from_temp_file())
-                        QTimer.singleShot(300, lambda: self.scan_status_dialog.restore_child_parts_status())
+                    # 저장소 데이터(저널 복원분 포함)로 테이블/하위부품 상태 표시
+                    from PyQt5.QtCore import QTimer
+                    QTimer.singleShot(100, self.restore_scan_data)
                     
-                    print(f"DEBUG: {current_panel_title} 스캔현황 다이얼로그 표시됨")
+                    logger.debug("%s 스캔현황 다이얼로그 표시됨", current_panel_title)
             else:
-                print("DEBUG: 활성화된 패널이 없음 - 스캔현황 다이얼로그 표시 안함")
+                logger.debug("활성화된 패널이 없음 - 스캔현황 다이얼로그 표시 안함")
                 
         except Exception as e:
-            print(f"ERROR: 스캔현황 다이얼로그 표시 오류: {e}")
+            logger.error("스캔현황 다이얼로그 표시 오류: %s", e)
     
     def restore_scan_data(self):
-        """스캔 데이터 복원 실행"""
-        print(f"DEBUG: 메인화면 - restore_scan_data 시작")
-        
-        if hasattr(self, 'scan_status_dialog') and self.scan_status_dialog:
-            print(f"DEBUG: 스캔 데이터 복원 실행 - 복원할 데이터: {len(self.scan_status_dialog.real_time_scanned_data)}개 항목")
-            
-            # 복원할 데이터 상세 출력
-            for i, data in enumerate(self.scan_status_dialog.real_time_scanned_data):
-                print(f"DEBUG: 메인화면 - 복원할 데이터 {i}: {data}")
-            
-            # 다이얼로그 데이터 상태 확인
-            if hasattr(self.scan_status_dialog, 'real_time_scanned_data'):
-                print(f"DEBUG: 메인화면 - 다이얼로그 real_time_scanned_data 존재: {len(self.scan_status_dialog.real_time_scanned_data)}개 항목")
-                if self.scan_status_dialog.real_time_scanned_data:
-                    print(f"DEBUG: 메인화면 - 다이얼로그 데이터 내용:")
-                    for i, data in enumerate(self.scan_status_dialog.real_time_scanned_data):
-                        print(f"DEBUG: 메인화면 -   {i}: {data}")
-                else:
-                    print(f"DEBUG: 메인화면 - ⚠️ 다이얼로그 데이터가 비어있음!")
-            else:
-                print(f"DEBUG: 메인화면 - ⚠️ 다이얼로그에 real_time_scanned_data 속성이 없음!")
-            
-            # 복원된 데이터로 테이블 업데이트
-            print(f"DEBUG: 메인화면 - 스캔 테이블 업데이트 시작")
-            self.scan_status_dialog.update_scan_table_data()
-            print(f"DEBUG: 메인화면 - 스캔 테이블 업데이트 완료")
-            
-            print(f"DEBUG: 메인화면 - 통계 업데이트 시작")
-            self.scan_status_dialog.update_statistics()
-            print(f"DEBUG: 메인화면 - 통계 업데이트 완료")
-            
-            # 하위부품 스캔 상태도 복원
-            print(f"DEBUG: 메인화면 - 하위부품 상태 복원 시작")
-            print(f"DEBUG: 메인화면 - 복원 전 real_time_scanned_data: {len(self.scan_status_dialog.real_time_scanned_data)}개")
-            self.scan_status_dialog.restore_child_parts_status()
-            print(f"DEBUG: 메인화면 - 하위부품 상태 복원 완료")
-            
-            print(f"DEBUG: 스캔 데이터 복원 완료")
-        else:
-            print(f"DEBUG: 메인화면 - ⚠️ scan_status_dialog가 없어서 복원 실패!")
-    
-    def force_restore_scan_data(self):
-        """강제 스캔 데이터 복원 (더 강력한 복원)"""
+        """스캔현황 다이얼로그에 스캔 세션 저장소 데이터 반영 (테이블/통계/하위부품 상태)"""
         try:
-            print(f"DEBUG: 메인화면 - 강제 스캔 데이터 복원 시작")
-            if hasattr(self, 'scan_status_dialog') and self.scan_status_dialog:
-                print(f"DEBUG: 메인화면 - 강제 복원 시 다이얼로그 데이터: {len(self.scan_status_dialog.real_time_scanned_data)}개 항목")
-                
-                # 다이얼로그 데이터 상태 확인
-                if hasattr(self.scan_status_dialog, 'real_time_scanned_data'):
-                    print(f"DEBUG: 메인화면 - 강제 복원 시 다이얼로그 real_time_scanned_data 존재: {len(self.scan_status_dialog.real_time_scanned_data)}개 항목")
-                    if self.scan_status_dialog.real_time_scanned_data:
-                        print(f"DEBUG: 메인화면 - 강제 복원 시 다이얼로그 데이터 내용:")
-                        for i, data in enumerate(self.scan_status_dialog.real_time_scanned_data):
-                            print(f"DEBUG: 메인화면 -   {i}: {data}")
-                    else:
-                        print(f"DEBUG: 메인화면 - ⚠️ 강제 복원 시 다이얼로그 데이터가 비어있음!")
-                else:
-                    print(f"DEBUG: 메인화면 - ⚠️ 강제 복원 시 다이얼로그에 real_time_scanned_data 속성이 없음!")
-                
-                # 다이얼로그의 restore_child_parts_status 메서드 직접 호출
-                if hasattr(self.scan_status_dialog, 'restore_child_parts_status'):
-                    print(f"DEBUG: 메인화면 - 강제 복원 시 restore_child_parts_status 호출")
-                    self.scan_status_dialog.restore_child_parts_status()
-                    print(f"DEBUG: 메인화면 - 강제 복원 시 restore_child_parts_status 호출 완료")
-                else:
-                    print(f"DEBUG: 메인화면 - 강제 복원 시 restore_child_parts_status 메서드가 없음")
-                
-                # 다이얼로그 강제 새로고침
-                if hasattr(self.scan_status_dialog, 'force_ui_refresh'):
-                    print(f"DEBUG: 메인화면 - 강제 복원 시 UI 강제 새로고침")
-                    self.scan_status_dialog.force_ui_refresh()
-                    print(f"DEBUG: 메인화면 - 강제 복원 시 UI 강제 새로고침 완료")
-                
-                # 테이블 강제 업데이트
-                if hasattr(self.scan_status_dialog, 'child_parts_table'):
-                    print(f"DEBUG: 메인화면 - 강제 복원 시 테이블 강제 업데이트")
-                    self.scan_status_dialog.child_parts_table.update()
-                    self.scan_status_dialog.child_parts_table.repaint()
-                    print(f"DEBUG: 메인화면 - 강제 복원 시 테이블 강제 업데이트 완료")
-                
-                # 다이얼로그 강제 새로고침
-                if hasattr(self.scan_status_dialog, 'update'):
-                    print(f"DEBUG: 메인화면 - 강제 복원 시 다이얼로그 강제 새로고침")
-                    self.scan_status_dialog.update()
-                    print(f"DEBUG: 메인화면 - 강제 복원 시 다이얼로그 강제 새로고침 완료")
-                
-                print(f"DEBUG: 메인화면 - 강제 스캔 데이터 복원 완료")
-            else:
-                print(f"DEBUG: 메인화면 - 강제 복원 시 스캔현황 다이얼로그가 없음")
-        except Exception as e:
-            print(f"ERROR: 강제 스캔 데이터 복원 오류: {e}")
-            import traceback
-            print(f"ERROR: 강제 복원 상세 오류: {traceback.format_exc()}")
-    
-    def immediate_restore_scan_data(self):
-        """즉시 스캔 데이터 복원 (간단하고 직접적인 방법)"""
-        try:
-            # 경로 변수 정의
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.dirname(script_dir)
+            dialog = getattr(self, 'scan_status_dialog', None)
+            if not dialog:
+                logger.debug("스캔현황 다이얼로그가 없어서 복원 생략")
+                return
             
-            print(f"DEBUG: 메인화면 - 즉시 스캔 데이터 복원 시작")
-            if hasattr(self, 'scan_status_dialog') and self.scan_status_dialog:
-                print(f"DEBUG: 메인화면 - 즉시 복원 시 다이얼로그 데이터: {len(self.scan_status_dialog.real_time_scanned_data)}개 항목")
-                
-                # 임시 파일에서 직접 데이터 로드
-                print(f"DEBUG: 메인화면 - 즉시 복원 시 임시 파일에서 직접 데이터 로드")
-                try:
-                    import json
-                    import os
-                    # 상대 경로로 파일 찾기
-                    temp_scan_file = os.path.join("data", "temp_scan_data.json")
-                    print(f"DEBUG: 메인화면 - 즉시 복원 시 임시 파일 절대 경로: {temp_scan_file}")
-                    print(f"DEBUG: 메인화면 - 즉시 복원 시 현재 작업 디렉토리: {os.getcwd()}")
-                    print(f"DEBUG: 메인화면 - 즉시 복원 시 스크립트 디렉토리: {script_dir}")
-                    print(f"DEBUG: 메인화면 - 즉시 복원 시 프로젝트 루트: {project_root}")
-                    print(f"DEBUG: 메인화면 - 즉시 복원 시 파일 존재 여부: {os.path.exists(temp_scan_file)}")
-                    
-                    if os.path.exists(temp_scan_file):
-                        with open(temp_scan_file, 'r', encoding='utf-8') as f:
-                            temp_data = json.load(f)
-                            if temp_data and len(temp_data) > 0:
-                                print(f"DEBUG: 메인화면 - 즉시 복원 시 임시 파일에서 로드된 데이터: {len(temp_data)}개 항목")
-                                
-                                # 다이얼로그에 직접 설정
-                                self.scan_status_dialog.real_time_scanned_data = temp_data.copy()
-                                print(f"DEBUG: 메인화면 - 즉시 복원 시 다이얼로그에 직접 설정 완료")
-                                
-                                # 강제 복원 시도
-                                if hasattr(self.scan_status_dialog, 'restore_child_parts_status'):
-                                    print(f"DEBUG: 메인화면 - 즉시 복원 시 restore_child_parts_status 강제 호출")
-                                    self.scan_status_dialog.restore_child_parts_status()
-                                    print(f"DEBUG: 메인화면 - 즉시 복원 시 restore_child_parts_status 강제 호출 완료")
-                                
-                                # UI 강제 새로고침
-                                if hasattr(self.scan_status_dialog, 'force_ui_refresh'):
-                                    print(f"DEBUG: 메인화면 - 즉시 복원 시 UI 강제 새로고침")
-                                    self.scan_status_dialog.force_ui_refresh()
-                                    print(f"DEBUG: 메인화면 - 즉시 복원 시 UI 강제 새로고침 완료")
-                                
-                                # 테이블 강제 업데이트
-                                if hasattr(self.scan_status_dialog, 'child_parts_table'):
-                                    print(f"DEBUG: 메인화면 - 즉시 복원 시 테이블 강제 업데이트")
-                                    self.scan_status_dialog.child_parts_table.update()
-                                    self.scan_status_dialog.child_parts_table.repaint()
-                                    print(f"DEBUG: 메인화면 - 즉시 복원 시 테이블 강제 업데이트 완료")
-                                
-                                # 다이얼로그 강제 새로고침
-                                if hasattr(self.scan_status_dialog, 'update'):
-                                    print(f"DEBUG: 메인화면 - 즉시 복원 시 다이얼로그 강제 새로고침")
-                                    self.scan_status_dialog.update()
-                                    print(f"DEBUG: 메인화면 - 즉시 복원 시 다이얼로그 강제 새로고침 완료")
-                                
-                                print(f"DEBUG: 메인화면 - 즉시 복원 시 복원 완료")
-                            else:
-                                print(f"DEBUG: 메인화면 - 즉시 복원 시 임시 파일에 데이터 없음")
-                    else:
-                        print(f"DEBUG: 메인화면 - 즉시 복원 시 임시 파일이 존재하지 않음")
-                except Exception as e:
-                    print(f"ERROR: 즉시 복원 시 임시 파일 로드 오류: {e}")
-                
-                print(f"DEBUG: 메인화면 - 즉시 스캔 데이터 복원 완료")
-            else:
-                print(f"DEBUG: 메인화면 - 즉시 복원 시 스캔현황 다이얼로그가 없음")
+            logger.debug("스캔 데이터 복원 - %s개 항목", len(self.scan_session.current))
+            dialog.update_scan_table_data()
+            dialog.update_statistics()
+            dialog.restore_child_parts_status()
         except Exception as e:
-            print(f"ERROR: 즉시 스캔 데이터 복원 오류: {e}")
-            import traceback
-            print(f"ERROR: 즉시 복원 상세 오류: {traceback.format_exc()}")
+            logger.error("스캔 데이터 복원 오류: %s", e)
     
-    def ultimate_restore_scan_data(self):
-        """최종 스캔 데이터 복원 (매우 강력한 복원)"""
+    def restore_scan_session_on_startup(self):
+        """프로그램 시작 시 스캔 세션 저널을 한 번에 재생하고 이후 변경을 저널에 기록"""
         try:
-            # 경로 변수 정의
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.dirname(script_dir)
+            # 이전 버전의 전체 덮어쓰기 임시 파일은 더 이상 사용하지 않음
+            project_root = os.path.dirname(os.path.abspath(__file__))
+            remove_legacy_temp_files([
+                LEGACY_TEMP_FILE,
+                os.path.join(project_root, LEGACY_TEMP_FILE),
+                os.path.join(project_root, "data", LEGACY_TEMP_FILE),
+            ])
             
-            print(f"DEBUG: 메인화면 - 최종 스캔 데이터 복원 시작")
-            if hasattr(self, 'scan_status_dialog') and self.scan_status_dialog:
-                print(f"DEBUG: 메인화면 - 최종 복원 시 다이얼로그 데이터: {len(self.scan_status_dialog.real_time_scanned_data)}개 항목")
-                
-                # 임시 파일에서 직접 데이터 다시 로드
-                print(f"DEBUG: 메인화면 - 최종 복원 시 임시 파일에서 직접 데이터 로드")
-                try:
-                    import json
-                    import os
-                    # 상대 경로로 파일 찾기
-                    temp_scan_file = os.path.join("data", "temp_scan_data.json")
-                    print(f"DEBUG: 메인화면 - 최종 복원 시 임시 파일 절대 경로: {temp_scan_file}")
-                    print(f"DEBUG: 메인화면 - 최종 복원 시 현재 작업 디렉토리: {os.getcwd()}")
-                    print(f"DEBUG: 메인화면 - 최종 복원 시 스크립트 디렉토리: {script_dir}")
-                    print(f"DEBUG: 메인화면 - 최종 복원 시 프로젝트 루트: {project_root}")
-                    print(f"DEBUG: 메인화면 - 최종 복원 시 파일 존재 여부: {os.path.exists(temp_scan_file)}")
-                    
-                    if os.path.exists(temp_scan_file):
-                        with open(temp_scan_file, 'r', encoding='utf-8') as f:
-                            temp_data = json.load(f)
-                            if temp_data and len(temp_data) > 0:
-                                print(f"DEBUG: 메인화면 - 최종 복원 시 임시 파일에서 로드된 데이터: {len(temp_data)}개 항목")
-                                
-                                # 다이얼로그에 직접 설정
-                                self.scan_status_dialog.real_time_scanned_data = temp_data.copy()
-                                print(f"DEBUG: 메인화면 - 최종 복원 시 다이얼로그에 직접 설정 완료")
-                                
-                                # 강제 복원 시도
-                                if hasattr(self.scan_status_dialog, 'restore_child_parts_status'):
-                                    print(f"DEBUG: 메인화면 - 최종 복원 시 restore_child_parts_status 강제 호출")
-                                    self.scan_status_dialog.restore_child_parts_status()
-                                    print(f"DEBUG: 메인화면 - 최종 복원 시 restore_child_parts_status 강제 호출 완료")
-                                
-                                # UI 강제 새로고침
-                                if hasattr(self.scan_status_dialog, 'force_ui_refresh'):
-                                    print(f"DEBUG: 메인화면 - 최종 복원 시 UI 강제 새로고침")
-                                    self.scan_status_dialog.force_ui_refresh()
-                                    print(f"DEBUG: 메인화면 - 최종 복원 시 UI 강제 새로고침 완료")
-                                
-                                # 테이블 강제 업데이트
-                                if hasattr(self.scan_status_dialog, 'child_parts_table'):
-                                    print(f"DEBUG: 메인화면 - 최종 복원 시 테이블 강제 업데이트")
-                                    self.scan_status_dialog.child_parts_table.update()
-                                    self.scan_status_dialog.child_parts_table.repaint()
-                                    print(f"DEBUG: 메인화면 - 최종 복원 시 테이블 강제 업데이트 완료")
-                                
-                                # 다이얼로그 강제 새로고침
-                                if hasattr(self.scan_status_dialog, 'update'):
-                                    print(f"DEBUG: 메인화면 - 최종 복원 시 다이얼로그 강제 새로고침")
-                                    self.scan_status_dialog.update()
-                                    print(f"DEBUG: 메인화면 - 최종 복원 시 다이얼로그 강제 새로고침 완료")
-                                
-                                print(f"DEBUG: 메인화면 - 최종 복원 시 복원 완료")
-                            else:
-                                print(f"DEBUG: 메인화면 - 최종 복원 시 임시 파일에 데이터 없음")
-                    else:
-                        print(f"DEBUG: 메인화면 - 최종 복원 시 임시 파일이 존재하지 않음")
-                except Exception as e:
-                    print(f"ERROR: 최종 복원 시 임시 파일 로드 오류: {e}")
-                
-                print(f"DEBUG: 메인화면 - 최종 스캔 데이터 복원 완료")
-            else:
-                print(f"DEBUG: 메인화면 - 최종 복원 시 스캔현황 다이얼로그가 없음")
+            self.scan_journal = ScanJournal()
+            restored = self.scan_journal.replay_into(self.scan_session)
+            if restored:
+                logger.info("이전 스캔 현황 복원: %s개 항목", restored)
         except Exception as e:
-            print(f"ERROR: 최종 스캔 데이터 복원 오류: {e}")
-            import traceback
-            print(f"ERROR: 최종 복원 상세 오류: {traceback.format_exc()}")
+            logger.error("스캔 세션 저널 복원 오류: %s", e)
+            self.scan_journal = None
+        self.scan_session.journal = self.scan_journal
     
     def update_workflow_label_colors(self, labels: dict):
         """워크플로우 레이블 색상 업데이트"""
@@ -2495,70 +1752,50 @@ class BarcodeMainScreen(QMainWindow):
                     if label_id in ["1", "2", "3", "4", "5", "6"]:
                         status = self.workflow_manager.label_color_manager.determine_label_status(label_id)
                         self.workflow_manager.label_color_manager.update_label_color(label_widget, status, label_id)
-                print("DEBUG: 워크플로우 레이블 색상 업데이트 완료")
+                logger.debug("워크플로우 레이블 색상 업데이트 완료")
         except Exception as e:
-            print(f"ERROR: 워크플로우 레이블 색상 업데이트 오류: {e}")
+            logger.error("워크플로우 레이블 색상 업데이트 오류: %s", e)
     
     def get_current_part_info(self, barcode: str = None) -> dict:
         """현재 선택된 부품정보 반환 - 바코드와 매칭되는 패널 찾기"""
         try:
             # 바코드가 제공된 경우, 해당 바코드와 일치하는 패널 찾기
             if barcode:
-                # FRONT/LH 패널 확인
-                if hasattr(self, 'front_panel') and self.front_panel and hasattr(self.front_panel, 'part_number'):
-                    if self.front_panel.part_number == barcode:
-                        print(f"DEBUG: FRONT/LH 패널 매칭 - 바코드: {barcode}, 부품번호: {self.front_panel.part_number}")
-                        child_parts_info = self.front_panel.get_child_parts_info()
-                        return {
-                            'part_number': self.front_panel.part_number,
-                            'expected_sub_parts': child_parts_info
-                        }
-                
-                # REAR/RH 패널 확인
-                if hasattr(self, 'rear_panel') and self.rear_panel and hasattr(self.rear_panel, 'part_number'):
-                    if self.rear_panel.part_number == barcode:
-                        print(f"DEBUG: REAR/RH 패널 매칭 - 바코드: {barcode}, 부품번호: {self.rear_panel.part_number}")
-                        child_parts_info = self.rear_panel.get_child_parts_info()
+                for station, panel in self.iter_panels():
+                    if getattr(panel, 'part_number', None) == barcode:
+                        logger.debug("%s 패널 매칭 - 바코드: %s, 부품번호: %s", station.name, barcode, panel.part_number)
+                        child_parts_info = panel.get_child_parts_info()
                         return {
-                            'part_number': self.rear_panel.part_number,
+                            'part_number': panel.part_number,
                             'expected_sub_parts': child_parts_info
                         }
             
             # 바코드가 없거나 매칭되지 않은 경우, 첫 번째 활성화된 패널 반환
-            if hasattr(self, 'front_panel') and self.front_panel and hasattr(self.front_panel, 'part_number'):
-                if self.front_panel.part_number:
-                    print(f"DEBUG: FRONT/LH 패널 부품번호: {self.front_panel.part_number}")
-                    child_parts_info = self.front_panel.get_child_parts_info()
+            for station, panel in self.iter_panels():
+                if getattr(panel, 'part_number', None):
+                    logger.debug("%s 패널 부품번호: %s", station.name, panel.part_number)
+                    child_parts_info = panel.get_child_parts_info()
                     return {
-                        'part_number': self.front_panel.part_number,
+                        'part_number': panel.part_number,
                         'expected_sub_parts': child_parts_info
                     }
             
-            if hasattr(self, 'rear_panel') and self.rear_panel and hasattr(self.rear_panel, 'part_number'):
-                if self.rear_panel.part_number:
-                    print(f"DEBUG: REAR/RH 패널 부품번호: {self.rear_panel.part_number}")
-                    child_parts_info = self.rear_panel.get_child_parts_info()
-                    return {
-                        'part_number': self.rear_panel.part_number,
-                        'expected_sub_parts': child_parts_info
-                    }
-            
-            print("DEBUG: 활성화된 패널 없음")
+            logger.debug("활성화된 패널 없음")
             return {
                 'part_number': '',
                 'expected_sub_parts': []
             }
         except Exception as e:
-            print(f"ERROR: 부품정보 조회 오류: {e}")
+            logger.error("부품정보 조회 오류: %s", e)
             return {
                 'part_number': '',
                 'expected_sub_parts': []
             }
     
     def process_barcode_with_workflow(self, barcode: str):
-        """바코드 처리 - 워크플로우 통합"""
+        """공정부품 스캔 처리 (작업 흐름 엔진이 사이클을 시작할 때 호출) - 이전 작업 초기화 + 스캔현황 표시"""
         try:
-            print(f"DEBUG: 바코드 처리 시작 - {barcode}")
+            logger.debug("바코드 처리 시작 - %s", barcode)
             
             # 현재 부품정보 조회 (바코드 전달)
             part_info = self.get_current_part_info(barcode)
@@ -2566,281 +1803,98 @@ class BarcodeMainScreen(QMainWindow):
             expected_sub_parts = part_info.get('expected_sub_parts', [])
             
             if not current_part_number:
-                print("DEBUG: 현재 선택된 부품정보 없음")
+                logger.debug("현재 선택된 부품정보 없음")
                 return
             
             # 바코드와 부품번호 비교
             if barcode == current_part_number:
-                print(f"DEBUG: 바코드와 부품번호 일치 - {barcode}")
-                
-                # 부모바코드 스캔 시점의 패널 정보 저장 (완료신호 검증용)
-                if hasattr(self, 'front_panel') and self.front_panel and self.front_panel.part_number == barcode:
-                    self.pending_print_panel = "FRONT/LH"
-                    print(f"DEBUG: 부모바코드 스캔 - FRONT/LH 패널 정보 저장")
-                elif hasattr(self, 'rear_panel') and self.rear_panel and self.rear_panel.part_number == barcode:
-                    self.pending_print_panel = "REAR/RH"
-                    print(f"DEBUG: 부모바코드 스캔 - REAR/RH 패널 정보 저장")
+                logger.debug("바코드와 부품번호 일치 - %s", barcode)
                 
                 # ===== 공정 부품코드 스캔 시 완전한 초기화 =====
-                print(f"DEBUG: 공정 부품코드 스캔 - 이전 데이터 완전 삭제")
+                logger.debug("공정 부품코드 스캔 - 이전 데이터 완전 삭제")
                 self.complete_reset_for_new_work()
                 
                 # ===== 신규 작업 시작 - 스캔 현황 데이터 초기화 =====
-                print(f"DEBUG: 신규 작업 시작 - 스캔 현황 데이터 초기화")
+                logger.debug("신규 작업 시작 - 스캔 현황 데이터 초기화")
                 self.initialize_scan_status_for_new_work(current_part_number, expected_sub_parts)
                 
                 # 기존 스캔현황 다이얼로그가 열려있다면 강제로 닫기
                 if hasattr(self, 'scan_status_dialog') and self.scan_status_dialog:
-                    print(f"DEBUG: 기존 스캔현황 다이얼로그 강제 닫기")
+                    logger.debug("기존 스캔현황 다이얼로그 강제 닫기")
                     self.scan_status_dialog.close()
                     self.scan_status_dialog = None
                 
                 # 하위자재가 있는 경우 워크플로우 시작
                 if expected_sub_parts and len(expected_sub_parts) > 0:
-                    print(f"DEBUG: 하위자재 {len(expected_sub_parts)}개 발견 - 워크플로우 시작")
+                    logger.debug("하위자재 %s개 발견 - 워크플로우 시작", len(expected_sub_parts))
                     
                     # 워크플로우 시작
                     if self.workflow_manager:
                         self.workflow_manager.start_workflow(current_part_number, expected_sub_parts)
                 else:
-                    print("DEBUG: 하위자재 없음 - 빈 다이얼로그 표시")
+                    logger.debug("하위자재 없음 - 빈 다이얼로그 표시")
                 
-                # 하위부품 유무와 관계없이 스캔현황 다이얼로그 표시
-                self.show_scan_status_dialog(barcode)
+                # 하위부품 유무와 관계없이 스캔현황 다이얼로그 표시 (모달 - 엔진 이벤트 처리가 끝난 뒤 열기)
+                QTimer.singleShot(0, lambda: self.show_scan_status_dialog(barcode))
             else:
-                print(f"DEBUG: 바코드와 부품번호 불일치 - 바코드: {barcode}, 부품번호: {current_part_number}")
+                logger.debug("바코드와 부품번호 불일치 - 바코드: %s, 부품번호: %s", barcode, current_part_number)
                 
         except Exception as e:
-            print(f"ERROR: 바코드 처리 오류: {e}")
+            logger.error("바코드 처리 오류: %s", e)
     
     def clear_temp_scan_data(self):
         """임시보관 데이터 클리어 (신규 작업 시작 시)"""
         try:
-            print(f"DEBUG: ===== 임시보관 데이터 클리어 시작 =====")
+            logger.debug("===== 임시보관 데이터 클리어 시작 =====")
             
             # 1. 신규 작업 시작 시 임시보관 데이터 클리어
-            print(f"DEBUG: 신규 작업 시작 - 임시보관 데이터 클리어")
-            print(f"DEBUG: 클리어 전 임시보관 데이터: {len(self.temp_scan_data)}개 항목")
+            logger.debug("신규 작업 시작 - 임시보관 데이터 클리어")
+            logger.debug("클리어 전 임시보관 데이터: %s개 항목", len(self.temp_scan_data))
             if self.temp_scan_data:
-                print(f"DEBUG: 클리어할 임시보관 데이터 내용:")
-                for i, data in enumerate(self.temp_scan_data):
-                    print(f"DEBUG:   {i}: {data}")
-            
-            # 임시보관 데이터 클리어
-            self.temp_scan_data = []
-            print(f"DEBUG: 임시보관 데이터 클리어 완료: {len(self.temp_scan_data)}개 항목")
-            
-            # 임시 TEXT 파일 삭제 (절대 경로 사용)
-            try:
-                import os
-                temp_scan_file = os.path.join("data", "temp_scan_data.json")
-                if os.path.exists(temp_scan_file):
-                    os.remove(temp_scan_file)
-                    print(f"DEBUG: 임시 TEXT 파일 삭제 완료: {temp_scan_file}")
-                else:
-                    print(f"DEBUG: 임시 TEXT 파일이 존재하지 않음: {temp_scan_file}")
-            except Exception as e:
-                print(f"DEBUG: 임시 TEXT 파일 삭제 오류: {e}")
+                logger.debug("클리어할 임시보관 데이터 내용:")
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, data in enumerate(self.temp_scan_data):
+                        logger.debug("%s: %s", i, data)
             
+            # 임시보관 데이터 클리어 (현재 세션 스캔 부품 목록/전역 스캔 데이터 포함)
+            self.scan_session.clear_current()
+            logger.debug("임시보관 데이터 클리어 완료: %s개 항목", len(self.temp_scan_data))
             
-            # 2. 현재 세션의 스캔된 부품 목록 초기화
-            self.scanned_parts = []
-            print(f"DEBUG: 현재 세션 스캔된 부품 목록 초기화 완료")
+            # 임시 파일은 사용하지 않음 - 초기화 이벤트는 스캔 세션 저널에 기록됨
             
-            # 3. 전역 스캔 데이터 초기화 (새 작업용)
-            self.global_scan_data = []
-            print(f"DEBUG: 전역 스캔 데이터 초기화 완료")
-            
-            # 4. 스캔 현황 다이얼로그 데이터 초기화
+            # 2. 스캔 현황 다이얼로그 데이터 초기화
             self.scan_status_data = {
-                'real_time_scanned_data': [],
+                'real_time_scanned_data': self.scan_session.current,
                 'child_parts_info': [],
                 'current_panel_title': ''
             }
-            print(f"DEBUG: 스캔 현황 다이얼로그 데이터 초기화 완료")
+            logger.debug("스캔 현황 다이얼로그 데이터 초기화 완료")
             
-            # 5. 기존 스캔 현황 다이얼로그가 열려있다면 닫기
+            # 3. 기존 스캔 현황 다이얼로그가 열려있다면 닫기
             if hasattr(self, 'scan_status_dialog') and self.scan_status_dialog:
-                print(f"DEBUG: 기존 스캔 현황 다이얼로그 닫기")
+                logger.debug("기존 스캔 현황 다이얼로그 닫기")
                 self.scan_status_dialog.close()
                 self.scan_status_dialog = None
             
             # 6. 워크플로우 리셋
             if hasattr(self, 'workflow_manager') and self.workflow_manager:
                 self.workflow_manager.reset_workflow()
-                print(f"DEBUG: 워크플로우 리셋 완료")
+                logger.debug("워크플로우 리셋 완료")
             
-            print(f"DEBUG: ===== 임시보관 데이터 클리어 완료 =====")
+            logger.debug("===== 임시보관 데이터 클리어 완료 =====")
             
         except Exception as e:
-            print(f"ERROR: 임시보관 데이터 클리어 오류: {e}")
-    
-    def clear_startup_data(self):
-        """프로그램 시작 시 모든 임시 데이터 삭제"""
-        try:
-            print(f"DEBUG: ===== 프로그램 시작 시 데이터 정리 시작 =====")
-            
-            # 1. 임시 스캔 데이터 파일 삭제
-            try:
-                import os
-                temp_scan_file = os.path.join("data", "temp_scan_data.json")
-                
-                if os.path.exists(temp_scan_file):
-                    os.remove(temp_scan_file)
-                    print(f"DEBUG: 프로그램 시작 - 임시 스캔 데이터 파일 삭제: {temp_scan_file}")
-                else:
-                    print(f"DEBUG: 프로그램 시작 - 임시 스캔 데이터 파일 없음: {temp_scan_file}")
-            except Exception as e:
-                print(f"DEBUG: 프로그램 시작 - 임시 파일 삭제 오류: {e}")
-            
-            # 2. 기타 임시 파일들 삭제
-            try:
-                import os
-                script_dir = os.path.dirname(os.path.abspath(__file__))
-                project_root = os.path.dirname(script_dir)
-                
-                # 스캔 데이터 백업 파일들 삭제
-                temp_files = [
-                    "data/scan_data_backup.json",
-                    "data/temp_scan_data.json"
-                ]
-                
-                for temp_file in temp_files:
-                    temp_path = os.path.join(project_root, temp_file)
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
-                        print(f"DEBUG: 프로그램 시작 - 임시 파일 삭제: {temp_file}")
-            except Exception as e:
-                print(f"DEBUG: 프로그램 시작 - 기타 임시 파일 삭제 오류: {e}")
-            
-            print(f"DEBUG: ===== 프로그램 시작 시 데이터 정리 완료 =====")
-            
-        except Exception as e:
-            print(f"ERROR: 프로그램 시작 시 데이터 정리 오류: {e}")
-    
-    def force_clear_all_temp_files(self):
-        """프로그램 시작 시 모든 임시 파일 강제 삭제"""
-        try:
-            print(f"DEBUG: ===== 프로그램 시작 시 강제 파일 삭제 시작 =====")
-            
-            import os
-            import json
-            
-            # 모든 가능한 경로에서 파일 삭제
-            possible_paths = [
-                # 1. 프로젝트 루트 (절대 경로)
-                os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "temp_scan_data.json"),
-                # 2. 현재 작업 디렉토리
-                "temp_scan_data.json",
-                # 3. Program 디렉토리
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_scan_data.json"),
-                # 4. 상위 디렉토리
-                os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "temp_scan_data.json")
-            ]
-            
-            deleted_count = 0
-            
-            for temp_file in possible_paths:
-                try:
-                    if os.path.exists(temp_file):
-                        print(f"DEBUG: 프로그램 시작 - 강제 삭제 대상 파일 발견: {temp_file}")
-                        
-                        # 파일 내용 확인
-                        try:
-                            with open(temp_file, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                                print(f"DEBUG: 프로그램 시작 - 삭제할 파일 내용: {len(data)}개 항목")
-                        except Exception as e:
-                            print(f"DEBUG: 프로그램 시작 - 파일 내용 읽기 오류: {e}")
-                        
-                        # 파일 삭제
-                        os.remove(temp_file)
-                        deleted_count += 1
-                        print(f"DEBUG: 프로그램 시작 - 강제 삭제 완료: {temp_file}")
-                        
-                        # 삭제 확인
-                        if not os.path.exists(temp_file):
-                            print(f"DEBUG: 프로그램 시작 - 삭제 확인됨: {temp_file}")
-                        else:
-                            print(f"DEBUG: 프로그램 시작 - ⚠️ 삭제 실패: {temp_file}")
-                    else:
-                        print(f"DEBUG: 프로그램 시작 - 파일 없음: {temp_file}")
-                except Exception as e:
-                    print(f"DEBUG: 프로그램 시작 - 파일 삭제 오류: {e}")
-            
-            print(f"DEBUG: 프로그램 시작 - 강제 삭제된 파일 수: {deleted_count}개")
-            print(f"DEBUG: ===== 프로그램 시작 시 강제 파일 삭제 완료 =====")
-            
-        except Exception as e:
-            print(f"ERROR: 프로그램 시작 시 강제 파일 삭제 오류: {e}")
-            import traceback
-            print(f"ERROR: 상세 오류: {traceback.format_exc()}")
-    
-    def clear_temp_file_on_startup(self):
-        """프로그램 시작 시 temp_scan_data.json 파일 초기화 (안전을 위해)"""
-        try:
-            print(f"DEBUG: ===== 프로그램 시작 시 임시 파일 초기화 시작 =====")
-            
-            import os
-            import json
-            
-            # 여러 경로에서 temp_scan_data.json 파일 삭제
-            possible_paths = [
-                os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "temp_scan_data.json"),
-                "temp_scan_data.json",
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_scan_data.json")
-            ]
-            
-            deleted_count = 0
-            
-            for temp_file in possible_paths:
-                try:
-                    if os.path.exists(temp_file):
-                        # 파일 내용 확인 (디버그용)
-                        try:
-                            with open(temp_file, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                                print(f"DEBUG: 프로그램 시작 - 삭제할 임시 파일 내용: {len(data)}개 항목")
-                        except Exception as e:
-                            print(f"DEBUG: 프로그램 시작 - 파일 내용 읽기 오류: {e}")
-                        
-                        # 파일 삭제
-                        os.remove(temp_file)
-                        deleted_count += 1
-                        print(f"DEBUG: 프로그램 시작 - 임시 파일 삭제: {temp_file}")
-                        
-                        # 삭제 확인
-                        if not os.path.exists(temp_file):
-                            print(f"DEBUG: 프로그램 시작 - 삭제 확인됨: {temp_file}")
-                        else:
-                            print(f"DEBUG: 프로그램 시작 - ⚠️ 삭제 실패: {temp_file}")
-                    else:
-                        print(f"DEBUG: 프로그램 시작 - 임시 파일 없음: {temp_file}")
-                except Exception as e:
-                    print(f"DEBUG: 프로그램 시작 - 파일 삭제 오류: {e}")
-            
-            print(f"DEBUG: 프로그램 시작 - 삭제된 임시 파일 수: {deleted_count}개")
-            print(f"DEBUG: ===== 프로그램 시작 시 임시 파일 초기화 완료 =====")
-            
-        except Exception as e:
-            print(f"ERROR: 프로그램 시작 시 임시 파일 초기화 오류: {e}")
-            import traceback
-            print(f"ERROR: 상세 오류: {traceback.format_exc()}")
+            logger.error("임시보관 데이터 클리어 오류: %s", e)
     
     def complete_reset_for_new_work(self):
         """공정 부품코드 스캔 시 완전한 초기화 (사용자 요구사항에 따른 명확한 로직)"""
         try:
-            print(f"DEBUG: ===== 공정 부품코드 스캔 시 완전한 초기화 시작 =====")
-            
-            # 부모바코드 스캔 시점의 패널 정보는 유지 (완료신호 검증을 위해)
-            # self.pending_print_panel은 process_barcode_with_workflow에서 설정되므로 여기서 초기화하지 않음
+            logger.debug("===== 공정 부품코드 스캔 시 완전한 초기화 시작 =====")
             
             # 1. 모든 메모리 데이터 초기화 (하위부품 데이터 완전 삭제)
-            self.temp_scan_data = []
-            self.scanned_parts = []
-            self.global_scan_data = []
+            self.scan_session.clear_current()
             self.scan_status_data = {
-                'real_time_scanned_data': [],
+                'real_time_scanned_data': self.scan_session.current,
                 'child_parts_info': [],
                 'current_panel_title': ''
             }
@@ -2848,88 +1902,58 @@ class BarcodeMainScreen(QMainWindow):
             # 하위부품 관련 추가 초기화
             if hasattr(self, 'child_part_validator') and self.child_part_validator:
                 # 하위부품 검증기 초기화
-                print(f"DEBUG: 공정 부품코드 스캔 - 하위부품 검증기 초기화")
+                logger.debug("공정 부품코드 스캔 - 하위부품 검증기 초기화")
             
             # 출력 상태 초기화 (중복 출력 방지)
             if hasattr(self, 'auto_print_manager') and self.auto_print_manager:
                 self.auto_print_manager.reset_print_status()
-                print(f"DEBUG: 공정 부품코드 스캔 - 출력 상태 초기화")
+                logger.debug("공정 부품코드 스캔 - 출력 상태 초기화")
             
             # 패널별 하위부품 데이터 초기화
-            if hasattr(self, 'front_panel') and self.front_panel:
-                if hasattr(self.front_panel, 'scanned_child_parts'):
-                    self.front_panel.scanned_child_parts = []
-                    print(f"DEBUG: 공정 부품코드 스캔 - Front 패널 하위부품 데이터 초기화")
-            
-            if hasattr(self, 'rear_panel') and self.rear_panel:
-                if hasattr(self.rear_panel, 'scanned_child_parts'):
-                    self.rear_panel.scanned_child_parts = []
-                    print(f"DEBUG: 공정 부품코드 스캔 - Rear 패널 하위부품 데이터 초기화")
-            
-            print(f"DEBUG: 공정 부품코드 스캔 - 메모리 데이터 초기화 완료")
-            
-            # 2. 임시 파일 삭제
-            import os
-            import json
-            
-            # 여러 경로에서 temp_scan_data.json 파일 삭제
-            possible_paths = [
-                os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "temp_scan_data.json"),
-                "temp_scan_data.json",
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_scan_data.json")
-            ]
-            
-            deleted_count = 0
-            for temp_file in possible_paths:
-                if os.path.exists(temp_file):
-                    try:
-                        os.remove(temp_file)
-                        deleted_count += 1
-                        print(f"DEBUG: 공정 부품코드 스캔 - 임시 파일 삭제: {temp_file}")
-                    except Exception as e:
-                        print(f"DEBUG: 공정 부품코드 스캔 - 파일 삭제 오류: {e}")
+            for station, panel in self.iter_panels():
+                if hasattr(panel, 'scanned_child_parts'):
+                    panel.scanned_child_parts = []
+                    logger.debug("공정 부품코드 스캔 - %s 패널 하위부품 데이터 초기화", station.name)
             
-            print(f"DEBUG: 공정 부품코드 스캔 - 삭제된 임시 파일 수: {deleted_count}개")
+            logger.debug("공정 부품코드 스캔 - 메모리 데이터 초기화 완료")
             
             # 3. 기존 스캔현황 다이얼로그 닫기
             if hasattr(self, 'scan_status_dialog') and self.scan_status_dialog:
                 self.scan_status_dialog.close()
                 self.scan_status_dialog = None
-                print(f"DEBUG: 공정 부품코드 스캔 - 기존 다이얼로그 닫기 완료")
+                logger.debug("공정 부품코드 스캔 - 기존 다이얼로그 닫기 완료")
             
             # 4. 워크플로우 리셋
             if hasattr(self, 'workflow_manager') and self.workflow_manager:
                 self.workflow_manager.reset_workflow()
-                print(f"DEBUG: 공정 부품코드 스캔 - 워크플로우 리셋 완료")
+                logger.debug("공정 부품코드 스캔 - 워크플로우 리셋 완료")
             
             # 5. 하위부품 스캔 관련 모든 데이터 강제 초기화
             self.force_clear_child_part_data()
             
-            print(f"DEBUG: ===== 공정 부품코드 스캔 시 완전한 초기화 완료 =====")
+            logger.debug("===== 공정 부품코드 스캔 시 완전한 초기화 완료 =====")
             
         except Exception as e:
-            print(f"ERROR: 공정 부품코드 스캔 시 완전한 초기화 오류: {e}")
+            logger.error("공정 부품코드 스캔 시 완전한 초기화 오류: %s", e)
             import traceback
-            print(f"ERROR: 상세 오류: {traceback.format_exc()}")
+            logger.error("상세 오류: %s", traceback.format_exc())
     
     def force_clear_child_part_data(self):
         """하위부품 스캔 관련 모든 데이터 강제 초기화"""
         try:
-            print(f"DEBUG: ===== 하위부품 데이터 강제 초기화 시작 =====")
+            logger.debug("===== 하위부품 데이터 강제 초기화 시작 =====")
             
             # 1. 하위부품 스캔 히스토리 초기화
-            if hasattr(self, 'scan_history'):
-                self.scan_history = []
-                print(f"DEBUG: 하위부품 데이터 초기화 - 스캔 히스토리 초기화")
+            if hasattr(self, 'scan_session'):
+                self.scan_session.clear_all()
+                logger.debug("하위부품 데이터 초기화 - 스캔 히스토리 초기화")
             
             # 2. 하위부품 관련 모든 임시 파일 삭제
             import os
             import json
             
             temp_files = [
-                "data/temp_scan_data.json",
                 "data/scan_data_backup.json",
-                os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "temp_scan_data.json"),
                 os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "scan_data_backup.json")
             ]
             
@@ -2937,33 +1961,24 @@ class BarcodeMainScreen(QMainWindow):
                 if os.path.exists(temp_file):
                     try:
                         os.remove(temp_file)
-                        print(f"DEBUG: 하위부품 데이터 초기화 - 임시 파일 삭제: {temp_file}")
+                        logger.debug("하위부품 데이터 초기화 - 임시 파일 삭제: %s", temp_file)
                     except Exception as e:
-                        print(f"DEBUG: 하위부품 데이터 초기화 - 파일 삭제 오류: {e}")
+                        logger.error("하위부품 데이터 초기화 - 파일 삭제 오류: %s", e)
             
             # 3. 하위부품 검증기 초기화
             if hasattr(self, 'child_part_validator') and self.child_part_validator:
                 # 하위부품 검증기 내부 상태 초기화
                 if hasattr(self.child_part_validator, 'reset'):
                     self.child_part_validator.reset()
-                    print(f"DEBUG: 하위부품 데이터 초기화 - 하위부품 검증기 리셋")
-            
-            # 4. 패널별 하위부품 데이터 강제 초기화
-            if hasattr(self, 'front_panel') and self.front_panel:
-                # Front 패널 하위부품 관련 모든 데이터 초기화
-                if hasattr(self.front_panel, 'scanned_child_parts'):
-                    self.front_panel.scanned_child_parts = []
-                if hasattr(self.front_panel, 'child_parts_status'):
-                    self.front_panel.child_parts_status = {}
-                print(f"DEBUG: 하위부품 데이터 초기화 - Front 패널 하위부품 데이터 초기화")
-            
-            if hasattr(self, 'rear_panel') and self.rear_panel:
-                # Rear 패널 하위부품 관련 모든 데이터 초기화
-                if hasattr(self.rear_panel, 'scanned_child_parts'):
-                    self.rear_panel.scanned_child_parts = []
-                if hasattr(self.rear_panel, 'child_parts_status'):
-                    self.rear_panel.child_parts_status = {}
-                print(f"DEBUG: 하위부품 데이터 초기화 - Rear 패널 하위부품 데이터 초기화")
+                    logger.debug("하위부품 데이터 초기화 - 하위부품 검증기 리셋")
+            
+            # 4. 패널별 하위부품 데이터 강제 초기화 (하위부품 관련 모든 데이터)
+            for station, panel in self.iter_panels():
+                if hasattr(panel, 'scanned_child_parts'):
+                    panel.scanned_child_parts = []
+                if hasattr(panel, 'child_parts_status'):
+                    panel.child_parts_status = {}
+                logger.debug("하위부품 데이터 초기화 - %s 패널 하위부품 데이터 초기화", station.name)
             
             # 5. 하위부품 스캔 관련 전역 변수 초기화
             if hasattr(self, 'current_child_parts'):
@@ -2971,144 +1986,59 @@ class BarcodeMainScreen(QMainWindow):
             if hasattr(self, 'scanned_child_parts'):
                 self.scanned_child_parts = []
             
-            print(f"DEBUG: ===== 하위부품 데이터 강제 초기화 완료 =====")
+            logger.debug("===== 하위부품 데이터 강제 초기화 완료 =====")
             
         except Exception as e:
-            print(f"ERROR: 하위부품 데이터 강제 초기화 오류: {e}")
+            logger.error("하위부품 데이터 강제 초기화 오류: %s", e)
             import traceback
-            print(f"ERROR: 상세 오류: {traceback.format_exc()}")
+            logger.error("상세 오류: %s", traceback.format_exc())
     
-    def clear_temp_scan_file(self):
-        """부품바코드 선택 시 temp_scan_data.json 파일 즉시 클리어"""
-        try:
-            print(f"DEBUG: ===== 부품바코드 선택 시 임시 파일 클리어 시작 =====")
-            
-            import os
-            import json
-            
-            # 여러 경로에서 파일 삭제 시도
-            possible_paths = [
-                # 1. 프로젝트 루트 (절대 경로)
-                os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "temp_scan_data.json"),
-                # 2. 현재 작업 디렉토리
-                "temp_scan_data.json",
-                # 3. Program 디렉토리
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_scan_data.json")
-            ]
-            
-            deleted_files = []
-            
-            for temp_scan_file in possible_paths:
-                print(f"DEBUG: 부품바코드 선택 - 임시 파일 경로 확인: {temp_scan_file}")
-                print(f"DEBUG: 부품바코드 선택 - 파일 존재 여부: {os.path.exists(temp_scan_file)}")
-                
-                if os.path.exists(temp_scan_file):
-                    # 파일 내용 확인
-                    try:
-                        with open(temp_scan_file, 'r', encoding='utf-8') as f:
-                            existing_data = json.load(f)
-                            print(f"DEBUG: 부품바코드 선택 - 기존 파일 내용: {len(existing_data)}개 항목")
-                            for i, data in enumerate(existing_data):
-                                print(f"DEBUG: 부품바코드 선택 - 기존 데이터 {i}: {data}")
-                    except Exception as e:
-                        print(f"DEBUG: 부품바코드 선택 - 기존 파일 내용 읽기 오류: {e}")
-                    
-                    # 파일 삭제 시도
-                    try:
-                        os.remove(temp_scan_file)
-                        print(f"DEBUG: 부품바코드 선택 - 임시 파일 삭제 완료: {temp_scan_file}")
-                        deleted_files.append(temp_scan_file)
-                        
-                        # 삭제 확인
-                        if not os.path.exists(temp_scan_file):
-                            print(f"DEBUG: 부품바코드 선택 - 파일 삭제 확인됨: {temp_scan_file}")
-                        else:
-                            print(f"DEBUG: 부품바코드 선택 - ⚠️ 파일 삭제 실패: {temp_scan_file}")
-                    except Exception as e:
-                        print(f"DEBUG: 부품바코드 선택 - 파일 삭제 오류: {e}")
-                else:
-                    print(f"DEBUG: 부품바코드 선택 - 임시 파일이 존재하지 않음: {temp_scan_file}")
-            
-            print(f"DEBUG: 부품바코드 선택 - 삭제된 파일 수: {len(deleted_files)}개")
-            for deleted_file in deleted_files:
-                print(f"DEBUG: 부품바코드 선택 - 삭제된 파일: {deleted_file}")
-            
-            print(f"DEBUG: ===== 부품바코드 선택 시 임시 파일 클리어 완료 =====")
-            
-        except Exception as e:
-            print(f"ERROR: 부품바코드 선택 시 임시 파일 클리어 오류: {e}")
-            import traceback
-            print(f"ERROR: 상세 오류: {traceback.format_exc()}")
+    def scanned_parts(self):
+        """최근 스캔 부품 (부품번호, OK여부) - 최신순 20건"""
+        return self.scan_session.recent_parts
     
-    def add_to_scan_history(self, scan_data):
-        """스캔 히스토리에 데이터 추가 (영구 저장)"""
-        try:
-            print(f"DEBUG: 스캔 히스토리에 데이터 추가: {scan_data}")
-            
-            # 히스토리에 추가 (최신순으로 앞에 추가)
-            self.scan_history.insert(0, scan_data.copy())
-            
-            # 최대 1000개까지만 유지 (메모리 관리)
-            if len(self.scan_history) > 1000:
-                self.scan_history = self.scan_history[:1000]
-                print(f"DEBUG: 스캔 히스토리 1000개로 제한됨")
-            
-            print(f"DEBUG: 스캔 히스토리 추가 완료: {len(self.scan_history)}개 항목")
-            
-        except Exception as e:
-            print(f"ERROR: 스캔 히스토리 추가 오류: {e}")
+    @property
+    def temp_scan_data(self):
+        """현재 작업 하위부품 스캔 데이터 - 최신순 100건"""
+        return self.scan_session.current
     
-    def add_to_temp_scan_data(self, scan_data):
-        """임시보관 데이터에 추가 (현재 작업용)"""
-        try:
-            print(f"DEBUG: ===== 임시보관 데이터 추가 시작 =====")
-            print(f"DEBUG: 추가할 데이터: {scan_data}")
-            print(f"DEBUG: 추가 전 임시보관 데이터: {len(self.temp_scan_data)}개 항목")
-            
-            # 임시보관에 추가 (최신순으로 앞에 추가)
-            self.temp_scan_data.insert(0, scan_data.copy())
-            
-            # 최대 100개까지만 유지 (현재 작업용)
-            if len(self.temp_scan_data) > 100:
-                self.temp_scan_data = self.temp_scan_data[:100]
-                print(f"DEBUG: 임시보관 데이터 100개로 제한됨")
-            
-            print(f"DEBUG: 임시보관 데이터 추가 완료: {len(self.temp_scan_data)}개 항목")
-            print(f"DEBUG: 현재 임시보관 데이터 내용:")
-            for i, data in enumerate(self.temp_scan_data):
-                print(f"DEBUG:   {i}: {data}")
-            print(f"DEBUG: ===== 임시보관 데이터 추가 완료 =====")
-            
-        except Exception as e:
-            print(f"ERROR: 임시보관 데이터 추가 오류: {e}")
+    @property
+    def global_scan_data(self):
+        """기존 호환용 - 현재 작업 스캔 데이터와 동일한 뷰"""
+        return self.scan_session.current
+    
+    @property
+    def scan_history(self):
+        """스캔 히스토리 - 최신순 1000건 (작업 초기화와 무관)"""
+        return self.scan_session.history
     
     def initialize_scan_status_for_new_work(self, part_number: str, expected_sub_parts: list):
         """신규 작업 시작 시 스캔 현황 데이터 초기화"""
         try:
-            print(f"DEBUG: ===== 신규 작업 스캔 현황 데이터 초기화 시작 =====")
-            print(f"DEBUG: 부품번호: {part_number}")
-            print(f"DEBUG: 예상 하위부품: {expected_sub_parts}")
+            logger.debug("===== 신규 작업 스캔 현황 데이터 초기화 시작 =====")
+            logger.debug("부품번호: %s", part_number)
+            logger.debug("예상 하위부품: %s", expected_sub_parts)
             
             # 1. 임시보관 데이터 클리어
             self.clear_temp_scan_data()
             
             # 2. 하위부품 정보 설정
             self.scan_status_data['child_parts_info'] = expected_sub_parts.copy() if expected_sub_parts else []
-            print(f"DEBUG: 하위부품 정보 설정 완료: {len(self.scan_status_data['child_parts_info'])}개")
+            logger.debug("하위부품 정보 설정 완료: %s개", len(self.scan_status_data['child_parts_info']))
             
-            print(f"DEBUG: ===== 신규 작업 스캔 현황 데이터 초기화 완료 =====")
+            logger.debug("===== 신규 작업 스캔 현황 데이터 초기화 완료 =====")
             
         except Exception as e:
-            print(f"ERROR: 신규 작업 스캔 현황 데이터 초기화 오류: {e}")
+            logger.error("신규 작업 스캔 현황 데이터 초기화 오류: %s", e)
     
     def on_scanner_data_received(self, data: str):
         """스캐너 데이터 수신 처리"""
         try:
-            print(f"DEBUG: ===== 스캐너 데이터 수신 ===== {data}")
+            logger.debug("===== 스캐너 데이터 수신 ===== %s", data)
             # 바코드 스캔 이벤트로 전달
             self.on_barcode_scanned(data.strip())
         except Exception as e:
-            print(f"ERROR: 스캐너 데이터 처리 오류: {e}")
+            logger.error("스캐너 데이터 처리 오류: %s", e)
     
     def check_scanner_data(self):
         """스캐너 데이터 폴링 체크"""
@@ -3124,88 +2054,81 @@ class BarcodeMainScreen(QMainWindow):
                             # 바이트를 문자열로 변환
                             data_str = data.decode('utf-8', errors='ignore').strip()
                             if data_str:
-                                print(f"DEBUG: ===== 스캐너 폴링 데이터 수신 ===== {data_str}")
+                                logger.debug("===== 스캐너 폴링 데이터 수신 ===== %s", data_str)
                                 # 바코드 스캔 이벤트로 전달
                                 self.on_barcode_scanned(data_str)
         except Exception as e:
-            print(f"ERROR: 스캐너 폴링 데이터 수신 오류: {e}")
+            logger.error("스캐너 폴링 데이터 수신 오류: %s", e)
+    
+    def start_nutrunner_ingest(self):
+        """연결된 너트런너 읽기 스레드 시작 (재연결 후에도 호출) - 해석된 결과는 100ms마다 작업 흐름 엔진에 전달"""
+        if self.nutrunner_ingest.start(self.serial_connections):
+            if getattr(self, 'nutrunner_timer', None) is None:
+                self.nutrunner_timer = QTimer()
+                self.nutrunner_timer.timeout.connect(self.check_nutrunner_results)
+                self.nutrunner_timer.start(100)
+    
+    def check_nutrunner_results(self):
+        """읽기 스레드가 해석한 체결 결과 → 작업 흐름 엔진 (진행 중인 사이클에 추가)"""
+        try:
+            for result in self.nutrunner_ingest.drain():
+                self.production_engine.on_tightening(result)
+        except Exception as e:
+            logger.error("체결 결과 처리 오류: %s", e)
     
     def on_barcode_scanned(self, barcode: str):
-        """바코드 스캔 이벤트 처리 - 메인 부품번호와 하위부품 구분"""
+        """바코드 스캔 이벤트 처리 - 공정부품/하위부품 판단과 검증은 작업 흐름 엔진이 하고, 화면은 엔진 이벤트로 갱신"""
         try:
-            print(f"DEBUG: ===== 바코드 스캔 이벤트 발생 ===== {barcode}")
-            print(f"DEBUG: 현재 FRONT/LH 부품번호: {getattr(self.front_panel, 'part_number', 'None') if hasattr(self, 'front_panel') else 'front_panel 없음'}")
-            print(f"DEBUG: 현재 REAR/RH 부품번호: {getattr(self.rear_panel, 'part_number', 'None') if hasattr(self, 'rear_panel') else 'rear_panel 없음'}")
-            
-            # 바코드가 메인 부품번호인지 확인
-            is_main_part = False
-            if hasattr(self, 'front_panel') and self.front_panel and self.front_panel.part_number == barcode:
-                print(f"DEBUG: FRONT/LH 메인 부품번호 스캔 - {barcode}")
-                is_main_part = True
-            elif hasattr(self, 'rear_panel') and self.rear_panel and self.rear_panel.part_number == barcode:
-                print(f"DEBUG: REAR/RH 메인 부품번호 스캔 - {barcode}")
-                is_main_part = True
-            
-            if is_main_part:
-                # 메인 부품번호 스캔 - 워크플로우 통합 처리
-                print(f"DEBUG: 메인 부품번호 스캔 처리 - {barcode}")
-                self.process_barcode_with_workflow(barcode)
-            else:
-                # 하위부품 스캔 - 하위부품 처리 로직 실행
-                print(f"DEBUG: 하위부품 스캔으로 판단 - {barcode}")
-                self.add_scanned_part(barcode, True, raw_barcode_data=barcode)
-            
+            logger.debug("===== 바코드 스캔 이벤트 발생 ===== %s", barcode)
+            self.production_engine.on_scan(barcode)
         except Exception as e:
-            print(f"ERROR: 바코드 스캔 처리 오류: {e}")
+            logger.error("바코드 스캔 처리 오류: %s", e)
     
     def test_barcode_scan(self, barcode: str):
         """바코드 스캔 테스트 - 수동 테스트용"""
-        print(f"DEBUG: ===== 수동 바코드 스캔 테스트 ===== {barcode}")
+        logger.debug("===== 수동 바코드 스캔 테스트 ===== %s", barcode)
         self.on_barcode_scanned(barcode)
     
     def keyPressEvent(self, event):
         """키보드 이벤트 처리 - 테스트용"""
-        print(f"DEBUG: 키보드 이벤트 발생 - 키 코드: {event.key()}")
+        logger.debug("키보드 이벤트 발생 - 키 코드: %s", event.key())
         
         # F키 처리
-        if event.key() == Qt.Key_F1:
-            # F1 키로 FRONT/LH 부품번호 스캔 테스트 (현재 활성화된 부품번호 사용)
-            current_part_number = getattr(self.front_panel, 'part_number', '') if hasattr(self, 'front_panel') else ''
-            print(f"DEBUG: F1 키 눌림 - FRONT/LH 부품번호 스캔 테스트: {current_part_number}")
+        if event.key() in (Qt.Key_F1, Qt.Key_F2):
+            # F1/F2 키로 첫 번째/두 번째 패널 부품번호 스캔 테스트 (현재 활성화된 부품번호 사용)
+            key_name = "F1" if event.key() == Qt.Key_F1 else "F2"
+            stations = list(self.station_layout)
+            index = 0 if event.key() == Qt.Key_F1 else 1
+            station = stations[index] if index < len(stations) else None
+            panel = self.panels.get(station.name) if station else None
+            current_part_number = getattr(panel, 'part_number', '') if panel else ''
+            logger.debug("%s 키 눌림 - %s 부품번호 스캔 테스트: %s", key_name, station.name if station else '-', current_part_number)
             if current_part_number:
                 self.test_barcode_scan(current_part_number)
             else:
-                print("DEBUG: F1 키 - FRONT/LH 부품번호가 없음")
-        elif event.key() == Qt.Key_F2:
-            # F2 키로 REAR/RH 부품번호 스캔 테스트 (현재 활성화된 부품번호 사용)
-            current_part_number = getattr(self.rear_panel, 'part_number', '') if hasattr(self, 'rear_panel') else ''
-            print(f"DEBUG: F2 키 눌림 - REAR/RH 부품번호 스캔 테스트: {current_part_number}")
-            if current_part_number:
-                self.test_barcode_scan(current_part_number)
-            else:
-                print("DEBUG: F2 키 - REAR/RH 부품번호가 없음")
+                logger.debug("%s 키 - %s 부품번호가 없음", key_name, station.name if station else '-')
         elif event.key() == Qt.Key_F3:
             # F3 키로 하위부품 바코드 스캔 테스트
             test_child_barcode = "[)>06V2812P89231CU1000T2510022000A0000001M"
-            print(f"DEBUG: F3 키 눌림 - 하위부품 바코드 스캔 테스트: {test_child_barcode}")
+            logger.debug("F3 키 눌림 - 하위부품 바코드 스캔 테스트: %s", test_child_barcode)
             self.test_barcode_scan(test_child_barcode)
         elif event.key() == Qt.Key_F4:
             # F4 키로 다른 하위부품 바코드 스캔 테스트
             test_child_barcode = "[)>06V2812P89231CU1001T251002S1B2A0000001M"
-            print(f"DEBUG: F4 키 눌림 - 하위부품 바코드 스캔 테스트: {test_child_barcode}")
+            logger.debug("F4 키 눌림 - 하위부품 바코드 스캔 테스트: %s", test_child_barcode)
             self.test_barcode_scan(test_child_barcode)
         elif event.key() == Qt.Key_F6:
             # F6 키로 하위부품 바코드 스캔 테스트 (다른 시리얼번호)
             test_child_barcode = "[)>\x1e06\x1dV2812\x1dP89231CU1002\x1dT2510022000A0000002\x1dM\x1e\x04"
-            print(f"DEBUG: F6 키 눌림 - 하위부품 바코드 스캔 테스트: {test_child_barcode}")
+            logger.debug("F6 키 눌림 - 하위부품 바코드 스캔 테스트: %s", test_child_barcode)
             self.test_barcode_scan(test_child_barcode)
         elif event.key() == Qt.Key_F7:
             # F7 키로 다른 하위부품 바코드 스캔 테스트 (다른 시리얼번호)
             test_child_barcode = "[)>\x1e06\x1dV2812\x1dP89331CU1003\x1dT251002S1B2A0000002\x1dM\x1e\x04"
-            print(f"DEBUG: F7 키 눌림 - 하위부품 바코드 스캔 테스트: {test_child_barcode}")
+            logger.debug("F7 키 눌림 - 하위부품 바코드 스캔 테스트: %s", test_child_barcode)
             self.test_barcode_scan(test_child_barcode)
         else:
-            print(f"DEBUG: 다른 키 눌림 - 키 코드: {event.key()}")
+            logger.debug("다른 키 눌림 - 키 코드: %s", event.key())
             super().keyPressEvent(event)
     
     def save_scan_log(self, part_number, is_ok, panel_name=None, raw_barcode_data=None):
@@ -3214,12 +2137,12 @@ class BarcodeMainScreen(QMainWindow):
             # 패널명이 전달되지 않으면 현재 패널 정보 확인
             if not panel_name:
                 panel_name = self.get_current_panel_name()
-                print(f"DEBUG: 스캔 로그 저장 - 패널명: {panel_name}, 부품번호: {part_number}")
+                logger.debug("스캔 로그 저장 - 패널명: %s, 부품번호: %s", panel_name, part_number)
                 if not panel_name:
-                    print(f"DEBUG: 패널명을 가져올 수 없음 - 스캔 로그 저장 중단")
+                    logger.debug("패널명을 가져올 수 없음 - 스캔 로그 저장 중단")
                     return
             else:
-                print(f"DEBUG: 스캔 로그 저장 - 패널명: {panel_name}, 부품번호: {part_number}")
+                logger.debug("스캔 로그 저장 - 패널명: %s, 부품번호: %s", panel_name, part_number)
             
             # 메인 부품 정보 가져오기
             main_part_info = self.get_main_part_info(panel_name)
@@ -3228,23 +2151,25 @@ class BarcodeMainScreen(QMainWindow):
             child_parts_info = self.get_child_parts_info_for_panel(panel_name)
             
             # 공정코드 (구분값) 가져오기
+            station = self.get_station(panel_name)
             process_code = ""
             if hasattr(self, 'plc_data_manager') and self.plc_data_manager:
                 plc_data = self.plc_data_manager.get_plc_data()
-                if panel_name.upper() == "FRONT/LH":
-                    process_code = plc_data.get("front_lh_division", "")
-                elif panel_name.upper() == "REAR/RH":
-                    process_code = plc_data.get("rear_rh_division", "")
+                if station:
+                    process_code = plc_data.get(station.division_field, "")
             
             # 선택한 공정의 부품번호 가져오기
             process_part_number = ""
             if main_part_info and "part_number" in main_part_info:
                 process_part_number = main_part_info["part_number"]
             
+            # 시간대/근무조별 실적 집계 (하위부품 스캔 판정)
+            self.production_rollup.record(panel_name, process_part_number, RESULT_SCAN_OK if is_ok else RESULT_SCAN_NG)
+            
             # 로그 데이터 생성 (개선된 형식) - 하나의 공정부품에 여러 하위부품 저장
             # 기존 로그에서 같은 공정부품이 있는지 확인
             existing_log = None
-            for log in self.scan_logs.get("rear_rh" if panel_name.upper() == "REAR/RH" else "front_lh", []):
+            for log in self.scan_logs.get(station.key if station else None, []):
                 if log.get("공정부품") == process_part_number:
                     existing_log = log
                     break
@@ -3259,7 +2184,7 @@ class BarcodeMainScreen(QMainWindow):
                 existing_log[f"하위부품{child_count}_바코드"] = raw_barcode_data or ""
                 existing_log[f"하위부품{child_count}_스캔결과"] = "OK" if is_ok else "NG"
                 
-                print(f"DEBUG: 기존 로그에 하위부품{child_count} 추가: {part_number}")
+                logger.debug("기존 로그에 하위부품%s 추가: %s", child_count, part_number)
                 # 하위부품 바코드 히스토리 파일 저장 (모든 하위부품 스캔 시마다 저장)
                 self.save_barcode_history(part_number, raw_barcode_data or "", panel_name)
                 # 파일 저장은 작업 완료 시점에 수행하므로 여기서는 메모리에만 저장
@@ -3278,15 +2203,11 @@ class BarcodeMainScreen(QMainWindow):
                 }
             
                 # 새로운 로그를 해당 패널에 추가 (대소문자 구분 없이)
-                panel_name_upper = panel_name.upper()
-                if panel_name_upper == "FRONT/LH":
-                    self.scan_logs["front_lh"].append(log_entry)
-                    print(f"DEBUG: FRONT/LH 새 로그 추가 - 총 {len(self.scan_logs['front_lh'])}개")
-                elif panel_name_upper == "REAR/RH":
-                    self.scan_logs["rear_rh"].append(log_entry)
-                    print(f"DEBUG: REAR/RH 새 로그 추가 - 총 {len(self.scan_logs['rear_rh'])}개")
+                if station:
+                    self.scan_logs.setdefault(station.key, []).append(log_entry)
+                    logger.debug("%s 새 로그 추가 - 총 %s개", station.name, len(self.scan_logs[station.key]))
                 else:
-                    print(f"DEBUG: 알 수 없는 패널명: {panel_name} (대소문자 변환 후: {panel_name_upper})")
+                    logger.debug("알 수 없는 패널명: %s", panel_name)
             
             # 파일 저장은 작업 완료 시점에 수행하므로 여기서는 메모리에만 저장
             # (모든 하위부품이 스캔 완료된 후 저장하기 위함)
@@ -3294,16 +2215,17 @@ class BarcodeMainScreen(QMainWindow):
             # 하위부품 바코드 히스토리 파일 저장
             self.save_barcode_history(part_number, raw_barcode_data or "", panel_name)
             
-            print(f"DEBUG: 스캔 로그 저장 완료 - {panel_name}: {part_number}")
+            logger.debug("스캔 로그 저장 완료 - %s: %s", panel_name, part_number)
             
         except Exception as e:
-            print(f"DEBUG: 스캔 로그 저장 오류: {e}")
+            logger.error("스캔 로그 저장 오류: %s", e)
             # 오류 발생 시 기본 패널로 재시도
             try:
-                print(f"DEBUG: 기본 패널로 재시도 - FRONT/LH")
-                self.save_scan_log(part_number, is_ok, "FRONT/LH", raw_barcode_data)
+                default_panel = self.station_layout.names()[0]
+                logger.debug("기본 패널로 재시도 - %s", default_panel)
+                self.save_scan_log(part_number, is_ok, default_panel, raw_barcode_data)
             except Exception as e2:
-                print(f"DEBUG: 기본 패널 재시도도 실패: {e2}")
+                logger.error("기본 패널 재시도도 실패: %s", e2)
     
     def save_barcode_history(self, part_number, barcode_data, panel_name):
         """하위부품 바코드 히스토리 저장 (텍스트 파일, 연도별 폴더)"""
@@ -3316,8 +2238,8 @@ class BarcodeMainScreen(QMainWindow):
             
             # 월별 파일명 생성
             current_month = datetime.now().strftime("%Y-%m")
-            panel_suffix = "front_lh" if panel_name.upper() == "FRONT/LH" else "rear_rh"
-            filename = f"barcode_history_{panel_suffix}_{current_month}.txt"
+            station = self.get_station(panel_name) or self.station_layout.stations[-1]
+            filename = f"barcode_history_{station.log_key}_{current_month}.txt"
             filepath = os.path.join(history_dir, filename)
             
             # 현재 시간
@@ -3327,71 +2249,35 @@ class BarcodeMainScreen(QMainWindow):
             with open(filepath, 'a', encoding='utf-8') as f:
                 f.write(f"[{current_time}] {part_number}: {barcode_data}\n")
             
-            print(f"DEBUG: 바코드 히스토리 저장 완료 - {filepath}")
+            logger.debug("바코드 히스토리 저장 완료 - %s", filepath)
             
         except Exception as e:
-            print(f"DEBUG: 바코드 히스토리 저장 오류: {e}")
+            logger.error("바코드 히스토리 저장 오류: %s", e)
     
     def get_current_panel_name(self):
-        """현재 작업 중인 패널 이름 반환"""
+        """현재 작업 중인 패널 이름 반환 (패널 타이틀)"""
         # PLC 데이터를 기반으로 현재 작업 패널 판단
         if not self.plc_data_manager:
-            return self.panel_titles["front_lh"]  # 기본값
-        
-        plc_data = self.plc_data_manager.get_plc_data()
-        completion_signal = plc_data.get("completion_signal", 0)
-        front_lh_division = plc_data.get("front_lh_division", "")
-        rear_rh_division = plc_data.get("rear_rh_division", "")
-        
-        if completion_signal == 1:
-            return self.panel_titles["front_lh"]
-        elif completion_signal == 2:
-            return self.panel_titles["rear_rh"]
+            station = next(iter(self.station_layout))  # 기본값
         else:
-            # 작업중인 경우, 두 패널의 구분값을 모두 확인하여 더 정확한 패널 판단
-            # REAR/RH 구분값이 있고 FRONT/LH 구분값이 없으면 REAR/RH 반환
-            if rear_rh_division and not front_lh_division:
-                return self.panel_titles["rear_rh"]
-            # FRONT/LH 구분값이 있고 REAR/RH 구분값이 없으면 FRONT/LH 반환
-            elif front_lh_division and not rear_rh_division:
-                return self.panel_titles["front_lh"]
-            # 두 패널 모두 구분값이 있는 경우, 최근 작업 상태를 확인
-            # (work_status나 최근 스캔 패널 등을 확인할 수 있으면 더 정확)
-            elif rear_rh_division and front_lh_division:
-                # 두 패널 모두 구분값이 있을 때는 패널 객체의 work_status로 판단
-                if hasattr(self, 'rear_panel') and self.rear_panel and hasattr(self.rear_panel, 'work_status'):
-                    if self.rear_panel.work_status == 1:  # REAR/RH 완료
-                        return self.panel_titles["rear_rh"]
-                if hasattr(self, 'front_panel') and self.front_panel and hasattr(self.front_panel, 'work_status'):
-                    if self.front_panel.work_status == 1:  # FRONT/LH 완료
-                        return self.panel_titles["front_lh"]
-                # work_status로 판단할 수 없으면 rear_rh가 우선순위 (일반적으로 더 많이 사용)
-                return self.panel_titles["rear_rh"]
-            else:
-                # 구분값이 없는 경우 기본값
-                return self.panel_titles["front_lh"]
+            plc_data = self.plc_data_manager.get_plc_data()
+            # 완료신호가 있으면 해당 패널, 작업중이면 구분값/work_status 로 판단
+            station = (self.station_layout.for_signal(plc_data.get("completion_signal", 0))
+                       or self.guess_working_station(plc_data))
+        return self.panel_titles.get(station.key, station.title)
     
-    def check_and_execute_print(self):
-        """PLC 완료신호 확인 및 출력 실행"""
+    def check_work_start_signal(self):
+        """PLC 작업중(0) 신호 확인 - 출력 상태 초기화 (완료신호 처리/출력은 작업 흐름 엔진이 함)"""
         try:
             if not self.plc_data_manager:
                 return
             
             completion_signal = self.plc_data_manager.get_plc_data().get("completion_signal", 0)
-            print(f"DEBUG: PLC 완료신호 확인: {completion_signal}")
-            
-            # 완료신호별 출력 실행
-            if completion_signal == 1:
-                # FRONT/LH 완료 - 출력 실행
-                print(f"DEBUG: FRONT/LH 완료 - 출력 실행 시작")
-                self.execute_print_for_panel("front_lh")
-            elif completion_signal == 2:
-                # REAR/RH 완료 - 출력 실행
-                print(f"DEBUG: REAR/RH 완료 - 출력 실행 시작")
-                self.execute_print_for_panel("rear_rh")
-            elif completion_signal == 0:
+            logger.debug("PLC 완료신호 확인: %s", completion_signal)
+            
+            if completion_signal == 0:
                 # 작업중 상태 - 출력 상태 초기화 (새로운 사이클 준비)
-                print(f"DEBUG: 완료신호 0 - 새로운 작업 사이클 시작")
+                logger.debug("완료신호 0 - 새로운 작업 사이클 시작")
                 if hasattr(self, 'auto_print_manager') and self.auto_print_manager:
                     self.auto_print_manager.reset_print_status()
                 
@@ -3401,47 +2287,43 @@ class BarcodeMainScreen(QMainWindow):
                 # 완료신호 0일 때 생산수량 표시 (시뮬레이션과 실제 모두)
                 self.display_production_counts_on_work_start()
             else:
-                # 기타 완료신호 - 출력하지 않음
-                print(f"DEBUG: 완료신호 {completion_signal} - 출력하지 않음")
+                # 완료신호 - 작업완료/출력은 작업 흐름 엔진 이벤트로 처리됨
+                logger.debug("완료신호 %s - 작업 흐름 엔진이 처리", completion_signal)
                 
         except Exception as e:
-            print(f"DEBUG: 출력 실행 확인 오류: {e}")
+            logger.error("작업중 신호 확인 오류: %s", e)
     
     def check_scan_status_for_new_cycle(self):
         """새로운 작업 사이클에서 하위바코드 스캔 상태 확인"""
         try:
-            print(f"DEBUG: 새로운 사이클 - 하위바코드 스캔 상태 확인")
+            logger.debug("새로운 사이클 - 하위바코드 스캔 상태 확인")
             
             # 전역 스캔 데이터 확인
             if hasattr(self, 'global_scan_data') and self.global_scan_data:
-                print(f"DEBUG: 현재 스캔된 하위바코드: {len(self.global_scan_data)}개")
+                logger.debug("현재 스캔된 하위바코드: %s개", len(self.global_scan_data))
                 for i, scan_data in enumerate(self.global_scan_data):
                     part_number = scan_data.get('part_number', '')
                     is_ok = scan_data.get('is_ok', False)
                     panel = scan_data.get('panel', '')
-                    print(f"DEBUG: 스캔 데이터 {i}: {part_number} (OK: {is_ok}, 패널: {panel})")
+                    logger.debug("스캔 데이터 %s: %s (OK: %s, 패널: %s)", i, part_number, is_ok, panel)
             else:
-                print(f"DEBUG: 스캔된 하위바코드 없음")
+                logger.debug("스캔된 하위바코드 없음")
                 
         except Exception as e:
-            print(f"DEBUG: 스캔 상태 확인 오류: {e}")
+            logger.error("스캔 상태 확인 오류: %s", e)
     
     def save_print_log(self, panel_name, part_number, main_part_info, success=True, printed_child_parts=None):
         """바코드 출력 완료 로그 저장"""
         try:
             # 패널명 검증 및 정규화
-            panel_name_upper = panel_name.upper() if panel_name else ""
-            if panel_name_upper == "FRONT/LH":
-                panel_name = "FRONT/LH"
-                log_key = "front_lh"
-            elif panel_name_upper == "REAR/RH":
-                panel_name = "REAR/RH"
-                log_key = "rear_rh"
-            else:
-                print(f"DEBUG: ⚠️ 잘못된 패널명 - panel_name: {panel_name}")
+            station = self.get_station(panel_name)
+            if station is None:
+                logger.warning("⚠️ 잘못된 패널명 - panel_name: %s", panel_name)
                 return
+            panel_name = station.name
+            log_key = station.key
             
-            print(f"DEBUG: ✅ 출력 로그 저장 시작 - 패널명: {panel_name}, 부품번호: {part_number}")
+            logger.debug("✅ 출력 로그 저장 시작 - 패널명: %s, 부품번호: %s", panel_name, part_number)
             
             # 하위부품 정보 가져오기
             child_parts_info = self.get_child_parts_info_for_panel(panel_name)
@@ -3461,7 +2343,10 @@ class BarcodeMainScreen(QMainWindow):
             if log_key not in self.print_logs:
                 self.print_logs[log_key] = []
             self.print_logs[log_key].append(print_log_entry)
-            print(f"DEBUG: 출력 로그 추가 완료 - {log_key}: {len(self.print_logs[log_key])}개 항목")
+            logger.debug("출력 로그 추가 완료 - %s: %s개 항목", log_key, len(self.print_logs[log_key]))
+            
+            # 시간대/근무조별 실적 집계 (라벨 출력 결과)
+            self.production_rollup.record(panel_name, part_number, RESULT_OK if success else RESULT_NG)
             
             # 출력 로그 파일로 저장 (해당 패널만)
             self.save_print_logs_to_file(panel_name=panel_name)
@@ -3469,10 +2354,10 @@ class BarcodeMainScreen(QMainWindow):
             # 출력 로그 텍스트 파일로 저장 (출력에 사용된 하위부품 정보 전달)
             self.save_print_log_to_text_file(panel_name, part_number, main_part_info, child_parts_info, success, printed_child_parts)
             
-            print(f"DEBUG: 바코드 출력 로그 저장 완료 - {panel_name}: {part_number}")
+            logger.debug("바코드 출력 로그 저장 완료 - %s: %s", panel_name, part_number)
             
         except Exception as e:
-            print(f"DEBUG: 바코드 출력 로그 저장 오류: {e}")
+            logger.error("바코드 출력 로그 저장 오류: %s", e)
     
     def save_print_logs_to_file(self, panel_name=None):
         """출력 로그를 날짜별 파일로 저장 (연도별 폴더) - 해당 패널의 파일만 덮어쓰기"""
@@ -3487,15 +2372,12 @@ class BarcodeMainScreen(QMainWindow):
             
             # 패널명이 지정된 경우 해당 패널만 저장
             if panel_name:
-                if panel_name == "FRONT/LH":
-                    log_key = "front_lh"
-                    file_prefix = "front_lh_print"
-                elif panel_name == "REAR/RH":
-                    log_key = "rear_rh"
-                    file_prefix = "rear_rh_print"
-                else:
-                    print(f"DEBUG: 알 수 없는 패널명: {panel_name}")
+                station = self.get_station(panel_name)
+                if station is None:
+                    logger.debug("알 수 없는 패널명: %s", panel_name)
                     return
+                log_key = station.key
+                file_prefix = f"{station.log_key}_print"
                 
                 log_file = os.path.join(year_log_dir, f"{file_prefix}_{today}.json")
                 
@@ -3506,22 +2388,22 @@ class BarcodeMainScreen(QMainWindow):
                 # 메모리의 모든 로그 데이터를 파일에 저장 (완전히 새로 쓰기)
                 with open(log_file, 'w', encoding='utf-8') as f:
                     json.dump(self.print_logs[log_key], f, ensure_ascii=False, indent=2)
-                print(f"DEBUG: ✅ {panel_name} 출력 로그 저장 - 파일: {log_file}, 항목 수: {len(self.print_logs[log_key])}")
+                logger.debug("✅ %s 출력 로그 저장 - 파일: %s, 항목 수: %s", panel_name, log_file, len(self.print_logs[log_key]))
             else:
-                # 패널명이 없으면 둘 다 저장
-                for log_key, file_prefix in [("front_lh", "front_lh_print"), ("rear_rh", "rear_rh_print")]:
+                # 패널명이 없으면 모든 패널 저장
+                for log_key, file_prefix in [(station.key, f"{station.log_key}_print") for station in self.station_layout]:
                     log_file = os.path.join(year_log_dir, f"{file_prefix}_{today}.json")
                     if log_key not in self.print_logs:
                         self.print_logs[log_key] = []
                     
                     with open(log_file, 'w', encoding='utf-8') as f:
                         json.dump(self.print_logs[log_key], f, ensure_ascii=False, indent=2)
-                    print(f"DEBUG: ✅ {log_key.upper()} 출력 로그 저장 - 파일: {log_file}, 항목 수: {len(self.print_logs[log_key])}")
+                    logger.debug("✅ %s 출력 로그 저장 - 파일: %s, 항목 수: %s", log_key.upper(), log_file, len(self.print_logs[log_key]))
             
-            print(f"DEBUG: 출력 로그 파일 저장 완료 - {today}")
+            logger.debug("출력 로그 파일 저장 완료 - %s", today)
             
         except Exception as e:
-            print(f"DEBUG: 출력 로그 파일 저장 오류: {e}")
+            logger.error("출력 로그 파일 저장 오류: %s", e)
             import traceback
             traceback.print_exc()
     
@@ -3536,8 +2418,8 @@ class BarcodeMainScreen(QMainWindow):
                 os.makedirs(print_log_dir)
             
             # 월별 파일명 생성
-            panel_suffix = "front_lh" if panel_name.upper() == "FRONT/LH" else "rear_rh"
-            filename = f"print_log_{panel_suffix}_{current_month}.txt"
+            station = self.get_station(panel_name) or self.station_layout.stations[-1]
+            filename = f"print_log_{station.log_key}_{current_month}.txt"
             filepath = os.path.join(print_log_dir, filename)
             
             # 현재 시간
@@ -3547,10 +2429,10 @@ class BarcodeMainScreen(QMainWindow):
             scanned_child_parts = []
             if printed_child_parts:
                 scanned_child_parts = printed_child_parts
-                print(f"DEBUG: 출력에 사용된 하위부품 정보 사용: {len(scanned_child_parts)}개")
+                logger.debug("출력에 사용된 하위부품 정보 사용: %s개", len(scanned_child_parts))
             else:
                 scanned_child_parts = self.get_scanned_child_parts_for_panel(panel_name)
-                print(f"DEBUG: 스캔 데이터에서 하위부품 정보 사용: {len(scanned_child_parts)}개")
+                logger.debug("스캔 데이터에서 하위부품 정보 사용: %s개", len(scanned_child_parts))
             
             # 부모바코드 데이터 생성 (HKMC 형식)
             parent_barcode_data = self.generate_parent_barcode_data(part_number, main_part_info)
@@ -3581,10 +2463,22 @@ class BarcodeMainScreen(QMainWindow):
                 f.write(f"  패널명: {panel_name}\n")
                 f.write("---\n")  # 구분선
             
-            print(f"DEBUG: 출력 로그 텍스트 파일 저장 완료 - {filepath}")
+            logger.debug("출력 로그 텍스트 파일 저장 완료 - %s", filepath)
+            
+            # 추적 인덱스 기록 (출력 성공 라벨만) + 이번 사이클 체결 결과에 부품 시리얼 연결
+            children = [(child_data.get('part_number', ''), child_data.get('raw_data', ''))
+                        for child_data in scanned_child_parts or []]
+            cycle = self.production_engine.cycles.get(panel_name)
+            if success:
+                self.traceability_index.record(parent_barcode_data, part_number, children, panel_name)
+                self.nutrunner_ingest.store.link_cycle(cycle, parent_barcode_data)
+            
+            # 라인 집계 서버로 라벨 출력 결과 전송 (성공/실패 모두)
+            if self.aggregator_client:
+                self.aggregator_client.push_label(panel_name, part_number, parent_barcode_data, children, success, cycle)
             
         except Exception as e:
-            print(f"DEBUG: 출력 로그 텍스트 파일 저장 오류: {e}")
+            logger.error("출력 로그 텍스트 파일 저장 오류: %s", e)
     
     def get_scanned_child_parts_for_panel(self, panel_name):
         """특정 패널의 스캔된 하위부품 데이터 가져오기"""
@@ -3598,7 +2492,7 @@ class BarcodeMainScreen(QMainWindow):
                     # 패널명 매칭 (대소문자 구분 없이)
                     if scan_panel.upper() == panel_name.upper():
                         panel_scanned_data.append(scan_data)
-                        print(f"DEBUG: 전역 데이터에서 {panel_name} 패널 하위부품 발견: {scan_data.get('part_number', '')}")
+                        logger.debug("전역 데이터에서 %s 패널 하위부품 발견: %s", panel_name, scan_data.get('part_number', ''))
             
             # 2. scan_status_data에서도 확인 (보조)
             if not panel_scanned_data and hasattr(self, 'scan_status_data') and self.scan_status_data:
@@ -3607,13 +2501,13 @@ class BarcodeMainScreen(QMainWindow):
                     # 패널명 매칭 (대소문자 구분 없이)
                     if scan_panel.upper() == panel_name.upper():
                         panel_scanned_data.append(scan_data)
-                        print(f"DEBUG: scan_status_data에서 {panel_name} 패널 하위부품 발견: {scan_data.get('part_number', '')}")
+                        logger.debug("scan_status_data에서 %s 패널 하위부품 발견: %s", panel_name, scan_data.get('part_number', ''))
             
-            print(f"DEBUG: {panel_name} 패널 스캔된 하위부품: {len(panel_scanned_data)}개")
+            logger.debug("%s 패널 스캔된 하위부품: %s개", panel_name, len(panel_scanned_data))
             return panel_scanned_data
             
         except Exception as e:
-            print(f"DEBUG: 스캔된 하위부품 데이터 가져오기 오류: {e}")
+            logger.error("스캔된 하위부품 데이터 가져오기 오류: %s", e)
             return []
     
     def generate_parent_barcode_data(self, part_number, main_part_info):
@@ -3628,7 +2522,7 @@ class BarcodeMainScreen(QMainWindow):
                         break
             
             if not part_data:
-                print(f"DEBUG: 부품 정보를 찾을 수 없음: {part_number}")
+                logger.debug("부품 정보를 찾을 수 없음: %s", part_number)
                 # 기본값: M 필드는 포함하지 않음 (기본값 'N'이므로)
                 return f"[)>\x1e06\x1dV2812\x1dP{part_number}\x1dT{datetime.now().strftime('%y%m%d')}0000A0000001\x1d\x1e\x04"
             
@@ -3643,7 +2537,6 @@ class BarcodeMainScreen(QMainWindow):
             # 실제 출력된 추적번호를 tracking_data 파일에서 가져오기
             import os
             import json
-            from datetime import date
             today = date.today()
             date_str = today.strftime("%y%m%d")
             tracking_file = f'tracking_data_{date_str}.json'
@@ -3658,13 +2551,13 @@ class BarcodeMainScreen(QMainWindow):
                     key = f"{date_str}_{part_number}"
                     if key in tracking_data:
                         tracking_number = str(tracking_data[key]).zfill(7)
-                        print(f"DEBUG: 로그 기록용 실제 추적번호 사용: {tracking_number}")
+                        logger.debug("로그 기록용 실제 추적번호 사용: %s", tracking_number)
                     else:
-                        print(f"DEBUG: 추적번호를 찾을 수 없음 - 기본값 사용: {tracking_number}")
+                        logger.debug("추적번호를 찾을 수 없음 - 기본값 사용: %s", tracking_number)
                 except Exception as e:
-                    print(f"DEBUG: 추적번호 파일 읽기 오류: {e}")
+                    logger.error("추적번호 파일 읽기 오류: %s", e)
             else:
-                print(f"DEBUG: 추적번호 파일 없음 - 기본값 사용: {tracking_number}")
+                logger.debug("추적번호 파일 없음 - 기본값 사용: %s", tracking_number)
             
             # 생산수량 표시 (새로운 작업 사이클 시작 시에도 표시)
             self.update_production_counts_on_cycle_start()
@@ -3707,11 +2600,11 @@ class BarcodeMainScreen(QMainWindow):
             # 트레일러
             hkmc_barcode += "\x1d\x1e\x04"
             
-            print(f"DEBUG: 부모바코드 데이터 생성: {hkmc_barcode}")
+            logger.debug("부모바코드 데이터 생성: %s", hkmc_barcode)
             return hkmc_barcode
             
         except Exception as e:
-            print(f"DEBUG: 부모바코드 데이터 생성 오류: {e}")
+            logger.error("부모바코드 데이터 생성 오류: %s", e)
             # 기본값: M 필드는 포함하지 않음 (기본값 'N'이므로)
             return f"[)>\x1e06\x1dV2812\x1dP{part_number}\x1dT{datetime.now().strftime('%y%m%d')}0000A0000001\x1d\x1e\x04"
     
@@ -3745,99 +2638,22 @@ class BarcodeMainScreen(QMainWindow):
             with open(tracking_file, 'w', encoding='utf-8') as f:
                 json.dump(tracking_data, f, ensure_ascii=False, indent=2)
             
-            print(f"DEBUG: 추적번호 생성: {tracking_number}")
+            logger.debug("추적번호 생성: %s", tracking_number)
             return tracking_number
             
         except Exception as e:
-            print(f"DEBUG: 추적번호 생성 오류: {e}")
+            logger.error("추적번호 생성 오류: %s", e)
             return "0000001"  # 기본값
     
-    def execute_print_for_panel(self, panel_type):
-        """특정 패널에 대한 출력 실행"""
-        try:
-            print(f"DEBUG: {panel_type} 패널 출력 실행")
-            
-            # 패널 정보 가져오기
-            if panel_type == "front_lh":
-                panel = self.front_panel
-            elif panel_type == "rear_rh":
-                panel = self.rear_panel
-            else:
-                print(f"DEBUG: 알 수 없는 패널 타입: {panel_type}")
-                return
-            
-            # 메인 부품 정보 가져오기
-            main_part_info = self.get_main_part_info(self.panel_titles[panel_type])
-            if not main_part_info:
-                print(f"DEBUG: 메인 부품 정보를 찾을 수 없음")
-                return
-            
-            # 스캔된 하위부품 데이터 가져오기 - 전역 데이터에서 패널별 필터링
-            scanned_child_parts = []
-            
-            # 1. 패널 객체에 real_time_scanned_data가 있는지 확인
-            if hasattr(panel, 'real_time_scanned_data') and panel.real_time_scanned_data:
-                scanned_child_parts = panel.real_time_scanned_data
-                print(f"DEBUG: 패널 객체에서 스캔된 하위부품: {len(scanned_child_parts)}개")
-            else:
-                # 2. 전역 스캔 데이터에서 해당 패널의 데이터 필터링
-                panel_name = self.panel_titles[panel_type]
-                print(f"DEBUG: 전역 데이터에서 {panel_name} 패널 데이터 필터링")
-                print(f"DEBUG: 전역 스캔 데이터: {len(self.global_scan_data)}개")
-                
-                # 전역 스캔 데이터 상세 확인
-                for i, scan_data in enumerate(self.global_scan_data):
-                    print(f"DEBUG: 전역 스캔 데이터 {i}: {scan_data}")
-                
-                # 패널별 매칭 시도
-                for scan_data in self.global_scan_data:
-                    scan_panel = scan_data.get('panel', '')
-                    print(f"DEBUG: 스캔 데이터 패널: '{scan_panel}' vs 찾는 패널: '{panel_name}'")
-                    if scan_panel == panel_name:
-                        scanned_child_parts.append(scan_data)
-                        print(f"DEBUG: ✅ 정확한 패널 매칭: {scan_data}")
-                    else:
-                        print(f"DEBUG: ❌ 패널 매칭 실패: '{scan_panel}' != '{panel_name}'")
-                
-                # 정확한 패널 매칭이 실패한 경우, 스캔된 데이터가 있는 모든 데이터 사용
-                if not scanned_child_parts:
-                    print(f"DEBUG: 정확한 패널 매칭 실패 - 스캔된 모든 데이터 사용")
-                    for scan_data in self.global_scan_data:
-                        if scan_data.get('is_ok', False):  # OK 상태인 스캔 데이터만
-                            scanned_child_parts.append(scan_data)
-                            print(f"DEBUG: ✅ 전체 스캔 데이터 사용: {scan_data}")
-                
-                print(f"DEBUG: 필터링된 스캔된 하위부품: {len(scanned_child_parts)}개")
-                
-                if not scanned_child_parts:
-                    print(f"DEBUG: 스캔된 하위부품 데이터 없음")
-            
-            # 자동 출력 매니저로 출력 실행
-            if hasattr(self, 'auto_print_manager') and self.auto_print_manager:
-                success = self.auto_print_manager.execute_auto_print(panel_type, main_part_info, scanned_child_parts)
-                if success:
-                    print(f"DEBUG: {panel_type} 패널 자동 출력 완료")
-                else:
-                    print(f"DEBUG: {panel_type} 패널 자동 출력 실패")
-            else:
-                print(f"DEBUG: 자동 출력 매니저가 없음")
-                
-        except Exception as e:
-            print(f"DEBUG: {panel_type} 패널 출력 실행 오류: {e}")
-
     def get_main_part_info(self, panel_name):
         """메인 부품 정보 가져오기 - 작업완료된 패널의 정보"""
         try:
-            print(f"DEBUG: 메인 부품 정보 가져오기 - 패널: {panel_name}")
+            logger.debug("메인 부품 정보 가져오기 - 패널: %s", panel_name)
             
             # 패널명 매칭 (대소문자 구분 없이)
-            panel_name_upper = panel_name.upper()
-            if panel_name_upper == "FRONT/LH" or panel_name_upper == "FRONT/LH":
-                panel = self.front_panel
-            elif panel_name_upper == "REAR/RH" or panel_name_upper == "REAR/RH":
-                panel = self.rear_panel
-            else:
-                print(f"DEBUG: 알 수 없는 패널: {panel_name} (대소문자 변환 후: {panel_name_upper})")
+            panel = self.get_panel(panel_name)
+            if panel is None:
+                logger.debug("알 수 없는 패널: %s", panel_name)
                 return {}
             
             part_info = {
@@ -3847,42 +2663,27 @@ class BarcodeMainScreen(QMainWindow):
                 "work_status": getattr(panel, 'work_status', 0)
             }
             
-            print(f"DEBUG: 패널 {panel_name}의 부품 정보: {part_info}")
+            logger.debug("패널 %s의 부품 정보: %s", panel_name, part_info)
             return part_info
             
         except Exception as e:
-            print(f"DEBUG: 메인 부품 정보 가져오기 오류: {e}")
+            logger.error("메인 부품 정보 가져오기 오류: %s", e)
             return {}
     
     def on_print_started(self, panel_type):
         """출력 시작 시그널 핸들러"""
-        print(f"DEBUG: {panel_type} 패널 출력 시작됨")
+        logger.debug("%s 패널 출력 시작됨", panel_type)
         # UI 업데이트 (예: 출력 상태 표시)
     
     def on_print_completed(self, panel_type, success):
         """출력 완료 시그널 핸들러"""
         if success:
-            print(f"DEBUG: {panel_type} 패널 출력 성공")
+            logger.debug("%s 패널 출력 성공", panel_type)
             
-            # 부모바코드 스캔 시점의 패널 정보 우선 확인 (정확한 패널 식별)
-            pending_panel = getattr(self, 'pending_print_panel', None)
-            if pending_panel:
-                panel_name = pending_panel
-                print(f"DEBUG: ✅ pending_print_panel 사용 - panel_name: {panel_name}")
-            else:
-                # 패널명 매핑 (표준화)
-                panel_name = self.panel_titles.get(panel_type, panel_type)
-                # 패널명 표준화 (REAR/RH -> REAR/RH)
-                if panel_name.startswith('1'):
-                    panel_name = panel_name[1:]  # 첫 번째 문자 제거
-                
-                # panel_type을 기반으로 표준 패널명 설정 (save_print_log와 일치하도록)
-                if panel_type == "front_lh" or panel_type.upper() == "FRONT_LH":
-                    panel_name = "FRONT/LH"
-                elif panel_type == "rear_rh" or panel_type.upper() == "REAR_RH":
-                    panel_name = "REAR/RH"
-                
-                print(f"DEBUG: 패널명 변환 - panel_type: {panel_type} -> panel_name: {panel_name}")
+            # panel_type(스테이션 키)을 기반으로 표준 패널명 설정 (save_print_log와 일치하도록)
+            station = self.get_station(panel_type) or self.get_station(str(panel_type).lower())
+            panel_name = station.name if station else self.panel_titles.get(panel_type, panel_type)
+            logger.debug("패널명 변환 - panel_type: %s -> panel_name: %s", panel_type, panel_name)
             
             # 메인 부품 정보 가져오기
             main_part_info = self.get_main_part_info(panel_name)
@@ -3894,34 +2695,42 @@ class BarcodeMainScreen(QMainWindow):
                     printed_child_parts = []
                     if hasattr(self, 'auto_print_manager') and self.auto_print_manager:
                         printed_child_parts = self.auto_print_manager.printed_child_parts.get(panel_name, [])
-                        print(f"DEBUG: 출력에 사용된 하위부품 정보: {panel_name} - {len(printed_child_parts)}개")
+                        logger.debug("출력에 사용된 하위부품 정보: %s - %s개", panel_name, len(printed_child_parts))
                     
                     self.save_print_log(panel_name, part_number, main_part_info, success=True, printed_child_parts=printed_child_parts)
-                    print(f"DEBUG: 출력 완료 로그 저장 - {panel_name}: {part_number}")
+                    logger.debug("출력 완료 로그 저장 - %s: %s", panel_name, part_number)
                 else:
-                    print(f"DEBUG: 메인 부품 정보 없음 - 생산실적 증가 안됨")
+                    logger.debug("메인 부품 정보 없음 - 생산실적 증가 안됨")
             else:
-                print(f"DEBUG: 메인 부품 정보 가져오기 실패 - 생산실적 증가 안됨")
+                logger.debug("메인 부품 정보 가져오기 실패 - 생산실적 증가 안됨")
+            
+            # 프린트 완료신호를 PLC 데이터 매니저로 전달
+            if hasattr(self, 'plc_data_manager') and self.plc_data_manager:
+                self.plc_data_manager.on_print_completed(panel_name)
+            
+            # 사이클 종료(시리얼 확정/스캔 데이터 종료)는 엔진 이벤트에서 처리 (finish_cycle)
+            self.production_engine.print_finished(panel_name, True)
         else:
-            print(f"DEBUG: {panel_type} 패널 출력 실패")
+            logger.debug("%s 패널 출력 실패", panel_type)
             # 실패 시 UI 업데이트
+            station = self.get_station(panel_type)
+            self.production_engine.print_finished(station.name if station else panel_type, False)
     
     def on_print_failed(self, panel_type, error_message):
         """출력 실패 시그널 핸들러"""
-        print(f"DEBUG: {panel_type} 패널 출력 실패: {error_message}")
+        logger.error("%s 패널 출력 실패: %s", panel_type, error_message)
+        station = self.get_station(panel_type)
+        self.production_engine.print_finished(station.name if station else panel_type, False)
         # 오류 메시지 표시
     
     def get_child_parts_info_for_panel(self, panel_name):
         """특정 패널의 하위부품 정보 가져오기 - 스캔된 원시 데이터 사용"""
         try:
             # 패널명 매칭 (대소문자 구분 없이)
-            panel_name_upper = panel_name.upper()
-            if panel_name_upper == "FRONT/LH" or panel_name_upper == "FRONT/LH":
-                panel = self.front_panel
-            elif panel_name_upper == "REAR/RH" or panel_name_upper == "REAR/RH":
-                panel = self.rear_panel
-            else:
+            panel = self.get_panel(panel_name)
+            if panel is None:
                 return []
+            panel_name_upper = self.get_station(panel_name).name.upper()
             
             part_number = getattr(panel, 'part_number', '')
             if not part_number:
@@ -3931,21 +2740,17 @@ class BarcodeMainScreen(QMainWindow):
             scanned_child_parts = []
             scan_data_sources = []
             
-            # 1. temp_scan_data 확인
+            # 현재 작업 스캔 데이터 (temp_scan_data와 global_scan_data는 같은 저장소 뷰)
             if hasattr(self, 'temp_scan_data') and self.temp_scan_data:
                 scan_data_sources.extend(self.temp_scan_data)
             
-            # 2. global_scan_data도 확인 (temp_scan_data에 없을 경우 대비)
-            if hasattr(self, 'global_scan_data') and self.global_scan_data:
-                scan_data_sources.extend(self.global_scan_data)
-            
             # 스캔 데이터에서 추적 정보 추출
             processed_part_numbers = set()  # 중복 방지
             for scan_data in scan_data_sources:
-                scan_panel = scan_data.get('panel', '').upper()
+                scan_panel = (scan_data.get('panel') or '').upper()
                 scan_part_number = scan_data.get('part_number', '')
                 
-                # 패널명이 일치하고, 이미 처리하지 않은 부품번호인 경우
+                # 패널명이 일치하고, 이미 처리하지 않은 부품번호인 경우 (대소문자 구분 없이)
                 if scan_panel == panel_name_upper and scan_part_number not in processed_part_numbers:
                     processed_part_numbers.add(scan_part_number)
                     
@@ -3963,7 +2768,7 @@ class BarcodeMainScreen(QMainWindow):
                                 "serial_type": trace_info.get('serial_type', ''),
                                 "serial_number": trace_info.get('serial_number', '')
                             })
-                            print(f"DEBUG: 스캔된 하위부품 원시 데이터 사용: {scan_part_number} - {trace_info}")
+                            logger.debug("스캔된 하위부품 원시 데이터 사용: %s - %s", scan_part_number, trace_info)
             
             # 스캔된 데이터가 없으면 기준정보에서 가져오기 (기본 형식으로)
             if not scanned_child_parts:
@@ -3975,7 +2780,7 @@ class BarcodeMainScreen(QMainWindow):
             
             return scanned_child_parts
         except Exception as e:
-            print(f"DEBUG: 하위부품 정보 가져오기 오류: {e}")
+            logger.error("하위부품 정보 가져오기 오류: %s", e)
             return []
     
     def parse_traceability_from_raw_data(self, raw_data):
@@ -3991,7 +2796,7 @@ class BarcodeMainScreen(QMainWindow):
                 trace_part = trace_part.replace('\x1d', '').replace('\x1e', '').replace('\x04', '')
                 trace_part = trace_part.replace('M', '').strip()
                 
-                print(f"DEBUG: 정리된 추적 부분: {trace_part}")
+                logger.debug("정리된 추적 부분: %s", trace_part)
                 
                 # T2510022000A0000001 형태에서 파싱
                 if len(trace_part) >= 13:  # 최소 길이 확인
@@ -4003,7 +2808,7 @@ class BarcodeMainScreen(QMainWindow):
                     # serial_number에서 추가 정리 (숫자만 남기기)
                     serial_number = ''.join(filter(str.isdigit, serial_number))
                     
-                    print(f"DEBUG: 파싱된 추적 정보 - identifier: {identifier}, serial_type: {serial_type}, serial_number: {serial_number}")
+                    logger.debug("파싱된 추적 정보 - identifier: %s, serial_type: %s, serial_number: %s", identifier, serial_type, serial_number)
                     
                     return {
                         'identifier': identifier,
@@ -4014,9 +2819,44 @@ class BarcodeMainScreen(QMainWindow):
             
             return None
         except Exception as e:
-            print(f"DEBUG: 추적 정보 파싱 오류: {e}")
+            logger.error("추적 정보 파싱 오류: %s", e)
             return None
     
+    def _merge_scan_log_file(self, station, log_file):
+        """스테이션 메모리 스캔 로그를 날짜별 파일에 병합 저장 (날짜/시간/공정부품 중복 제외)"""
+        memory_logs = self.scan_logs.get(station.key, [])
+        logger.debug("%s 로그 개수: %s", station.name, len(memory_logs))
+        
+        # 기존 파일이 있으면 읽어서 병합
+        existing_logs = []
+        if os.path.exists(log_file):
+            try:
+                with open(log_file, 'r', encoding='utf-8') as f:
+                    existing_logs = json.load(f)
+                logger.debug("기존 %s 로그 파일 읽기 완료 - %s개 항목", station.name, len(existing_logs))
+            except Exception as e:
+                logger.error("기존 %s 로그 파일 읽기 실패: %s", station.name, e)
+                existing_logs = []
+        
+        # 메모리 로그와 기존 로그 병합 (중복 제거)
+        merged_logs = existing_logs.copy()
+        for new_log in memory_logs:
+            # 중복 체크 (날짜, 시간, 공정부품으로 판단)
+            is_duplicate = False
+            for existing_log in merged_logs:
+                if (existing_log.get("날짜") == new_log.get("날짜") and
+                    existing_log.get("시간") == new_log.get("시간") and
+                    existing_log.get("공정부품") == new_log.get("공정부품")):
+                    is_duplicate = True
+                    break
+            if not is_duplicate:
+                merged_logs.append(new_log)
+        
+        # 병합된 로그를 파일에 저장
+        with open(log_file, 'w', encoding='utf-8') as f:
+            json.dump(merged_logs, f, ensure_ascii=False, indent=2)
+        logger.debug("%s 로그 파일 저장 완료 - 기존: %s개, 새로: %s개, 총: %s개 항목", station.name, len(existing_logs), len(memory_logs), len(merged_logs))
+    
     def save_logs_to_file(self, panel_name=None):
         """로그를 날짜별 파일로 저장 (연도별 폴더)"""
         try:
@@ -4028,225 +2868,118 @@ class BarcodeMainScreen(QMainWindow):
             if not os.path.exists(year_log_dir):
                 os.makedirs(year_log_dir)
             
-            print(f"DEBUG: 로그 파일 저장 시작 - {today}")
+            logger.debug("로그 파일 저장 시작 - %s", today)
             
-            # 특정 패널만 저장하거나, 모두 저장
+            # 특정 패널만 저장하거나, 모두 저장 (기존 파일 읽어서 병합)
             if panel_name:
-                # 특정 패널만 저장 (기존 파일 읽어서 병합)
-                panel_name_upper = panel_name.upper()
-                if panel_name_upper == "FRONT/LH":
-                    print(f"DEBUG: FRONT/LH 로그 개수: {len(self.scan_logs['front_lh'])}")
-                    front_log_file = os.path.join(year_log_dir, f"front_lh_{today}.json")
-                    
-                    # 기존 파일이 있으면 읽어서 병합
-                    existing_logs = []
-                    if os.path.exists(front_log_file):
-                        try:
-                            with open(front_log_file, 'r', encoding='utf-8') as f:
-                                existing_logs = json.load(f)
-                            print(f"DEBUG: 기존 FRONT/LH 로그 파일 읽기 완료 - {len(existing_logs)}개 항목")
-                        except Exception as e:
-                            print(f"DEBUG: 기존 FRONT/LH 로그 파일 읽기 실패: {e}")
-                            existing_logs = []
-                    
-                    # 메모리 로그와 기존 로그 병합 (중복 제거)
-                    merged_logs = existing_logs.copy()
-                    memory_logs = self.scan_logs["front_lh"]
-                    for new_log in memory_logs:
-                        # 중복 체크 (날짜, 시간, 공정부품으로 판단)
-                        is_duplicate = False
-                        for existing_log in merged_logs:
-                            if (existing_log.get("날짜") == new_log.get("날짜") and
-                                existing_log.get("시간") == new_log.get("시간") and
-                                existing_log.get("공정부품") == new_log.get("공정부품")):
-                                is_duplicate = True
-                                break
-                        if not is_duplicate:
-                            merged_logs.append(new_log)
-                    
-                    # 병합된 로그를 파일에 저장
-                    with open(front_log_file, 'w', encoding='utf-8') as f:
-                        json.dump(merged_logs, f, ensure_ascii=False, indent=2)
-                    print(f"DEBUG: FRONT/LH 로그 파일 저장 완료 - 기존: {len(existing_logs)}개, 새로: {len(memory_logs)}개, 총: {len(merged_logs)}개 항목")
-                    
-                elif panel_name_upper == "REAR/RH":
-                    print(f"DEBUG: REAR/RH 로그 개수: {len(self.scan_logs['rear_rh'])}")
-                    rear_log_file = os.path.join(year_log_dir, f"rear_rh_{today}.json")
-                    
-                    # 기존 파일이 있으면 읽어서 병합
-                    existing_logs = []
-                    if os.path.exists(rear_log_file):
-                        try:
-                            with open(rear_log_file, 'r', encoding='utf-8') as f:
-                                existing_logs = json.load(f)
-                            print(f"DEBUG: 기존 REAR/RH 로그 파일 읽기 완료 - {len(existing_logs)}개 항목")
-                        except Exception as e:
-                            print(f"DEBUG: 기존 REAR/RH 로그 파일 읽기 실패: {e}")
-                            existing_logs = []
-                    
-                    # 메모리 로그와 기존 로그 병합 (중복 제거)
-                    merged_logs = existing_logs.copy()
-                    memory_logs = self.scan_logs["rear_rh"]
-                    for new_log in memory_logs:
-                        # 중복 체크 (날짜, 시간, 공정부품으로 판단)
-                        is_duplicate = False
-                        for existing_log in merged_logs:
-                            if (existing_log.get("날짜") == new_log.get("날짜") and
-                                existing_log.get("시간") == new_log.get("시간") and
-                                existing_log.get("공정부품") == new_log.get("공정부품")):
-                                is_duplicate = True
-                                break
-                        if not is_duplicate:
-                            merged_logs.append(new_log)
-                    
-                    # 병합된 로그를 파일에 저장
-                    with open(rear_log_file, 'w', encoding='utf-8') as f:
-                        json.dump(merged_logs, f, ensure_ascii=False, indent=2)
-                    print(f"DEBUG: REAR/RH 로그 파일 저장 완료 - 기존: {len(existing_logs)}개, 새로: {len(memory_logs)}개, 총: {len(merged_logs)}개 항목")
+                station = self.get_station(panel_name)
+                stations = [station] if station else []
             else:
-                # 모든 패널 저장 (기존 파일 읽어서 병합)
-                print(f"DEBUG: FRONT/LH 로그 개수: {len(self.scan_logs['front_lh'])}")
-                print(f"DEBUG: REAR/RH 로그 개수: {len(self.scan_logs['rear_rh'])}")
-                
-                # FRONT/LH 로그 저장
-                front_log_file = os.path.join(year_log_dir, f"front_lh_{today}.json")
-                existing_front_logs = []
-                if os.path.exists(front_log_file):
-                    try:
-                        with open(front_log_file, 'r', encoding='utf-8') as f:
-                            existing_front_logs = json.load(f)
-                        print(f"DEBUG: 기존 FRONT/LH 로그 파일 읽기 완료 - {len(existing_front_logs)}개 항목")
-                    except Exception as e:
-                        print(f"DEBUG: 기존 FRONT/LH 로그 파일 읽기 실패: {e}")
-                
-                merged_front_logs = existing_front_logs.copy()
-                for new_log in self.scan_logs["front_lh"]:
-                    is_duplicate = False
-                    for existing_log in merged_front_logs:
-                        if (existing_log.get("날짜") == new_log.get("날짜") and
-                            existing_log.get("시간") == new_log.get("시간") and
-                            existing_log.get("공정부품") == new_log.get("공정부품")):
-                            is_duplicate = True
-                            break
-                    if not is_duplicate:
-                        merged_front_logs.append(new_log)
-                
-                with open(front_log_file, 'w', encoding='utf-8') as f:
-                    json.dump(merged_front_logs, f, ensure_ascii=False, indent=2)
-                print(f"DEBUG: FRONT/LH 로그 파일 저장 완료 - 기존: {len(existing_front_logs)}개, 새로: {len(self.scan_logs['front_lh'])}개, 총: {len(merged_front_logs)}개 항목")
-                
-                # REAR/RH 로그 저장
-                rear_log_file = os.path.join(year_log_dir, f"rear_rh_{today}.json")
-                existing_rear_logs = []
-                if os.path.exists(rear_log_file):
-                    try:
-                        with open(rear_log_file, 'r', encoding='utf-8') as f:
-                            existing_rear_logs = json.load(f)
-                        print(f"DEBUG: 기존 REAR/RH 로그 파일 읽기 완료 - {len(existing_rear_logs)}개 항목")
-                    except Exception as e:
-                        print(f"DEBUG: 기존 REAR/RH 로그 파일 읽기 실패: {e}")
-                
-                merged_rear_logs = existing_rear_logs.copy()
-                for new_log in self.scan_logs["rear_rh"]:
-                    is_duplicate = False
-                    for existing_log in merged_rear_logs:
-                        if (existing_log.get("날짜") == new_log.get("날짜") and
-                            existing_log.get("시간") == new_log.get("시간") and
-                            existing_log.get("공정부품") == new_log.get("공정부품")):
-                            is_duplicate = True
-                            break
-                    if not is_duplicate:
-                        merged_rear_logs.append(new_log)
-                
-                with open(rear_log_file, 'w', encoding='utf-8') as f:
-                    json.dump(merged_rear_logs, f, ensure_ascii=False, indent=2)
-                print(f"DEBUG: REAR/RH 로그 파일 저장 완료 - 기존: {len(existing_rear_logs)}개, 새로: {len(self.scan_logs['rear_rh'])}개, 총: {len(merged_rear_logs)}개 항목")
+                stations = list(self.station_layout)
+            for station in stations:
+                self._merge_scan_log_file(station, os.path.join(year_log_dir, f"{station.log_key}_{today}.json"))
             
-            print(f"DEBUG: 로그 파일 저장 완료 - {today}")
+            logger.debug("로그 파일 저장 완료 - %s", today)
             
         except Exception as e:
-            print(f"DEBUG: 로그 파일 저장 오류: {e}")
+            logger.error("로그 파일 저장 오류: %s", e)
             import traceback
             traceback.print_exception(type(e), e, e.__traceback__)
     
     def complete_work(self, panel_name):
-        """작업완료 시 생산카운트 증가 및 자동 프린트"""
+        """작업완료 시 생산카운트 증가 및 자동 프린트 (작업 흐름 엔진이 완료신호를 받아들여 출력중으로 바뀔 때 호출)"""
         # 현재 부품번호 가져오기
-        if panel_name == "FRONT/LH":
-            part_number = self.front_panel.part_number
-            part_name = self.front_panel.part_name
-            panel = self.front_panel
-        elif panel_name == "REAR/RH":
-            part_number = self.rear_panel.part_number
-            part_name = self.rear_panel.part_name
-            panel = self.rear_panel
-        else:
+        station = self.get_station(panel_name)
+        panel = self.panels.get(station.name) if station else None
+        if panel is None:
             return
+        panel_name = station.name
+        part_number = panel.part_number
         
         # 생산카운터 업데이트
         self.update_production_counters(part_number, panel_name)
         
-        print(f"DEBUG: {panel_name} 작업완료 - Part_No: {part_number}")
+        logger.debug("%s 작업완료 - Part_No: %s", panel_name, part_number)
         
         # 작업 완료 시점에 해당 패널의 하위부품 스캔 로그 저장 (덮어쓰기)
         self.save_logs_to_file(panel_name=panel_name)
-        print(f"DEBUG: {panel_name} 작업완료 - 하위부품 스캔 로그 저장 완료")
+        logger.debug("%s 작업완료 - 하위부품 스캔 로그 저장 완료", panel_name)
         
         # 저장 후 해당 패널의 메모리 로그 초기화 (다음 작업을 위해)
-        if panel_name == "FRONT/LH":
-            self.scan_logs["front_lh"] = []
-            # 프린트 로그도 초기화 (중복 저장 방지)
-            if "front_lh" in self.print_logs:
-                self.print_logs["front_lh"] = []
-            print(f"DEBUG: FRONT/LH 메모리 로그 초기화 완료 (스캔 로그 + 프린트 로그)")
-        elif panel_name == "REAR/RH":
-            self.scan_logs["rear_rh"] = []
-            # 프린트 로그도 초기화 (중복 저장 방지)
-            if "rear_rh" in self.print_logs:
-                self.print_logs["rear_rh"] = []
-            print(f"DEBUG: REAR/RH 메모리 로그 초기화 완료 (스캔 로그 + 프린트 로그)")
+        self.scan_logs[station.key] = []
+        # 프린트 로그도 초기화 (중복 저장 방지)
+        if station.key in self.print_logs:
+            self.print_logs[station.key] = []
+        logger.debug("%s 메모리 로그 초기화 완료 (스캔 로그 + 프린트 로그)", panel_name)
         
         # 자동 프린트 실행
-        self.auto_print_on_completion(panel_name, part_number, part_name, panel)
-    
-    def auto_print_on_completion(self, panel_name, part_number, part_name, panel):
-        """작업완료 시 자동 프린트 실행"""
-        try:
-            # 하위부품 스캔 정보 수집
-            child_parts_list = []
-            
-            # 패널의 하위부품 아이콘 상태 확인
-            if hasattr(panel, 'child_parts_icons'):
-                for i, icon in enumerate(panel.child_parts_icons):
-                    if icon.isVisible():
-                        # 하위부품 번호 생성 (예: part_number_1, part_number_2)
-                        child_part = f"{part_number}_{i+1}"
-                        child_parts_list.append(child_part)
-            
-            # 하위부품이 있는 경우에만 프린트 실행
-            if child_parts_list:
-                print(f"DEBUG: {panel_name} 자동 프린트 시작 - 메인부품: {part_number}, 하위부품: {child_parts_list}")
-                
-                # 프린트 매니저를 통한 자동 프린트
-                success = self.print_manager.print_auto(
-                    panel_name=panel_name,
-                    part_number=part_number,
-                    part_name=part_name,
-                    child_parts_list=child_parts_list
-                )
-                
-                if success:
-                    print(f"DEBUG: {panel_name} 자동 프린트 완료")
-                    # 프린트 완료신호를 PLC 데이터 매니저로 전달
-                    if hasattr(self, 'plc_data_manager') and self.plc_data_manager:
-                        self.plc_data_manager.on_print_completed(panel_name)
-                else:
-                    print(f"DEBUG: {panel_name} 자동 프린트 실패")
-            else:
-                print(f"DEBUG: {panel_name} 하위부품이 없어 프린트 건너뜀")
+        self.auto_print_on_completion(panel_name)
+    
+    def auto_print_on_completion(self, panel_name):
+        """작업완료 시 자동 프린트 실행 - 엔진 사이클에 투입된 하위부품으로 출력 (결과는 on_print_completed/on_print_failed 에서 엔진에 전달)"""
+        station = self.get_station(panel_name)
+        try:
+            # 엔진 사이클에서 투입 확정된 하위부품 수집 (하위부품이 없는 부품도 같은 출력/로그 경로)
+            cycle = self.production_engine.cycles.get(station.name)
+            child_parts_scanned = [{"part_number": record.part_number, "raw_data": record.raw_data}
+                                   for record in (cycle.matched.values() if cycle else [])]
+            main_part_info = self.get_main_part_info(station.name)
+            logger.debug("%s 자동 프린트 시작 - 메인부품: %s, 하위부품: %s개",
+                         station.name, main_part_info.get('part_number', ''), len(child_parts_scanned))
+            
+            if not self.auto_print_manager:
+                self.on_print_failed(station.key, "자동 출력 매니저 없음")
+                return
+            # 사이클마다 한 장 출력 - 같은 부품 연속 생산이 중복 출력 방지에 걸리지 않도록 상태 초기화
+            self.auto_print_manager.reset_print_status(station.key)
+            self.auto_print_manager.execute_auto_print(station.key, main_part_info, child_parts_scanned)
                 
         except Exception as e:
-            print(f"DEBUG: {panel_name} 자동 프린트 오류: {e}")
+            logger.error("%s 자동 프린트 오류: %s", panel_name, e)
+            self.on_print_failed(station.key, str(e))
+    
+    def on_engine_event(self, event):
+        """작업 흐름 엔진 이벤트 → 기록/출력/표시 (스캔 판정·작업완료 판단은 엔진이 함)"""
+        if event.kind == EVENT_IGNORED:
+            logger.info("작업 흐름 - %s 무시: %s", event.panel or "-", event.reason)
+            return
+        panel = self.panels.get(event.panel)
+        if panel is not None and event.kind == EVENT_STATE:
+            panel.work_status_label.setToolTip(f"작업 흐름: {STATE_LABELS.get(event.new_state, event.new_state)}")
+        
+        if event.kind == EVENT_SCAN:
+            self.add_scanned_part(event.record)
+        elif event.kind == EVENT_STATE and event.new_state == STATE_SCANNING:
+            # 공정부품 스캔 - 새 사이클 시작 (이전 작업 초기화 후 저널에 사이클 시작 기록)
+            self.process_barcode_with_workflow(event.cycle.part_number)
+            self.scan_session.start_cycle(event.panel, event.cycle.part_number, event.cycle.expected)
+        elif event.kind == EVENT_STATE and event.new_state == STATE_PRINTING:
+            # 완료신호 수락 - 생산카운트/로그/자동 출력 (출력 결과는 print_finished 로 엔진에 전달)
+            self.complete_work(event.panel)
+        elif event.kind == EVENT_STATE and event.old_state == STATE_PRINTING and event.cycle is not None:
+            self.finish_cycle(event.cycle, event.reason == REASON_PRINTED)
+        
+        if panel is None:
+            return
+        if event.kind == EVENT_BLOCKED:
+            logger.warning("%s 작업완료 보류 - %s", event.panel, event.reason)
+            panel.work_status_label.setToolTip(f"작업완료 보류: {event.reason}")
+        elif event.kind == EVENT_TIGHTENING:
+            result = event.record
+            panel.work_status_label.setToolTip(
+                f"체결 {result.status} ({result.tool}) - 토크 {result.torque} Nm, 각도 {result.angle}°"
+                f" / NOK {len(event.cycle.nok_tightenings())}건")
+    
+    def finish_cycle(self, cycle, printed):
+        """사이클 종료 (출력중 → 대기) - 출력 성공이면 투입 시리얼 확정, 라인 집계 서버로 사이클 전송"""
+        if printed:
+            # 투입 확정된 하위부품 시리얼을 중복 인덱스에 등록
+            for scan_data in cycle.matched.values():
+                self.duplicate_index.add(scan_data.raw_data, scan_data.part_number)
+            # 해당 패널 현재 작업 스캔 데이터 종료 (저널에 완료 이벤트 기록)
+            self.scan_session.complete(cycle.panel)
+        if self.aggregator_client:
+            self.aggregator_client.push_cycle(cycle, printed)
     
     def show_message(self, title, message):
         """메시지 박스 표시"""
@@ -4265,20 +2998,13 @@ class BarcodeMainScreen(QMainWindow):
             if hasattr(self, 'serial_connector'):
                 self.serial_connector.device_connection_status[device_name] = is_connected
             
-            # 모든 패널의 해당 장비 상태를 동일하게 업데이트
-            self.front_panel.update_device_status(device_name, is_connected)
-            self.rear_panel.update_device_status(device_name, is_connected)
-            
-            # PLC 연결 상태에 따른 특별 처리
-            if device_name == "PLC":
-                if is_connected:
-                    self.front_panel.update_plc_connection_display('connected')
-                    self.rear_panel.update_plc_connection_display('connected')
-                else:
-                    self.front_panel.update_plc_connection_display('disconnected')
-                    self.rear_panel.update_plc_connection_display('disconnected')
+            # 모든 패널의 해당 장비 상태를 동일하게 업데이트 (PLC 는 연결 상태 표시도 함께)
+            for panel in self.panels.values():
+                panel.update_device_status(device_name, is_connected)
+                if device_name == "PLC":
+                    panel.update_plc_connection_display('connected' if is_connected else 'disconnected')
             
-            print(f"DEBUG: {device_name} 연결 상태 업데이트 - {'연결됨' if is_connected else '연결안됨'}")
+            logger.debug("%s 연결 상태 업데이트 - %s", device_name, '연결됨' if is_connected else '연결안됨')
     
     # AdminPanel 연동 제거 - 메인화면은 독립적으로 시리얼 연결 관리
     
@@ -4298,7 +3024,7 @@ class BarcodeMainScreen(QMainWindow):
         timer.start(3000)  # 3초
         self.press_timers[device_name] = timer
         
-        print(f"DEBUG: {device_name} 3초 누르기 시작")
+        logger.debug("%s 3초 누르기 시작", device_name)
     
     def stop_press_timer(self, device_name):
         """3초 누르기 타이머 중지"""
@@ -4309,15 +3035,18 @@ class BarcodeMainScreen(QMainWindow):
         if device_name in self.press_start_time:
             del self.press_start_time[device_name]
         
-        print(f"DEBUG: {device_name} 3초 누르기 중지")
+        logger.debug("%s 3초 누르기 중지", device_name)
     
     def open_admin_panel(self, device_name):
         """AdminPanel 열기 및 해당 탭 활성화"""
+        # 관리자 패널(전체 탭)은 처음 열 때 import - 프로그램 시작 시간 단축
+        from AdminPanel import AdminPanel
+        
         # 싱글톤 패턴으로 이미 실행 중인 AdminPanel이 있으면 재사용
         if AdminPanel._instance is not None:
             # 기존 인스턴스 사용
             self.admin_panel = AdminPanel._instance
-            print("DEBUG: 기존 AdminPanel 인스턴스 사용")
+            logger.debug("기존 AdminPanel 인스턴스 사용")
         elif self.admin_panel is None:
             self.admin_panel = AdminPanel()
             # AdminPanel 연동 제거 - 독립적인 설정/테스트 도구
@@ -4341,7 +3070,7 @@ class BarcodeMainScreen(QMainWindow):
         
         # AdminPanel 연동 제거 - 독립적인 설정/테스트 도구
         
-        print(f"DEBUG: AdminPanel 열기 - {device_name} 탭 활성화 (인덱스: {tab_index})")
+        logger.debug("AdminPanel 열기 - %s 탭 활성화 (인덱스: %s)", device_name, tab_index)
     
     # AdminPanel 연동 제거 - 메인화면은 독립적으로 시리얼 연결 관리
     
@@ -4350,44 +3079,45 @@ class BarcodeMainScreen(QMainWindow):
         # 현재 활성화된 패널의 하위부품 정보 가져오기
         child_parts_info = []
         
-        # FRONT/LH와 REAR/RH 패널 중에서 하위부품이 있는 패널 찾기
-        print(f"DEBUG: 스캔 다이얼로그 - 하위부품 정보 검색 시작")
-        print(f"DEBUG: 스캔 다이얼로그 - master_data 개수: {len(self.master_data)}")
+        # 패널 중에서 하위부품이 있는 패널 찾기 (스테이션 순서)
+        logger.debug("스캔 다이얼로그 - 하위부품 정보 검색 시작")
+        logger.debug("스캔 다이얼로그 - master_data 개수: %s", len(self.master_data))
         
-        for panel_name, panel in [(self.panel_titles["front_lh"], self.front_panel), (self.panel_titles["rear_rh"], self.rear_panel)]:
-            print(f"DEBUG: 스캔 다이얼로그 - {panel_name} 패널 확인")
-            print(f"DEBUG: 스캔 다이얼로그 - hasattr(panel, 'part_number'): {hasattr(panel, 'part_number')}")
+        for panel_name, panel in [(self.panel_titles.get(station.key, station.title), panel) for station, panel in self.iter_panels()]:
+            logger.debug("스캔 다이얼로그 - %s 패널 확인", panel_name)
+            logger.debug("스캔 다이얼로그 - hasattr(panel, 'part_number'): %s", hasattr(panel, 'part_number'))
             if hasattr(panel, 'part_number'):
-                print(f"DEBUG: 스캔 다이얼로그 - {panel_name} part_number: '{getattr(panel, 'part_number', 'None')}'")
+                logger.debug("스캔 다이얼로그 - %s part_number: '%s'", panel_name, getattr(panel, 'part_number', 'None'))
             
             if hasattr(panel, 'part_number') and panel.part_number:
-                print(f"DEBUG: 스캔 다이얼로그 - {panel_name} 부품번호 '{panel.part_number}'로 기준정보 검색")
+                logger.debug("스캔 다이얼로그 - %s 부품번호 '%s'로 기준정보 검색", panel_name, panel.part_number)
                 found_match = False
                 for part_data in self.master_data:
-                    print(f"DEBUG: 스캔 다이얼로그 - 기준정보 비교: '{part_data.get('part_number')}' == '{panel.part_number}'")
+                    logger.debug("스캔 다이얼로그 - 기준정보 비교: '%s' == '%s'", part_data.get('part_number'), panel.part_number)
                     if part_data.get("part_number") == panel.part_number:
                         child_parts = part_data.get("child_parts", [])
-                        print(f"DEBUG: 스캔 다이얼로그 - {panel_name} 하위부품 발견: {child_parts}")
+                        logger.debug("스캔 다이얼로그 - %s 하위부품 발견: %s", panel_name, child_parts)
                         if child_parts:  # 하위부품이 있는 경우
                             child_parts_info = child_parts
-                            print(f"DEBUG: 메인화면 - {panel_name} Part_No {panel.part_number}의 하위부품: {child_parts_info}")
+                            logger.debug("메인화면 - %s Part_No %s의 하위부품: %s", panel_name, panel.part_number, child_parts_info)
                             found_match = True
                             break
                 if not found_match:
-                    print(f"DEBUG: 스캔 다이얼로그 - {panel_name} 부품번호 '{panel.part_number}'에 해당하는 기준정보를 찾을 수 없음")
+                    logger.debug("스캔 다이얼로그 - %s 부품번호 '%s'에 해당하는 기준정보를 찾을 수 없음", panel_name, panel.part_number)
                 if child_parts_info:
                     break
             else:
-                print(f"DEBUG: 스캔 다이얼로그 - {panel_name} 패널에 부품번호가 설정되지 않음")
+                logger.debug("스캔 다이얼로그 - %s 패널에 부품번호가 설정되지 않음", panel_name)
         
         if not child_parts_info:
-            print("DEBUG: 메인화면 - 하위부품 정보를 찾을 수 없음")
-            print(f"DEBUG: 메인화면 - 현재 패널 상태:")
-            print(f"DEBUG: 메인화면 - FRONT/LH part_number: '{getattr(self.front_panel, 'part_number', 'None')}'")
-            print(f"DEBUG: 메인화면 - REAR/RH part_number: '{getattr(self.rear_panel, 'part_number', 'None')}'")
+            logger.debug("메인화면 - 하위부품 정보를 찾을 수 없음")
+            logger.debug("메인화면 - 현재 패널 상태:")
+            for station, panel in self.iter_panels():
+                logger.debug("메인화면 - %s part_number: '%s'", station.name, getattr(panel, 'part_number', 'None'))
         else:
-            print(f"DEBUG: 메인화면 - 최종 하위부품 정보: {child_parts_info}")
+            logger.debug("메인화면 - 최종 하위부품 정보: %s", child_parts_info)
         
+        from modules.ui.scan_status_dialog import ScanStatusDialog
         self.scan_status_dialog = ScanStatusDialog(self.scanned_parts, self, child_parts_info)
         self.scan_status_dialog.exec_()
         self.scan_status_dialog = None  # 다이얼로그 닫힌 후 참조 제거
@@ -4395,30 +3125,30 @@ class BarcodeMainScreen(QMainWindow):
     def start_connection_monitoring(self):
         """연결 상태 모니터링 시작"""
         try:
-            print("🔍 연결 상태 모니터링 시작...")
+            logger.info("🔍 연결 상태 모니터링 시작...")
             self.connection_monitor_timer.start(self.connection_monitor_interval)
-            print("✅ 연결 상태 모니터링 활성화")
+            logger.info("✅ 연결 상태 모니터링 활성화")
         except Exception as e:
-            print(f"❌ 연결 상태 모니터링 시작 실패: {e}")
+            logger.error("❌ 연결 상태 모니터링 시작 실패: %s", e)
     
     def stop_connection_monitoring(self):
         """연결 상태 모니터링 중지"""
         try:
             if hasattr(self, 'connection_monitor_timer'):
                 self.connection_monitor_timer.stop()
-                print("⏹️ 연결 상태 모니터링 중지")
+                logger.info("⏹️ 연결 상태 모니터링 중지")
         except Exception as e:
-            print(f"❌ 연결 상태 모니터링 중지 실패: {e}")
+            logger.error("❌ 연결 상태 모니터링 중지 실패: %s", e)
     
     def check_connection_status(self):
         """연결 상태 체크 및 자동 재연결"""
         try:
-            # 각 장비별 연결 상태 체크 (너트1, 너트2는 아직 구현되지 않음)
-            for device_name in ["PLC", "스캐너", "프린터"]:
+            # 각 장비별 연결 상태 체크 (너트런너는 읽기 스레드가 수신 오류 시 포트를 닫으면 여기서 재연결)
+            for device_name in ["PLC", "스캐너", "프린터", *NUTRUNNER_DEVICES]:
                 self.check_device_connection(device_name)
                 
         except Exception as e:
-            print(f"❌ 연결 상태 체크 오류: {e}")
+            logger.error("❌ 연결 상태 체크 오류: %s", e)
     
     def check_device_connection(self, device_name):
         """특정 장비의 연결 상태 체크 및 재연결"""
@@ -4428,34 +3158,50 @@ class BarcodeMainScreen(QMainWindow):
             
             # 내부 상태와 실제 상태 동기화
             if actual_connection_status != self.device_connection_status.get(device_name, False):
-                print(f"🔄 {device_name} 연결 상태 동기화: {self.device_connection_status.get(device_name, False)} → {actual_connection_status}")
+                logger.info("🔄 %s 연결 상태 동기화: %s → %s", device_name, self.device_connection_status.get(device_name, False), actual_connection_status)
                 self.device_connection_status[device_name] = actual_connection_status
                 self.update_connection_status_display()
             
+            # 연결되어 있으면 다음 끊김 때 즉시 재연결 1회 허용
+            fast_retry_key = f"{device_name}_fast_retry_done"
+            if actual_connection_status:
+                setattr(self, fast_retry_key, False)
+            
             # 연결된 장비의 실제 상태 확인
             if actual_connection_status and device_name in self.serial_connections:
                 connection = self.serial_connections[device_name]
                 if connection and hasattr(connection, 'is_open'):
                     if not connection.is_open:
-                        print(f"⚠️ {device_name} 연결이 끊어짐 - 재연결 시도")
+                        logger.warning("⚠️ %s 연결이 끊어짐 - 재연결 시도", device_name)
                         self.attempt_reconnect_device(device_name)
                 elif connection is None:
-                    print(f"⚠️ {device_name} 연결 객체가 None - 재연결 시도")
+                    logger.warning("⚠️ %s 연결 객체가 None - 재연결 시도", device_name)
                     self.attempt_reconnect_device(device_name)
             
             # 연결되지 않은 장비 재연결 시도 (너무 자주 시도하지 않도록 제한)
             elif not actual_connection_status:
+                # USB 프로파일이 있는 장비가 다시 꽂혔으면 대기 없이 바로 재연결 (포트 번호가 바뀌어도 찾음)
+                # 끊긴 뒤(또는 빠졌다 다시 보일 때) 한 번만 - 꽂혀 있는데 열리지 않는 장비(사용 중/잠김)는 아래 30초 제한을 따름
+                if not self.serial_connector.is_device_present(device_name):
+                    setattr(self, fast_retry_key, False)
+                elif not getattr(self, fast_retry_key, False):
+                    setattr(self, fast_retry_key, True)
+                    logger.info("🔌 %s 장비 재삽입 감지 - 즉시 재연결 시도", device_name)
+                    setattr(self, f"{device_name}_last_attempt", time.time())
+                    self.attempt_reconnect_device(device_name)
+                    return
+
                 # 재연결 시도 간격 제한 (30초마다)
                 current_time = time.time()
                 last_attempt_key = f"{device_name}_last_attempt"
                 
                 if not hasattr(self, last_attempt_key) or current_time - getattr(self, last_attempt_key, 0) > 30:
-                    print(f"🔄 {device_name} 재연결 시도")
+                    logger.info("🔄 %s 재연결 시도", device_name)
                     setattr(self, last_attempt_key, current_time)
                     self.attempt_reconnect_device(device_name)
                 
         except Exception as e:
-            print(f"❌ {device_name} 연결 상태 체크 오류: {e}")
+            logger.error("❌ %s 연결 상태 체크 오류: %s", device_name, e)
     
     def attempt_reconnect_device(self, device_name):
         """특정 장비 재연결 시도"""
@@ -4477,9 +3223,13 @@ class BarcodeMainScreen(QMainWindow):
             self.device_connection_status[device_name] = actual_status
             
             if success:
-                print(f"✅ {device_name} 재연결 성공")
+                logger.info("✅ %s 재연결 성공", device_name)
+                if device_name in NUTRUNNER_DEVICES:
+                    # 새 연결 객체로 체결 결과 수집 재시작
+                    self.serial_connections = self.serial_connector.serial_connections
+                    self.start_nutrunner_ingest()
             else:
-                print(f"❌ {device_name} 재연결 실패")
+                logger.error("❌ %s 재연결 실패", device_name)
             
             # UI 상태 업데이트
             self.update_connection_status_display()
@@ -4487,26 +3237,21 @@ class BarcodeMainScreen(QMainWindow):
             return success
             
         except Exception as e:
-            print(f"❌ {device_name} 재연결 시도 오류: {e}")
+            logger.error("❌ %s 재연결 시도 오류: %s", device_name, e)
             return False
     
     def get_device_config(self, device_name):
         """장비별 설정 정보 가져오기"""
         try:
-            device_mapping = {
-                "PLC": "plc",
-                "스캐너": "scanner", 
-                "프린터": "printer"
-                # 너트1, 너트2는 아직 구현되지 않음 - 나중에 추가 예정
-            }
-            
-            config_key = device_mapping.get(device_name)
-            if config_key and self.config:
-                return self.config.get(config_key, {})
+            # 장비명 → (설정 섹션, 포트 키) - 너트런너는 nutrunner 섹션의 nutrunner1_port / nutrunner2_port
+            section, port_key, _ = self.serial_connector.device_keys.get(device_name, (None, None, None))
+            if section and self.config:
+                settings = self.config.get(section, {})
+                return dict(settings, port=settings.get(port_key, ""))
             return {}
             
         except Exception as e:
-            print(f"❌ {device_name} 설정 정보 가져오기 오류: {e}")
+            logger.error("❌ %s 설정 정보 가져오기 오류: %s", device_name, e)
             return {}
     
     def update_connection_status_display(self):
@@ -4532,10 +3277,10 @@ class BarcodeMainScreen(QMainWindow):
                 self.serial_status_label.setText(status_msg)
                 self.serial_status_label.setStyleSheet(f"QLabel {{ color: {status_color}; font-weight: bold; }}")
             
-            print(f"📊 연결 상태: {status_msg}")
+            logger.debug("📊 연결 상태: %s", status_msg)
             
         except Exception as e:
-            print(f"❌ 연결 상태 표시 업데이트 오류: {e}")
+            logger.error("❌ 연결 상태 표시 업데이트 오류: %s", e)
     
     def sync_connection_status(self):
         """연결 상태 동기화"""
@@ -4544,21 +3289,37 @@ class BarcodeMainScreen(QMainWindow):
             for device_name in self.device_connection_status.keys():
                 actual_status = self.serial_connector.device_connection_status.get(device_name, False)
                 if actual_status != self.device_connection_status.get(device_name, False):
-                    print(f"🔄 {device_name} 상태 동기화: {self.device_connection_status.get(device_name, False)} → {actual_status}")
+                    logger.info("🔄 %s 상태 동기화: %s → %s", device_name, self.device_connection_status.get(device_name, False), actual_status)
                     self.device_connection_status[device_name] = actual_status
             
             # UI 업데이트
             self.update_connection_status_display()
             
         except Exception as e:
-            print(f"❌ 연결 상태 동기화 오류: {e}")
+            logger.error("❌ 연결 상태 동기화 오류: %s", e)
+
 
+def create_startup_splash(app):
+    """시작 진행 표시 스플래시 화면 - (스플래시, 진행 콜백) 반환"""
+    from PyQt5.QtWidgets import QSplashScreen
+    pixmap = QPixmap(420, 120)
+    pixmap.fill(QColor("#2c3e50"))
+    splash = QSplashScreen(pixmap)
+    splash.show()
+    splash.showMessage("프로그램 시작 중...", Qt.AlignCenter, QColor("white"))
+    app.processEvents()
+    
+    def progress(done, total, name):
+        splash.showMessage(f"데이터 로드 중... {name} ({done}/{total})", Qt.AlignCenter, QColor("white"))
+        app.processEvents()
+    
+    return splash, progress
 
 def main():
     try:
         # 이미 실행 중인 인스턴스가 있는지 확인
         if BarcodeMainScreen._instance is not None:
-            print("⚠️ 메인 화면이 이미 실행 중입니다. 기존 창을 활성화합니다.")
+            logger.warning("⚠️ 메인 화면이 이미 실행 중입니다. 기존 창을 활성화합니다.")
             # 기존 창을 앞으로 가져오기
             existing_window = BarcodeMainScreen._instance
             existing_window.show()
@@ -4578,7 +3339,7 @@ def main():
                 sys.__excepthook__(exc_type, exc_value, exc_traceback)
                 return
             
-            print(f" 예상치 못한 오류 발생: {exc_type.__name__}: {exc_value}")
+            logger.error("예상치 못한 오류 발생: %s: %s", exc_type.__name__, exc_value)
             import traceback
             traceback.print_exception(exc_type, exc_value, exc_traceback)
         
@@ -4586,9 +3347,11 @@ def main():
         
         # 로그인 다이얼로그 표시
         if LoginDialog is None:
-            print("경고: LoginDialog가 없어 로그인 없이 메인 화면을 실행합니다.")
-            window = BarcodeMainScreen()
+            logger.warning("경고: LoginDialog가 없어 로그인 없이 메인 화면을 실행합니다.")
+            splash, progress = create_startup_splash(app)
+            window = BarcodeMainScreen(startup_progress=progress)
             window.show()
+            splash.finish(window)
             sys.exit(app.exec_())
         
         login_dialog = LoginDialog()
@@ -4596,39 +3359,42 @@ def main():
         
         if result == QDialog.Accepted:
             # 로그인 성공 시 사용자 정보 확인
-            print(f"DEBUG: 로그인 성공 후 LoginDialog.current_user 확인: {LoginDialog.current_user}")
+            logger.debug("로그인 성공 후 LoginDialog.current_user 확인: %s", LoginDialog.current_user)
             
             # get_current_user() 메서드도 확인
             if hasattr(LoginDialog, 'get_current_user'):
                 user_info = LoginDialog.get_current_user()
-                print(f"DEBUG: LoginDialog.get_current_user() 결과: {user_info}")
+                logger.debug("LoginDialog.get_current_user() 결과: %s", user_info)
                 if user_info is None:
-                    print("⚠️ 경고: LoginDialog.get_current_user()가 None입니다.")
+                    logger.warning("⚠️ 경고: LoginDialog.get_current_user()가 None입니다.")
             
             if LoginDialog.current_user is None:
-                print("⚠️ 경고: LoginDialog.current_user가 None입니다. 로그인 정보를 확인하세요.")
+                logger.warning("⚠️ 경고: LoginDialog.current_user가 None입니다. 로그인 정보를 확인하세요.")
             
-            # 로그인 성공 시 메인 창 표시
-            window = BarcodeMainScreen()
+            # 로그인 성공 시 메인 창 표시 (로그인 대기 시간은 시작 보고서 이정표로 구분)
+            startup_report.mark("로그인 완료")
+            splash, progress = create_startup_splash(app)
+            window = BarcodeMainScreen(startup_progress=progress)
             
             # 창 생성 후 권한 재확인 및 버튼 표시 업데이트
             if hasattr(window, 'sim_dialog_btn'):
-                print(f"DEBUG: 메인 창 생성 후 권한 재확인")
+                logger.debug("메인 창 생성 후 권한 재확인")
                 if hasattr(LoginDialog, 'get_current_user'):
                     latest_user = LoginDialog.get_current_user()
                     if latest_user:
                         window.current_user = latest_user
-                        print(f"DEBUG: 사용자 정보 업데이트 완료: {window.current_user}")
+                        logger.debug("사용자 정보 업데이트 완료: %s", window.current_user)
                 window.update_simulation_button_visibility()
             
             window.show()
+            splash.finish(window)
             sys.exit(app.exec_())
         else:
             # 로그인 취소 또는 실패 시 프로그램 종료
             sys.exit()
         
     except Exception as e:
-        print(f" 프로그램 시작 오류: {e}")
+        logger.error("프로그램 시작 오류: %s", e)
         import traceback
         traceback.print_exception(type(e), e, e.__traceback__)
         sys.exit(1)
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+하위부품 시리얼 중복 투입 인덱스
+하위부품 바코드의 (부품번호, T필드 추적번호)를 키로 이미 투입된 시리얼인지 판정한다.
+- 최근 window_days 일: 메모리 해시 테이블 (상수 시간)
+- 그 이전: 디스크 저장 Bloom 필터로 먼저 거르고, 걸린 경우에만 해시 샤드 파일 1개를 읽어 정확히 확인
+  → 파일 전체를 읽지 않음 (샤드 = 전체의 1/256)
+- 투입 확정(라벨 출력 성공) 시 add, 스캔 시 check
+- 인덱스가 없으면 기존 스캔 로그와 print_data.json 에서 만든다
+"""
+
+import os
+import re
+import json
+import atexit
+import hashlib
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_DIR = os.path.join("data", "duplicate_index")
+ACTIVE_FILE = "active.jsonl"
+BLOOM_FILE = "bloom.bin"
+META_FILE = "meta.json"
+SHARD_DIR = "shards"               # 키 해시 첫 바이트별 256개 파일
+
+DEFAULT_WINDOW_DAYS = 30
+DEFAULT_CAPACITY = 1000000          # Bloom 필터 설계 용량 (시리얼 수)
+DEFAULT_ERROR_RATE = 0.001          # 오탐률 (오탐이어도 샤드 정확 확인으로 걸러짐)
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+# 중복 처리 정책
+POLICY_OFF = "off"                  # 검사 안 함
+POLICY_WARN = "warn"                # 경고 로그만 (투입 허용)
+POLICY_REJECT = "reject"            # 투입 거부
+POLICIES = (POLICY_OFF, POLICY_WARN, POLICY_REJECT)
+
+_PART_FIELD = re.compile(r'\x1dP([^\x1d\x1e\x04]+)')
+_TRACE_FIELD = re.compile(r'\x1dT([^\x1d\x1e\x04]+)')
+# 구분자(GS)가 빠진 예전 로그용 - T + 생산일자 6 + 4M 4 + 추적구분 1 + 일련번호 (숫자)
+_BARE_TRACE_FIELD = re.compile(r'T(\d{6}[0-9A-Z]{4}[A-Z@#*]\d{7,})')
+# 예전 로그에 문자로 기록된 제어문자 (_1D = GS, _1E = RS, _04 = EOT)
+_ESCAPED_CONTROLS = (("_1D", "\x1d"), ("_1E", "\x1e"), ("_04", "\x04"))
+
+
+def barcode_fields(raw_barcode):
+    """HKMC 바코드에서 (P필드 부품번호, T필드 추적정보) 추출 (없는 필드는 None)
+    예전 출력 로그 형식(제어문자가 _1D/_1E 로 기록되었거나 GS 가 빠진 바코드)도 T필드는 찾는다"""
+    if not raw_barcode:
+        return None, None
+    if "_1D" in raw_barcode or "_1E" in raw_barcode:
+        for escaped, control in _ESCAPED_CONTROLS:
+            raw_barcode = raw_barcode.replace(escaped, control)
+    part = _PART_FIELD.search(raw_barcode)
+    trace = _TRACE_FIELD.search(raw_barcode)
+    if trace:
+        trace = trace.group(1).strip()
+    else:
+        bare = _BARE_TRACE_FIELD.findall(raw_barcode)
+        trace = bare[-1] if bare else None
+    return (part.group(1).strip() if part else None), trace
+
+
+def serial_key(raw_barcode, part_number=None):
+    """바코드에서 중복 판정 키 'Part_No|T필드' 추출 (T필드가 없으면 None)"""
+    part, trace = barcode_fields(raw_barcode)
+    if not trace:
+        return None
+    return f"{part or (part_number or '').strip()}|{trace}"
+
+
+def _digest(key):
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+
+
+class BloomFilter:
+    """고정 크기 비트 배열 Bloom 필터 (bytearray, 파일로 그대로 저장)"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, error_rate=DEFAULT_ERROR_RATE, bits=None):
+        import math
+        self.size = int(-capacity * math.log(error_rate) / (math.log(2) ** 2)) + 1
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bits if bits is not None and len(bits) == (self.size + 7) // 8 else bytearray((self.size + 7) // 8)
+
+    def _positions(self, digest):
+        # 이중 해싱: h1 + i*h2
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, digest):
+        for position in self._positions(digest):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, digest):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+
+class DuplicateSerialIndex:
+    """하위부품 시리얼 중복 인덱스"""
+
+    def __init__(self, directory=INDEX_DIR, window_days=DEFAULT_WINDOW_DAYS, policy=POLICY_WARN,
+                 capacity=DEFAULT_CAPACITY, error_rate=DEFAULT_ERROR_RATE, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        self.directory = directory
+        self.window = timedelta(days=window_days)
+        self.policy = policy if policy in POLICIES else POLICY_WARN
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.flush_interval = flush_interval
+
+        self._active = {}           # 키 → 투입 시각 (최근 window)
+        self._order = deque()       # (투입 시각, 키) 투입 순서 - 만료 처리용
+        self.bloom = BloomFilter(capacity, error_rate)
+
+        self._lock = threading.Lock()
+        self._timer = None
+        self._dirty = False
+        self._closed = False
+        self._active_handle = None
+        atexit.register(self.close)
+
+    @classmethod
+    def from_config(cls, config):
+        """admin_panel_config.json 의 duplicate_check 항목으로 생성"""
+        settings = (config or {}).get("duplicate_check", {})
+        return cls(window_days=int(settings.get("window_days", DEFAULT_WINDOW_DAYS)),
+                   policy=settings.get("policy", POLICY_WARN),
+                   capacity=int(settings.get("bloom_capacity", DEFAULT_CAPACITY)),
+                   error_rate=float(settings.get("bloom_error_rate", DEFAULT_ERROR_RATE)))
+
+    @property
+    def enabled(self):
+        return self.policy != POLICY_OFF
+
+    @property
+    def rejects(self):
+        return self.policy == POLICY_REJECT
+
+    def _path(self, *names):
+        return os.path.join(self.directory, *names)
+
+    def _shard_path(self, digest):
+        return self._path(SHARD_DIR, f"{digest[0]:02x}.txt")
+
+    # ===== 조회 =====
+
+    def _expire(self, now):
+        """lock 보유 상태에서 호출 - window 밖 항목을 메모리 테이블에서 제거 (보관 데이터로만 남음)"""
+        limit = now - self.window
+        while self._order and self._order[0][0] < limit:
+            when, key = self._order.popleft()
+            if self._active.get(key) == when:
+                del self._active[key]
+
+    def find(self, key, now=None):
+        """이미 투입된 키면 투입 시각(datetime 또는 보관 데이터 시각 문자열), 아니면 None"""
+        if not key:
+            return None
+        with self._lock:
+            self._expire(now or datetime.now())
+            when = self._active.get(key)
+            if when is not None:
+                return when
+            digest = _digest(key)
+            if digest not in self.bloom:
+                return None
+        return self._exact_lookup(key, digest)
+
+    def _exact_lookup(self, key, digest):
+        """Bloom 필터 통과 시 해당 샤드 파일만 읽어 정확히 확인"""
+        path = self._shard_path(digest)
+        prefix = key + "\t"
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.startswith(prefix):
+                        return line[len(prefix):].strip()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error("중복 인덱스 샤드 조회 실패: %s - %s", path, e)
+        return None
+
+    def check(self, raw_barcode, part_number=None):
+        """스캔 바코드 중복 여부 (정책 off 이거나 T필드가 없으면 항상 False)"""
+        if not self.enabled:
+            return False
+        return self.find(serial_key(raw_barcode, part_number)) is not None
+
+    # ===== 추가 =====
+
+    def add(self, raw_barcode, part_number=None, when=None):
+        """투입 확정된 하위부품 시리얼 등록"""
+        key = serial_key(raw_barcode, part_number)
+        if key:
+            self.add_key(key, when or datetime.now())
+        return key
+
+    def add_key(self, key, when, persist_active=True):
+        digest = _digest(key)
+        with self._lock:
+            if key in self._active:
+                return
+            if when >= datetime.now() - self.window:
+                self._active[key] = when
+                self._order.append((when, key))
+                if persist_active:
+                    self._append_active(key, when)
+            self.bloom.add(digest)
+            self._append_shard(digest, key, when)
+            self._mark_dirty()
+
+    def _append_active(self, key, when):
+        if self._active_handle is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._active_handle = open(self._path(ACTIVE_FILE), 'a', encoding='utf-8')
+        self._active_handle.write(json.dumps([key, when.isoformat(timespec='seconds')], ensure_ascii=False) + "\n")
+        self._active_handle.flush()
+
+    def _append_shard(self, digest, key, when):
+        path = self._shard_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(f"{key}\t{when.isoformat(timespec='seconds')}\n")
+
+    # ===== 저장/로드 =====
+
+    def _mark_dirty(self):
+        """lock 보유 상태에서 호출 - Bloom 필터 파일 저장을 모아서 예약"""
+        self._dirty = True
+        if self._closed or self._timer is not None:
+            return
+        self._timer = threading.Timer(self.flush_interval, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._timer = None
+            if not self._dirty:
+                return True
+            self._dirty = False
+            bits = bytes(self.bloom.bits)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = self._path(BLOOM_FILE + ".tmp")
+            with open(temp_path, 'wb') as f:
+                f.write(bits)
+            os.replace(temp_path, self._path(BLOOM_FILE))
+            with open(self._path(META_FILE), 'w', encoding='utf-8') as f:
+                json.dump({"capacity": self.capacity, "error_rate": self.error_rate}, f)
+            return True
+        except Exception as e:
+            logger.error("중복 인덱스 Bloom 필터 저장 실패: %s", e)
+            return False
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._active_handle is not None:
+                self._active_handle.close()
+                self._active_handle = None
+        self.flush()
+
+    def load(self, log_root="logs", print_data_file="print_data.json"):
+        """인덱스 로드 - 없으면 기존 스캔 로그/print_data.json 에서 생성"""
+        if not os.path.isdir(self._path(SHARD_DIR)):
+            logger.info("중복 인덱스 없음 - 기존 로그에서 생성")
+            self.rebuild(log_root, print_data_file)
+            return False
+        try:
+            bloom_loaded = False
+            if os.path.exists(self._path(META_FILE)) and os.path.exists(self._path(BLOOM_FILE)):
+                with open(self._path(META_FILE), 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                if (meta.get("capacity"), meta.get("error_rate")) == (self.capacity, self.error_rate):
+                    with open(self._path(BLOOM_FILE), 'rb') as f:
+                        self.bloom = BloomFilter(self.capacity, self.error_rate, bytearray(f.read()))
+                    bloom_loaded = True
+            if not bloom_loaded:
+                self._rebuild_bloom_from_shards()
+            self._load_active()
+            logger.info("중복 인덱스 로드 완료 - 최근 %s건 (정책: %s)", len(self._active), self.policy)
+            return True
+        except Exception as e:
+            logger.error("중복 인덱스 로드 오류: %s", e)
+            return False
+
+    def _load_active(self):
+        """최근 window 항목만 메모리로 읽고 active 파일을 그 항목으로 다시 씀 (만료분 정리)"""
+        path = self._path(ACTIVE_FILE)
+        limit = datetime.now() - self.window
+        entries = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        key, when_text = json.loads(line)
+                        when = datetime.fromisoformat(when_text)
+                    except Exception:
+                        continue    # 기록 중 잘린 줄
+                    if when >= limit:
+                        entries.setdefault(key, when)
+        with self._lock:
+            for key, when in sorted(entries.items(), key=lambda item: item[1]):
+                self._active[key] = when
+                self._order.append((when, key))
+                # 마지막 Bloom 저장 이후 추가분도 반영
+                self.bloom.add(_digest(key))
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for when, key in self._order:
+                f.write(json.dumps([key, when.isoformat(timespec='seconds')], ensure_ascii=False) + "\n")
+        os.replace(temp_path, path)
+
+    def _rebuild_bloom_from_shards(self):
+        bloom = BloomFilter(self.capacity, self.error_rate)
+        shard_dir = self._path(SHARD_DIR)
+        for file_name in os.listdir(shard_dir):
+            with open(os.path.join(shard_dir, file_name), 'r', encoding='utf-8') as f:
+                for line in f:
+                    key = line.split("\t", 1)[0]
+                    if key:
+                        bloom.add(_digest(key))
+        with self._lock:
+            self.bloom = bloom
+            self._dirty = True
+        logger.info("중복 인덱스 Bloom 필터 재생성 (샤드 파일 기준)")
+
+    def rebuild(self, log_root="logs", print_data_file="print_data.json"):
+        """기존 스캔 로그(하위부품 바코드)와 print_data.json 에서 인덱스 생성 (등록 건수 반환)"""
+        os.makedirs(self._path(SHARD_DIR), exist_ok=True)
+        entries = {}
+        for directory, _, file_names in os.walk(log_root):
+            if os.path.basename(directory) != "scan_logs":
+                continue
+            for file_name in file_names:
+                if not file_name.endswith(".json") or "_print_" in file_name:
+                    continue
+                try:
+                    with open(os.path.join(directory, file_name), 'r', encoding='utf-8') as f:
+                        logs = json.load(f)
+                    for log in logs if isinstance(logs, list) else []:
+                        when = self._log_time(log.get("날짜"), log.get("시간"))
+                        index = 1
+                        while f"하위부품{index}" in log:
+                            if log.get(f"하위부품{index}_스캔결과") == "OK":
+                                key = serial_key(log.get(f"하위부품{index}_바코드"), log.get(f"하위부품{index}"))
+                                if key:
+                                    entries.setdefault(key, when)
+                            index += 1
+                except Exception as e:
+                    logger.error("중복 인덱스 생성 - 스캔 로그 읽기 실패: %s - %s", file_name, e)
+
+        try:
+            if os.path.exists(print_data_file):
+                with open(print_data_file, 'r', encoding='utf-8') as f:
+                    print_data = json.load(f)
+                for entry in print_data if isinstance(print_data, list) else []:
+                    for child in entry.get("child_parts", []):
+                        if child.get("status") == "OK":
+                            key = serial_key(child.get("raw_barcode"), child.get("part_number"))
+                            if key:
+                                # print_data.json 에는 날짜가 없으므로 보관 데이터로만 등록
+                                entries.setdefault(key, datetime.min)
+        except Exception as e:
+            logger.error("중복 인덱스 생성 - print_data.json 읽기 실패: %s", e)
+
+        for key, when in sorted(entries.items(), key=lambda item: item[1]):
+            self.add_key(key, when)
+        self.flush()
+        logger.info("중복 인덱스 생성 완료 - %s건", len(entries))
+        return len(entries)
+
+    @staticmethod
+    def _log_time(date_text, time_text):
+        try:
+            return datetime.strptime(f"{date_text} {time_text}", "%Y-%m-%d %H:%M:%S")
+        except Exception:
+            return datetime.min
@@ -0,0 +1,595 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+라인(셀) 데이터 집계 서버/클라이언트 (선택 기능)
+각 라인 PC(스테이션)가 작업완료 사이클과 라벨 출력 결과를 집계 서버 1곳으로 보내고,
+이력/보고서 화면은 폴더 복사 없이 라인 전체 추적·근무조 합계를 서버에서 조회한다.
+- 전송: 로컬 TCP 소켓, 한 줄 = JSON 요청 1건 / 응답 1건 (표준 라이브러리만 사용)
+- 스테이션: 기록은 먼저 로컬 outbox(sqlite3)에 넣고 전송 스레드가 묶어서 보냄
+  서버가 꺼져 있거나 연결이 끊기면 outbox 에 남겨 두었다가 재연결 시 순서대로 재전송
+- 서버: (outbox 식별자, 순번) 고유 키로 중복 없이 저장 → 응답을 못 받아 다시 보낸 묶음도 안전
+- 설정 (admin_panel_config.json aggregator 항목, 없으면 사용 안 함):
+    enabled, host(127.0.0.1), port(8765), station(기본: 컴퓨터 이름), batch_size, flush_interval, outbox
+
+서버 실행 (프로젝트 루트에서):
+    python -m modules.core.line_aggregator --port 8765 --db data/line_aggregate.db
+한 PC 에서 여러 스테이션 시험: benchmarks/line_aggregator_stations.py
+"""
+
+import os
+import json
+import uuid
+import socket
+import sqlite3
+import argparse
+import threading
+import socketserver
+from datetime import datetime
+
+from .duplicate_index import barcode_fields
+from .production_counter import ShiftCalendar
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+AGGREGATE_DB = os.path.join("data", "line_aggregate.db")
+OUTBOX_DB = os.path.join("data", "aggregator_outbox.db")
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 1.0    # 전송 주기 (초) - 1묶음이 차면 주기 전이라도 전송
+CONNECT_TIMEOUT = 3.0
+QUERY_TIMEOUT = 10.0
+RECONNECT_MIN = 1.0             # 재연결 대기 (초, 실패할 때마다 2배)
+RECONNECT_MAX = 30.0
+
+KIND_LABEL = "label"            # 라벨 출력 결과 (OK/NG + 부모 바코드 + 하위부품)
+KIND_CYCLE = "cycle"            # 작업완료 사이클 (하위부품/체결 요약)
+
+RESULT_OK = "OK"
+RESULT_NG = "NG"
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_FIELD_STRIP = " \r\n"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    source TEXT PRIMARY KEY,
+    station TEXT NOT NULL,
+    last_seq INTEGER NOT NULL DEFAULT 0,
+    last_seen TEXT
+);
+CREATE TABLE IF NOT EXISTS labels (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    station TEXT NOT NULL,
+    printed_at TEXT NOT NULL,
+    work_date TEXT,
+    shift TEXT,
+    panel TEXT,
+    part_number TEXT NOT NULL,
+    parent_trace TEXT NOT NULL,
+    barcode TEXT,
+    result TEXT NOT NULL,
+    cycle_id INTEGER,
+    UNIQUE (source, seq)
+);
+CREATE TABLE IF NOT EXISTS label_children (
+    label_id INTEGER NOT NULL REFERENCES labels(id),
+    child_part TEXT,
+    child_trace TEXT,
+    barcode TEXT
+);
+CREATE TABLE IF NOT EXISTS cycles (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    station TEXT NOT NULL,
+    completed_at TEXT NOT NULL,
+    started_at TEXT,
+    work_date TEXT,
+    shift TEXT,
+    panel TEXT,
+    part_number TEXT,
+    cycle_id INTEGER,
+    expected INTEGER,
+    matched INTEGER,
+    tightenings INTEGER,
+    tightening_nok INTEGER,
+    result TEXT NOT NULL,
+    UNIQUE (source, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_labels_trace ON labels(parent_trace);
+CREATE INDEX IF NOT EXISTS idx_labels_date ON labels(printed_at);
+CREATE INDEX IF NOT EXISTS idx_labels_part_date ON labels(part_number, printed_at);
+CREATE INDEX IF NOT EXISTS idx_labels_shift ON labels(work_date, shift);
+CREATE INDEX IF NOT EXISTS idx_label_children_trace ON label_children(child_trace);
+CREATE INDEX IF NOT EXISTS idx_label_children_label ON label_children(label_id);
+CREATE INDEX IF NOT EXISTS idx_cycles_date ON cycles(completed_at);
+CREATE INDEX IF NOT EXISTS idx_cycles_shift ON cycles(work_date, shift);
+"""
+
+_OUTBOX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+"""
+
+
+def _open_db(path, schema):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(schema)
+    return conn
+
+
+def _exchange(stream, message):
+    """요청 1줄 전송 → 응답 1줄 (ok 가 아니면 RuntimeError)"""
+    stream.write(json.dumps(message, ensure_ascii=False).encode('utf-8') + b"\n")
+    stream.flush()
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("집계 서버 연결 끊김")
+    reply = json.loads(line)
+    if not reply.get("ok"):
+        raise RuntimeError(reply.get("error") or "집계 서버 오류")
+    return reply
+
+
+def _settings(config):
+    """설정의 aggregator 항목 (사용 안 하면 None)"""
+    settings = (config or {}).get("aggregator") or {}
+    return settings if settings.get("enabled") else None
+
+
+# ===== 서버 =====
+
+class AggregateStore:
+    """라인 전체 사이클/라벨 저장소 (서버 측)"""
+
+    def __init__(self, path=AGGREGATE_DB):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = _open_db(path, _SCHEMA)
+
+    # ===== 수신 =====
+
+    def ingest(self, station, source, records):
+        """스테이션 전송 묶음 저장 - 이미 받은 순번은 건너뜀, 확인 순번(묶음 최대 순번) 반환"""
+        if not source:
+            raise ValueError("source 없음")
+        acked = 0
+        with self._lock, self._conn:
+            for record in records:
+                seq = int(record["seq"])
+                kind = record.get("kind")
+                if kind == KIND_LABEL:
+                    self._insert_label(station, source, seq, record)
+                elif kind == KIND_CYCLE:
+                    self._insert_cycle(station, source, seq, record)
+                else:
+                    logger.warning("알 수 없는 집계 기록 (무시): %s %s #%s", station, kind, seq)
+                acked = max(acked, seq)
+            self._conn.execute(
+                "INSERT INTO sources (source, station, last_seq, last_seen) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(source) DO UPDATE SET station = excluded.station, "
+                "last_seq = MAX(last_seq, excluded.last_seq), last_seen = excluded.last_seen",
+                (source, station, acked, datetime.now().strftime(TIME_FORMAT)))
+        return acked
+
+    def _insert_label(self, station, source, seq, record):
+        """lock 보유 + 트랜잭션 안에서 호출"""
+        barcode = record.get("barcode") or ""
+        parent_part, parent_trace = barcode_fields(barcode)
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO labels (source, seq, station, printed_at, work_date, shift, panel, part_number, "
+            "parent_trace, barcode, result, cycle_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (source, seq, station, record["at"], record.get("work_date"), record.get("shift"), record.get("panel"),
+             parent_part or record.get("part_number") or "", parent_trace or "", barcode,
+             record.get("result", RESULT_OK), record.get("cycle_id")))
+        if not cursor.rowcount:
+            return      # 재전송된 기록
+        rows = []
+        for child_part, child_barcode in record.get("children") or []:
+            barcode_part, child_trace = barcode_fields(child_barcode)
+            rows.append((cursor.lastrowid, barcode_part or child_part, child_trace, child_barcode))
+        self._conn.executemany(
+            "INSERT INTO label_children (label_id, child_part, child_trace, barcode) VALUES (?, ?, ?, ?)", rows)
+
+    def _insert_cycle(self, station, source, seq, record):
+        self._conn.execute(
+            "INSERT OR IGNORE INTO cycles (source, seq, station, completed_at, started_at, work_date, shift, panel, "
+            "part_number, cycle_id, expected, matched, tightenings, tightening_nok, result) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (source, seq, station, record["at"], record.get("started_at"), record.get("work_date"),
+             record.get("shift"), record.get("panel"), record.get("part_number"), record.get("cycle_id"),
+             record.get("expected"), record.get("matched"), record.get("tightenings"),
+             record.get("tightening_nok"), record.get("result", RESULT_OK)))
+
+    # ===== 조회 (요청 이름 = 메서드 이름) =====
+
+    def _rows(self, query, params):
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def labels(self, date_from, date_to, part_number=None, station=None, limit=5000):
+        """출력일자 범위(YYYY-MM-DD, 포함) [+ 부품번호/스테이션] 라벨 출력 이력 (OK/NG 모두)"""
+        where, params = "printed_at >= ? AND printed_at < ?", [str(date_from), f"{date_to} 99"]
+        if part_number:
+            where += " AND part_number = ?"
+            params.append(part_number)
+        if station:
+            where += " AND station = ?"
+            params.append(station)
+        return self._rows(f"SELECT * FROM labels WHERE {where} ORDER BY printed_at DESC LIMIT ?",
+                          (*params, int(limit)))
+
+    def lookup(self, text, limit=100):
+        """TraceabilityIndex.lookup 과 같은 양방향 조회 - 라인 전체 출력 성공 라벨 대상"""
+        text = (text or "").strip(_FIELD_STRIP)
+        if not text.strip():
+            return {"parents": [], "child_of": []}
+        _, trace = barcode_fields(text)
+        query = "SELECT * FROM labels WHERE result = 'OK' AND parent_trace {} ORDER BY printed_at DESC LIMIT ?"
+        parents = self._rows(query.format("= ?"), ((trace or text).strip(_FIELD_STRIP), int(limit)))
+        if not parents and text.isdigit():
+            parents = self._rows(query.format("LIKE ?"), ("%" + text, int(limit)))
+        return {"parents": parents, "child_of": self.parents_of_child(text, limit=limit)}
+
+    def children_of(self, parent_id):
+        return self._rows("SELECT child_part, child_trace, barcode FROM label_children WHERE label_id = ?",
+                          (int(parent_id),))
+
+    def parents_of_child(self, child_trace, child_part=None, limit=100):
+        """하위부품 T필드 추적정보(또는 바코드 전체) → 이 하위부품을 사용한 부모 라벨 (전 스테이션)"""
+        part, trace = barcode_fields(child_trace)
+        trace = (trace or child_trace or "").strip(_FIELD_STRIP)
+        if not trace.strip():
+            return []
+        child_part = child_part or part
+        query = ("SELECT l.*, c.child_part, c.child_trace FROM label_children c JOIN labels l ON l.id = c.label_id "
+                 "WHERE c.child_trace = ? AND l.result = 'OK'")
+        params = [trace]
+        if child_part:
+            query += " AND c.child_part = ?"
+            params.append(child_part)
+        query += " ORDER BY l.printed_at DESC LIMIT ?"
+        params.append(int(limit))
+        return self._rows(query, params)
+
+    def shift_totals(self, work_date, station=None):
+        """작업일 근무조별 라벨 OK/NG 합계 [{work_date, shift, station, panel, part_number, OK, NG}]"""
+        where, params = "work_date = ?", [str(work_date)]
+        if station:
+            where += " AND station = ?"
+            params.append(station)
+        return self._rows(
+            "SELECT work_date, shift, station, panel, part_number, "
+            "SUM(result = 'OK') AS OK, SUM(result != 'OK') AS NG, MIN(printed_at) AS first_at "
+            f"FROM labels WHERE {where} GROUP BY work_date, shift, station, panel, part_number "
+            "ORDER BY first_at, station, panel, part_number", params)
+
+    def cycles(self, date_from, date_to, station=None, limit=5000):
+        where, params = "completed_at >= ? AND completed_at < ?", [str(date_from), f"{date_to} 99"]
+        if station:
+            where += " AND station = ?"
+            params.append(station)
+        return self._rows(f"SELECT * FROM cycles WHERE {where} ORDER BY completed_at DESC LIMIT ?",
+                          (*params, int(limit)))
+
+    def stations(self):
+        """스테이션별 마지막 수신 순번/시각"""
+        return self._rows("SELECT station, source, last_seq, last_seen FROM sources ORDER BY station", ())
+
+    QUERIES = ("labels", "lookup", "children_of", "parents_of_child", "shift_totals", "cycles", "stations")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class _AggregatorHandler(socketserver.StreamRequestHandler):
+    """연결 1개 - 요청 줄마다 응답 줄 1개"""
+
+    def handle(self):
+        peer = "%s:%s" % self.client_address[:2]
+        logger.debug("집계 서버 연결: %s", peer)
+        for line in self.rfile:
+            try:
+                reply = self.server.dispatch(json.loads(line))
+            except Exception as e:
+                logger.warning("집계 서버 요청 처리 실패 (%s): %s", peer, e)
+                reply = {"ok": False, "error": str(e)}
+            try:
+                self.wfile.write(json.dumps(reply, ensure_ascii=False).encode('utf-8') + b"\n")
+            except OSError:
+                break
+        logger.debug("집계 서버 연결 종료: %s", peer)
+
+
+class AggregatorServer(socketserver.ThreadingTCPServer):
+    """집계 서버 - 스테이션 전송(push)과 화면 조회(query) 처리"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, store):
+        self.store = store
+        super().__init__(address, _AggregatorHandler)
+
+    def dispatch(self, request):
+        op = request.get("op")
+        if op == "push":
+            records = request.get("records") or []
+            acked = self.store.ingest(request.get("station") or "", request.get("source"), records)
+            logger.debug("집계 수신 - %s %s건 (확인 순번 %s)", request.get("station"), len(records), acked)
+            return {"ok": True, "acked": acked}
+        if op == "query":
+            name = request.get("name")
+            if name not in AggregateStore.QUERIES:
+                raise ValueError(f"알 수 없는 조회: {name}")
+            return {"ok": True, "rows": getattr(self.store, name)(**(request.get("args") or {}))}
+        if op == "ping":
+            return {"ok": True}
+        raise ValueError(f"알 수 없는 요청: {op}")
+
+
+# ===== 스테이션 =====
+
+class AggregatorClient:
+    """스테이션 → 집계 서버 전송 (outbox 에 먼저 기록, 전송 스레드가 묶어서 보내고 확인분만 삭제)"""
+
+    def __init__(self, station, host=DEFAULT_HOST, port=DEFAULT_PORT, outbox_path=OUTBOX_DB,
+                 batch_size=DEFAULT_BATCH_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL, shifts=None):
+        self.station = station
+        self.address = (host, int(port))
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = flush_interval
+        self.calendar = ShiftCalendar(shifts)
+        self.connected = False
+
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._conn = _open_db(outbox_path, _OUTBOX_SCHEMA)
+        self.source = self._outbox_source()
+        self._queued = 0            # 마지막 전송 이후 기록 수 - 1묶음이 차면 주기를 기다리지 않고 전송
+        self._failures = 0
+        self._stream = None
+        self._socket = None
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def from_config(cls, config):
+        """admin_panel_config.json 의 aggregator 항목으로 생성 (enabled 가 아니면 None)"""
+        settings = _settings(config)
+        if settings is None:
+            return None
+        return cls(settings.get("station") or socket.gethostname(),
+                   host=settings.get("host", DEFAULT_HOST),
+                   port=settings.get("port", DEFAULT_PORT),
+                   outbox_path=settings.get("outbox", OUTBOX_DB),
+                   batch_size=settings.get("batch_size", DEFAULT_BATCH_SIZE),
+                   flush_interval=settings.get("flush_interval", DEFAULT_FLUSH_INTERVAL),
+                   shifts=(config or {}).get("production_counter", {}).get("shifts"))
+
+    def _outbox_source(self):
+        """outbox 식별자 - 서버 중복 판정 키 (outbox 파일을 새로 만들면 순번이 1부터 다시 시작하므로)"""
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+            if row:
+                return row["value"]
+            source = uuid.uuid4().hex
+            self._conn.execute("INSERT INTO meta (key, value) VALUES ('source', ?)", (source,))
+            return source
+
+    # ===== 기록 (GUI 스레드) =====
+
+    def _enqueue(self, kind, record, when=None):
+        when = when or datetime.now()
+        work_date, shift, _ = self.calendar.period(when)
+        record.update(at=when.strftime(TIME_FORMAT), work_date=work_date.isoformat(), shift=shift)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("INSERT INTO outbox (kind, payload) VALUES (?, ?)",
+                                   (kind, json.dumps(record, ensure_ascii=False)))
+        except Exception as e:
+            logger.error("집계 전송 대기열 기록 실패: %s - %s", kind, e)
+            return
+        self._queued += 1
+        if self._queued >= self.batch_size:
+            self._wake.set()
+
+    def push_label(self, panel_name, part_number, parent_barcode, children, success, cycle=None, when=None):
+        """라벨 출력 결과 1건 (children: [(하위부품번호, 원본 바코드)])"""
+        self._enqueue(KIND_LABEL, {
+            "panel": panel_name, "part_number": part_number, "barcode": parent_barcode,
+            "result": RESULT_OK if success else RESULT_NG,
+            "cycle_id": getattr(cycle, 'cycle_id', None),
+            "children": [list(child) for child in children or []],
+        }, when)
+
+    def push_cycle(self, cycle, success):
+        """작업완료 사이클 1건 (작업 흐름 엔진 PanelCycle)"""
+        self._enqueue(KIND_CYCLE, {
+            "panel": cycle.panel, "part_number": cycle.part_number, "cycle_id": cycle.cycle_id,
+            "started_at": cycle.started_at.strftime(TIME_FORMAT),
+            "expected": len(cycle.expected), "matched": len(cycle.matched),
+            "tightenings": len(cycle.tightenings), "tightening_nok": len(cycle.nok_tightenings()),
+            "result": RESULT_OK if success else RESULT_NG,
+        }, cycle.completed_at)
+
+    def pending(self):
+        """아직 서버 확인을 받지 못한 기록 수"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    # ===== 전송 (전송 스레드) =====
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="aggregator-client", daemon=True)
+            self._thread.start()
+        logger.info("집계 서버 전송 시작 - %s → %s:%s (미전송 %s건)", self.station, *self.address, self.pending())
+
+    def _connect(self):
+        self._socket = socket.create_connection(self.address, timeout=CONNECT_TIMEOUT)
+        self._stream = self._socket.makefile('rwb')
+        if not self.connected:
+            logger.info("집계 서버 연결됨 - %s:%s", *self.address)
+        self.connected = True
+
+    def _disconnect(self):
+        for handle in (self._stream, self._socket):
+            if handle is not None:
+                try:
+                    handle.close()
+                except OSError:
+                    pass
+        self._stream = None
+        self._socket = None
+
+    def _send_batch(self):
+        """outbox 앞에서부터 1묶음 전송 - 확인받은 순번까지 삭제, 더 보낼 것이 있으면 True"""
+        with self._send_lock:
+            return self._send_batch_locked()
+
+    def _send_batch_locked(self):
+        self._queued = 0
+        with self._lock:
+            rows = self._conn.execute("SELECT seq, kind, payload FROM outbox ORDER BY seq LIMIT ?",
+                                      (self.batch_size,)).fetchall()
+        if not rows:
+            return False
+        records = []
+        for row in rows:
+            record = json.loads(row["payload"])
+            record.update(seq=row["seq"], kind=row["kind"])
+            records.append(record)
+        if self._stream is None:
+            self._connect()
+        reply = _exchange(self._stream, {"op": "push", "station": self.station, "source": self.source,
+                                         "records": records})
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM outbox WHERE seq <= ?", (int(reply["acked"]),))
+        return len(rows) == self.batch_size
+
+    def _run(self):
+        retry = RECONNECT_MIN
+        while not self._stop_event.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                # 재연결 직후에는 밀린 묶음을 연달아 재전송
+                while self._send_batch() and not self._stop_event.is_set():
+                    pass
+                retry = RECONNECT_MIN
+                self._failures = 0
+            except Exception as e:
+                with self._send_lock:
+                    self._disconnect()
+                self.connected = False
+                if not self._failures:
+                    logger.warning("집계 서버 전송 실패 - 재연결 대기 (미전송 %s건): %s", self.pending(), e)
+                self._failures += 1
+                self._stop_event.wait(retry)
+                retry = min(retry * 2, RECONNECT_MAX)
+
+    def stop(self, timeout=2.0):
+        """전송 스레드 종료 - 남은 기록 1묶음을 한 번 더 보내 보고, 나머지는 다음 실행 때 재전송"""
+        self._stop_event.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        try:
+            self._send_batch()
+        except Exception as e:
+            logger.debug("집계 서버 종료 전 전송 실패: %s", e)
+        pending = self.pending()
+        if pending:
+            logger.info("집계 서버 미전송 %s건은 다음 실행 때 전송", pending)
+        with self._send_lock:
+            self._disconnect()
+        with self._lock:
+            self._conn.close()
+
+
+class AggregatorQuery:
+    """집계 서버 조회 (이력/보고서 화면) - 추적 조회 메서드는 TraceabilityIndex 와 같음"""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, timeout=QUERY_TIMEOUT):
+        self.address = (host, int(port))
+        self.timeout = timeout
+
+    @classmethod
+    def from_config(cls, config):
+        """aggregator 항목이 enabled 가 아니면 None (로컬 로그/인덱스 사용)"""
+        settings = _settings(config)
+        if settings is None:
+            return None
+        return cls(settings.get("host", DEFAULT_HOST), settings.get("port", DEFAULT_PORT))
+
+    def _query(self, name, **args):
+        with socket.create_connection(self.address, timeout=self.timeout) as sock:
+            with sock.makefile('rwb') as stream:
+                return _exchange(stream, {"op": "query", "name": name, "args": args})["rows"]
+
+    def labels(self, date_from, date_to, part_number=None, station=None, limit=5000):
+        return self._query("labels", date_from=str(date_from), date_to=str(date_to),
+                           part_number=part_number, station=station, limit=limit)
+
+    def lookup(self, text, limit=100):
+        return self._query("lookup", text=text, limit=limit)
+
+    def children_of(self, parent_id):
+        return self._query("children_of", parent_id=parent_id)
+
+    def parents_of_child(self, child_trace, child_part=None, limit=100):
+        return self._query("parents_of_child", child_trace=child_trace, child_part=child_part, limit=limit)
+
+    def shift_totals(self, work_date, station=None):
+        return self._query("shift_totals", work_date=str(work_date), station=station)
+
+    def cycles(self, date_from, date_to, station=None, limit=5000):
+        return self._query("cycles", date_from=str(date_from), date_to=str(date_to), station=station, limit=limit)
+
+    def stations(self):
+        return self._query("stations")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="라인 데이터 집계 서버")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="수신 주소 (다른 PC 에서 받으려면 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--db", default=AGGREGATE_DB, help="집계 sqlite 파일")
+    args = parser.parse_args()
+
+    store = AggregateStore(args.db)
+    server = AggregatorServer((args.host, args.port), store)
+    logger.info("집계 서버 시작 - %s:%s (%s)", args.host, args.port, args.db)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        store.close()
+        logger.info("집계 서버 종료")
+
+
+if __name__ == "__main__":
+    main()
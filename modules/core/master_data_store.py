@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기준정보 저장소
+- 항목 1건 = 1행 (sqlite3, WAL) - 추가/수정/삭제는 해당 행만 한 트랜잭션으로 기록
+- 사용유무 Y 항목의 구분값은 유일 인덱스로 보장, 일괄 가져오기는 한 트랜잭션
+- 처음 열 때 config/master_data.json 을 한 번 가져온다 (이후 원본은 이 저장소)
+"""
+
+import os
+import json
+import atexit
+import sqlite3
+import threading
+
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+MASTER_DATA_DB = os.path.join("data", "master_data.db")
+ACTIVE_STATUS = "Y"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS master_parts (
+    id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    supplier_code TEXT NOT NULL DEFAULT '',
+    division TEXT NOT NULL DEFAULT '',
+    part_number TEXT NOT NULL DEFAULT '',
+    use_status TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_master_parts_position ON master_parts(position);
+CREATE INDEX IF NOT EXISTS idx_master_parts_part ON master_parts(part_number, division);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_master_parts_active_division ON master_parts(division)
+    WHERE use_status = 'Y';
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _key_columns(item):
+    """조회/유일성 검사용 컬럼 (표와 같은 기준 - 앞뒤 공백 제외)"""
+    return (str(item.get('supplier_code') or '').strip(), str(item.get('division') or '').strip(),
+            str(item.get('part_number') or '').strip(), str(item.get('use_status') or '').strip())
+
+
+class MasterDataStore:
+    """기준정보 항목 저장/조회 - 목록 순서는 position, 항목 키는 id"""
+
+    def __init__(self, path=MASTER_DATA_DB):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # 기준정보는 쓰기가 드물고 잃으면 안 됨 - 커밋마다 디스크 동기화
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.executescript(_SCHEMA)
+        atexit.register(self.close)
+
+    # ===== 메타 =====
+
+    def get_meta(self, key, default=None):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else default
+
+    def set_meta(self, key, value):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    # ===== 조회 =====
+
+    def load(self):
+        """전체 목록 - ([id...], [항목...]) 목록 순서대로"""
+        with self._lock:
+            rows = self._conn.execute("SELECT id, data FROM master_parts ORDER BY position").fetchall()
+        return [row["id"] for row in rows], [json.loads(row["data"]) for row in rows]
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM master_parts").fetchone()[0]
+
+    def active_division_owner(self, division):
+        """사용유무 Y 항목 중 구분값을 쓰는 항목 id (없으면 None) - 유일 인덱스 조회"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM master_parts WHERE division = ? AND use_status = ?",
+                (str(division or '').strip(), ACTIVE_STATUS)).fetchone()
+        return row["id"] if row else None
+
+    # ===== 기록 (항목 단위) =====
+
+    def _execute(self, sql, item, prefix=(), suffix=()):
+        """항목 1건 쓰기 - 사용유무 Y 구분값 중복은 ValueError (트랜잭션 전체 취소)"""
+        columns = _key_columns(item)
+        try:
+            return self._conn.execute(sql, (*prefix, *columns, json.dumps(item, ensure_ascii=False), *suffix))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"구분값 '{columns[1]}'은 이미 사용 중입니다. (사용유무 Y인 항목과 중복)")
+
+    def _insert(self, item, position=None):
+        if position is None:
+            position = self._conn.execute(
+                "SELECT COALESCE(MAX(position), 0) + 1 FROM master_parts").fetchone()[0]
+        return self._execute(
+            "INSERT INTO master_parts (position, supplier_code, division, part_number, use_status, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)", item, prefix=(position,)).lastrowid
+
+    def _update(self, record_id, item):
+        return self._execute(
+            "UPDATE master_parts SET supplier_code = ?, division = ?, part_number = ?, use_status = ?, data = ? "
+            "WHERE id = ?", item, suffix=(record_id,)).rowcount
+
+    def upsert(self, item, record_id=None):
+        """항목 1건 추가(record_id 없음) 또는 교체 - 항목 id 반환"""
+        with self._lock, self._conn:
+            if record_id is None:
+                return self._insert(item)
+            if not self._update(record_id, item):
+                raise KeyError(record_id)
+        return record_id
+
+    def delete(self, record_id):
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM master_parts WHERE id = ?", (record_id,)).rowcount > 0
+
+    # ===== 기록 (전체/일괄) =====
+
+    def replace_all(self, items):
+        """전체 목록 교체 (전체 저장/복구) - 한 트랜잭션, 새 id 목록 반환"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM master_parts")
+            return [self._insert(item, position) for position, item in enumerate(items, 1)]
+
+    def bulk_import(self, items):
+        """일괄 가져오기 - 업체코드+구분+Part_No 가 같은 항목은 교체, 나머지는 뒤에 추가
+        한 트랜잭션이므로 중간에 구분값 중복이 있으면 아무것도 바뀌지 않음 → (추가 건수, 교체 건수)"""
+        added = replaced = 0
+        with self._lock, self._conn:
+            position = self._conn.execute("SELECT COALESCE(MAX(position), 0) FROM master_parts").fetchone()[0]
+            for item in items:
+                supplier_code, division, part_number, _ = _key_columns(item)
+                row = self._conn.execute(
+                    "SELECT id FROM master_parts WHERE part_number = ? AND division = ? AND supplier_code = ?",
+                    (part_number, division, supplier_code)).fetchone()
+                if row:
+                    self._update(row["id"], item)
+                    replaced += 1
+                else:
+                    position += 1
+                    self._insert(item, position)
+                    added += 1
+        return added, replaced
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception as e:
+                logger.debug("기준정보 저장소 종료 오류: %s", e)
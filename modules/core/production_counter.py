@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+생산수량 카운터 서비스
+(작업일, 근무조, 패널, 부품번호)별 생산수량을 메모리에서 집계하고 파일 저장은 모아서 한다.
+- 1대 생산 = dict 카운터 3개 증가 (디스크 I/O 없음)
+- 저장: 변경 후 최대 flush_interval 초 이내 1회, 근무조 교대 시 즉시, 정상 종료 시
+- 작업일/근무조는 설정된 교대 시각 기준 (자정이 아니라 첫 근무조 시작 시각에 작업일 변경)
+- 이전 작업일 수량도 history_days 일 동안 보관 (아침 전일 실적 확인용)
+- 저장은 임시 파일에 쓴 뒤 교체 (저장 중 전원 차단에도 기존 파일 유지)
+"""
+
+import os
+import json
+import atexit
+import threading
+from datetime import datetime, timedelta
+
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+PRODUCTION_FILE = os.path.join("data", "production_data.json")
+FILE_VERSION = 2
+
+DEFAULT_SHIFTS = [
+    {"name": "주간", "start": "08:00"},
+    {"name": "야간", "start": "20:00"},
+]
+DEFAULT_FLUSH_INTERVAL = 5.0    # 저장 주기 (초) = 비정상 종료 시 최대 유실 구간
+DEFAULT_HISTORY_DAYS = 90       # 보관 작업일 수
+
+LEGACY_SHIFT = ""               # 이전 형식(근무조 없음)에서 가져온 수량
+
+
+def _parse_minutes(text):
+    """'HH:MM' → 자정 이후 분"""
+    hour, minute = str(text).split(":", 1)
+    return (int(hour) % 24) * 60 + int(minute)
+
+
+class ShiftCalendar:
+    """교대 시각 기준 작업일/근무조 계산"""
+
+    def __init__(self, shifts=None):
+        parsed = []
+        for shift in shifts or DEFAULT_SHIFTS:
+            try:
+                parsed.append((_parse_minutes(shift.get("start", "00:00")), shift.get("name", "")))
+            except Exception as e:
+                logger.error("근무조 설정 오류 (무시): %s - %s", shift, e)
+        if not parsed:
+            parsed = [(_parse_minutes(s["start"]), s["name"]) for s in DEFAULT_SHIFTS]
+        parsed.sort()
+        self.day_start = parsed[0][0]
+        # 작업일 시작 기준 오프셋(분) 순서
+        self._shifts = [(start - self.day_start, name) for start, name in parsed]
+
+    def period(self, now):
+        """now가 속한 (작업일, 근무조명, 근무조 종료 시각)"""
+        day_begin = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(minutes=self.day_start)
+        if now < day_begin:
+            day_begin -= timedelta(days=1)
+        offset = (now - day_begin).total_seconds() / 60
+        index = 0
+        for i, (shift_offset, _) in enumerate(self._shifts):
+            if shift_offset <= offset:
+                index = i
+        if index + 1 < len(self._shifts):
+            end = day_begin + timedelta(minutes=self._shifts[index + 1][0])
+        else:
+            end = day_begin + timedelta(days=1)
+        return day_begin.date(), self._shifts[index][1], end
+
+    @property
+    def shift_names(self):
+        return [name for _, name in self._shifts]
+
+
+class ProductionCounterService:
+    """생산수량 카운터 - 메인 화면은 increment/panel_total/part_total 만 사용"""
+
+    def __init__(self, path=PRODUCTION_FILE, shifts=None, flush_interval=DEFAULT_FLUSH_INTERVAL,
+                 history_days=DEFAULT_HISTORY_DAYS):
+        self.path = path
+        self.calendar = ShiftCalendar(shifts)
+        self.flush_interval = flush_interval
+        self.history_days = history_days
+
+        self._counts = {}         # (작업일, 근무조, 패널, 부품번호) → 수량
+        self._panel_totals = {}   # (작업일, 패널) → 수량 (구분값 변경 시 조정될 수 있음)
+        self._part_totals = {}    # (작업일, 부품번호, 패널) → 수량
+
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._timer = None
+        self._dirty = False
+        self._closed = False
+
+        self.work_date, self.shift, self._period_end = self.calendar.period(datetime.now())
+        atexit.register(self.close)
+
+    @classmethod
+    def from_config(cls, config, path=PRODUCTION_FILE):
+        """admin_panel_config.json 의 production_counter 항목으로 생성"""
+        settings = (config or {}).get("production_counter", {})
+        return cls(path,
+                   shifts=settings.get("shifts"),
+                   flush_interval=float(settings.get("flush_interval", DEFAULT_FLUSH_INTERVAL)),
+                   history_days=int(settings.get("history_days", DEFAULT_HISTORY_DAYS)))
+
+    # ===== 작업일/근무조 =====
+
+    def _roll(self, now=None):
+        """교대 시각이 지났으면 작업일/근무조 변경 (변경 시 True)"""
+        now = now or datetime.now()
+        if now < self._period_end:
+            return False
+        previous = (self.work_date, self.shift)
+        self.work_date, self.shift, self._period_end = self.calendar.period(now)
+        logger.info("근무조 변경 - %s %s → %s %s", previous[0], previous[1], self.work_date, self.shift)
+        self._prune()
+        return True
+
+    def _prune(self):
+        oldest = self.work_date - timedelta(days=self.history_days - 1)
+        for table in (self._counts, self._panel_totals, self._part_totals):
+            for key in [key for key in table if key[0] < oldest]:
+                del table[key]
+
+    # ===== 집계 (호출 스레드) =====
+
+    def increment(self, panel_name, part_number, now=None):
+        """생산 1대 반영 - 해당 패널의 현재 작업일 누적수량 반환"""
+        with self._lock:
+            rolled = self._roll(now)
+            work_date = self.work_date
+            key = (work_date, self.shift, panel_name, part_number)
+            self._counts[key] = self._counts.get(key, 0) + 1
+            part_key = (work_date, part_number, panel_name)
+            self._part_totals[part_key] = self._part_totals.get(part_key, 0) + 1
+            panel_key = (work_date, panel_name)
+            total = self._panel_totals.get(panel_key, 0) + 1
+            self._panel_totals[panel_key] = total
+            self._mark_dirty(0 if rolled else self.flush_interval)
+        return total
+
+    def set_panel_total(self, panel_name, count):
+        """현재 작업일 패널 누적수량 조정 (구분값 변경 시 해당 부품 수량으로 표시)"""
+        with self._lock:
+            self._roll()
+            self._panel_totals[(self.work_date, panel_name)] = count
+            self._mark_dirty(self.flush_interval)
+
+    def panel_total(self, panel_name, work_date=None):
+        with self._lock:
+            self._roll()
+            return self._panel_totals.get((work_date or self.work_date, panel_name), 0)
+
+    def part_total(self, part_number, panel_name, work_date=None):
+        with self._lock:
+            self._roll()
+            return self._part_totals.get((work_date or self.work_date, part_number, panel_name), 0)
+
+    def shift_totals(self, work_date=None):
+        """작업일의 근무조별 패널 수량 {근무조: {패널: 수량}} (전일 실적 조회용)"""
+        with self._lock:
+            self._roll()
+            work_date = work_date or self.work_date
+            result = {}
+            for (day, shift, panel_name, _), count in self._counts.items():
+                if day == work_date:
+                    panel_counts = result.setdefault(shift, {})
+                    panel_counts[panel_name] = panel_counts.get(panel_name, 0) + count
+            return result
+
+    def work_dates(self):
+        """보관 중인 작업일 목록 (최신순)"""
+        with self._lock:
+            return sorted({key[0] for key in self._panel_totals}, reverse=True)
+
+    # ===== 저장 =====
+
+    def _mark_dirty(self, delay):
+        """lock 보유 상태에서 호출 - 저장 예약이 없을 때만 타이머 시작 (모아서 저장)"""
+        self._dirty = True
+        if self._closed:
+            return
+        if self._timer is not None and delay > 0:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _snapshot(self):
+        daily_total = {}
+        for (day, panel_name), count in self._panel_totals.items():
+            daily_total.setdefault(day.isoformat(), {})[panel_name] = count
+        part_counts = {}
+        for (day, part_number, panel_name), count in self._part_totals.items():
+            if day == self.work_date:
+                part_counts.setdefault(part_number, {})[panel_name] = count
+        counters = [[day.isoformat(), shift, panel_name, part_number, count]
+                    for (day, shift, panel_name, part_number), count in sorted(self._counts.items())]
+        return {
+            "version": FILE_VERSION,
+            "current_date": self.work_date.isoformat(),
+            "current_shift": self.shift,
+            "daily_total": daily_total,     # 이전 형식 호환 (작업일별 패널 누적)
+            "part_counts": part_counts,     # 이전 형식 호환 (현재 작업일 부품별)
+            "counters": counters,
+        }
+
+    def flush(self):
+        """변경된 수량이 있으면 파일로 저장 (진행 중인 저장이 있으면 끝난 뒤 실행)"""
+        with self._save_lock:
+            with self._lock:
+                self._timer = None
+                if not self._dirty:
+                    return True
+                self._dirty = False
+                data = self._snapshot()
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                temp_path = self.path + ".tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+                logger.debug("생산수량 데이터 저장 완료 - %s", self.path)
+                return True
+            except Exception as e:
+                logger.error("생산수량 데이터 저장 오류: %s", e)
+                with self._lock:
+                    self._dirty = True
+                return False
+
+    def close(self):
+        """예약된 저장 취소 후 즉시 저장 (프로그램 종료 시 자동 호출)"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self.flush()
+
+    # ===== 로드 =====
+
+    def load(self):
+        """저장 파일 로드 - 이전 형식(오늘 데이터만 저장)도 읽음"""
+        if not os.path.exists(self.path):
+            logger.info("생산수량 데이터 파일 없음 - 새로 시작")
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error("생산수량 데이터 로드 오류: %s", e)
+            return False
+
+        with self._lock:
+            self._roll()
+            parse = datetime.strptime
+            for date_str, panel_counts in (data.get("daily_total") or {}).items():
+                day = parse(date_str, "%Y-%m-%d").date()
+                for panel_name, count in panel_counts.items():
+                    self._panel_totals[(day, panel_name)] = count
+
+            if data.get("version", 1) >= FILE_VERSION:
+                for date_str, shift, panel_name, part_number, count in data.get("counters", []):
+                    day = parse(date_str, "%Y-%m-%d").date()
+                    self._counts[(day, shift, panel_name, part_number)] = count
+                    part_key = (day, part_number, panel_name)
+                    self._part_totals[part_key] = self._part_totals.get(part_key, 0) + count
+            elif data.get("current_date"):
+                # 이전 형식: part_counts 는 current_date 하루치 (근무조 구분 없음)
+                day = parse(data["current_date"], "%Y-%m-%d").date()
+                for part_number, panel_counts in (data.get("part_counts") or {}).items():
+                    for panel_name, count in panel_counts.items():
+                        self._counts[(day, LEGACY_SHIFT, panel_name, part_number)] = count
+                        self._part_totals[(day, part_number, panel_name)] = count
+            self._prune()
+
+        logger.info("생산수량 데이터 로드 완료 - %s (보관 작업일 %s일, 현재 %s %s)",
+                    self.path, len(self.work_dates()), self.work_date, self.shift)
+        return True
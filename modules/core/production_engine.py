@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+생산 라인 작업 흐름 엔진 (Qt 없음)
+패널별 상태 머신을 직접 관리하고, 장비 이벤트(스캔/PLC/출력 결과)를 받아 상태 변경 이벤트를 내보낸다.
+- 상태: 대기 → 하위부품 스캔중 → 하위부품 전체 OK → 완료신호 대기 → 출력중 → 대기
+- 너트런너 체결 결과는 공구가 연결된 스테이션(패널)의 진행 중인 사이클에 붙고, block_on_nok 이면 NOK 가 남은 패널의 완료신호를 거부
+- 화면(메인 화면)은 subscribe() 로 받은 이벤트에 따라 기록/출력/표시만 한다 (스캔 판정·작업완료 판단은 엔진만)
+- Qt/시리얼 의존성이 없어 벤치마크·프로파일러에서 초당 수천 사이클로 돌릴 수 있다
+- 이벤트는 호출한 스레드에서 바로 전달 (메인 화면에서는 Qt 메인 스레드)
+  이벤트 처리 중 엔진을 다시 호출해 생긴 이벤트(예: 출력중 처리 안에서 print_finished)는 처리 중인 이벤트 뒤에 순서대로 전달
+"""
+
+import itertools
+from collections import deque
+from datetime import datetime
+
+from .duplicate_index import barcode_fields, serial_key
+from .scan_session import ScanRecord
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+# 패널 상태
+STATE_IDLE = "idle"
+STATE_SCANNING = "scanning"
+STATE_CHILDREN_OK = "children_ok"
+STATE_AWAITING_COMPLETION = "awaiting_completion"
+STATE_PRINTING = "printing"
+
+STATE_LABELS = {
+    STATE_IDLE: "대기",
+    STATE_SCANNING: "하위부품 스캔중",
+    STATE_CHILDREN_OK: "하위부품 전체 OK",
+    STATE_AWAITING_COMPLETION: "완료신호 대기",
+    STATE_PRINTING: "출력중",
+}
+
+# 작업 사이클이 진행 중인 상태 (하위부품 스캔/완료신호를 받을 수 있음)
+ACTIVE_STATES = (STATE_SCANNING, STATE_CHILDREN_OK, STATE_AWAITING_COMPLETION)
+
+# 이벤트 종류
+EVENT_STATE = "state"          # 패널 상태 변경
+EVENT_SCAN = "scan"            # 하위부품 스캔 결과 (OK/NG)
+EVENT_BLOCKED = "blocked"      # 완료신호 거부 (하위부품 미완료 / 체결 NOK)
+EVENT_TIGHTENING = "tightening"  # 너트런너 체결 결과 (OK/NOK)
+EVENT_IGNORED = "ignored"      # 처리 대상 패널 없음 (작업 중이 아닌 패널의 완료신호/스캔)
+
+# 출력중 → 대기 상태 변경 사유 (사이클 종료 - 출력 결과)
+REASON_PRINTED = "출력 완료"
+REASON_PRINT_FAILED = "출력 실패"
+
+DEFAULT_PANELS = ("FRONT/LH", "REAR/RH")
+
+
+def _default_validator(barcode):
+    """기본 하위부품 검증 - HKMC 바코드 P필드만 확인 (HKMCBarcodeUtils.validate_child_part_barcode 와 같은 반환 형식)"""
+    part_number, trace = barcode_fields(barcode)
+    if not part_number:
+        return False, ["P필드(부품번호) 없음"], {}
+    return True, [], {"part_number": part_number, "traceability_number": trace}
+
+
+class PanelCycle:
+    """패널 작업 1사이클 - 공정부품 + 기준정보 하위부품 목록 + 스캔 기록"""
+
+    __slots__ = ('cycle_id', 'panel', 'part_number', 'expected', 'matched', 'records', 'tightenings',
+                 'started_at', 'completed_at')
+
+    def __init__(self, cycle_id, panel, part_number, expected):
+        self.cycle_id = cycle_id
+        self.panel = panel
+        self.part_number = part_number
+        self.expected = expected          # 하위부품 번호 목록 (기준정보 순서)
+        self.matched = {}                 # 하위부품 번호 → OK 스캔 레코드
+        self.records = []                 # 이번 사이클의 모든 스캔 (OK/NG)
+        self.tightenings = []             # 이번 사이클의 체결 결과 (수신 순서)
+        self.started_at = datetime.now()
+        self.completed_at = None
+
+    def missing(self):
+        return [part for part in self.expected if part not in self.matched]
+
+    @property
+    def children_ok(self):
+        return len(self.matched) == len(self.expected)
+
+    def nok_tightenings(self):
+        """해소되지 않은 체결 NOK - 같은 공구/볼트의 마지막 결과가 NOK 인 것 (재체결 OK 면 해소)
+        볼트 구분이 없는 NOK 는 재체결을 확인할 수 없으므로 이 사이클에서는 해소되지 않음"""
+        latest = {}
+        for result in self.tightenings:
+            latest[result.key] = result
+        return [result for result in latest.values() if not result.ok]
+
+
+class EngineEvent:
+    """엔진이 내보내는 이벤트 1건"""
+
+    __slots__ = ('kind', 'panel', 'old_state', 'new_state', 'cycle', 'record', 'reason')
+
+    def __init__(self, kind, panel, old_state=None, new_state=None, cycle=None, record=None, reason=""):
+        self.kind = kind
+        self.panel = panel
+        self.old_state = old_state
+        self.new_state = new_state
+        self.cycle = cycle
+        self.record = record
+        self.reason = reason
+
+    def __repr__(self):
+        return (f"EngineEvent({self.kind}, {self.panel}, {self.old_state} → {self.new_state}"
+                f"{', ' + self.reason if self.reason else ''})")
+
+
+class ProductionLineEngine:
+    """패널별 작업 상태 머신 - 스캔/PLC/출력 결과 이벤트 처리"""
+
+    def __init__(self, master_data, panels=DEFAULT_PANELS, validator=None, duplicate_index=None,
+                 printer=None, require_all_children=False, block_on_nok=False, signals=None, tools=None):
+        self.master_data = master_data or []
+        self.panels = tuple(panels)
+        # PLC 완료신호 → 패널 (기본: 패널 순서대로 1, 2, 3 ...)
+        self.signals = dict(signals) if signals else {index + 1: panel for index, panel in enumerate(self.panels)}
+        # 너트런너 장비명 → 패널 (없는 공구의 체결 결과는 버림)
+        self.tools = dict(tools) if tools else {}
+        self.validator = validator or _default_validator
+        self.duplicate_index = duplicate_index
+        # printer(cycle) → 성공 여부. 없으면 출력은 호출 측이 하고 print_finished() 로 결과를 알려준다
+        self.printer = printer
+        # True 면 하위부품이 모두 OK 가 아닐 때 완료신호를 거부 (기존 화면 동작은 False)
+        self.require_all_children = require_all_children
+        # True 면 해소되지 않은 체결 NOK 가 있을 때 완료신호를 거부
+        self.block_on_nok = block_on_nok
+
+        self.states = {panel: STATE_IDLE for panel in self.panels}
+        self.cycles = {panel: None for panel in self.panels}
+        self.panel_parts = {panel: "" for panel in self.panels}
+        # 패널별 기대 하위부품 (구분값 기준정보 레코드에서 받은 목록, None 이면 부품번호로 조회)
+        self.panel_children = {panel: None for panel in self.panels}
+        self.pending_panel = None         # 마지막으로 공정부품을 스캔한 패널 (완료신호 검증용)
+        self.previous_completion = None
+        self.blocked = {panel: "" for panel in self.panels}  # 패널별 마지막 완료신호 거부 사유
+        self.stats = {"cycles": 0, "scans": 0, "ng_scans": 0, "blocked": 0, "print_failed": 0,
+                      "tightenings": 0, "tightening_nok": 0}
+
+        self._listeners = []
+        self._queue = deque()
+        self._emitting = False
+        self._cycle_ids = itertools.count(1)
+        self._parts_by_number = {}
+        self._parts_by_division = {}
+        self.set_master_data(self.master_data)
+
+    # ===== 구독 =====
+
+    def subscribe(self, callback):
+        """이벤트 수신 함수 등록 - callback(EngineEvent)"""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _emit(self, event):
+        self._queue.append(event)
+        if self._emitting:
+            return
+        self._emitting = True
+        try:
+            while self._queue:
+                event = self._queue.popleft()
+                for callback in list(self._listeners):
+                    try:
+                        callback(event)
+                    except Exception as e:
+                        logger.error("작업 흐름 이벤트 처리 오류: %s - %s", event, e)
+        finally:
+            self._emitting = False
+
+    def _set_state(self, panel, new_state, reason=""):
+        old_state = self.states[panel]
+        if old_state == new_state:
+            return
+        self.states[panel] = new_state
+        logger.debug("작업 흐름 %s: %s → %s %s", panel, old_state, new_state, reason)
+        self._emit(EngineEvent(EVENT_STATE, panel, old_state, new_state, self.cycles[panel], reason=reason))
+
+    # ===== 기준정보 / 패널 부품 =====
+
+    def set_master_data(self, master_data):
+        """기준정보 교체 - 부품번호/구분값 조회 테이블 재구성"""
+        self.master_data = master_data or []
+        self._parts_by_number = {}
+        self._parts_by_division = {}
+        for part in self.master_data:
+            number = part.get("part_number")
+            if number and number not in self._parts_by_number:
+                self._parts_by_number[number] = part
+            division = str(part.get("division", "")).strip()
+            if division and division not in self._parts_by_division:
+                self._parts_by_division[division] = part
+
+    @staticmethod
+    def print_children(child_parts):
+        """사용/출력포함 하위부품 번호 목록"""
+        return [child.get("part_number", "") for child in child_parts or []
+                if child.get("use_status", "Y") == "Y" and child.get("print_include", "Y") == "Y"]
+
+    def expected_children(self, part_number):
+        """기준정보의 사용/출력포함 하위부품 번호 목록 (같은 부품번호가 여러 구분값에 있으면 첫 레코드)"""
+        part = self._parts_by_number.get(part_number) or {}
+        return self.print_children(part.get("child_parts", []))
+
+    def set_panel_part(self, panel, part_number, child_parts=None):
+        """패널 공정부품 변경 (구분값 변경) - 진행 중이던 사이클은 취소
+
+        child_parts: 구분값 기준정보 레코드의 하위부품 목록 (같은 부품번호라도 구분값마다 다를 수 있음)
+        """
+        children = self.print_children(child_parts) if child_parts is not None else None
+        if self.panel_parts.get(panel) == part_number and self.panel_children.get(panel) == children:
+            return
+        self.panel_parts[panel] = part_number
+        self.panel_children[panel] = children
+        if self.states[panel] in ACTIVE_STATES:
+            self._reset_panel(panel, "공정부품 변경")
+
+    def _reset_panel(self, panel, reason):
+        self._set_state(panel, STATE_IDLE, reason)
+        self.cycles[panel] = None
+        self.blocked[panel] = ""
+        if self.pending_panel == panel:
+            self.pending_panel = None
+
+    # ===== 스캐너 =====
+
+    def on_scan(self, barcode):
+        """스캐너 데이터 1건 - 공정부품 번호면 사이클 시작, 아니면 하위부품 스캔"""
+        barcode = (barcode or "").strip()
+        if not barcode:
+            return None
+        for panel in self.panels:
+            if self.panel_parts[panel] and self.panel_parts[panel] == barcode:
+                return self.start_cycle(panel)
+        return self.scan_child(barcode)
+
+    def start_cycle(self, panel):
+        """공정부품 스캔 - 새 사이클 시작 (다른 패널의 진행 중 사이클은 정리, 출력중 패널은 유지)"""
+        for other in self.panels:
+            if other != panel and self.states[other] in ACTIVE_STATES:
+                self._reset_panel(other, "다른 패널 작업 시작")
+        if self.states[panel] != STATE_IDLE and self.states[panel] != STATE_PRINTING:
+            self._reset_panel(panel, "공정부품 재스캔")
+
+        part_number = self.panel_parts[panel]
+        expected = self.panel_children[panel]
+        if expected is None:
+            expected = self.expected_children(part_number)
+        cycle = PanelCycle(next(self._cycle_ids), panel, part_number, expected)
+        self.cycles[panel] = cycle
+        self.blocked[panel] = ""
+        self.pending_panel = panel
+        self._set_state(panel, STATE_SCANNING, "공정부품 스캔")
+        # 이벤트 처리 중 다른 스캔/완료신호로 이미 진행됐으면 그대로 둠
+        if self.cycles[panel] is cycle and self.states[panel] == STATE_SCANNING and cycle.children_ok:
+            self._children_complete(panel)
+        return cycle
+
+    def restore_cycle(self, panel, part_number, expected, records):
+        """재시작 시 스캔 저널에서 복원한 진행 중 사이클 재구성 (records: 오래된 순, 화면 이벤트 없이 상태만 복원)"""
+        if panel not in self.states:
+            return None
+        self.panel_parts[panel] = part_number
+        self.panel_children[panel] = list(expected)
+        cycle = PanelCycle(next(self._cycle_ids), panel, part_number, list(expected))
+        for record in records:
+            cycle.records.append(record)
+            if record.is_ok and record.part_number in cycle.expected:
+                cycle.matched.setdefault(record.part_number, record)
+        self.cycles[panel] = cycle
+        self.blocked[panel] = ""
+        self.pending_panel = panel
+        self.states[panel] = STATE_AWAITING_COMPLETION if cycle.children_ok else STATE_SCANNING
+        logger.info("작업 흐름 %s: 진행 중 사이클 복원 - %s (하위부품 %s/%s)",
+                    panel, part_number, len(cycle.matched), len(cycle.expected))
+        return cycle
+
+    def _target_panel(self, part_number):
+        """하위부품이 들어갈 패널 - 이 부품을 아직 기다리는 진행 중 패널, 없으면 마지막 공정부품 스캔 패널"""
+        for panel in self.panels:
+            cycle = self.cycles[panel]
+            if (self.states[panel] in ACTIVE_STATES and cycle
+                    and part_number in cycle.expected and part_number not in cycle.matched):
+                return panel
+        if self.pending_panel and self.states[self.pending_panel] in ACTIVE_STATES:
+            return self.pending_panel
+        return None
+
+    def scan_child(self, barcode):
+        """하위부품 바코드 스캔 - 검증/중복/기준정보 매칭 후 스캔 이벤트"""
+        self.stats["scans"] += 1
+        is_valid, errors, info = self.validator(barcode)
+        part_number = (info or {}).get("part_number") or barcode
+        reason = "" if is_valid else "; ".join(errors or [])
+
+        panel = self._target_panel(part_number)
+        if panel is None:
+            logger.debug("작업 흐름 - 진행 중인 사이클 없음, 하위부품 스캔 무시: %s", part_number)
+            self._emit(EngineEvent(EVENT_IGNORED, None, reason="진행 중인 사이클 없음"))
+            return None
+
+        cycle = self.cycles[panel]
+        is_ok = is_valid
+        if is_ok and self.duplicate_index is not None and self.duplicate_index.enabled:
+            if self._is_duplicate(cycle, barcode, part_number):
+                if self.duplicate_index.rejects:
+                    is_ok, reason = False, "중복 투입"
+                else:
+                    logger.warning("작업 흐름 - 중복 투입 경고 (경고 모드): %s", part_number)
+        if is_ok and part_number not in cycle.expected:
+            is_ok, reason = False, "기준정보 하위부품 아님"
+
+        record = ScanRecord(datetime.now().strftime("%H:%M:%S"), part_number, is_ok, raw_data=barcode, panel=panel)
+        cycle.records.append(record)
+        if is_ok:
+            cycle.matched.setdefault(part_number, record)
+        else:
+            self.stats["ng_scans"] += 1
+        self._emit(EngineEvent(EVENT_SCAN, panel, self.states[panel], self.states[panel], cycle, record, reason))
+
+        if is_ok and self.states[panel] == STATE_SCANNING and cycle.children_ok:
+            self._children_complete(panel)
+        return record
+
+    def _is_duplicate(self, cycle, barcode, part_number):
+        """이번 사이클에서 이미 OK 로 스캔했거나 투입 확정된 시리얼인지 (T필드 없으면 False)"""
+        key = serial_key(barcode, part_number)
+        if not key:
+            return False
+        if any(record.is_ok and serial_key(record.raw_data, record.part_number) == key for record in cycle.records):
+            return True
+        return self.duplicate_index.find(key) is not None
+
+    def _children_complete(self, panel):
+        """하위부품 전체 OK → 완료신호 대기"""
+        self._set_state(panel, STATE_CHILDREN_OK, "하위부품 전체 OK")
+        self._set_state(panel, STATE_AWAITING_COMPLETION, "완료신호 대기")
+
+    # ===== 너트런너 =====
+
+    def on_tightening(self, result):
+        """체결 결과 1건 - 공구가 연결된 패널의 진행 중 사이클에 추가"""
+        self.stats["tightenings"] += 1
+        if not result.ok:
+            self.stats["tightening_nok"] += 1
+        panel = self.tools.get(result.tool)
+        if panel is None:
+            logger.warning("작업 흐름 - 스테이션에 연결되지 않은 너트런너, 체결 결과 버림: %s", result)
+            self._emit(EngineEvent(EVENT_IGNORED, None, reason=f"스테이션 미지정 너트런너: {result.tool}"))
+            return None
+        if self.states[panel] not in ACTIVE_STATES:
+            logger.debug("작업 흐름 - 진행 중인 사이클 없음, 체결 결과 무시: %s", result)
+            self._emit(EngineEvent(EVENT_IGNORED, panel, reason="진행 중인 사이클 없음"))
+            return None
+        cycle = self.cycles[panel]
+        cycle.tightenings.append(result)
+        self._emit(EngineEvent(EVENT_TIGHTENING, panel, self.states[panel], self.states[panel], cycle, result,
+                               "" if result.ok else "체결 NOK"))
+        return cycle
+
+    # ===== PLC =====
+
+    def on_plc(self, completion_signal, *divisions):
+        """PLC 데이터 1건 (완료신호 0=작업중, 그 외=해당 패널 완료 + 패널 순서대로 구분값)"""
+        for panel, division in zip(self.panels, divisions):
+            if division:
+                part = self._parts_by_division.get(str(division).strip())
+                if part and part.get("part_number"):
+                    self.set_panel_part(panel, part["part_number"], part.get("child_parts", []))
+
+        previous, self.previous_completion = self.previous_completion, completion_signal
+        # 0 에서 완료신호로 바뀔 때만 완료 처리 (같은 완료신호 반복 수신은 무시)
+        panel = self.signals.get(completion_signal)
+        if panel is not None and previous == 0:
+            return self.complete(panel)
+        return None
+
+    def complete(self, panel):
+        """작업완료 신호 - 완료신호 대기/스캔중 패널이면 출력 시작"""
+        state = self.states[panel]
+        cycle = self.cycles[panel]
+        if panel != self.pending_panel or state not in ACTIVE_STATES:
+            logger.debug("작업 흐름 - %s 완료신호 무시 (상태: %s, 공정부품 스캔 패널: %s)", panel, state, self.pending_panel)
+            self._emit(EngineEvent(EVENT_IGNORED, panel, state, state, cycle, reason="공정부품 스캔 패널 아님"))
+            return None
+        reason = ""
+        if self.require_all_children and not cycle.children_ok:
+            reason = "하위부품 미완료: " + ", ".join(cycle.missing())
+        elif self.block_on_nok and cycle.nok_tightenings():
+            reason = "체결 NOK: " + ", ".join(f"{result.tool} {result.bolt or ''}".strip()
+                                              for result in cycle.nok_tightenings())
+        if reason:
+            self.stats["blocked"] += 1
+            self.blocked[panel] = reason
+            logger.warning("작업 흐름 - %s 완료신호 거부 - %s", panel, reason)
+            self._emit(EngineEvent(EVENT_BLOCKED, panel, state, state, cycle, reason=reason))
+            return None
+
+        self.blocked[panel] = ""
+        cycle.completed_at = datetime.now()
+        self.pending_panel = None
+        self._set_state(panel, STATE_PRINTING, "작업완료")
+        if self.printer is not None:
+            try:
+                success = bool(self.printer(cycle))
+            except Exception as e:
+                logger.error("작업 흐름 - %s 출력 오류: %s", panel, e)
+                success = False
+            self.print_finished(panel, success)
+        return cycle
+
+    # ===== 프린터 =====
+
+    def print_finished(self, panel, success):
+        """출력 결과 - 성공/실패 모두 사이클 종료 후 대기 상태로"""
+        if self.states.get(panel) != STATE_PRINTING:
+            return
+        if success:
+            self.stats["cycles"] += 1
+        else:
+            self.stats["print_failed"] += 1
+        self._set_state(panel, STATE_IDLE, REASON_PRINTED if success else REASON_PRINT_FAILED)
+        self.cycles[panel] = None
+
+    def snapshot(self):
+        """패널별 현재 상태/진행 요약 (화면·진단용)"""
+        result = {}
+        for panel in self.panels:
+            cycle = self.cycles[panel]
+            result[panel] = {
+                "state": self.states[panel],
+                "part_number": self.panel_parts[panel],
+                "expected": len(cycle.expected) if cycle else 0,
+                "matched": len(cycle.matched) if cycle else 0,
+                "missing": cycle.missing() if cycle else [],
+                "tightenings": len(cycle.tightenings) if cycle else 0,
+                "tightening_nok": len(cycle.nok_tightenings()) if cycle else 0,
+                "blocked": self.blocked[panel],
+            }
+        return result
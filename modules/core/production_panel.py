@@ -11,11 +11,14 @@ from PyQt5.QtGui import QColor
 
 from ..utils.font_manager import FontManager
 from ..ui.styles import *
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
 
 class ProductionPanel(QWidget):
-    """생산 패널 (FRONT/LH, REAR/RH) - 실용적 디자인"""
+    """생산 패널 (스테이션 1개 - 기본 FRONT/LH, REAR/RH) - 실용적 디자인"""
     
-    def __init__(self, title, part_number, part_name, division, press_callback=None):
+    def __init__(self, title, part_number, part_name, division, press_callback=None, max_children=6):
         super().__init__()
         # self.setGeometry(10, 10, 1140, 760)
         self.title = title
@@ -26,6 +29,7 @@ class ProductionPanel(QWidget):
         self.accumulated_count = 0  # 최초 시작: 0
         self.is_normal = True
         self.press_callback = press_callback  # 3초 누르기 콜백 함수
+        self.max_children = max_children  # 하위부품 아이콘 수 (스테이션 설정)
         self.init_ui()
         
     def init_ui(self):
@@ -89,6 +93,7 @@ class ProductionPanel(QWidget):
         
         # 구분 프레임 (작업완료 상태 + 구분값)
         division_frame = QFrame()
+        division_frame.setObjectName("mainDivisionFrame")
         division_frame.setStyleSheet(get_main_division_frame_style())
         division_layout = QHBoxLayout(division_frame)
         division_layout.setContentsMargins(0, 0, 0, 0)
@@ -97,14 +102,14 @@ class ProductionPanel(QWidget):
         # 작업완료 상태 (왼쪽 절반)
         self.work_status_label = QLabel("작업완료")
         self.work_status_label.setFont(FontManager.get_main_status_font())
-        self.work_status_label.setStyleSheet(get_main_work_status_style())
+        apply_style_role(self.work_status_label, "work_status", "completed")
         self.work_status_label.setAlignment(Qt.AlignCenter)
         division_layout.addWidget(self.work_status_label)
         
         # 구분값 (오른쪽 절반)
         self.division_label = QLabel(f"구분: {self.division}")
         self.division_label.setFont(FontManager.get_main_division_font())
-        self.division_label.setStyleSheet(get_main_division_label_style())
+        apply_style_role(self.division_label, "division", "default")
         self.division_label.setAlignment(Qt.AlignCenter)
         division_layout.addWidget(self.division_label)
         
@@ -116,11 +121,18 @@ class ProductionPanel(QWidget):
         status_layout = QHBoxLayout()
         status_layout.setSpacing(5)
         
-        # UPH 라벨
-        uph_label = QLabel("UPH")
-        uph_label.setFont(FontManager.get_main_uph_font())
-        uph_label.setStyleSheet(get_main_uph_label_style())
-        status_layout.addWidget(uph_label)
+        # UPH 라벨 (생산 속도 지표 - 메인 화면 타이머가 주기적으로 갱신)
+        self.uph_label = QLabel("UPH 0")
+        self.uph_label.setFont(FontManager.get_main_uph_font())
+        self.uph_label.setStyleSheet(get_main_uph_label_style())
+        status_layout.addWidget(self.uph_label)
+        
+        # 사이클타임 라벨 (평균 / P95 / 비가동)
+        self.cycle_label = QLabel("CT -")
+        self.cycle_label.setFont(FontManager.get_small_label_font())
+        apply_style_role(self.cycle_label, "cycle", "normal")
+        status_layout.addWidget(self.cycle_label)
+        self._throughput_text = None
         
         # 스캔 현황 보기 버튼 (다른 레이블들보다 2배 크기)
         scan_btn = QPushButton("📊 스캔현황")
@@ -130,17 +142,17 @@ class ProductionPanel(QWidget):
         scan_btn.clicked.connect(self.show_scan_status)
         status_layout.addWidget(scan_btn)
         
-        print(f"DEBUG: {self.title} 스캔현황 버튼 생성 완료")
-        print(f"DEBUG: {self.title} 스캔현황 버튼 연결: {scan_btn.clicked}")
+        logger.debug("%s 스캔현황 버튼 생성 완료", self.title)
+        logger.debug("%s 스캔현황 버튼 연결: %s", self.title, scan_btn.clicked)
         
-        # 하위부품 수 아이콘들 (1️⃣2️⃣3️⃣4️⃣5️⃣6️⃣) - 스캔현황 버튼과 동일한 높이
+        # 하위부품 수 아이콘들 (1️⃣2️⃣3️⃣...) - 스캔현황 버튼과 동일한 높이, 스테이션 설정 수만큼
         self.child_parts_icons = []
-        for i in range(6):
+        for i in range(self.max_children):
             icon_label = QLabel(f"{i+1}")
             icon_label.setFont(FontManager.get_main_icon_font())  # 폰트 크기 증가
             icon_label.setFixedSize(30, 50)  # 스캔현황 버튼과 동일한 높이 (50px)
             icon_label.setAlignment(Qt.AlignCenter)
-            icon_label.setStyleSheet(get_main_icon_label_style())
+            apply_style_role(icon_label, "child_part", "idle")
             icon_label.setVisible(False)  # 기본적으로 숨김
             self.child_parts_icons.append(icon_label)
             status_layout.addWidget(icon_label)
@@ -153,7 +165,7 @@ class ProductionPanel(QWidget):
         self.plc_status_label.setFixedSize(30, 25)
         self.plc_status_label.setAlignment(Qt.AlignCenter)
         self.plc_status_label.setToolTip("PLC")
-        self.plc_status_label.setStyleSheet(get_main_status_connected_style())
+        apply_style_role(self.plc_status_label, "device_status", "connected")
         status_layout.addWidget(self.plc_status_label)
         
         # 스캐너 상태 (아이콘만)
@@ -162,7 +174,7 @@ class ProductionPanel(QWidget):
         self.scanner_status_label.setFixedSize(30, 25)
         self.scanner_status_label.setAlignment(Qt.AlignCenter)
         self.scanner_status_label.setToolTip("스캐너")
-        self.scanner_status_label.setStyleSheet(get_main_status_connected_style())
+        apply_style_role(self.scanner_status_label, "device_status", "connected")
         status_layout.addWidget(self.scanner_status_label)
         
         # 프린터 상태 (아이콘만)
@@ -171,7 +183,7 @@ class ProductionPanel(QWidget):
         self.printer_status_label.setFixedSize(30, 25)
         self.printer_status_label.setAlignment(Qt.AlignCenter)
         self.printer_status_label.setToolTip("프린터")
-        self.printer_status_label.setStyleSheet(get_main_status_connected_style())
+        apply_style_role(self.printer_status_label, "device_status", "connected")
         status_layout.addWidget(self.printer_status_label)
         
         # 너트런너1 상태 (아이콘만)
@@ -180,7 +192,7 @@ class ProductionPanel(QWidget):
         self.nutrunner1_status_label.setFixedSize(30, 25)
         self.nutrunner1_status_label.setAlignment(Qt.AlignCenter)
         self.nutrunner1_status_label.setToolTip("너트1")
-        self.nutrunner1_status_label.setStyleSheet(get_main_status_connected_style())
+        apply_style_role(self.nutrunner1_status_label, "device_status", "connected")
         status_layout.addWidget(self.nutrunner1_status_label)
         
         # 너트런너2 상태 (아이콘만)
@@ -189,7 +201,7 @@ class ProductionPanel(QWidget):
         self.nutrunner2_status_label.setFixedSize(30, 25)
         self.nutrunner2_status_label.setAlignment(Qt.AlignCenter)
         self.nutrunner2_status_label.setToolTip("너트2")
-        self.nutrunner2_status_label.setStyleSheet(get_main_status_connected_style())
+        apply_style_role(self.nutrunner2_status_label, "device_status", "connected")
         status_layout.addWidget(self.nutrunner2_status_label)
          
         # 장비 아이콘 3초 누르기 이벤트 연결 (콜백 함수 사용)
@@ -244,31 +256,15 @@ class ProductionPanel(QWidget):
     
     def set_status(self, device_name, is_normal):
         """장비 상태 설정 (정상/오류) - 색상으로만 표시"""
-        if device_name == "PLC":
-            if is_normal:
-                self.plc_status_label.setStyleSheet(get_main_status_connected_style())
-            else:
-                self.plc_status_label.setStyleSheet(get_main_status_disconnected_style())
-        elif device_name == "스캐너":
-            if is_normal:
-                self.scanner_status_label.setStyleSheet(get_main_status_connected_style())
-            else:
-                self.scanner_status_label.setStyleSheet(get_main_status_disconnected_style())
-        elif device_name == "프린터":
-            if is_normal:
-                self.printer_status_label.setStyleSheet(get_main_status_connected_style())
-            else:
-                self.printer_status_label.setStyleSheet(get_main_status_disconnected_style())
-        elif device_name == "너트런너1":
-            if is_normal:
-                self.nutrunner1_status_label.setStyleSheet(get_main_status_connected_style())
-            else:
-                self.nutrunner1_status_label.setStyleSheet(get_main_status_disconnected_style())
-        elif device_name == "너트런너2":
-            if is_normal:
-                self.nutrunner2_status_label.setStyleSheet(get_main_status_connected_style())
-            else:
-                self.nutrunner2_status_label.setStyleSheet(get_main_status_disconnected_style())
+        labels = {
+            "PLC": self.plc_status_label,
+            "스캐너": self.scanner_status_label,
+            "프린터": self.printer_status_label,
+            "너트런너1": self.nutrunner1_status_label,
+            "너트런너2": self.nutrunner2_status_label,
+        }
+        if device_name in labels:
+            self.update_status_label(labels[device_name], is_normal)
     
     def update_production_count(self, count):
         """생산수량 업데이트"""
@@ -280,16 +276,32 @@ class ProductionPanel(QWidget):
         self.accumulated_count = count
         self.accumulated_box.setText(str(count).zfill(5))
     
+    def update_throughput(self, metrics):
+        """생산 속도 지표 표시 (UPH, 평균/P95 사이클타임, 비가동) - 값이 바뀐 경우에만 갱신"""
+        idle_minutes, idle_seconds = divmod(int(metrics.get("idle_seconds", 0)), 60)
+        uph_text = f"UPH {metrics.get('uph', 0):.0f}"
+        cycle_text = (f"CT {metrics.get('avg_cycle', 0):.1f}s / P95 {metrics.get('p95_cycle', 0):.0f}s"
+                      f" / 비가동 {idle_minutes}:{idle_seconds:02d}")
+        slow = metrics.get("slow", False)
+        if (uph_text, cycle_text, slow) == self._throughput_text:
+            return
+        self._throughput_text = (uph_text, cycle_text, slow)
+        self.uph_label.setText(uph_text)
+        self.cycle_label.setText(cycle_text)
+        set_style_state(self.cycle_label, "slow" if slow else "normal")
+        takt = metrics.get("takt") or 0
+        self.uph_label.setToolTip(f"최근 {metrics.get('window_minutes', 60)}분 {metrics.get('units', 0)}대" + (f" / 목표 택트 {takt:.0f}s" if takt else ""))
+    
     def update_work_status(self, status):
         """작업완료 상태 업데이트 (0: 작업중, 1: 완료)"""
         if status == 1:
             # 작업완료 (녹색)
             self.work_status_label.setText("작업완료")
-            self.work_status_label.setStyleSheet(get_main_work_completed_style())
+            set_style_state(self.work_status_label, "completed")
         else:
             # 작업중 (회색)
             self.work_status_label.setText("작업중")
-            self.work_status_label.setStyleSheet(get_main_work_in_progress_style())
+            set_style_state(self.work_status_label, "in_progress")
     
     def update_division_status(self, has_value, division_value=""):
         """구분값 상태 업데이트 (값이 있으면 녹색, 없으면 적색)"""
@@ -297,16 +309,16 @@ class ProductionPanel(QWidget):
         if has_value:
             # 구분값 있음 (녹색) - 구분값 표시
             self.division_label.setText(f"구분: {division_value}")
-            self.division_label.setStyleSheet(get_main_division_normal_style())
+            set_style_state(self.division_label, "normal")
             # print(f"DEBUG: 구분값 표시 완료 - 구분: {division_value}")
         else:
             # 구분값 없음 (적색) - 오류 표시
             self.division_label.setText("구분: 오류")
-            self.division_label.setStyleSheet(get_main_division_error_style())
+            set_style_state(self.division_label, "error")
             # print(f"DEBUG: 구분값 오류 표시")
     
     def update_child_parts_count(self, count):
-        """하위부품 수 업데이트 (1-6개까지 표시)"""
+        """하위부품 수 업데이트 (스테이션 설정 하위부품 수까지 표시)"""
         # print(f"DEBUG: {self.title} 하위부품 수 업데이트 - {count}개")
         # print(f"DEBUG: {self.title} child_parts_icons 개수: {len(self.child_parts_icons)}")
         
@@ -316,26 +328,27 @@ class ProductionPanel(QWidget):
             # print(f"DEBUG: {self.title} 아이콘[{i}] 숨김")
         
         # 하위부품 수만큼 아이콘 표시 (기본적으로 붉은색 - 미매칭 상태)
-        # print(f"DEBUG: {self.title} 아이콘 표시 시작 - count: {count}, min(count, 6): {min(count, 6)}")
-        for i in range(min(count, 6)):
+        if count > len(self.child_parts_icons):
+            logger.warning("%s 하위부품 %s개 - 아이콘은 %s개까지 표시", self.title, count, len(self.child_parts_icons))
+        for i in range(min(count, len(self.child_parts_icons))):
             # print(f"DEBUG: {self.title} 아이콘[{i}] 표시 시작")
             self.child_parts_icons[i].setVisible(True)
             # print(f"DEBUG: {self.title} 아이콘[{i}] 표시 완료 (하위부품 {i+1})")
             # 기본 상태는 붉은색 (미매칭)
-            self.child_parts_icons[i].setStyleSheet(get_main_child_part_unmatched_style())
+            set_style_state(self.child_parts_icons[i], "unmatched")
             # print(f"DEBUG: {self.title} 아이콘[{i}] 스타일 적용 완료")
         
         # print(f"DEBUG: {self.title} 하위부품 아이콘 업데이트 완료 - {count}개 표시")
     
     def update_child_part_status(self, part_index, is_matched):
-        """개별 하위부품 상태 업데이트 (0-5 인덱스, 매칭 여부)"""
+        """개별 하위부품 상태 업데이트 (0부터 인덱스, 매칭 여부)"""
         if 0 <= part_index < len(self.child_parts_icons):
             if is_matched:
                 # 매칭됨 (녹색)
-                self.child_parts_icons[part_index].setStyleSheet(get_main_child_part_matched_style())
+                set_style_state(self.child_parts_icons[part_index], "matched")
             else:
                 # 미매칭 (붉은색)
-                self.child_parts_icons[part_index].setStyleSheet(get_main_child_part_unmatched_style())
+                set_style_state(self.child_parts_icons[part_index], "unmatched")
     
     def reset_child_parts_status(self):
         """모든 하위부품 상태를 미매칭(붉은색)으로 초기화"""
@@ -365,7 +378,7 @@ class ProductionPanel(QWidget):
         # 시뮬레이션 모드에서는 PLC 연결 상태를 강제로 유지
         if hasattr(self, 'main_window') and hasattr(self.main_window, 'plc_data_manager') and self.main_window.plc_data_manager.simulation_mode:
             if status == 'disconnected':
-                print("DEBUG: 시뮬레이션 모드 - PLC 연결 끊김 상태를 정상으로 강제 변경")
+                logger.debug("시뮬레이션 모드 - PLC 연결 끊김 상태를 정상으로 강제 변경")
                 status = 'normal'
         
         # 현재 상태와 비교하여 변경이 필요한 경우에만 업데이트
@@ -375,48 +388,38 @@ class ProductionPanel(QWidget):
             if status == 'disconnected':
                 # PLC 연결 끊김 - "PLC LINK OFF" 표시
                 self.work_status_label.setText("PLC LINK OFF")
-                self.work_status_label.setStyleSheet(get_main_plc_link_off_style())
+                set_style_state(self.work_status_label, "plc_link_off")
                 self.division_label.setText("PLC LINK OFF")
-                self.division_label.setStyleSheet(get_main_plc_link_off_style())
+                set_style_state(self.division_label, "plc_link_off")
                 # print("DEBUG: PLC 연결 끊김 상태 적용")
             elif status == 'connected':
                 # PLC 연결됨 - "PLC 연결됨" 표시
                 self.work_status_label.setText("PLC 연결됨")
-                self.work_status_label.setStyleSheet(get_main_plc_connected_style())
+                set_style_state(self.work_status_label, "plc_connected")
                 self.division_label.setText("데이터 대기중")
-                self.division_label.setStyleSheet(get_main_plc_connected_style())
+                set_style_state(self.division_label, "plc_connected")
                 # print("DEBUG: PLC 연결됨 상태 적용")
             elif status == 'no_data':
                 # PLC 연결됨 but 데이터 수신 불가 - "PLC DATA 수신 불가" 표시
                 self.work_status_label.setText("PLC DATA 수신 불가")
-                self.work_status_label.setStyleSheet(get_main_plc_data_error_style())
+                set_style_state(self.work_status_label, "plc_data_error")
                 self.division_label.setText("데이터 수신 불가")
-                self.division_label.setStyleSheet(get_main_plc_data_error_style())
+                set_style_state(self.division_label, "plc_data_error")
                 # print("DEBUG: PLC 데이터 수신 불가 상태 적용")
             else:  # status == 'normal'
                 # 정상 상태 - 기본 상태로 복원 (나중에 실제 데이터로 업데이트됨)
                 self.work_status_label.setText("작업완료")
-                self.work_status_label.setStyleSheet(get_main_work_completed_style())
+                set_style_state(self.work_status_label, "completed")
                 self.division_label.setText(f"구분: {self.division}")
-                self.division_label.setStyleSheet(get_main_division_label_style())
+                set_style_state(self.division_label, "default")
                 # print("DEBUG: PLC 정상 상태 적용")
         else:
             # print(f"DEBUG: PLC 상태 변경 불필요 - 현재 상태: {status}")
             pass
     
     def update_status_label(self, label, is_connected):
-        """상태 레이블 업데이트 - 스타일 변경 시에만 적용"""
-        # 현재 스타일과 비교하여 변경이 필요한 경우에만 적용
-        current_style = label.styleSheet()
-        target_style = get_main_status_connected_style() if is_connected else get_main_status_disconnected_style()
-        
-        if current_style != target_style:
-            # print(f"DEBUG: 상태 레이블 스타일 변경 - 연결됨: {is_connected}")
-            label.setStyleSheet(target_style)
-            # print(f"DEBUG: {'녹색' if is_connected else '적색'} 스타일 적용됨")
-        else:
-            # print(f"DEBUG: 상태 레이블 스타일 변경 불필요 - 연결됨: {is_connected}")
-            pass
+        """상태 레이블 업데이트 - 상태가 바뀐 경우에만 적용"""
+        set_style_state(label, "connected" if is_connected else "disconnected")
     
     def toggle_device_label(self, label, device_name):
         """장비 아이콘 클릭 시 라벨 텍스트 토글"""
@@ -463,106 +466,106 @@ class ProductionPanel(QWidget):
         # 구분값도 업데이트 (제공된 경우)
         if division is not None:
             self.division = division
-            print(f"DEBUG: {self.title} 구분값 업데이트: {self.division}")
+            logger.debug("%s 구분값 업데이트: %s", self.title, self.division)
         
         # UI 업데이트
         self.part_number_label.setText(part_number)
         self.part_name_label.setText(part_name)
         
-        print(f"DEBUG: {self.title} 부품정보 업데이트 - Part_No: {part_number}, Part_Name: {part_name}, Division: {self.division}")
+        logger.debug("%s 부품정보 업데이트 - Part_No: %s, Part_Name: %s, Division: %s", self.title, part_number, part_name, self.division)
     
     def show_scan_status(self):
         """스캔 현황 보기 (각 패널별 독립적)"""
-        print(f"DEBUG: ===== {self.title} 스캔현황 버튼 클릭 =====")
-        print(f"DEBUG: {self.title} 현재 부품번호: {self.part_number}")
-        print(f"DEBUG: {self.title} 현재 부품명: {self.part_name}")
+        logger.debug("===== %s 스캔현황 버튼 클릭 =====", self.title)
+        logger.debug("%s 현재 부품번호: %s", self.title, self.part_number)
+        logger.debug("%s 현재 부품명: %s", self.title, self.part_name)
         
         # 현재 패널의 하위부품 정보 가져오기
         child_parts_info = self.get_child_parts_info()
-        print(f"DEBUG: {self.title} 하위부품 정보 - {child_parts_info}")
-        print(f"DEBUG: {self.title} 하위부품 정보 타입: {type(child_parts_info)}")
-        print(f"DEBUG: {self.title} 하위부품 정보 길이: {len(child_parts_info) if child_parts_info else 0}")
+        logger.debug("%s 하위부품 정보 - %s", self.title, child_parts_info)
+        logger.debug("%s 하위부품 정보 타입: %s", self.title, type(child_parts_info))
+        logger.debug("%s 하위부품 정보 길이: %s", self.title, len(child_parts_info) if child_parts_info else 0)
         
         # 하위부품 정보가 비어있는 경우 경고 메시지
         if not child_parts_info or len(child_parts_info) == 0:
-            print(f"⚠️ WARNING: {self.title} 하위부품 정보가 비어있습니다!")
-            print(f"⚠️ WARNING: 부품번호 {self.part_number}에 대한 하위부품을 찾을 수 없습니다.")
+            logger.warning("⚠️ WARNING: %s 하위부품 정보가 비어있습니다!", self.title)
+            logger.warning("⚠️ WARNING: 부품번호 %s에 대한 하위부품을 찾을 수 없습니다.", self.part_number)
         else:
-            print(f"SUCCESS: {self.title} 하위부품 {len(child_parts_info)}개 발견!")
+            logger.debug("%s 하위부품 %s개 발견!", self.title, len(child_parts_info))
         
         from ..ui.scan_status_dialog_simple import SimpleScanStatusDialog
         
-        print(f"DEBUG: {self.title} SimpleScanStatusDialog 생성 시작")
-        print(f"DEBUG: {self.title} main_window: {self.main_window}")
-        print(f"DEBUG: {self.title} child_parts_info: {len(child_parts_info) if child_parts_info else 0}개")
-        print(f"DEBUG: {self.title} title: {self.title}")
+        logger.debug("%s SimpleScanStatusDialog 생성 시작", self.title)
+        logger.debug("%s main_window: %s", self.title, self.main_window)
+        logger.debug("%s child_parts_info: %s개", self.title, len(child_parts_info) if child_parts_info else 0)
+        logger.debug("%s title: %s", self.title, self.title)
         
         # 첨부이미지의 다이얼로그 함수 사용
         try:
-            print(f"DEBUG: {self.title} SimpleScanStatusDialog 생성 시도")
+            logger.debug("%s SimpleScanStatusDialog 생성 시도", self.title)
             dialog = SimpleScanStatusDialog(self.main_window, child_parts_info, self.title)
-            print(f"DEBUG: {self.title} SimpleScanStatusDialog 생성 완료")
-            print(f"DEBUG: {self.title} dialog.exec_() 시작")
+            logger.debug("%s SimpleScanStatusDialog 생성 완료", self.title)
+            logger.debug("%s dialog.exec_() 시작", self.title)
             dialog.exec_()
-            print(f"DEBUG: {self.title} dialog.exec_() 완료")
+            logger.debug("%s dialog.exec_() 완료", self.title)
         except Exception as e:
-            print(f"DEBUG: {self.title} SimpleScanStatusDialog 생성 오류: {e}")
+            logger.error("%s SimpleScanStatusDialog 생성 오류: %s", self.title, e)
             import traceback
-            print(f"DEBUG: {self.title} 상세 오류: {traceback.format_exc()}")
+            logger.error("%s 상세 오류: %s", self.title, traceback.format_exc())
     
     def increment_production_counter(self):
         """생산카운터 증가"""
         try:
-            print(f"DEBUG: {self.title} 생산카운터 증가 시작")
+            logger.debug("%s 생산카운터 증가 시작", self.title)
             
             # 현재 패널의 생산카운터 증가
             if hasattr(self, 'production_counter'):
                 self.production_counter += 1
-                print(f"DEBUG: {self.title} 생산카운터 증가: {self.production_counter}")
+                logger.debug("%s 생산카운터 증가: %s", self.title, self.production_counter)
                 
                 # 메인 윈도우의 일누적수량도 증가
                 if hasattr(self.main_window, 'increment_daily_total'):
                     self.main_window.increment_daily_total(self.title)
-                    print(f"DEBUG: {self.title} 일누적수량 증가 완료")
+                    logger.debug("%s 일누적수량 증가 완료", self.title)
             else:
-                print(f"DEBUG: {self.title} 생산카운터 속성이 없음")
+                logger.debug("%s 생산카운터 속성이 없음", self.title)
                 
         except Exception as e:
-            print(f"DEBUG: {self.title} 생산카운터 증가 오류: {e}")
+            logger.error("%s 생산카운터 증가 오류: %s", self.title, e)
     
     def get_child_parts_info(self):
         """현재 패널의 하위부품 정보 가져오기"""
         # 메인 화면에서 현재 부품번호의 하위부품 정보 찾기
-        print(f"DEBUG: {self.title} get_child_parts_info - self.main_window: {getattr(self, 'main_window', None)}")
-        print(f"DEBUG: {self.title} get_child_parts_info - 현재 부품번호: {self.part_number}")
-        print(f"DEBUG: {self.title} get_child_parts_info - 현재 구분값: {self.division}")
+        logger.debug("%s get_child_parts_info - self.main_window: %s", self.title, getattr(self, 'main_window', None))
+        logger.debug("%s get_child_parts_info - 현재 부품번호: %s", self.title, self.part_number)
+        logger.debug("%s get_child_parts_info - 현재 구분값: %s", self.title, self.division)
         
         if hasattr(self, 'main_window') and self.main_window:
-            print(f"DEBUG: {self.title} get_child_parts_info - hasattr(main_window, 'master_data'): {hasattr(self.main_window, 'master_data')}")
+            logger.debug("%s get_child_parts_info - hasattr(main_window, 'master_data'): %s", self.title, hasattr(self.main_window, 'master_data'))
             
             if hasattr(self.main_window, 'master_data'):
-                print(f"DEBUG: {self.title} get_child_parts_info - master_data 개수: {len(self.main_window.master_data)}")
+                logger.debug("%s get_child_parts_info - master_data 개수: %s", self.title, len(self.main_window.master_data))
                 for i, part_data in enumerate(self.main_window.master_data):
-                    print(f"DEBUG: {self.title} get_child_parts_info - master_data[{i}] part_number: {part_data.get('part_number')}, division: {part_data.get('division')}")
+                    logger.debug("%s get_child_parts_info - master_data[%s] part_number: %s, division: %s", self.title, i, part_data.get('part_number'), part_data.get('division'))
                     if part_data.get("part_number") == self.part_number and part_data.get("division") == self.division:
                         child_parts = part_data.get("child_parts", [])
-                        print(f"DEBUG: {self.title} 부품번호 {self.part_number} (구분값 {self.division})의 하위부품: {child_parts}")
-                        print(f"DEBUG: {self.title} 하위부품 개수: {len(child_parts)}")
+                        logger.debug("%s 부품번호 %s (구분값 %s)의 하위부품: %s", self.title, self.part_number, self.division, child_parts)
+                        logger.debug("%s 하위부품 개수: %s", self.title, len(child_parts))
                         return child_parts
         else:
-            print(f"DEBUG: {self.title} get_child_parts_info - main_window 참조가 없음, find_main_window() 시도")
+            logger.debug("%s get_child_parts_info - main_window 참조가 없음, find_main_window() 시도", self.title)
             main_window = self.find_main_window()
             if main_window and hasattr(main_window, 'master_data'):
-                print(f"DEBUG: {self.title} get_child_parts_info - find_main_window로 찾은 master_data 개수: {len(main_window.master_data)}")
+                logger.debug("%s get_child_parts_info - find_main_window로 찾은 master_data 개수: %s", self.title, len(main_window.master_data))
                 for i, part_data in enumerate(main_window.master_data):
-                    print(f"DEBUG: {self.title} get_child_parts_info - master_data[{i}] part_number: {part_data.get('part_number')}, division: {part_data.get('division')}")
+                    logger.debug("%s get_child_parts_info - master_data[%s] part_number: %s, division: %s", self.title, i, part_data.get('part_number'), part_data.get('division'))
                     if part_data.get("part_number") == self.part_number and part_data.get("division") == self.division:
                         child_parts = part_data.get("child_parts", [])
-                        print(f"DEBUG: {self.title} 부품번호 {self.part_number} (구분값 {self.division})의 하위부품: {child_parts}")
-                        print(f"DEBUG: {self.title} 하위부품 개수: {len(child_parts)}")
+                        logger.debug("%s 부품번호 %s (구분값 %s)의 하위부품: %s", self.title, self.part_number, self.division, child_parts)
+                        logger.debug("%s 하위부품 개수: %s", self.title, len(child_parts))
                         return child_parts
         
-        print(f"DEBUG: {self.title} 하위부품 정보를 찾을 수 없음 - 부품번호: {self.part_number}")
+        logger.debug("%s 하위부품 정보를 찾을 수 없음 - 부품번호: %s", self.title, self.part_number)
         return []
     
     def find_main_window(self):
@@ -573,11 +576,11 @@ class ProductionPanel(QWidget):
             try:
                 from main_screen import BarcodeMainScreen
                 if isinstance(widget, BarcodeMainScreen):
-                    print(f"DEBUG: {self.title} find_main_window - 메인 윈도우 찾음: {widget}")
+                    logger.debug("%s find_main_window - 메인 윈도우 찾음: %s", self.title, widget)
                     return widget
             except ImportError as e:
-                print(f"DEBUG: {self.title} find_main_window - ImportError: {e}")
+                logger.debug("%s find_main_window - ImportError: %s", self.title, e)
                 pass
             widget = widget.parent()
-        print(f"DEBUG: {self.title} find_main_window - 메인 윈도우를 찾을 수 없음")
+        logger.debug("%s find_main_window - 메인 윈도우를 찾을 수 없음", self.title)
         return None
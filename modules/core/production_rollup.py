@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+생산 실적 집계 (시간대/근무조별 OK·NG 수량)
+(시간, 근무조, 패널, 부품번호, 결과)별 수량을 작업완료/출력 시점에 바로 누적해 두고,
+근무조 보고서/기간 조회는 원본 로그(scan_logs JSON, print_logs 텍스트)를 다시 읽지 않고 답한다.
+- 결과: OK/NG = 라벨 출력 성공/실패, SCAN_OK/SCAN_NG = 하위부품 스캔 판정
+- 조회 단위는 1시간 (시간대 키로 바로 찾음)
+- 집계가 없거나 어긋나면 rebuild() 로 기존 로그 파일에서 다시 만든다
+- 저장: sqlite3 (WAL) - 누적분은 모아 두었다가 증가분으로 더함(UPDATE count = count + n)
+  메인 화면과 관리자 패널이 다른 프로세스여도 조회는 항상 DB 최신값
+- 재구성은 기록하는 프로세스가 하나일 때만 정확함 (rebuild() 참고)
+"""
+
+import os
+import re
+import json
+import atexit
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from .production_counter import ShiftCalendar
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+ROLLUP_DB = os.path.join("data", "production_rollup.db")
+LOG_ROOT = "logs"
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+RESULT_OK = "OK"
+RESULT_NG = "NG"
+RESULT_SCAN_OK = "SCAN_OK"
+RESULT_SCAN_NG = "SCAN_NG"
+RESULTS = (RESULT_OK, RESULT_NG, RESULT_SCAN_OK, RESULT_SCAN_NG)
+
+HOUR_FORMAT = "%Y-%m-%d %H"
+
+# print_logs 텍스트 파일 항목 시작 줄: [2025-10-31 13:00:45] 공정부품: 89131CU214
+_PRINT_HEADER = re.compile(r'^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] 공정부품: (.*)$')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rollup (
+    hour TEXT NOT NULL,
+    work_date TEXT NOT NULL,
+    shift TEXT NOT NULL,
+    panel TEXT NOT NULL,
+    part_number TEXT NOT NULL,
+    result TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (hour, work_date, shift, panel, part_number, result)
+) WITHOUT ROWID;
+"""
+
+_UPSERT = ("INSERT INTO rollup (hour, work_date, shift, panel, part_number, result, count) "
+           "VALUES (?, ?, ?, ?, ?, ?, ?) "
+           "ON CONFLICT (hour, work_date, shift, panel, part_number, result) "
+           "DO UPDATE SET count = count + excluded.count")
+
+
+def hour_key(when):
+    return when.strftime(HOUR_FORMAT)
+
+
+def _hour_range(start, end):
+    """[start, end) 에 걸치는 시간대 키 범위 (low 포함, high 제외)"""
+    low = start.replace(minute=0, second=0, microsecond=0)
+    high = end.replace(minute=0, second=0, microsecond=0)
+    if high < end:
+        high += timedelta(hours=1)
+    return hour_key(low), hour_key(high)
+
+
+class ProductionRollupStore:
+    """시간대/근무조별 생산 실적 집계 저장소 (프로세스 공용 인스턴스는 shared())"""
+
+    _shared = None
+
+    def __init__(self, path=ROLLUP_DB, shifts=None, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        self.path = path
+        self.calendar = ShiftCalendar(shifts)
+        self.flush_interval = flush_interval
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._pending = {}  # (시간대, 작업일, 근무조, 패널, 부품번호, 결과) → 아직 DB 에 더하지 않은 수량
+
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._timer = None
+        self._closed = False
+        atexit.register(self.close)
+
+    @classmethod
+    def shared(cls, config=None):
+        """메인 화면과 관리자 패널이 함께 쓰는 인스턴스 (최초 호출 시 비어 있으면 가져오기/재구성)"""
+        if cls._shared is None:
+            shifts = (config or {}).get("production_counter", {}).get("shifts")
+            cls._shared = cls(shifts=shifts)
+            cls._shared.load()
+        return cls._shared
+
+    # ===== 누적 =====
+
+    def _add(self, counts, when, panel_name, part_number, result, count=1):
+        work_date, shift, _ = self.calendar.period(when)
+        key = (hour_key(when), work_date.isoformat(), shift or "", panel_name or "", part_number or "", result)
+        counts[key] = counts.get(key, 0) + count
+
+    def record(self, panel_name, part_number, result, when=None):
+        """실적 1건 누적 (작업완료/출력 시 호출)"""
+        with self._lock:
+            self._add(self._pending, when or datetime.now(), panel_name, part_number, result)
+            self._schedule_flush()
+
+    # ===== 조회 =====
+
+    def _select(self, sql, params):
+        """조회 전 이 프로세스의 누적분을 먼저 DB 에 더함 → 다른 프로세스 기록까지 포함한 최신값"""
+        self.flush()
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _filters(panel_name, part_number, shift):
+        where, params = "", []
+        for column, value in (("panel", panel_name), ("part_number", part_number), ("shift", shift)):
+            if value is not None:
+                where += f" AND {column} = ?"
+                params.append(value)
+        return where, params
+
+    def query(self, start, end, panel_name=None, part_number=None, shift=None):
+        """기간 합계 {결과: 수량} - 예: query(화요일 14시, 화요일 22시, 'REAR/RH')"""
+        where, params = self._filters(panel_name, part_number, shift)
+        rows = self._select("SELECT result, SUM(count) FROM rollup WHERE hour >= ? AND hour < ?"
+                            f"{where} GROUP BY result", (*_hour_range(start, end), *params))
+        totals = dict.fromkeys(RESULTS, 0)
+        totals.update({result: count for result, count in rows})
+        return totals
+
+    def hourly(self, start, end, panel_name=None, part_number=None):
+        """시간대별 행 목록 [(시간, 근무조, 패널, 부품번호, {결과: 수량})] (시간순)"""
+        where, params = self._filters(panel_name, part_number, None)
+        rows = {}
+        for hour, shift, panel, part, result, count in self._select(
+                "SELECT hour, shift, panel, part_number, result, SUM(count) FROM rollup "
+                f"WHERE hour >= ? AND hour < ?{where} GROUP BY hour, shift, panel, part_number, result",
+                (*_hour_range(start, end), *params)):
+            counts = rows.setdefault((datetime.strptime(hour, HOUR_FORMAT), shift, panel, part),
+                                     dict.fromkeys(RESULTS, 0))
+            counts[result] = counts.get(result, 0) + count
+        return [row_key + (counts,) for row_key, counts in sorted(rows.items())]
+
+    def shift_report(self, work_date, panel_name=None):
+        """작업일 근무조별 행 목록 [(근무조, 패널, 부품번호, {결과: 수량})] (근무조 순서)"""
+        day_start = datetime.combine(work_date, datetime.min.time()) + timedelta(minutes=self.calendar.day_start)
+        where, params = self._filters(panel_name, None, None)
+        rows = {}
+        for shift, panel, part, result, count in self._select(
+                "SELECT shift, panel, part_number, result, SUM(count) FROM rollup "
+                f"WHERE hour >= ? AND hour < ? AND work_date = ?{where} "
+                "GROUP BY shift, panel, part_number, result",
+                (*_hour_range(day_start, day_start + timedelta(days=1)), work_date.isoformat(), *params)):
+            counts = rows.setdefault((shift, panel, part), dict.fromkeys(RESULTS, 0))
+            counts[result] = counts.get(result, 0) + count
+        order = {name: index for index, name in enumerate(self.calendar.shift_names)}
+        return [row_key + (counts,) for row_key, counts in
+                sorted(rows.items(), key=lambda item: (order.get(item[0][0], len(order)), item[0][1:]))]
+
+    # ===== 로그에서 재구성 =====
+
+    def rebuild(self, log_root=LOG_ROOT):
+        """기존 로그 파일(scan_logs JSON, print_logs 텍스트)에서 집계를 다시 만든다 (반영 건수 반환)
+
+        한 트랜잭션으로 교체하고 이 프로세스의 아직 더하지 않은 누적분은 버린다 (이미 로그에 있는 실적).
+        다른 프로세스의 누적분은 알 수 없으므로 재구성 후 그 프로세스가 저장하면 두 번 더해진다
+        → 실적을 기록하는 프로세스(메인 화면)가 하나이고, 그 프로세스의 shared() 인스턴스에서 실행해야 함
+        """
+        events = []
+        for directory, _, file_names in os.walk(log_root):
+            folder = os.path.basename(directory)
+            for file_name in file_names:
+                path = os.path.join(directory, file_name)
+                try:
+                    if folder == "print_logs" and file_name.endswith(".txt"):
+                        events.extend(self._read_print_log(path))
+                    elif folder == "scan_logs" and file_name.endswith(".json") and "_print_" not in file_name:
+                        events.extend(self._read_scan_log(path))
+                except Exception as e:
+                    logger.error("생산 실적 재구성 - 로그 읽기 실패: %s - %s", path, e)
+
+        counts = {}
+        for when, panel_name, part_number, result in events:
+            self._add(counts, when, panel_name, part_number, result)
+        with self._save_lock, self._lock:
+            # 아직 더하지 않은 누적분도 이미 로그에 기록된 실적이므로 버림
+            self._pending = {}
+            with self._conn:
+                self._conn.execute("DELETE FROM rollup")
+                self._conn.executemany(_UPSERT, [key + (count,) for key, count in counts.items()])
+        logger.info("생산 실적 재구성 완료 - %s건 (%s)", len(events), log_root)
+        return len(events)
+
+    @staticmethod
+    def _read_print_log(path):
+        """print_log_*.txt → (시각, 패널, 공정부품, OK/NG)"""
+        events = []
+        entry = None
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.rstrip("\n")
+                match = _PRINT_HEADER.match(line)
+                if match:
+                    entry = {"time": datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S"),
+                             "part": match.group(2).strip()}
+                elif entry is None:
+                    continue
+                elif line.strip().startswith("출력결과:"):
+                    entry["result"] = RESULT_OK if line.split(":", 1)[1].strip() == "SUCCESS" else RESULT_NG
+                elif line.strip().startswith("패널명:"):
+                    entry["panel"] = line.split(":", 1)[1].strip()
+                elif line.strip() == "---":
+                    if "result" in entry:
+                        events.append((entry["time"], entry.get("panel", ""), entry["part"], entry["result"]))
+                    entry = None
+        return events
+
+    @staticmethod
+    def _read_scan_log(path):
+        """front_lh_YYYY-MM-DD.json 등 → 하위부품별 (시각, 패널, 공정부품, SCAN_OK/SCAN_NG)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            logs = json.load(f)
+        events = []
+        for log in logs if isinstance(logs, list) else []:
+            try:
+                when = datetime.strptime(f"{log.get('날짜')} {log.get('시간')}", "%Y-%m-%d %H:%M:%S")
+            except Exception:
+                continue
+            index = 1
+            while f"하위부품{index}" in log:
+                result = RESULT_SCAN_OK if log.get(f"하위부품{index}_스캔결과") == "OK" else RESULT_SCAN_NG
+                events.append((when, log.get("패널명", ""), log.get("공정부품", ""), result))
+                index += 1
+        return events
+
+    # ===== 저장 =====
+
+    def _schedule_flush(self):
+        """lock 보유 상태에서 호출 - 저장 예약이 없을 때만 타이머 시작"""
+        if self._closed or self._timer is not None:
+            return
+        self._timer = threading.Timer(self.flush_interval, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self):
+        """모아 둔 누적분을 DB 에 더함 (증가분 기록 - 다른 프로세스 기록/재구성과 합쳐짐)"""
+        with self._save_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return True
+            try:
+                with self._lock, self._conn:
+                    self._conn.executemany(_UPSERT, [key + (count,) for key, count in pending.items()])
+                logger.debug("생산 실적 집계 저장 완료 - %s (%s건)", self.path, len(pending))
+                return True
+            except Exception as e:
+                logger.error("생산 실적 집계 저장 오류: %s", e)
+                with self._lock:
+                    for key, count in pending.items():
+                        self._pending[key] = self._pending.get(key, 0) + count
+                    self._schedule_flush()
+                return False
+
+    def close(self):
+        """예약된 저장 취소 후 즉시 저장 (프로그램 종료 시 자동 호출)
+        DB 연결은 유지 - 같은 프로세스의 관리자 패널이 계속 조회할 수 있음"""
+        with self._lock:
+            self._closed = True
+        return self.flush()
+
+    def load(self):
+        """집계가 비어 있으면 기존 로그에서 재구성"""
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM rollup LIMIT 1").fetchone() is not None:
+                return True
+        logger.info("생산 실적 집계 없음 - 로그에서 재구성")
+        self.rebuild()
+        return False
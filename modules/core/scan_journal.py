@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스캔 세션 저널
+패널별 추가 전용(append-only) 파일에 사이클 시작/스캔/수정/초기화/완료 이벤트를 한 줄씩 기록하고,
+프로그램 시작 시 한 번에 재생해 충돌 직전 스캔 세션을 그대로 복원한다.
+- 스캔 1건 = 메모리 큐에 이벤트 1개 추가 (호출 스레드는 디스크를 기다리지 않음)
+- 기록 스레드가 commit_interval 마다 모아서 한 번에 write + fsync (그룹 커밋)
+  → 충돌 시 유실 가능 구간은 최대 commit_interval
+- 마지막 줄이 잘린 경우(기록 중 전원 차단) 재생 시 무시하고 파일을 잘라냄
+- 초기화/완료 시 파일이 커졌으면 비움 (해당 패널 상태가 비어 있으므로 정확)
+"""
+
+import os
+import re
+import json
+import time
+import heapq
+import atexit
+import threading
+
+from .scan_session import ScanRecord, UNKNOWN_PANEL
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+JOURNAL_DIR = os.path.join("data", "journal")
+JOURNAL_EXT = ".jsonl"
+DEFAULT_COMMIT_INTERVAL = 0.2          # 그룹 커밋 주기 (초) = 최대 유실 구간
+COMPACT_BYTES = 64 * 1024              # 초기화/완료 시 이 크기를 넘으면 파일 비움
+
+# 이벤트 종류
+OP_START = "start"
+OP_SCAN = "scan"
+OP_AMEND = "amend"
+OP_CLEAR = "clear"
+OP_COMPLETE = "complete"
+
+# 이전 버전의 전체 덮어쓰기 임시 파일 (저널로 대체)
+LEGACY_TEMP_FILE = "temp_scan_data.json"
+
+
+def _panel_file_name(panel_name):
+    """패널명을 파일명으로 변환 (예: 'FRONT/LH' → 'FRONT_LH.jsonl')"""
+    name = re.sub(r'[^0-9A-Za-z가-힣_-]+', '_', panel_name or UNKNOWN_PANEL).strip('_')
+    return (name or "_default") + JOURNAL_EXT
+
+
+class ScanJournal:
+    """패널별 스캔 세션 저널 - ScanSessionStore.journal 로 연결해 사용"""
+
+    def __init__(self, directory=JOURNAL_DIR, commit_interval=DEFAULT_COMMIT_INTERVAL,
+                 compact_bytes=COMPACT_BYTES):
+        self.directory = directory
+        self.commit_interval = commit_interval
+        self.compact_bytes = compact_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._seq = 0
+        self._pending = []                 # (파일명, 이벤트 dict) - 다음 그룹 커밋 대상
+        self._files = {}                   # 파일명 → 열린 파일 객체 (기록 스레드 전용)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._committed = threading.Condition(self._lock)
+        self._committed_seq = 0
+        self._closed = False
+        self._thread = None
+        atexit.register(self.close)
+
+    # ===== 기록 (호출 스레드) =====
+
+    def _append(self, panel_name, op, **fields):
+        with self._lock:
+            if self._closed:
+                return
+            self._seq += 1
+            event = {"seq": self._seq, "op": op, "panel": panel_name or UNKNOWN_PANEL}
+            event.update(fields)
+            self._pending.append((_panel_file_name(panel_name), event))
+            self._ensure_writer()
+            self._wakeup.notify()
+
+    def record_start(self, panel_name, part_number, expected):
+        """공정부품 스캔으로 사이클 시작 - 재생 시 작업 흐름 엔진의 진행 중 사이클 복원에 사용"""
+        self._append(panel_name, OP_START, part_number=part_number, expected=list(expected))
+
+    def record_scan(self, record):
+        self._append(record.panel, OP_SCAN, record=record.to_dict())
+
+    def record_amend(self, record, is_ok=None, part_number=None, raw_data=None):
+        self._append(record.panel, OP_AMEND, is_ok=is_ok, part_number=part_number, raw_data=raw_data)
+
+    def record_clear(self, panel_name=None):
+        """panel_name이 None이면 모든 패널 초기화 (패널 파일마다 같은 seq로 기록)"""
+        if panel_name is not None:
+            self._append(panel_name, OP_CLEAR)
+            return
+        file_names = self._known_files()
+        with self._lock:
+            if self._closed or not file_names:
+                return
+            self._seq += 1
+            for file_name in sorted(file_names):
+                self._pending.append((file_name, {"seq": self._seq, "op": OP_CLEAR, "panel": None}))
+            self._ensure_writer()
+            self._wakeup.notify()
+
+    def record_complete(self, panel_name):
+        """사이클 완료 (출력 완료 등) - 재생 시 해당 패널 작업 종료로 처리"""
+        self._append(panel_name, OP_COMPLETE)
+
+    def _known_files(self):
+        with self._lock:
+            names = set(self._files)
+            names.update(file_name for file_name, _ in self._pending)
+        try:
+            names.update(name for name in os.listdir(self.directory) if name.endswith(JOURNAL_EXT))
+        except Exception as e:
+            logger.error("스캔 저널 디렉토리 조회 실패: %s", e)
+        return names
+
+    # ===== 그룹 커밋 (기록 스레드) =====
+
+    def _ensure_writer(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="ScanJournalWriter", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._wakeup.wait()
+                if not self._pending and self._closed:
+                    return
+            # 주기 동안 들어온 이벤트를 모아서 한 번에 기록
+            if not self._closed:
+                time.sleep(self.commit_interval)
+            with self._lock:
+                batch, self._pending = self._pending, []
+            try:
+                self._commit(batch)
+            except Exception as e:
+                logger.error("스캔 저널 기록 실패 (%s건): %s", len(batch), e)
+            with self._lock:
+                self._committed_seq = batch[-1][1]["seq"]
+                self._committed.notify_all()
+
+    def _open(self, file_name):
+        handle = self._files.get(file_name)
+        if handle is None:
+            handle = open(os.path.join(self.directory, file_name), 'ab')
+            self._files[file_name] = handle
+        return handle
+
+    def _commit(self, batch):
+        touched = {}
+        for file_name, event in batch:
+            handle = self._open(file_name)
+            if event["op"] in (OP_CLEAR, OP_COMPLETE) and handle.tell() >= self.compact_bytes:
+                # 패널 상태가 비므로 이전 이벤트는 재생할 필요 없음
+                handle.seek(0)
+                handle.truncate()
+            line = json.dumps(event, ensure_ascii=False, separators=(',', ':')) + "\n"
+            handle.write(line.encode('utf-8'))
+            touched[file_name] = handle
+        for handle in touched.values():
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def flush(self, timeout=2.0):
+        """지금까지 기록한 이벤트가 디스크에 반영될 때까지 대기"""
+        with self._lock:
+            target = self._seq
+            if self._committed_seq >= target or self._thread is None:
+                return True
+            self._wakeup.notify()
+            return self._committed.wait_for(lambda: self._committed_seq >= target, timeout)
+
+    def close(self):
+        """남은 이벤트 기록 후 파일 닫기 (프로그램 종료 시 자동 호출)"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wakeup.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(5.0)
+        for handle in self._files.values():
+            try:
+                handle.close()
+            except Exception as e:
+                logger.error("스캔 저널 파일 닫기 실패: %s", e)
+        self._files.clear()
+
+    # ===== 재생 =====
+
+    def _read_events(self, file_name):
+        """파일의 이벤트를 순서대로 반환 - 잘린 마지막 줄은 버리고 파일도 그 앞까지 자름"""
+        path = os.path.join(self.directory, file_name)
+        events = []
+        valid_size = 0
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("잘린 줄")
+                    events.append(json.loads(line.decode('utf-8')))
+                except Exception:
+                    logger.warning("스캔 저널 손상 구간 무시: %s (%s bytes 이후)", file_name, valid_size)
+                    break
+                valid_size += len(line)
+        if valid_size < os.path.getsize(path):
+            with open(path, 'r+b') as f:
+                f.truncate(valid_size)
+        return events
+
+    def replay_into(self, store):
+        """모든 패널 저널을 seq 순서로 합쳐 한 번에 재생 (복원된 스캔 수 반환)"""
+        streams = []
+        for file_name in sorted(self._known_files()):
+            try:
+                streams.append(self._read_events(file_name))
+            except Exception as e:
+                logger.error("스캔 저널 읽기 실패: %s - %s", file_name, e)
+
+        journal, store.journal = store.journal, None   # 재생 중에는 다시 기록하지 않음
+        last_seq = 0
+        try:
+            for event in heapq.merge(*streams, key=lambda ev: ev.get("seq", 0)):
+                last_seq = max(last_seq, event.get("seq", 0))
+                op = event.get("op")
+                if op == OP_START:
+                    store.start_cycle(event.get("panel"), event.get("part_number", ""), event.get("expected") or [])
+                elif op == OP_SCAN:
+                    store.add(ScanRecord.from_dict(event.get("record") or {}))
+                elif op == OP_AMEND:
+                    store.amend_latest(event.get("is_ok"), event.get("part_number"), event.get("raw_data"))
+                elif op in (OP_CLEAR, OP_COMPLETE):
+                    store.clear_current(event.get("panel"))
+        finally:
+            store.journal = journal
+
+        with self._lock:
+            self._seq = max(self._seq, last_seq)
+            self._committed_seq = self._seq
+        logger.info("스캔 저널 복원: %s건", len(store.current))
+        return len(store.current)
+
+
+def remove_legacy_temp_files(paths):
+    """이전 버전의 temp_scan_data.json 삭제 (저널로 대체되어 더 이상 사용하지 않음)"""
+    removed = 0
+    for path in paths:
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+                removed += 1
+                logger.debug("이전 임시 스캔 파일 삭제: %s", path)
+        except Exception as e:
+            logger.error("이전 임시 스캔 파일 삭제 실패: %s - %s", path, e)
+    return removed
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스캔 세션 저장소
+한 사이클(작업)의 하위부품 스캔 데이터를 패널별로 한 곳에서 관리한다.
+- 모든 컨테이너는 deque(maxlen) - 스캔 1건당 상수 시간, 장시간 운전에도 메모리 일정
+- 스캔 레코드는 __slots__ 객체 하나를 모든 뷰가 공유 (dict 복사 없음)
+- 다이얼로그/이력 화면에는 읽기 전용 뷰만 제공 (최신순)
+"""
+
+from collections import deque
+from collections.abc import Sequence
+
+# 기본 보관 개수 (기존 리스트 제한값과 동일)
+RECENT_PARTS_LIMIT = 20      # 최근 스캔 부품 (scanned_parts)
+CURRENT_SCAN_LIMIT = 100     # 현재 작업 스캔 데이터 (temp_scan_data)
+HISTORY_LIMIT = 1000         # 스캔 히스토리 (scan_history)
+
+UNKNOWN_PANEL = ""
+
+
+class ScanRecord:
+    """스캔 레코드 1건 - dict처럼 읽을 수 있음 (record['part_number'], record.get(...))"""
+
+    __slots__ = ('time', 'part_number', 'is_ok', 'status', 'raw_data', 'panel')
+
+    FIELDS = __slots__
+
+    def __init__(self, time, part_number, is_ok, raw_data=None, panel=None, status=None):
+        self.time = time
+        self.part_number = part_number
+        self.is_ok = bool(is_ok)
+        self.status = status or ('OK' if self.is_ok else 'NG')
+        self.raw_data = raw_data
+        self.panel = panel
+
+    @classmethod
+    def from_dict(cls, data):
+        """저장 파일/기존 dict 데이터에서 레코드 생성"""
+        if isinstance(data, ScanRecord):
+            return data
+        is_ok = data.get('is_ok', data.get('status') == 'OK')
+        return cls(data.get('time', ''), data.get('part_number', ''), is_ok,
+                   raw_data=data.get('raw_data'), panel=data.get('panel'), status=data.get('status'))
+
+    # dict 호환 읽기 인터페이스 (기존 scan_data.get(...) 코드 그대로 사용)
+    def get(self, key, default=None):
+        if key in self.FIELDS:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.FIELDS
+
+    def keys(self):
+        return self.FIELDS
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self.FIELDS]
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.FIELDS}
+
+    def copy(self):
+        """수정 가능한 dict 사본 반환 (기존 scan_data.copy() 호환)"""
+        return self.to_dict()
+
+    def __repr__(self):
+        return f"ScanRecord({self.to_dict()})"
+
+
+def to_dicts(items):
+    """레코드/dict 혼합 목록을 JSON 저장용 dict 목록으로 변환"""
+    return [item.to_dict() if isinstance(item, ScanRecord) else dict(item) for item in items]
+
+
+class ScanView(Sequence):
+    """deque에 대한 읽기 전용 뷰 (최신순, 복사 없음)"""
+
+    __slots__ = ('_items',)
+
+    def __init__(self, items):
+        self._items = items
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._items)[index]
+        return self._items[index]
+
+    def __bool__(self):
+        return bool(self._items)
+
+    def copy(self):
+        """현재 시점 스냅샷 (list)"""
+        return list(self._items)
+
+    def to_dicts(self):
+        return to_dicts(self._items)
+
+    def __repr__(self):
+        return f"ScanView({list(self._items)!r})"
+
+
+class PanelScanSession:
+    """패널 하나의 현재 작업 스캔 데이터"""
+
+    __slots__ = ('panel_name', '_current', 'current')
+
+    def __init__(self, panel_name, current_limit=CURRENT_SCAN_LIMIT):
+        self.panel_name = panel_name
+        self._current = deque(maxlen=current_limit)
+        self.current = ScanView(self._current)
+
+    def add(self, record):
+        self._current.appendleft(record)
+
+    def clear(self):
+        self._current.clear()
+
+
+class ScanSessionStore:
+    """전체 스캔 세션 저장소 - 패널별 세션 + 전체 최신순 뷰
+
+    기존 리스트와의 대응:
+        recent_parts  ← scanned_parts          (부품번호, OK여부) 최근 20건
+        current       ← temp_scan_data / global_scan_data / real_time_scanned_data
+        history       ← scan_history           최근 1000건 (작업 초기화와 무관)
+        panel(name)   ← 패널별 현재 작업 데이터
+
+    journal 이 연결되어 있으면 현재 작업 데이터 변경을 저널에 이벤트로 남긴다 (scan_journal 참고).
+    """
+
+    def __init__(self, recent_limit=RECENT_PARTS_LIMIT, current_limit=CURRENT_SCAN_LIMIT,
+                 history_limit=HISTORY_LIMIT, journal=None):
+        self.journal = journal
+        self._current_limit = current_limit
+        self._recent_parts = deque(maxlen=recent_limit)
+        self._current = deque(maxlen=current_limit)
+        self._history = deque(maxlen=history_limit)
+        self._panels = {}
+
+        self.recent_parts = ScanView(self._recent_parts)
+        self.current = ScanView(self._current)
+        self.history = ScanView(self._history)
+        # 진행 중 사이클 (패널, 공정부품, 기대 하위부품) - 재시작 시 작업 흐름 엔진 복원용
+        self.open_cycle = None
+
+    def panel(self, panel_name):
+        """패널별 세션 (없으면 생성)"""
+        key = panel_name or UNKNOWN_PANEL
+        session = self._panels.get(key)
+        if session is None:
+            session = PanelScanSession(key, self._current_limit)
+            self._panels[key] = session
+        return session
+
+    def panel_view(self, panel_name):
+        return self.panel(panel_name).current
+
+    def add(self, record):
+        """스캔 1건 추가 - 모든 뷰에 같은 레코드를 공유 (상수 시간)"""
+        if not isinstance(record, ScanRecord):
+            record = ScanRecord.from_dict(record)
+        self._recent_parts.appendleft((record.part_number, record.is_ok))
+        self._current.appendleft(record)
+        self._history.appendleft(record)
+        self.panel(record.panel).add(record)
+        if self.journal is not None:
+            self.journal.record_scan(record)
+        return record
+
+    def latest(self):
+        """가장 최근 스캔 레코드 (없으면 None)"""
+        return self._current[0] if self._current else None
+
+    def amend_latest(self, is_ok=None, part_number=None, raw_data=None):
+        """가장 최근 스캔 레코드 판정 수정 (스캔현황 다이얼로그의 하위부품 매칭 결과 반영)"""
+        record = self.latest()
+        if record is None:
+            return None
+        if is_ok is not None:
+            record.is_ok = bool(is_ok)
+            record.status = 'OK' if record.is_ok else 'NG'
+        if part_number:
+            record.part_number = part_number
+        if raw_data:
+            record.raw_data = raw_data
+        if self.journal is not None:
+            self.journal.record_amend(record, is_ok, part_number, raw_data)
+        return record
+
+    def replace_current(self, items):
+        """현재 작업 데이터를 저장 파일 등에서 복원 (최신순 목록)"""
+        records = [ScanRecord.from_dict(item) for item in items]
+        if len(records) == len(self._current) and all(a is b for a, b in zip(records, self._current)):
+            return  # 현재 뷰의 스냅샷을 다시 넣는 경우 - 변경 없음
+
+        self._current.clear()
+        for session in self._panels.values():
+            session.clear()
+        self.open_cycle = None
+        if self.journal is not None:
+            self.journal.record_clear()
+        # 최신순 목록이므로 오래된 것부터 넣어야 순서 유지
+        for record in reversed(records):
+            self._current.appendleft(record)
+            self.panel(record.panel).add(record)
+            if self.journal is not None:
+                self.journal.record_scan(record)
+
+    def start_cycle(self, panel_name, part_number, expected):
+        """공정부품 스캔으로 사이클 시작 - 저널에 기록해 재시작 후에도 같은 사이클로 이어서 작업"""
+        self.open_cycle = (panel_name, part_number, list(expected))
+        if self.journal is not None:
+            self.journal.record_start(panel_name, part_number, expected)
+
+    def _close_cycle(self, panel_name=None):
+        if self.open_cycle and (panel_name is None or self.open_cycle[0] == panel_name):
+            self.open_cycle = None
+
+    def clear_current(self, panel_name=None):
+        """현재 작업 데이터 초기화 (panel_name 지정 시 해당 패널만)"""
+        if self.journal is not None:
+            self.journal.record_clear(panel_name)
+        self._close_cycle(panel_name)
+        if panel_name is None:
+            self._current.clear()
+            self._recent_parts.clear()
+            for session in self._panels.values():
+                session.clear()
+            return
+
+        self._clear_panel(panel_name)
+
+    def complete(self, panel_name):
+        """패널 작업 사이클 완료 - 현재 작업 데이터에서 제외하고 저널에 완료 이벤트 기록"""
+        if self.journal is not None:
+            self.journal.record_complete(panel_name)
+        self._close_cycle(panel_name)
+        self._clear_panel(panel_name)
+
+    def _clear_panel(self, panel_name):
+        session = self.panel(panel_name)
+        session.clear()
+        remaining = [record for record in self._current if (record.panel or UNKNOWN_PANEL) != session.panel_name]
+        self._current.clear()
+        self._current.extend(remaining)
+
+    def clear_all(self):
+        """히스토리까지 모두 초기화"""
+        self.clear_current()
+        self._history.clear()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+생산 스테이션(패널) 구성
+- admin_panel_config.json 의 stations 목록으로 패널 수와 패널별 PLC 완료신호/구분값 위치, 프린터, 너트런너, 로그, 하위부품 수를 선언
+- 설정이 없으면 기존 2패널: FRONT/LH (완료신호 1, 구분값 1번째, 너트1) / REAR/RH (완료신호 2, 구분값 2번째, 너트2)
+- 이름/키/완료신호별 사전으로 바로 조회 (스테이션 수와 무관하게 O(1))
+
+설정 예:
+    "stations": [
+        {"key": "front_lh", "name": "FRONT/LH", "completion_signal": 1, "division_index": 0,
+         "printer": "프린터", "nutrunner": "너트1", "max_children": 6},
+        {"key": "st3", "name": "ST3", "completion_signal": 3, "division_index": 2, "printer": "프린터2",
+         "nutrunner": ""}
+    ]
+"""
+
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PRINTER = "프린터"
+DEFAULT_MAX_CHILDREN = 6
+MAX_COMPLETION_SIGNAL = 9       # PLC 완료신호 1자리
+
+# 기존 2패널 구성 (설정에 stations 가 없을 때) - 자리표시 부품정보는 기존 화면 초기값
+DEFAULT_STATIONS = [
+    {"key": "front_lh", "name": "FRONT/LH", "completion_signal": 1, "division_index": 0, "nutrunner": "너트1",
+     "part_number": "123456789", "part_name": "프론트 도어 핸들", "division": "A001"},
+    {"key": "rear_rh", "name": "REAR/RH", "completion_signal": 2, "division_index": 1, "nutrunner": "너트2",
+     "part_number": "987654321", "part_name": "리어 도어 핸들", "division": "B001"},
+]
+
+
+def station_key(name):
+    """스테이션 이름 → 키 (예: 'FRONT/LH' → 'front_lh')"""
+    return "".join(char if char.isalnum() else "_" for char in str(name).strip().lower()).strip("_")
+
+
+class Station:
+    """스테이션 1개 - 화면 패널 1개와 PLC 완료신호/구분값 1개"""
+
+    __slots__ = ('index', 'key', 'name', 'title', 'completion_signal', 'division_index', 'printer',
+                 'nutrunner', 'log_key', 'max_children', 'part_number', 'part_name', 'division')
+
+    def __init__(self, index, key, name, title="", completion_signal=None, division_index=None,
+                 printer=DEFAULT_PRINTER, nutrunner="", log_key="", max_children=DEFAULT_MAX_CHILDREN,
+                 part_number="", part_name="", division=""):
+        self.index = index
+        self.key = key                          # 로그/카운터/설정 키 (예: front_lh)
+        self.name = name                        # 패널명 (예: FRONT/LH) - 작업 흐름/스캔/로그 기록용
+        self.title = title or name              # 화면 표시 타이틀
+        self.completion_signal = index + 1 if completion_signal is None else int(completion_signal)
+        self.division_index = index if division_index is None else int(division_index)
+        self.printer = printer or DEFAULT_PRINTER
+        self.nutrunner = nutrunner or ""        # 체결 결과를 받을 너트런너 장비명 (없으면 체결 결과 없음)
+        self.log_key = log_key or key           # 로그 파일 접두어
+        self.max_children = max(0, int(max_children))
+        self.part_number = part_number
+        self.part_name = part_name
+        self.division = division
+
+    @property
+    def division_field(self):
+        """PLC 데이터(plc_data) 구분값 키 (예: front_lh_division)"""
+        return f"{self.key}_division"
+
+    def __repr__(self):
+        return f"Station({self.name}, 완료신호={self.completion_signal}, 구분값={self.division_index})"
+
+
+class StationLayout:
+    """스테이션 목록 + 이름/키/완료신호 조회 사전"""
+
+    def __init__(self, stations):
+        self.stations = tuple(stations)
+        self.by_name = {}
+        self.by_key = {}
+        self.by_signal = {}
+        self.by_nutrunner = {}
+        for station in self.stations:
+            self.by_name[station.name.upper()] = station
+            self.by_key[station.key] = station
+            self.by_signal[station.completion_signal] = station
+            if station.nutrunner:
+                self.by_nutrunner[station.nutrunner] = station
+        # PLC 데이터에서 읽어야 하는 구분값 수 (완료신호 1자리 + 구분값)
+        self.division_count = max((station.division_index + 1 for station in self.stations), default=0)
+
+    @classmethod
+    def from_config(cls, config):
+        """admin_panel_config.json 의 stations 항목으로 생성 (없거나 잘못되면 기존 2패널)"""
+        entries = (config or {}).get("stations") or DEFAULT_STATIONS
+        stations = []
+        keys, names, signals, nutrunners = set(), set(), set(), set()
+        for entry in entries:
+            try:
+                name = str(entry.get("name") or entry.get("key") or "").strip()
+                key = str(entry.get("key") or station_key(name)).strip()
+                if not name or not key:
+                    raise ValueError("name/key 없음")
+                station = Station(len(stations), key, name, title=entry.get("title", ""),
+                                  completion_signal=entry.get("completion_signal"),
+                                  division_index=entry.get("division_index"),
+                                  printer=entry.get("printer", DEFAULT_PRINTER),
+                                  nutrunner=str(entry.get("nutrunner") or "").strip(),
+                                  log_key=entry.get("log_key", ""),
+                                  max_children=entry.get("max_children", DEFAULT_MAX_CHILDREN),
+                                  part_number=entry.get("part_number", ""),
+                                  part_name=entry.get("part_name", ""),
+                                  division=entry.get("division", ""))
+                if not 1 <= station.completion_signal <= MAX_COMPLETION_SIGNAL:
+                    # PLC 완료신호는 1자리 - 10 이상이면 완료될 수 없음
+                    raise ValueError(f"완료신호는 1~{MAX_COMPLETION_SIGNAL} (0 = 작업중)")
+                if key in keys or name.upper() in names or station.completion_signal in signals:
+                    raise ValueError("키/이름/완료신호 중복")
+                if station.nutrunner and station.nutrunner in nutrunners:
+                    # 체결 결과는 공구 기준으로 스테이션을 정함 - 공구 1대는 스테이션 1개에만
+                    raise ValueError(f"너트런너 중복: {station.nutrunner}")
+            except Exception as e:
+                logger.error("스테이션 설정 오류 (무시): %s - %s", entry, e)
+                continue
+            keys.add(key)
+            names.add(name.upper())
+            signals.add(station.completion_signal)
+            if station.nutrunner:
+                nutrunners.add(station.nutrunner)
+            stations.append(station)
+        if not stations:
+            logger.error("사용할 수 있는 스테이션 설정 없음 - 기존 2패널 구성 사용")
+            return cls.from_config({})
+        return cls(stations)
+
+    def __iter__(self):
+        return iter(self.stations)
+
+    def __len__(self):
+        return len(self.stations)
+
+    def get(self, name_or_key):
+        """패널명(대소문자 무시) 또는 키로 조회 - 없으면 None"""
+        if not name_or_key:
+            return None
+        return self.by_name.get(str(name_or_key).upper()) or self.by_key.get(name_or_key)
+
+    def for_signal(self, completion_signal):
+        """PLC 완료신호 → 스테이션 (0/알 수 없는 신호는 None)"""
+        return self.by_signal.get(completion_signal)
+
+    def for_nutrunner(self, tool):
+        """너트런너 장비명 → 스테이션 (연결되지 않은 공구는 None)"""
+        return self.by_nutrunner.get(tool)
+
+    def names(self):
+        return [station.name for station in self.stations]
+
+    def keys(self):
+        return [station.key for station in self.stations]
+
+    def printers(self):
+        """스테이션이 사용하는 프린터 장비명 (중복 제거, 순서 유지)"""
+        return list(dict.fromkeys(station.printer for station in self.stations))
+
+    def divisions(self, division_text):
+        """PLC 구분값 문자열(완료신호 다음 자리들) → {스테이션 키: 구분값}"""
+        return {station.key: division_text[station.division_index]
+                if station.division_index < len(division_text) else ""
+                for station in self.stations}
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+생산 속도 지표 (UPH / 택트 / 사이클타임 분포 / 비가동 시간)
+패널별 작업완료 이벤트만으로 계산한다.
+- 최근 window 구간을 고정 크기 시간 버킷 링으로 관리 → 완료 1건 반영은 상수 시간
+- 사이클타임 분포는 고정 구간 히스토그램 (만료 버킷은 빼기만 하면 됨) → p95 도 상수 시간
+- 완료 간격이 idle_threshold 를 넘으면 사이클이 아니라 비가동 시간으로 집계
+"""
+
+import time
+import threading
+
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BUCKET_SECONDS = 60       # 버킷 1개 = 1분
+DEFAULT_WINDOW_MINUTES = 60       # 최근 1시간 기준
+DEFAULT_IDLE_THRESHOLD = 300      # 5분 이상 간격은 비가동
+HISTOGRAM_BIN_SECONDS = 1         # 사이클타임 분포 구간 (초)
+
+
+class _Bucket:
+    __slots__ = ('slot', 'units', 'cycle_sum', 'cycles', 'idle', 'hist')
+
+    def __init__(self):
+        self.reset(-1)
+
+    def reset(self, slot):
+        self.slot = slot
+        self.units = 0
+        self.cycle_sum = 0.0
+        self.cycles = 0
+        self.idle = 0.0
+        self.hist = {}
+
+
+class PanelThroughput:
+    """패널 하나의 최근 window 생산 속도 집계"""
+
+    def __init__(self, bucket_seconds=DEFAULT_BUCKET_SECONDS, window_minutes=DEFAULT_WINDOW_MINUTES,
+                 idle_threshold=DEFAULT_IDLE_THRESHOLD):
+        self.bucket_seconds = bucket_seconds
+        self.bucket_count = max(1, int(window_minutes * 60 // bucket_seconds))
+        self.idle_threshold = idle_threshold
+        self.max_bin = int(idle_threshold // HISTOGRAM_BIN_SECONDS)
+        self._buckets = [_Bucket() for _ in range(self.bucket_count)]
+
+        # window 전체 합계 (버킷 만료 시 빼서 유지)
+        self.units = 0
+        self.cycle_sum = 0.0
+        self.cycles = 0
+        self.idle = 0.0
+        self._hist = [0] * (self.max_bin + 1)
+
+        self.first_time = None
+        self.last_time = None
+
+    def _bucket(self, now):
+        """now가 속한 버킷 (오래된 버킷이면 합계에서 빼고 재사용)"""
+        slot = int(now // self.bucket_seconds)
+        bucket = self._buckets[slot % self.bucket_count]
+        if bucket.slot != slot:
+            self._expire(bucket)
+            bucket.reset(slot)
+        return bucket
+
+    def _expire(self, bucket):
+        self.units -= bucket.units
+        self.cycle_sum -= bucket.cycle_sum
+        self.cycles -= bucket.cycles
+        self.idle -= bucket.idle
+        for index, count in bucket.hist.items():
+            self._hist[index] -= count
+
+    def _expire_old(self, now):
+        """window 밖으로 나간 버킷 정리 (조회 시 호출, 버킷 수만큼 고정 비용)"""
+        oldest = int(now // self.bucket_seconds) - self.bucket_count + 1
+        for bucket in self._buckets:
+            if 0 <= bucket.slot < oldest:
+                self._expire(bucket)
+                bucket.reset(-1)
+
+    def record(self, now):
+        """작업완료 1건 반영"""
+        bucket = self._bucket(now)
+        bucket.units += 1
+        self.units += 1
+        if self.last_time is not None:
+            gap = max(0.0, now - self.last_time)
+            if gap >= self.idle_threshold:
+                bucket.idle += gap
+                self.idle += gap
+            else:
+                index = min(int(gap // HISTOGRAM_BIN_SECONDS), self.max_bin)
+                bucket.cycle_sum += gap
+                bucket.cycles += 1
+                bucket.hist[index] = bucket.hist.get(index, 0) + 1
+                self.cycle_sum += gap
+                self.cycles += 1
+                self._hist[index] += 1
+        if self.first_time is None:
+            self.first_time = now
+        self.last_time = now
+
+    def percentile(self, ratio):
+        """사이클타임 분위수 (초, 구간 상한값)"""
+        if self.cycles <= 0:
+            return 0.0
+        target = self.cycles * ratio
+        seen = 0
+        for index, count in enumerate(self._hist):
+            seen += count
+            if seen >= target:
+                return float((index + 1) * HISTOGRAM_BIN_SECONDS)
+        return float(self.idle_threshold)
+
+    def snapshot(self, now):
+        self._expire_old(now)
+        window = self.bucket_count * self.bucket_seconds
+        elapsed = min(window, now - self.first_time) if self.first_time is not None else 0
+        # 현재 진행 중인 무작업 구간도 비가동으로 표시
+        current_gap = now - self.last_time if self.last_time is not None else 0.0
+        idle = self.idle + (current_gap if current_gap >= self.idle_threshold else 0.0)
+        return {
+            "units": self.units,
+            "uph": self.units * 3600.0 / elapsed if elapsed >= self.bucket_seconds else float(self.units),
+            "avg_cycle": self.cycle_sum / self.cycles if self.cycles else 0.0,
+            "p95_cycle": self.percentile(0.95),
+            "idle_seconds": min(idle, window),
+            "since_last": current_gap,
+        }
+
+
+class ThroughputMetrics:
+    """패널별 생산 속도 지표 - record_completion 은 작업완료 시, snapshot 은 화면 갱신 주기마다 호출"""
+
+    def __init__(self, bucket_seconds=DEFAULT_BUCKET_SECONDS, window_minutes=DEFAULT_WINDOW_MINUTES,
+                 idle_threshold=DEFAULT_IDLE_THRESHOLD, takt_seconds=0, clock=time.time):
+        self.bucket_seconds = bucket_seconds
+        self.window_minutes = window_minutes
+        self.idle_threshold = idle_threshold
+        self.takt_seconds = takt_seconds
+        self._clock = clock
+        self._panels = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """admin_panel_config.json 의 production_metrics 항목으로 생성"""
+        settings = (config or {}).get("production_metrics", {})
+        return cls(bucket_seconds=int(settings.get("bucket_seconds", DEFAULT_BUCKET_SECONDS)),
+                   window_minutes=int(settings.get("window_minutes", DEFAULT_WINDOW_MINUTES)),
+                   idle_threshold=float(settings.get("idle_threshold", DEFAULT_IDLE_THRESHOLD)),
+                   takt_seconds=float(settings.get("takt_seconds", 0)))
+
+    def _panel(self, panel_name):
+        panel = self._panels.get(panel_name)
+        if panel is None:
+            panel = PanelThroughput(self.bucket_seconds, self.window_minutes, self.idle_threshold)
+            self._panels[panel_name] = panel
+        return panel
+
+    def record_completion(self, panel_name, now=None):
+        with self._lock:
+            self._panel(panel_name).record(self._clock() if now is None else now)
+
+    def snapshot(self, panel_name, now=None):
+        """패널 지표 dict (uph, avg_cycle, p95_cycle, idle_seconds, takt, slow ...)"""
+        with self._lock:
+            result = self._panel(panel_name).snapshot(self._clock() if now is None else now)
+        result["takt"] = self.takt_seconds
+        result["window_minutes"] = self.window_minutes
+        # 목표 택트가 설정된 경우 p95 사이클타임이 택트를 넘으면 지연 공정으로 표시
+        result["slow"] = bool(self.takt_seconds) and result["p95_cycle"] > self.takt_seconds
+        return result
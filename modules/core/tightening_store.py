@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+너트런너 체결 결과 저장소
+- 결과는 수신 즉시(읽기 스레드) 1행 기록, 라벨 출력 시 부모 추적정보(T필드)를 붙인다
+- 부품 시리얼(부모 추적정보)/수신일시/공구 인덱스로 조회 - 추적 인덱스와 같은 sqlite3 (WAL)
+"""
+
+import os
+import atexit
+import sqlite3
+import threading
+
+from .duplicate_index import barcode_fields
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+TIGHTENING_DB = os.path.join("data", "tightening.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tightenings (
+    id INTEGER PRIMARY KEY,
+    received_at TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    status TEXT NOT NULL,
+    torque REAL,
+    angle REAL,
+    pset TEXT,
+    bolt TEXT,
+    tightening_id TEXT,
+    vin TEXT,
+    panel TEXT,
+    part_number TEXT,
+    cycle_id INTEGER,
+    part_serial TEXT,
+    parent_barcode TEXT,
+    raw TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tightenings_serial ON tightenings(part_serial);
+CREATE INDEX IF NOT EXISTS idx_tightenings_date ON tightenings(received_at);
+CREATE INDEX IF NOT EXISTS idx_tightenings_tool_date ON tightenings(tool, received_at);
+"""
+
+_FIELD_STRIP = " \r\n"
+
+
+class TighteningStore:
+    """체결 결과 저장/조회 (프로세스 공용 인스턴스는 shared())"""
+
+    _shared = None
+
+    def __init__(self, path=TIGHTENING_DB):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        atexit.register(self.close)
+
+    @classmethod
+    def shared(cls):
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    # ===== 기록 =====
+
+    def record(self, result):
+        """체결 결과 1건 기록 (읽기 스레드) - result.row_id 설정"""
+        try:
+            with self._lock, self._conn:
+                cursor = self._conn.execute(
+                    "INSERT INTO tightenings (received_at, tool, status, torque, angle, pset, bolt, tightening_id, "
+                    "vin, raw) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (result.received_at.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3], result.tool, result.status,
+                     result.torque, result.angle, result.pset, result.bolt, result.tightening_id,
+                     result.vin, result.raw))
+            result.row_id = cursor.lastrowid
+        except Exception as e:
+            logger.error("체결 결과 기록 실패: %s - %s", result, e)
+
+    def link_cycle(self, cycle, parent_barcode):
+        """라벨 출력 - 사이클에 붙은 체결 결과에 부품 시리얼(부모 추적정보) 연결"""
+        row_ids = [result.row_id for result in getattr(cycle, 'tightenings', None) or []
+                   if result.row_id is not None]
+        if not row_ids:
+            return 0
+        _, trace = barcode_fields(parent_barcode)
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "UPDATE tightenings SET panel = ?, part_number = ?, cycle_id = ?, part_serial = ?, "
+                    "parent_barcode = ? WHERE id = ?",
+                    [(cycle.panel, cycle.part_number, cycle.cycle_id, trace or "", parent_barcode, row_id)
+                     for row_id in row_ids])
+        except Exception as e:
+            logger.error("체결 결과 부품 시리얼 연결 실패: %s - %s", trace, e)
+            return 0
+        return len(row_ids)
+
+    # ===== 조회 =====
+
+    def _select(self, where, params, limit):
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM tightenings WHERE {where} ORDER BY received_at DESC LIMIT ?",
+                (*params, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def by_serial(self, part_serial, limit=100):
+        """부품 시리얼(부모 T필드 추적정보 또는 부모 바코드 전체)로 체결 이력 조회"""
+        _, trace = barcode_fields(part_serial)
+        return self._select("part_serial = ?", ((trace or part_serial).strip(_FIELD_STRIP),), limit)
+
+    def by_date(self, date_from, date_to, tool=None, limit=1000):
+        """수신일자 범위(YYYY-MM-DD, 포함) [+ 공구] 조회"""
+        where, params = "received_at >= ? AND received_at < ?", [str(date_from), f"{date_to} 99"]
+        if tool:
+            where = "tool = ? AND " + where
+            params.insert(0, tool)
+        return self._select(where, params, limit)
+
+    def unlinked(self, limit=100):
+        """부품 시리얼이 연결되지 않은 결과 (사이클 없이 들어온 체결/출력 전 종료)"""
+        return self._select("part_serial IS NULL", (), limit)
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception as e:
+                logger.debug("체결 결과 저장소 종료 오류: %s", e)
+        if TighteningStore._shared is self:
+            TighteningStore._shared = None
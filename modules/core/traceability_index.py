@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+부모 라벨 ↔ 하위부품 바코드 추적 인덱스
+라벨 출력 1건 = 부모(공정부품 T필드 추적정보) 1행 + 사용된 하위부품 N행.
+- 부모 추적정보 → 하위부품, 하위부품 추적정보 → 부모 양방향 조회
+- 부품번호/출력일자 인덱스로 기간·품번 조회 (리콜 시 다건 조회)
+- 저장: 표준 라이브러리 sqlite3 (WAL) - 수년치 데이터도 인덱스 조회라 파일 전체를 읽지 않음
+- 인덱스가 비어 있으면 기존 print_logs 텍스트(부모바코드_데이터 + 하위부품N_바코드)에서 만든다
+"""
+
+import os
+import re
+import atexit
+import sqlite3
+import threading
+from datetime import datetime
+
+from .duplicate_index import barcode_fields
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+TRACE_DB = os.path.join("data", "traceability.db")
+LOG_ROOT = "logs"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parents (
+    id INTEGER PRIMARY KEY,
+    parent_trace TEXT NOT NULL,
+    part_number TEXT NOT NULL,
+    printed_at TEXT NOT NULL,
+    panel TEXT,
+    barcode TEXT
+);
+CREATE TABLE IF NOT EXISTS children (
+    parent_id INTEGER NOT NULL REFERENCES parents(id),
+    child_part TEXT,
+    child_trace TEXT,
+    barcode TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_parents_trace ON parents(parent_trace);
+CREATE INDEX IF NOT EXISTS idx_parents_part_date ON parents(part_number, printed_at);
+CREATE INDEX IF NOT EXISTS idx_parents_date ON parents(printed_at);
+CREATE INDEX IF NOT EXISTS idx_children_trace ON children(child_trace);
+CREATE INDEX IF NOT EXISTS idx_children_part ON children(child_part);
+CREATE INDEX IF NOT EXISTS idx_children_parent ON children(parent_id);
+"""
+
+# print_logs 텍스트 파일 항목
+_PRINT_HEADER = re.compile(r'^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] 공정부품: (.*)$')
+_CHILD_BARCODE = re.compile(r'^하위부품(\d+)_바코드: ?(.*)$')
+_CHILD_PART = re.compile(r'^하위부품(\d+): ?(.*)$')
+
+_FIELD_STRIP = " \r\n"      # 바코드 제어문자(\x1d, \x1e)는 공백으로 취급되므로 strip() 대신 사용
+
+
+class TraceabilityIndex:
+    """부모 라벨 ↔ 하위부품 추적 인덱스 (프로세스 공용 인스턴스는 shared())"""
+
+    _shared = None
+    _holders = 0                    # shared() 를 가져간 곳 수 - 모두 release() 하면 닫음
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path=TRACE_DB):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def shared(cls):
+        """메인 화면과 이력 화면이 함께 쓰는 인스턴스 (비어 있으면 로그에서 생성)
+        가져간 곳은 다 쓰면 close() 대신 release() - 다른 화면이 쓰는 중이면 닫지 않음"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                cls._holders = 0
+                atexit.register(cls._shared.close)
+                if cls._shared.is_empty():
+                    cls._shared.rebuild()
+            cls._holders += 1
+            return cls._shared
+
+    def release(self):
+        """shared() 로 가져간 인스턴스 반납 - 마지막 사용자가 반납하면 닫음"""
+        with TraceabilityIndex._shared_lock:
+            if TraceabilityIndex._shared is self:
+                TraceabilityIndex._holders -= 1
+                if TraceabilityIndex._holders > 0:
+                    return
+        self.close()
+
+    def is_empty(self):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM parents LIMIT 1").fetchone() is None
+
+    # ===== 기록 =====
+
+    def _insert(self, parent_barcode, part_number, children, printed_at, panel_name):
+        """lock 보유 + 트랜잭션 안에서 호출 - children: [(하위부품번호, 바코드)]"""
+        parent_part, parent_trace = barcode_fields(parent_barcode)
+        cursor = self._conn.execute(
+            "INSERT INTO parents (parent_trace, part_number, printed_at, panel, barcode) VALUES (?, ?, ?, ?, ?)",
+            (parent_trace or "", parent_part or part_number or "", printed_at, panel_name, parent_barcode))
+        rows = []
+        for child_part, child_barcode in children:
+            barcode_part, child_trace = barcode_fields(child_barcode)
+            rows.append((cursor.lastrowid, barcode_part or child_part, child_trace, child_barcode))
+        self._conn.executemany(
+            "INSERT INTO children (parent_id, child_part, child_trace, barcode) VALUES (?, ?, ?, ?)", rows)
+
+    def record(self, parent_barcode, part_number, children, panel_name=None, printed_at=None):
+        """라벨 출력 1건 기록 (children: [(하위부품번호, 원본 바코드)])"""
+        printed_at = (printed_at or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            with self._lock, self._conn:
+                self._insert(parent_barcode, part_number, children, printed_at, panel_name)
+        except Exception as e:
+            logger.error("추적 인덱스 기록 실패: %s - %s", part_number, e)
+
+    # ===== 조회 =====
+
+    def _parents(self, where, params, limit):
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM parents WHERE {where} ORDER BY printed_at DESC LIMIT ?", (*params, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def parents_by_trace(self, parent_trace, limit=100):
+        """부모 T필드 추적정보(또는 부모 바코드 전체)로 출력 이력 조회"""
+        _, trace = barcode_fields(parent_trace)
+        trace = (trace or parent_trace or "").strip(_FIELD_STRIP)
+        if not trace.strip():
+            return []   # 빈 입력은 추적정보가 없는 행 전체와 일치하므로 조회하지 않음
+        return self._parents("parent_trace = ?", (trace,), limit)
+
+    def parents_by_part(self, part_number, date_from=None, date_to=None, limit=1000):
+        """부모 부품번호 + 출력일자 범위(YYYY-MM-DD, 포함)로 조회"""
+        where, params = "part_number = ?", [part_number]
+        if date_from:
+            where += " AND printed_at >= ?"
+            params.append(str(date_from))
+        if date_to:
+            where += " AND printed_at < ?"
+            params.append(f"{date_to} 99")   # 해당 일자 끝까지 포함
+        return self._parents(where, params, limit)
+
+    def parents_by_date(self, date_from, date_to, limit=1000):
+        return self._parents("printed_at >= ? AND printed_at < ?", (str(date_from), f"{date_to} 99"), limit)
+
+    def children_of(self, parent_id):
+        """부모 → 사용된 하위부품 목록"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT child_part, child_trace, barcode FROM children WHERE parent_id = ?", (parent_id,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def parents_of_child(self, child_trace, child_part=None, limit=100):
+        """하위부품 T필드 추적정보(또는 하위부품 바코드 전체) → 이 하위부품을 사용한 부모 목록"""
+        part, trace = barcode_fields(child_trace)
+        trace = (trace or child_trace or "").strip(_FIELD_STRIP)
+        if not trace.strip():
+            return []
+        child_part = child_part or part
+        query = ("SELECT p.*, c.child_part, c.child_trace FROM children c JOIN parents p ON p.id = c.parent_id "
+                 "WHERE c.child_trace = ?")
+        params = [trace]
+        if child_part:
+            query += " AND c.child_part = ?"
+            params.append(child_part)
+        query += " ORDER BY p.printed_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def lookup(self, text, limit=100):
+        """입력값으로 양방향 조회 - {'parents': 부모 목록, 'child_of': 하위부품으로 찾은 부모 목록}
+        추적정보 전체가 아닌 일련번호(예: '0000009')만 입력한 경우 부모 추적정보 끝자리로 찾는다."""
+        text = (text or "").strip(_FIELD_STRIP)
+        if not text.strip():
+            return {"parents": [], "child_of": []}
+        parents = self.parents_by_trace(text, limit)
+        if not parents and text.isdigit():
+            parents = self._parents("parent_trace LIKE ?", ("%" + text,), limit)
+        return {"parents": parents, "child_of": self.parents_of_child(text, limit=limit)}
+
+    # ===== 로그에서 재구성 =====
+
+    def rebuild(self, log_root=LOG_ROOT):
+        """기존 print_logs 텍스트 파일에서 인덱스 다시 만들기 (부모 건수 반환)"""
+        entries = []
+        for directory, _, file_names in os.walk(log_root):
+            if os.path.basename(directory) != "print_logs":
+                continue
+            for file_name in sorted(file_names):
+                if file_name.endswith(".txt"):
+                    try:
+                        entries.extend(self._read_print_log(os.path.join(directory, file_name)))
+                    except Exception as e:
+                        logger.error("추적 인덱스 재구성 - 로그 읽기 실패: %s - %s", file_name, e)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM children")
+            self._conn.execute("DELETE FROM parents")
+            for entry in entries:
+                children = [entry["children"][index] for index in sorted(entry["children"])]
+                self._insert(entry.get("barcode", ""), entry["part"], children, entry["time"], entry.get("panel"))
+        logger.info("추적 인덱스 재구성 완료 - 라벨 %s건 (%s)", len(entries), log_root)
+        return len(entries)
+
+    @staticmethod
+    def _read_print_log(path):
+        """print_log_*.txt → 출력 성공 항목 목록"""
+        entries = []
+        entry = None
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                text = line.strip(_FIELD_STRIP)
+                match = _PRINT_HEADER.match(text)
+                if match:
+                    entry = {"time": match.group(1), "part": match.group(2), "children": {}}
+                    continue
+                if entry is None:
+                    continue
+                if text == "---":
+                    if entry.get("result") == "SUCCESS":
+                        entries.append(entry)
+                    entry = None
+                elif text.startswith("부모바코드_데이터:"):
+                    entry["barcode"] = text.split(":", 1)[1].strip(_FIELD_STRIP)
+                elif text.startswith("출력결과:"):
+                    entry["result"] = text.split(":", 1)[1].strip(_FIELD_STRIP)
+                elif text.startswith("패널명:"):
+                    entry["panel"] = text.split(":", 1)[1].strip(_FIELD_STRIP)
+                else:
+                    child = _CHILD_BARCODE.match(text)
+                    if child:
+                        index = int(child.group(1))
+                        part = entry["children"].get(index, ("", ""))[0]
+                        entry["children"][index] = (part, child.group(2))
+                        continue
+                    child = _CHILD_PART.match(text)
+                    if child:
+                        index = int(child.group(1))
+                        barcode = entry["children"].get(index, ("", ""))[1]
+                        entry["children"][index] = (child.group(2), barcode)
+        return entries
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+        with TraceabilityIndex._shared_lock:
+            if TraceabilityIndex._shared is self:
+                TraceabilityIndex._shared = None
+                TraceabilityIndex._holders = 0
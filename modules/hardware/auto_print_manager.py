@@ -3,11 +3,16 @@
 하위부품 스캔 완료 + 작업완료 신호 시 자동 출력
 """
 import json
+import logging
 import os
 import time
 import serial
 from datetime import datetime
 from PyQt5.QtCore import QObject, pyqtSignal
+from ..core.station_config import StationLayout, DEFAULT_PRINTER
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
 
 
 class AutoPrintManager(QObject):
@@ -24,18 +29,19 @@ class AutoPrintManager(QObject):
         self.serial_port = None
         self.print_config = self.load_print_config()
         
-        # 출력 상태 추적 (중복 출력 방지)
-        self.print_status = {
-            'front_lh': {'printed': False, 'last_part': None, 'last_time': None},
-            'rear_rh': {'printed': False, 'last_part': None, 'last_time': None}
-        }
+        # 스테이션 구성 (패널별 프린터 장비) - 메인 화면 구성 우선, 없으면 기존 2패널
+        self.stations = getattr(main_window, 'station_layout', None) or StationLayout.from_config({})
+        
+        # 출력 상태 추적 (중복 출력 방지) - 스테이션 키별
+        self.print_status = {station.key: {'printed': False, 'last_part': None, 'last_time': None}
+                             for station in self.stations}
         
         # 출력에 사용된 하위부품 정보 저장 (로그 저장용)
         self.printed_child_parts = {}
         
         self.init_serial_connection()
         
-        print("DEBUG: AutoPrintManager 초기화 완료")
+        logger.debug("AutoPrintManager 초기화 완료")
     
     def load_print_config(self):
         """출력 설정 로드 - admin_panel_config.json 사용"""
@@ -60,14 +66,16 @@ class AutoPrintManager(QObject):
                         "stopbits": serial_config.get('stopbits', 1),
                         "timeout": serial_config.get('timeout', 1)
                     },
+                    # 전송 후 프린터 처리 대기 시간 (초)
+                    "settle_seconds": float(printer_config.get('settle_seconds', 2.0)),
                     "zpl_template": admin_config.get('zpl_template', 'default'),
                     "auto_print_enabled": admin_config.get('auto_print_enabled', True)
                 }
             else:
-                print(f"DEBUG: admin_panel_config.json 파일을 찾을 수 없습니다: {config_file}")
+                logger.debug("admin_panel_config.json 파일을 찾을 수 없습니다: %s", config_file)
                 return {}
         except Exception as e:
-            print(f"DEBUG: 출력 설정 로드 오류: {e}")
+            logger.error("출력 설정 로드 오류: %s", e)
             return {}
     
     def save_print_config(self, config):
@@ -93,9 +101,9 @@ class AutoPrintManager(QObject):
             with open(config_file, 'w', encoding='utf-8') as f:
                 json.dump(admin_config, f, ensure_ascii=False, indent=2)
                 
-            print(f"DEBUG: 프린터 설정이 admin_panel_config.json에 저장되었습니다")
+            logger.debug("프린터 설정이 admin_panel_config.json에 저장되었습니다")
         except Exception as e:
-            print(f"DEBUG: 출력 설정 저장 오류: {e}")
+            logger.error("출력 설정 저장 오류: %s", e)
     
     def init_serial_connection(self):
         """시리얼 연결 초기화 - SerialConnectionManager 사용"""
@@ -103,21 +111,22 @@ class AutoPrintManager(QObject):
             # AutoPrintManager는 자체 시리얼 연결을 하지 않고
             # SerialConnectionManager의 연결을 사용
             self.serial_port = None
-            print("DEBUG: AutoPrintManager - SerialConnectionManager 연결 사용")
+            logger.debug("AutoPrintManager - SerialConnectionManager 연결 사용")
         except Exception as e:
-            print(f"DEBUG: AutoPrintManager 초기화 실패: {e}")
+            logger.error("AutoPrintManager 초기화 실패: %s", e)
             self.serial_port = None
     
     def execute_auto_print(self, panel_type, process_part, child_parts_scanned):
         """자동 출력 실행"""
         try:
-            print(f"DEBUG: ===== {panel_type} 패널 자동 출력 시작 =====")
-            print(f"DEBUG: 공정부품: {process_part.get('part_number', '')}")
-            print(f"DEBUG: 스캔된 하위부품: {len(child_parts_scanned) if child_parts_scanned else 0}개")
+            logger.debug("===== %s 패널 자동 출력 시작 =====", panel_type)
+            station = self.stations.get(panel_type)
+            logger.debug("공정부품: %s", process_part.get('part_number', ''))
+            logger.debug("스캔된 하위부품: %s개", len(child_parts_scanned) if child_parts_scanned else 0)
             
             # 중복 출력 방지 체크
             if self.is_already_printed(panel_type, process_part):
-                print(f"DEBUG: {panel_type} 패널 이미 출력됨 - 중복 출력 방지")
+                logger.debug("%s 패널 이미 출력됨 - 중복 출력 방지", panel_type)
                 return True
             
             # 출력 시작 시그널
@@ -125,76 +134,79 @@ class AutoPrintManager(QObject):
             
             # 1. 하위부품 스캔 검증
             if not self.validate_child_parts_scanning(process_part, child_parts_scanned):
-                print(f"DEBUG: 하위부품 스캔 검증 실패 - 출력 중단")
+                logger.debug("하위부품 스캔 검증 실패 - 출력 중단")
                 self.print_failed.emit(panel_type, "하위부품 스캔 검증 실패")
                 return False
             
             # 2. HKMC 바코드 데이터 생성
-            hkmc_data = self.generate_hkmc_barcode(process_part, child_parts_scanned)
+            hkmc_data = self.generate_hkmc_barcode(process_part, child_parts_scanned, panel_type)
             if not hkmc_data:
-                print(f"DEBUG: HKMC 바코드 데이터 생성 실패")
+                logger.debug("HKMC 바코드 데이터 생성 실패")
                 self.print_failed.emit(panel_type, "바코드 데이터 생성 실패")
                 return False
             
             # 3. ZPL 템플릿 생성
             zpl_data = self.generate_zpl_template(process_part, hkmc_data)
             if not zpl_data:
-                print(f"DEBUG: ZPL 템플릿 생성 실패")
+                logger.debug("ZPL 템플릿 생성 실패")
                 self.print_failed.emit(panel_type, "ZPL 템플릿 생성 실패")
                 return False
             
-            # 4. 프린터로 전송
-            if self.send_to_printer(zpl_data):
-                print(f"DEBUG: ===== {panel_type} 패널 출력 완료 =====")
+            # 4. 프린터로 전송 (스테이션에 지정된 프린터)
+            if self.send_to_printer(zpl_data, station.printer if station else DEFAULT_PRINTER):
+                logger.debug("===== %s 패널 출력 완료 =====", panel_type)
                 # 출력 완료 상태 업데이트
                 self.mark_as_printed(panel_type, process_part)
                 
                 # 출력에 사용된 하위부품 정보 저장 (로그 저장용)
-                panel_name = self.main_window.panel_titles.get(panel_type, panel_type)
+                panel_name = station.name if station else self.main_window.panel_titles.get(panel_type, panel_type)
                 self.printed_child_parts[panel_name] = child_parts_scanned.copy() if child_parts_scanned else []
-                print(f"DEBUG: 출력에 사용된 하위부품 정보 저장: {panel_name} - {len(self.printed_child_parts[panel_name])}개")
+                logger.debug("출력에 사용된 하위부품 정보 저장: %s - %s개", panel_name, len(self.printed_child_parts[panel_name]))
                 
                 self.print_completed.emit(panel_type, True)
                 return True
             else:
-                print(f"DEBUG: ===== {panel_type} 패널 출력 실패 =====")
+                logger.debug("===== %s 패널 출력 실패 =====", panel_type)
                 self.print_failed.emit(panel_type, "프린터 전송 실패")
                 return False
                 
         except Exception as e:
-            print(f"DEBUG: {panel_type} 패널 자동 출력 오류: {e}")
+            logger.error("%s 패널 자동 출력 오류: %s", panel_type, e)
             self.print_failed.emit(panel_type, str(e))
             return False
     
     def validate_child_parts_scanning(self, process_part, child_parts_scanned):
         """하위부품 스캔 검증"""
         try:
-            print(f"DEBUG: 하위부품 스캔 검증 시작")
-            print(f"DEBUG: 공정부품: {process_part.get('part_number', '')}")
-            print(f"DEBUG: 스캔된 하위부품: {len(child_parts_scanned) if child_parts_scanned else 0}개")
+            logger.debug("하위부품 스캔 검증 시작")
+            logger.debug("공정부품: %s", process_part.get('part_number', ''))
+            logger.debug("스캔된 하위부품: %s개", len(child_parts_scanned) if child_parts_scanned else 0)
             
             # 1. 공정부품의 하위부품 정보 가져오기
             process_part_number = process_part.get('part_number', '')
+            process_division = str(process_part.get('division') or '').strip()
             expected_child_parts = []
             
-            # 메인 윈도우에서 해당 공정부품의 하위부품 정보 찾기
+            # 메인 윈도우에서 해당 공정부품의 하위부품 정보 찾기 (같은 부품번호는 구분값으로 구분)
             if hasattr(self.main_window, 'master_data') and self.main_window.master_data:
                 for part_data in self.main_window.master_data:
-                    if part_data.get('part_number') == process_part_number:
+                    if part_data.get('part_number') == process_part_number and (
+                            not process_division or str(part_data.get('division', '')).strip() == process_division):
                         expected_child_parts = part_data.get('child_parts', [])
-                        print(f"DEBUG: 예상 하위부품: {len(expected_child_parts)}개")
-                        for child in expected_child_parts:
-                            print(f"DEBUG: - {child.get('part_number', '')}")
+                        logger.debug("예상 하위부품: %s개", len(expected_child_parts))
+                        if logger.isEnabledFor(logging.DEBUG):
+                            for child in expected_child_parts:
+                                logger.debug("- %s", child.get('part_number', ''))
                         break
             
             # 2. 하위부품이 없으면 출력 허용
             if not expected_child_parts:
-                print(f"DEBUG: 하위부품이 없음 - 출력 허용")
+                logger.debug("하위부품이 없음 - 출력 허용")
                 return True
             
             # 3. 하위부품이 있으면 스캔 검증
             if not child_parts_scanned:
-                print(f"DEBUG: 하위부품이 있지만 스캔되지 않음 - 출력 거부")
+                logger.debug("하위부품이 있지만 스캔되지 않음 - 출력 거부")
                 return False
             
             # 4. 사용유무 Y이고 출력포함여부 Y인 하위부품만 필터링
@@ -206,23 +218,23 @@ class AutoPrintManager(QObject):
                 # 사용유무가 Y이고 출력포함여부가 Y인 하위부품만 포함
                 if use_status == 'Y' and print_include == 'Y':
                     print_include_parts.append(child)
-                    print(f"DEBUG: - {child.get('part_number', '')} (사용유무: {use_status}, 출력포함: {print_include})")
+                    logger.debug("- %s (사용유무: %s, 출력포함: %s)", child.get('part_number', ''), use_status, print_include)
                 else:
-                    print(f"DEBUG: - {child.get('part_number', '')} 제외 (사용유무: {use_status}, 출력포함: {print_include})")
+                    logger.debug("- %s 제외 (사용유무: %s, 출력포함: %s)", child.get('part_number', ''), use_status, print_include)
             
-            print(f"DEBUG: 사용유무 Y이고 출력포함여부 Y인 하위부품: {len(print_include_parts)}개")
+            logger.debug("사용유무 Y이고 출력포함여부 Y인 하위부품: %s개", len(print_include_parts))
             
             # 사용유무 Y이고 출력포함여부 Y인 하위부품이 없으면 출력 허용
             if not print_include_parts:
-                print(f"DEBUG: 사용유무 Y이고 출력포함여부 Y인 하위부품이 없음 - 출력 허용")
+                logger.debug("사용유무 Y이고 출력포함여부 Y인 하위부품이 없음 - 출력 허용")
                 return True
             
             # 5. 사용유무 Y이고 출력포함여부 Y인 하위부품이 모두 스캔되었는지 확인
             scanned_part_numbers = [child.get('part_number', '') for child in child_parts_scanned]
             expected_print_parts = [child.get('part_number', '') for child in print_include_parts]
             
-            print(f"DEBUG: 스캔된 부품번호: {scanned_part_numbers}")
-            print(f"DEBUG: 사용유무 Y이고 출력포함 예상 부품번호: {expected_print_parts}")
+            logger.debug("스캔된 부품번호: %s", scanned_part_numbers)
+            logger.debug("사용유무 Y이고 출력포함 예상 부품번호: %s", expected_print_parts)
             
             # 모든 사용유무 Y이고 출력포함 하위부품이 스캔되었는지 확인
             missing_parts = []
@@ -231,20 +243,20 @@ class AutoPrintManager(QObject):
                     missing_parts.append(expected_part)
             
             if missing_parts:
-                print(f"DEBUG: 미스캔 사용유무 Y이고 출력포함 하위부품: {missing_parts} - 출력 거부")
+                logger.debug("미스캔 사용유무 Y이고 출력포함 하위부품: %s - 출력 거부", missing_parts)
                 return False
             
-            print(f"DEBUG: 모든 사용유무 Y이고 출력포함 하위부품 스캔 완료 - 출력 허용")
+            logger.debug("모든 사용유무 Y이고 출력포함 하위부품 스캔 완료 - 출력 허용")
             return True
             
         except Exception as e:
-            print(f"DEBUG: 하위부품 스캔 검증 오류: {e}")
+            logger.error("하위부품 스캔 검증 오류: %s", e)
             return False
     
-    def generate_hkmc_barcode(self, process_part, child_parts_scanned):
+    def generate_hkmc_barcode(self, process_part, child_parts_scanned, panel_type=None):
         """HKMC 바코드 데이터 생성"""
         try:
-            print(f"DEBUG: HKMC 바코드 데이터 생성 시작")
+            logger.debug("HKMC 바코드 데이터 생성 시작")
             
             # 공정부품 정보
             part_number = process_part.get('part_number', '')
@@ -255,7 +267,7 @@ class AutoPrintManager(QObject):
             date_str = current_time.strftime('%y%m%d')  # YYMMDD 형식
             
             # 추적번호 생성 (7자리)
-            tracking_number = self.generate_tracking_number(part_number, date_str)
+            tracking_number = self.generate_tracking_number(part_number, date_str, panel_type)
             
             # HKMC 바코드 형식: [)>06V2812P89131CU217SE251016S1B1A0476217M04
             # 구성: [)> + 06 + V2812 + P + 부품번호 + S + E + T + 추적정보 + M + 04
@@ -296,7 +308,7 @@ class AutoPrintManager(QObject):
                                 initial_sample = init_val.upper()
                             break
             except Exception as e:
-                print(f"DEBUG: initial_sample 가져오기 오류: {e}")
+                logger.error("initial_sample 가져오기 오류: %s", e)
                 initial_sample = 'N'
             
             # 1. 공정부품 HKMC 바코드 생성 (ASCII 코드 포함)
@@ -327,7 +339,7 @@ class AutoPrintManager(QObject):
                 process_m_part = '\x1dM' + initial_sample
             process_hkmc_ascii = f"[)>\x1e06\x1d{supplier_code}\x1dP{part_number}{process_s_part}{process_e_part}\x1d{traceability_code}{serial_type}{tracking_number}{process_m_part}\x1d\x1e\x04"
             
-            print(f"DEBUG: 공정부품 HKMC: {process_hkmc}")
+            logger.debug("공정부품 HKMC: %s", process_hkmc)
             
             # 2. 하위부품 HKMC 바코드들 생성 (출력포함여부 Y인 것만)
             child_hkmc_list = []
@@ -349,11 +361,11 @@ class AutoPrintManager(QObject):
                 # 사용유무가 Y이고 출력포함여부가 Y인 하위부품만 포함
                 if use_status == 'Y' and print_include == 'Y':
                     print_include_parts.append(child)
-                    print(f"DEBUG: - {child.get('part_number', '')} (사용유무: {use_status}, 출력포함: {print_include})")
+                    logger.debug("- %s (사용유무: %s, 출력포함: %s)", child.get('part_number', ''), use_status, print_include)
                 else:
-                    print(f"DEBUG: - {child.get('part_number', '')} 제외 (사용유무: {use_status}, 출력포함: {print_include})")
+                    logger.debug("- %s 제외 (사용유무: %s, 출력포함: %s)", child.get('part_number', ''), use_status, print_include)
             
-            print(f"DEBUG: 사용유무 Y이고 출력포함여부 Y인 하위부품: {len(print_include_parts)}개")
+            logger.debug("사용유무 Y이고 출력포함여부 Y인 하위부품: %s개", len(print_include_parts))
             
             for child_data in child_parts_scanned:
                 child_part_number = child_data.get('part_number', '')
@@ -366,7 +378,7 @@ class AutoPrintManager(QObject):
                         break
                 
                 if not is_print_include:
-                    print(f"DEBUG: 하위부품 {child_part_number} 사용유무 N 또는 출력포함여부 N - 바코드에서 제외")
+                    logger.debug("하위부품 %s 사용유무 N 또는 출력포함여부 N - 바코드에서 제외", child_part_number)
                     continue
                 
                 child_serial_type = child_data.get('serial_type', 'A')  # 하위부품별 serial_type 사용
@@ -392,9 +404,9 @@ class AutoPrintManager(QObject):
                         child_e_part = '\x1dE' + eo_number
                     child_hkmc_ascii = f"[)>\x1e06\x1d{supplier_code}\x1dP{child_part_number}{child_s_part}{child_e_part}\x1d{traceability_code}{child_serial_type}{child_serial_number}\x1d\x1e\x04"
                     child_hkmc_list.append(child_hkmc_ascii)
-                    print(f"DEBUG: 하위부품 HKMC: {child_hkmc}")
-                    print(f"DEBUG: 하위부품 HKMC ASCII: {child_hkmc_ascii}")
-                    print(f"DEBUG: 하위부품 추적정보 - serial_type: {child_serial_type}, serial_number: {child_serial_number}")
+                    logger.debug("하위부품 HKMC: %s", child_hkmc)
+                    logger.debug("하위부품 HKMC ASCII: %s", child_hkmc_ascii)
+                    logger.debug("하위부품 추적정보 - serial_type: %s, serial_number: %s", child_serial_type, child_serial_number)
             
             # 3. 첨부 파일 방식으로 formatted_data 구성 (프린터용)
             # 공정바코드 (첨부 파일 방식 - ASCII 코드 없이)
@@ -435,7 +447,7 @@ class AutoPrintManager(QObject):
                         break
                 
                 if not is_print_include:
-                    print(f"DEBUG: 하위부품 {child_part_number} 출력포함여부 N - formatted_parts에서 제외")
+                    logger.debug("하위부품 %s 출력포함여부 N - formatted_parts에서 제외", child_part_number)
                     continue
                 
                 raw_barcode_data = child_data.get('raw_data', '')  # raw_data 필드 사용
@@ -443,8 +455,8 @@ class AutoPrintManager(QObject):
                     # 하위부품 원시데이터 ASCII 제어문자 변환
                     converted_barcode = raw_barcode_data.replace('\x1e', '_1E').replace('\x1d', '_1D').replace('\x04', '_04')
                     formatted_parts.append(converted_barcode)
-                    print(f"DEBUG: 하위부품 원시데이터 보존: {raw_barcode_data}")
-                    print(f"DEBUG: 하위부품 변환된 데이터: {converted_barcode}")
+                    logger.debug("하위부품 원시데이터 보존: %s", raw_barcode_data)
+                    logger.debug("하위부품 변환된 데이터: %s", converted_barcode)
                 elif child_part_number:
                     # 원시데이터가 없는 경우에만 새로 생성
                     # 하위부품은 초도품 구분 없음 (기본값 'N'이므로 M 필드 생략)
@@ -470,12 +482,13 @@ class AutoPrintManager(QObject):
             
             formatted_data = "#".join(formatted_parts)
             
-            print(f"DEBUG: 하위부품 HKMC 개수: {len(child_hkmc_list)}")
-            print(f"DEBUG: formatted_parts 개수: {len(formatted_parts)}")
-            for i, part in enumerate(formatted_parts):
-                print(f"DEBUG: formatted_parts[{i}]: {part[:100]}..." if len(part) > 100 else f"DEBUG: formatted_parts[{i}]: {part}")
-            print(f"DEBUG: 최종 조합 데이터 길이: {len(formatted_data)}")
-            print(f"DEBUG: 최종 조합 데이터: {formatted_data}")
+            logger.debug("하위부품 HKMC 개수: %s", len(child_hkmc_list))
+            logger.debug("formatted_parts 개수: %s", len(formatted_parts))
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, part in enumerate(formatted_parts):
+                    logger.debug("formatted_parts[%s]: %s%s", i, part[:100], "..." if len(part) > 100 else "")
+            logger.debug("최종 조합 데이터 길이: %s", len(formatted_data))
+            logger.debug("최종 조합 데이터: %s", formatted_data)
             
             return {
                 'hkmc_barcode': formatted_data,  # 공정#하위부품#하위부품 형식
@@ -487,10 +500,10 @@ class AutoPrintManager(QObject):
             }
             
         except Exception as e:
-            print(f"DEBUG: HKMC 바코드 생성 오류: {e}")
+            logger.error("HKMC 바코드 생성 오류: %s", e)
             return None
     
-    def generate_tracking_number(self, part_number, date_str):
+    def generate_tracking_number(self, part_number, date_str, panel_type=None):
         """추적번호 생성 (7자리)"""
         try:
             # 추적번호 파일 경로
@@ -513,40 +526,40 @@ class AutoPrintManager(QObject):
             # 추적 데이터 업데이트
             tracking_data[key] = next_count
             
-            # 패널별 시리얼번호 저장 (main_screen.py에서 사용)
-            if "FRONT/LH" in part_number or "front" in part_number.lower():
-                tracking_data["front_lh_serial"] = next_count
-            elif "REAR/RH" in part_number or "rear" in part_number.lower():
-                tracking_data["rear_rh_serial"] = next_count
+            # 패널별 시리얼번호 저장 (main_screen.py에서 사용) - 키: <스테이션 키>_serial
+            station = self.stations.get(panel_type)
+            if station is not None:
+                tracking_data[f"{station.key}_serial"] = next_count
             
             # 추적 데이터 저장
             with open(tracking_file, 'w', encoding='utf-8') as f:
                 json.dump(tracking_data, f, ensure_ascii=False, indent=2)
             
-            print(f"DEBUG: 추적번호 생성: {tracking_number}")
-            print(f"DEBUG: 패널별 시리얼번호 저장: {tracking_data.get('front_lh_serial', 0)}, {tracking_data.get('rear_rh_serial', 0)}")
+            logger.debug("추적번호 생성: %s", tracking_number)
+            if station is not None:
+                logger.debug("패널별 시리얼번호 저장: %s = %s", station.key, next_count)
             return tracking_number
             
         except Exception as e:
-            print(f"DEBUG: 추적번호 생성 오류: {e}")
+            logger.error("추적번호 생성 오류: %s", e)
             return "0000001"  # 기본값
     
     def generate_zpl_template(self, process_part, hkmc_data):
         """ZPL 템플릿 생성"""
         try:
-            print(f"DEBUG: ZPL 템플릿 생성 시작")
+            logger.debug("ZPL 템플릿 생성 시작")
             
             # 현재 템플릿 가져오기
             template_name = self.print_config.get('zpl_template', 'default')
-            print(f"DEBUG: 사용할 템플릿 이름: {template_name}")
+            logger.debug("사용할 템플릿 이름: %s", template_name)
             zpl_template = self.get_zpl_template(template_name)
             
             if not zpl_template:
-                print(f"DEBUG: ZPL 템플릿을 찾을 수 없습니다: {template_name}")
+                logger.debug("ZPL 템플릿을 찾을 수 없습니다: %s", template_name)
                 return None
             
-            print(f"DEBUG: 로드된 ZPL 템플릿 길이: {len(zpl_template)} 문자")
-            print(f"DEBUG: ZPL 템플릿 내용 (처음 200자): {zpl_template[:200]}")
+            logger.debug("로드된 ZPL 템플릿 길이: %s 문자", len(zpl_template))
+            logger.debug("ZPL 템플릿 내용 (처음 200자): %s", zpl_template[:200])
             
             # 템플릿 변수 설정
             template_vars = {
@@ -561,57 +574,57 @@ class AutoPrintManager(QObject):
             # 템플릿에 변수 적용
             zpl_data = zpl_template.format(**template_vars)
             
-            print(f"DEBUG: ZPL 템플릿 생성 완료")
-            print(f"DEBUG: ZPL 데이터 길이: {len(zpl_data)} 문자")
+            logger.debug("ZPL 템플릿 생성 완료")
+            logger.debug("ZPL 데이터 길이: %s 문자", len(zpl_data))
             
             return zpl_data
             
         except Exception as e:
-            print(f"DEBUG: ZPL 템플릿 생성 오류: {e}")
+            logger.error("ZPL 템플릿 생성 오류: %s", e)
             return None
     
     def get_zpl_template(self, template_name):
         """ZPL 템플릿 가져오기 (zpl_templates.json에서 로드)"""
         try:
-            print(f"DEBUG: ===== ZPL 템플릿 로딩 시작 =====")
-            print(f"DEBUG: 요청된 템플릿: {template_name}")
+            logger.debug("===== ZPL 템플릿 로딩 시작 =====")
+            logger.debug("요청된 템플릿: %s", template_name)
             
             # zpl_templates.json에서 템플릿 로드
             templates = self.load_zpl_templates()
-            print(f"DEBUG: 로드된 템플릿 개수: {len(templates) if templates else 0}")
+            logger.debug("로드된 템플릿 개수: %s", len(templates) if templates else 0)
             
             if templates and template_name in templates:
                 template_data = templates[template_name]
-                print(f"DEBUG: ✅ 템플릿 '{template_name}' 발견")
-                print(f"DEBUG: 템플릿 데이터 타입: {type(template_data)}")
+                logger.debug("✅ 템플릿 '%s' 발견", template_name)
+                logger.debug("템플릿 데이터 타입: %s", type(template_data))
                 
                 # 딕셔너리에서 'zpl' 키의 값(문자열) 반환
                 if isinstance(template_data, dict) and 'zpl' in template_data:
                     zpl_content = template_data['zpl']
-                    print(f"DEBUG: ✅ ZPL 내용 길이: {len(zpl_content)}")
-                    print(f"DEBUG: ZPL 내용 미리보기: {zpl_content[:200]}...")
+                    logger.debug("✅ ZPL 내용 길이: %s", len(zpl_content))
+                    logger.debug("ZPL 내용 미리보기: %s...", zpl_content[:200])
                     return zpl_content
                 else:
-                    print(f"DEBUG: ❌ 템플릿 '{template_name}' 형식 오류")
+                    logger.error("❌ 템플릿 '%s' 형식 오류", template_name)
                     return self.get_default_template()
             elif templates and 'default' in templates:
-                print(f"DEBUG: ⚠️ 템플릿 '{template_name}' 없음, 기본 템플릿 사용")
+                logger.warning("⚠️ 템플릿 '%s' 없음, 기본 템플릿 사용", template_name)
                 template_data = templates['default']
                 if isinstance(template_data, dict) and 'zpl' in template_data:
                     zpl_content = template_data['zpl']
-                    print(f"DEBUG: ✅ 기본 ZPL 내용 길이: {len(zpl_content)}")
+                    logger.debug("✅ 기본 ZPL 내용 길이: %s", len(zpl_content))
                     return zpl_content
                 else:
-                    print(f"DEBUG: ❌ 기본 템플릿 형식 오류")
+                    logger.error("❌ 기본 템플릿 형식 오류")
                     return self.get_default_template()
             else:
-                print(f"DEBUG: ❌ zpl_templates.json 로드 실패, 기본 템플릿 사용")
+                logger.error("❌ zpl_templates.json 로드 실패, 기본 템플릿 사용")
                 return self.get_default_template()
             
         except Exception as e:
-            print(f"DEBUG: ❌ ZPL 템플릿 가져오기 오류: {e}")
+            logger.error("❌ ZPL 템플릿 가져오기 오류: %s", e)
             import traceback
-            print(f"DEBUG: 상세 오류: {traceback.format_exc()}")
+            logger.error("상세 오류: %s", traceback.format_exc())
             return self.get_default_template()
     
     def load_zpl_templates(self):
@@ -625,14 +638,14 @@ class AutoPrintManager(QObject):
                 with open(config_path, 'r', encoding='utf-8') as f:
                     config = json.load(f)
                     templates = config.get('templates', {})
-                    print(f"DEBUG: zpl_templates.json 로드 성공, {len(templates)}개 템플릿")
+                    logger.debug("zpl_templates.json 로드 성공, %s개 템플릿", len(templates))
                     return templates
             else:
-                print(f"DEBUG: zpl_templates.json 파일 없음: {config_path}")
+                logger.debug("zpl_templates.json 파일 없음: %s", config_path)
                 return None
                 
         except Exception as e:
-            print(f"DEBUG: zpl_templates.json 로드 오류: {e}")
+            logger.error("zpl_templates.json 로드 오류: %s", e)
             return None
     
     def get_default_template(self):
@@ -649,45 +662,45 @@ class AutoPrintManager(QObject):
 ^FX 조합데이터 주석처리 ^FS
 ^XZ'''
     
-    def send_to_printer(self, zpl_data):
+    def send_to_printer(self, zpl_data, device_name=DEFAULT_PRINTER):
         """프린터로 ZPL 데이터 전송 - SerialConnectionManager 연결 사용"""
         try:
-            print(f"DEBUG: ===== 프린터 전송 시작 =====")
+            logger.debug("===== 프린터 전송 시작 (%s) =====", device_name)
             
-            # SerialConnectionManager의 프린터 연결 사용
-            printer_connection = self.main_window.get_serial_connection("프린터")
+            # SerialConnectionManager의 프린터 연결 사용 (스테이션별 프린터 장비명)
+            printer_connection = self.main_window.get_serial_connection(device_name)
             if not printer_connection:
-                print(f"DEBUG: ❌ 프린터 연결 객체가 없음")
+                logger.error("❌ %s 연결 객체가 없음", device_name)
                 return False
                 
             if not printer_connection.is_open:
-                print(f"DEBUG: ❌ 프린터 연결이 열려있지 않음")
+                logger.error("❌ %s 연결이 열려있지 않음", device_name)
                 return False
             
-            print(f"DEBUG: ✅ 프린터 연결 상태: {printer_connection.is_open}")
-            print(f"DEBUG: ✅ 프린터 포트: {getattr(printer_connection, 'port', 'Unknown')}")
+            logger.debug("✅ 프린터 연결 상태: %s", printer_connection.is_open)
+            logger.debug("✅ 프린터 포트: %s", getattr(printer_connection, 'port', 'Unknown'))
             
-            print(f"DEBUG: ZPL 데이터 길이: {len(zpl_data)}")
-            print(f"DEBUG: ZPL 데이터 미리보기: {zpl_data[:200]}...")
+            logger.debug("ZPL 데이터 길이: %s", len(zpl_data))
+            logger.debug("ZPL 데이터 미리보기: %s...", zpl_data[:200])
             
             # ZPL 데이터를 바이트로 변환하여 전송
             zpl_bytes = zpl_data.encode('utf-8')
-            print(f"DEBUG: 전송할 바이트 길이: {len(zpl_bytes)}")
+            logger.debug("전송할 바이트 길이: %s", len(zpl_bytes))
             
             # 실제 전송
             bytes_written = printer_connection.write(zpl_bytes)
-            print(f"DEBUG: 실제 전송된 바이트: {bytes_written}")
+            logger.debug("실제 전송된 바이트: %s", bytes_written)
             
             # 프린터 처리 시간 대기 (프린터가 데이터를 처리할 시간)
-            time.sleep(2.0)  # 프린터 처리 시간 증가
+            time.sleep(self.print_config.get('settle_seconds', 2.0))
             
-            print(f"DEBUG: ✅ 프린터 전송 완료")
+            logger.debug("✅ 프린터 전송 완료")
             return True
             
         except Exception as e:
-            print(f"DEBUG: ❌ 프린터 전송 오류: {e}")
+            logger.error("❌ 프린터 전송 오류: %s", e)
             import traceback
-            print(f"DEBUG: 상세 오류: {traceback.format_exc()}")
+            logger.error("상세 오류: %s", traceback.format_exc())
             return False
     
     def is_already_printed(self, panel_type, process_part):
@@ -702,13 +715,13 @@ class AutoPrintManager(QObject):
             
             # 같은 부품이고 이미 출력되었다면 중복으로 판단
             if printed and last_part == current_part:
-                print(f"DEBUG: 중복 출력 방지 - {panel_type}: {current_part} (이미 출력됨)")
+                logger.debug("중복 출력 방지 - %s: %s (이미 출력됨)", panel_type, current_part)
                 return True
             
             return False
             
         except Exception as e:
-            print(f"DEBUG: 중복 출력 체크 오류: {e}")
+            logger.error("중복 출력 체크 오류: %s", e)
             return False
     
     def mark_as_printed(self, panel_type, process_part):
@@ -724,10 +737,10 @@ class AutoPrintManager(QObject):
                 'last_time': current_time
             }
             
-            print(f"DEBUG: 출력 완료 마킹 - {panel_type}: {current_part} at {current_time}")
+            logger.debug("출력 완료 마킹 - %s: %s at %s", panel_type, current_part, current_time)
             
         except Exception as e:
-            print(f"DEBUG: 출력 마킹 오류: {e}")
+            logger.error("출력 마킹 오류: %s", e)
     
     def reset_print_status(self, panel_type=None):
         """출력 상태 초기화"""
@@ -739,7 +752,7 @@ class AutoPrintManager(QObject):
                     'last_part': None,
                     'last_time': None
                 }
-                print(f"DEBUG: {panel_type} 패널 출력 상태 초기화")
+                logger.debug("%s 패널 출력 상태 초기화", panel_type)
             else:
                 # 모든 패널 초기화
                 for panel in self.print_status:
@@ -748,10 +761,10 @@ class AutoPrintManager(QObject):
                         'last_part': None,
                         'last_time': None
                     }
-                print(f"DEBUG: 모든 패널 출력 상태 초기화")
+                logger.debug("모든 패널 출력 상태 초기화")
                 
         except Exception as e:
-            print(f"DEBUG: 출력 상태 초기화 오류: {e}")
+            logger.error("출력 상태 초기화 오류: %s", e)
     
     def get_supplier_code_from_master_data(self, part_number):
         """기준정보에서 업체코드 가져오기"""
@@ -760,14 +773,14 @@ class AutoPrintManager(QObject):
                 for data in self.main_window.master_data:
                     if data.get('part_number') == part_number:
                         supplier_code = data.get('supplier_code', '2812')
-                        print(f"DEBUG: 기준정보에서 업체코드 가져옴: {supplier_code} (부품: {part_number})")
+                        logger.debug("기준정보에서 업체코드 가져옴: %s (부품: %s)", supplier_code, part_number)
                         return supplier_code
             
-            print(f"DEBUG: 기준정보에서 부품을 찾을 수 없음, 기본값 사용: 2812 (부품: {part_number})")
+            logger.debug("기준정보에서 부품을 찾을 수 없음, 기본값 사용: 2812 (부품: %s)", part_number)
             return '2812'
             
         except Exception as e:
-            print(f"DEBUG: 업체코드 가져오기 오류: {e}")
+            logger.error("업체코드 가져오기 오류: %s", e)
             return '2812'
     
     def close_connection(self):
@@ -775,6 +788,6 @@ class AutoPrintManager(QObject):
         try:
             if self.serial_port and self.serial_port.is_open:
                 self.serial_port.close()
-                print(f"DEBUG: 프린터 연결 종료")
+                logger.debug("프린터 연결 종료")
         except Exception as e:
-            print(f"DEBUG: 연결 종료 오류: {e}")
+            logger.error("연결 종료 오류: %s", e)
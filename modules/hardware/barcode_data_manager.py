@@ -7,6 +7,9 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from enum import Enum
 from modules.hardware.hkmc_barcode_utils import HKMCBarcodeUtils, BarcodeData, BarcodeType
+from modules.utils.log_manager import get_logger
+
+logger = get_logger(__name__)
 
 
 @dataclass
@@ -61,15 +64,15 @@ class BarcodeDataManager:
             StandardBarcodeData: 표준화된 바코드 데이터
         """
         try:
-            print(f"DEBUG: 바코드 데이터 관리자 - 원본 바코드 파싱 시작: {raw_barcode[:50]}...")
+            logger.debug("바코드 데이터 관리자 - 원본 바코드 파싱 시작: %s...", raw_barcode[:50])
             
             # 1. 원본 데이터 정리 (ASCII 제어 문자 제거)
             cleaned_barcode = self._clean_raw_barcode(raw_barcode)
-            print(f"DEBUG: 정리된 바코드: {cleaned_barcode}")
+            logger.debug("정리된 바코드: %s", cleaned_barcode)
             
             # 2. HKMC 표준 형식으로 변환
             standard_format = self._convert_to_standard_format(cleaned_barcode)
-            print(f"DEBUG: 표준 형식으로 변환: {standard_format}")
+            logger.debug("표준 형식으로 변환: %s", standard_format)
             
             # 3. 표준 형식으로 파싱
             parsed_data = self.barcode_utils.parse_barcode(standard_format)
@@ -95,11 +98,11 @@ class BarcodeDataManager:
                 parse_errors=[]
             )
             
-            print(f"DEBUG: 바코드 파싱 성공 - 부품번호: {standard_data.part_number}")
+            logger.debug("바코드 파싱 성공 - 부품번호: %s", standard_data.part_number)
             return standard_data
             
         except Exception as e:
-            print(f"DEBUG: 바코드 파싱 실패: {str(e)}")
+            logger.error("바코드 파싱 실패: %s", str(e))
             return StandardBarcodeData(
                 raw_barcode=raw_barcode,
                 supplier_code="UNKNOWN",
@@ -138,7 +141,7 @@ class BarcodeDataManager:
             else:
                 raise ValueError(f"지원되지 않는 바코드 헤더: {cleaned_barcode[:10]}")
             
-            print(f"DEBUG: 데이터 부분: {data_part}")
+            logger.debug("데이터 부분: %s", data_part)
             
             # 2. V, P, S, E, T, M으로 분리하여 각 필드 처리
             processed_parts = []
@@ -166,15 +169,15 @@ class BarcodeDataManager:
             if current_field:
                 processed_parts.append(current_field)
             
-            print(f"DEBUG: 분리된 필드들: {processed_parts}")
+            logger.debug("분리된 필드들: %s", processed_parts)
             
             # 3. 최종 조합
             result = header + ' ' + ' gs '.join(processed_parts)
-            print(f"DEBUG: 표준 형식 변환 완료: {result}")
+            logger.debug("표준 형식 변환 완료: %s", result)
             return result
             
         except Exception as e:
-            print(f"DEBUG: 표준 형식 변환 실패: {str(e)}")
+            logger.error("표준 형식 변환 실패: %s", str(e))
             raise
     
     def get_part_number(self, standard_data: StandardBarcodeData) -> str:
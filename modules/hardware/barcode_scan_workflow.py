@@ -15,7 +15,7 @@ from typing import Dict, List, Tuple, Optional
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QTableWidget, QTableWidgetItem, 
                              QGroupBox, QMessageBox, QProgressBar)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QColor, QPalette
 
 from ..utils.font_manager import FontManager
@@ -23,6 +23,9 @@ from ..utils.font_manager import FontManager
 # 기존 모듈들 임포트
 from .hkmc_barcode_utils import HKMCBarcodeUtils, BarcodeData, BarcodeType
 from ..utils.modules.serial_connection_manager import SerialConnectionManager
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
 
 
 class ProcessValidator:
@@ -151,21 +154,22 @@ class LabelColorManager:
                 self.label_states[label_id] = status
                 
         except Exception as e:
-            print(f"레이블 색상 업데이트 오류: {e}")
+            logger.error("레이블 색상 업데이트 오류: %s", e)
     
     def get_label_status(self, label_id: str) -> str:
         """레이블 상태 조회"""
         return self.label_states.get(label_id, 'normal')
 
 
-class BarcodeScanWorkflow:
+class BarcodeScanWorkflow(QObject):
     """바코드 스캔 워크플로우 메인 클래스"""
     
-    # 시그널 정의
+    # 시그널 정의 (QObject 를 상속해야 emit 가능)
     workflow_status_changed = pyqtSignal(str, str)  # 워크플로우 상태 변경
     scan_result = pyqtSignal(bool, str, dict)      # 스캔 결과
     
     def __init__(self, settings_manager=None):
+        super().__init__()
         self.settings_manager = settings_manager
         self.process_validator = ProcessValidator()
         self.sub_barcode_validator = SubBarcodeValidator()
@@ -203,7 +207,7 @@ class BarcodeScanWorkflow:
             self.current_workflow_state = "part_selected"
             
             self.workflow_status_changed.emit("part_selected", f"부품번호 선택됨: {part_number}")
-            print(f"DEBUG: 워크플로우 시작 - 부품번호: {part_number}")
+            logger.debug("워크플로우 시작 - 부품번호: %s", part_number)
             
         except Exception as e:
             self.workflow_status_changed.emit("error", f"워크플로우 시작 오류: {str(e)}")
@@ -218,7 +222,7 @@ class BarcodeScanWorkflow:
             self.barcode_timer.start(100)
             
         except Exception as e:
-            print(f"바코드 수신 처리 오류: {e}")
+            logger.error("바코드 수신 처리 오류: %s", e)
     
     def process_barcode_buffer(self):
         """바코드 버퍼 처리"""
@@ -233,7 +237,7 @@ class BarcodeScanWorkflow:
             if not barcode:
                 return
             
-            print(f"DEBUG: 바코드 수신: {barcode}")
+            logger.debug("바코드 수신: %s", barcode)
             
             # 워크플로우 상태에 따른 처리
             if self.current_workflow_state == "part_selected":
@@ -241,10 +245,10 @@ class BarcodeScanWorkflow:
             elif self.current_workflow_state == "process_validated":
                 self.process_sub_barcode(barcode)
             else:
-                print(f"DEBUG: 현재 상태에서 바코드 처리 불가: {self.current_workflow_state}")
+                logger.debug("현재 상태에서 바코드 처리 불가: %s", self.current_workflow_state)
                 
         except Exception as e:
-            print(f"바코드 버퍼 처리 오류: {e}")
+            logger.error("바코드 버퍼 처리 오류: %s", e)
     
     def process_main_barcode(self, barcode: str):
         """메인 바코드 처리 (공정 확인)"""
@@ -258,18 +262,18 @@ class BarcodeScanWorkflow:
                 self.current_process_type = process_type
                 self.current_workflow_state = "process_validated"
                 self.workflow_status_changed.emit("process_validated", message)
-                print(f"DEBUG: 공정 확인 성공 - {process_type}: {message}")
+                logger.debug("공정 확인 성공 - %s: %s", process_type, message)
                 
                 # 하위자재가 있는 경우에만 스캔현황 다이얼로그 표시
                 if self.expected_sub_parts and len(self.expected_sub_parts) > 0:
                     self.workflow_status_changed.emit("show_scan_dialog", "스캔현황 다이얼로그 표시")
-                    print(f"DEBUG: 하위자재 {len(self.expected_sub_parts)}개 발견 - 스캔현황 다이얼로그 표시")
+                    logger.debug("하위자재 %s개 발견 - 스캔현황 다이얼로그 표시", len(self.expected_sub_parts))
                 else:
                     self.workflow_status_changed.emit("no_sub_parts", "하위자재 없음 - 다이얼로그 표시 안함")
-                    print("DEBUG: 하위자재 없음 - 스캔현황 다이얼로그 표시 안함")
+                    logger.debug("하위자재 없음 - 스캔현황 다이얼로그 표시 안함")
             else:
                 self.workflow_status_changed.emit("error", message)
-                print(f"DEBUG: 공정 확인 실패: {message}")
+                logger.error("공정 확인 실패: %s", message)
             
         except Exception as e:
             self.workflow_status_changed.emit("error", f"메인 바코드 처리 오류: {str(e)}")
@@ -286,11 +290,11 @@ class BarcodeScanWorkflow:
                 self.scanned_sub_parts.append(barcode_info)
                 self.workflow_status_changed.emit("sub_barcode_validated", message)
                 self.scan_result.emit(True, message, barcode_info)
-                print(f"DEBUG: 하위바코드 검증 성공: {message}")
+                logger.debug("하위바코드 검증 성공: %s", message)
             else:
                 self.workflow_status_changed.emit("error", message)
                 self.scan_result.emit(False, message, barcode_info)
-                print(f"DEBUG: 하위바코드 검증 실패: {message}")
+                logger.error("하위바코드 검증 실패: %s", message)
             
         except Exception as e:
             self.workflow_status_changed.emit("error", f"하위바코드 처리 오류: {str(e)}")
@@ -310,7 +314,7 @@ class BarcodeScanWorkflow:
                     self.label_color_manager.update_label_color(label_widget, status, label_id)
                     
         except Exception as e:
-            print(f"레이블 색상 업데이트 오류: {e}")
+            logger.error("레이블 색상 업데이트 오류: %s", e)
     
     def determine_label_status(self, label_id: str) -> str:
         """레이블 상태 결정"""
@@ -335,7 +339,7 @@ class BarcodeScanWorkflow:
                 return "normal"
                 
         except Exception as e:
-            print(f"레이블 상태 결정 오류: {e}")
+            logger.error("레이블 상태 결정 오류: %s", e)
             return "normal"
     
     def get_workflow_status(self) -> Dict:
@@ -360,7 +364,7 @@ class BarcodeScanWorkflow:
         self.sub_barcode_validator.validated_parts = []
         
         self.workflow_status_changed.emit("idle", "워크플로우 리셋됨")
-        print("DEBUG: 워크플로우 리셋됨")
+        logger.debug("워크플로우 리셋됨")
 
 
 class ScanStatusDialog(QDialog):
@@ -481,19 +485,19 @@ class ScanStatusDialog(QDialog):
             scanned_count = status.get('scanned_count', 0)
             expected_count = status.get('expected_count', 0)
             
-            print(f"DEBUG: 스캔 완료 확인 - 스캔됨: {scanned_count}, 예상: {expected_count}")
+            logger.debug("스캔 완료 확인 - 스캔됨: %s, 예상: %s", scanned_count, expected_count)
             
             # 모든 하위부품이 스캔되었는지 확인
             if scanned_count >= expected_count and expected_count > 0:
-                print("DEBUG: 모든 하위부품 스캔 완료 - 완료 메시지 표시")
+                logger.debug("모든 하위부품 스캔 완료 - 완료 메시지 표시")
                 self.show_completion_message()
         except Exception as e:
-            print(f"ERROR: 스캔 완료 확인 오류: {e}")
+            logger.error("스캔 완료 확인 오류: %s", e)
     
     def show_completion_message(self):
         """부품확인완료 메시지 3번 표시 후 화면 닫기"""
         try:
-            print("DEBUG: 부품확인완료 메시지 표시 시작")
+            logger.debug("부품확인완료 메시지 표시 시작")
             
             # 완료 메시지 다이얼로그 생성
             completion_dialog = QDialog(self)
@@ -546,7 +550,7 @@ class ScanStatusDialog(QDialog):
             self.show_countdown(completion_dialog, count_label, 3)
             
         except Exception as e:
-            print(f"ERROR: 완료 메시지 표시 오류: {e}")
+            logger.error("완료 메시지 표시 오류: %s", e)
             # 오류 발생 시에도 다이얼로그 닫기
             self.close()
     
@@ -586,17 +590,17 @@ class ScanStatusDialog(QDialog):
                 QTimer.singleShot(1000, lambda: self.close_all_dialogs(dialog))
                 
         except Exception as e:
-            print(f"ERROR: 카운트 다운 오류: {e}")
+            logger.error("카운트 다운 오류: %s", e)
             self.close_all_dialogs(dialog)
     
     def close_all_dialogs(self, completion_dialog):
         """모든 다이얼로그 닫기"""
         try:
-            print("DEBUG: 모든 다이얼로그 닫기")
+            logger.debug("모든 다이얼로그 닫기")
             completion_dialog.close()
             self.close()
         except Exception as e:
-            print(f"ERROR: 다이얼로그 닫기 오류: {e}")
+            logger.error("다이얼로그 닫기 오류: %s", e)
     
     def refresh_data(self):
         """데이터 새로고침"""
@@ -9,6 +9,9 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
 
 # ASCII 제어 문자 상수
 GS, RS, EOT = '\x1d', '\x1e', '\x04'
@@ -89,16 +92,16 @@ class HKMCBarcodeUtils:
         """정규식 기반 패턴 매칭으로 개선된 파싱 로직"""
         try:
             s = raw.decode('ascii', errors='ignore').strip('\r\n')
-            print(f"DEBUG: 원본 바코드: {s}")
+            logger.debug("원본 바코드: %s", s)
             
             # EOT 제거 (끝에 있는 경우)
             if s.endswith(EOT):
                 s = s[:-1]
-                print(f"DEBUG: EOT 제거 후: {s}")
+                logger.debug("EOT 제거 후: %s", s)
             
             # RS로 레코드 분리
             records = [r for r in s.split(RS) if r]
-            print(f"DEBUG: 분리된 레코드 수: {len(records)}")
+            logger.debug("분리된 레코드 수: %s", len(records))
 
             # 정규식 기반 필드 패턴 정의
             FIELD_PATTERNS = {
@@ -113,10 +116,10 @@ class HKMCBarcodeUtils:
 
             parsed_records = []
             for rec in records:
-                print(f"DEBUG: 처리할 레코드: {rec}")
+                logger.debug("처리할 레코드: %s", rec)
                 # GS로 필드 분리
                 fields = [f for f in rec.split(GS) if f]
-                print(f"DEBUG: 분리된 필드: {fields}")
+                logger.debug("분리된 필드: %s", fields)
                 
                 out = {
                     'Supplier Code': None,
@@ -141,7 +144,7 @@ class HKMCBarcodeUtils:
                         m = re.match(pattern, token)
                         if m:
                             matched = True
-                            print(f"DEBUG: 패턴 매칭 성공 - {label}: {token}")
+                            logger.debug("패턴 매칭 성공 - %s: %s", label, token)
                             
                             if label == "Traceability":
                                 out['Traceability']['Full'] = token
@@ -149,7 +152,7 @@ class HKMCBarcodeUtils:
                                 out['Traceability']['부품4M'] = m.group('m4')
                                 out['Traceability']['시리얼구분'] = m.group('stype')
                                 out['Traceability']['시리얼번호'] = m.group('snum')
-                                print(f"DEBUG: 추적 정보 파싱 성공: {m.groupdict()}")
+                                logger.debug("추적 정보 파싱 성공: %s", m.groupdict())
                             elif label == "Supplier Code":
                                 out['Supplier Code'] = m.group(1)
                             elif label == "Part Number":
@@ -166,32 +169,32 @@ class HKMCBarcodeUtils:
                             break
                     
                     if not matched:
-                        print(f"DEBUG: 인식되지 않은 필드 → {token}")
+                        logger.debug("인식되지 않은 필드 → %s", token)
                 
                 parsed_records.append(out)
-                print(f"DEBUG: 파싱 결과: {out}")
+                logger.debug("파싱 결과: %s", out)
             return parsed_records
         except Exception as e:
-            print(f"DEBUG: parse_record_bytes 오류: {e}")
+            logger.error("parse_record_bytes 오류: %s", e)
             import traceback
-            print(f"DEBUG: 상세 오류: {traceback.format_exc()}")
+            logger.error("상세 오류: %s", traceback.format_exc())
             return []
     
     def parse_barcode(self, barcode: str) -> BarcodeData:
         """바코드 문자열을 파싱하여 데이터 구조로 변환 - 실제 ASCII 제어 문자 사용"""
         try:
-            print(f"DEBUG: 새로운 파싱 로직 시작 - 바코드: {barcode}")
+            logger.debug("새로운 파싱 로직 시작 - 바코드: %s", barcode)
             
             # 실제 바코드 형식: [)>06V2812P89231CU1000SET2510022000A0000001M
             # 이미 ASCII 제어 문자가 포함된 형태이므로 그대로 사용
-            print(f"DEBUG: 원본 바코드 (ASCII 제어 문자 포함): {barcode}")
+            logger.debug("원본 바코드 (ASCII 제어 문자 포함): %s", barcode)
             
             # 바코드를 바이트로 변환하여 새로운 파싱 로직 사용
             barcode_bytes = barcode.encode('ascii', errors='ignore')
             parsed_records = self.parse_record_bytes(barcode_bytes)
             
             if not parsed_records:
-                print("DEBUG: 파싱된 레코드가 없음")
+                logger.debug("파싱된 레코드가 없음")
                 return self._create_default_barcode_data()
             
             # 올바른 데이터가 있는 레코드 찾기
@@ -202,10 +205,10 @@ class HKMCBarcodeUtils:
                     break
             
             if not record:
-                print("DEBUG: 올바른 데이터가 있는 레코드를 찾을 수 없음")
+                logger.debug("올바른 데이터가 있는 레코드를 찾을 수 없음")
                 return self._create_default_barcode_data()
             
-            print(f"DEBUG: 선택된 레코드: {record}")
+            logger.debug("선택된 레코드: %s", record)
             
             # BarcodeData 객체 생성
             supplier_code = record.get('Supplier Code', '')
@@ -230,10 +233,10 @@ class HKMCBarcodeUtils:
             if len(fourm_info) < 4:
                 fourm_info = (fourm_info + '0000')[:4]
             
-            print(f"DEBUG: 최종 파싱 결과 - 업체코드: {supplier_code}, 부품번호: {part_number}")
-            print(f"DEBUG: 최종 파싱 결과 - 서열코드: {sequence_code}, EO번호: {eo_number}")
-            print(f"DEBUG: 최종 파싱 결과 - 생산일자: {manufacturing_date}, 4M: {m4_info}")
-            print(f"DEBUG: 최종 파싱 결과 - 추적타입: {trace_type_char}, 추적번호: {traceability_number}")
+            logger.debug("최종 파싱 결과 - 업체코드: %s, 부품번호: %s", supplier_code, part_number)
+            logger.debug("최종 파싱 결과 - 서열코드: %s, EO번호: %s", sequence_code, eo_number)
+            logger.debug("최종 파싱 결과 - 생산일자: %s, 4M: %s", manufacturing_date, m4_info)
+            logger.debug("최종 파싱 결과 - 추적타입: %s, 추적번호: %s", trace_type_char, traceability_number)
             
             return BarcodeData(
                 supplier_code=supplier_code,
@@ -250,7 +253,7 @@ class HKMCBarcodeUtils:
             )
             
         except Exception as e:
-            print(f"DEBUG: 바코드 파싱 오류: {str(e)}")
+            logger.error("바코드 파싱 오류: %s", str(e))
             return self._create_default_barcode_data()
     
     def _create_default_barcode_data(self) -> BarcodeData:
@@ -432,7 +435,7 @@ class HKMCBarcodeUtils:
             return barcode_info
             
         except Exception as e:
-            print(f"DEBUG: get_barcode_info 오류: {e}")
+            logger.error("get_barcode_info 오류: %s", e)
             return {
                 'supplier_code': '',
                 'part_number': '',
@@ -463,13 +466,13 @@ class HKMCBarcodeUtils:
             Tuple[bool, List[str], Dict]: (검증성공여부, 오류목록, 바코드정보)
         """
         try:
-            print(f"DEBUG: hkmc_barcode_utils - 하위부품 바코드 검증 시작: {barcode}")
+            logger.debug("hkmc_barcode_utils - 하위부품 바코드 검증 시작: %s", barcode)
             
             # 기존 validate_barcode 메서드 사용
             is_valid, errors = self.validate_barcode(barcode)
             
             if not is_valid:
-                print(f"DEBUG: hkmc_barcode_utils - 바코드 검증 실패: {errors}")
+                logger.error("hkmc_barcode_utils - 바코드 검증 실패: %s", errors)
                 return False, errors, {}
             
             # 바코드 파싱하여 정보 추출
@@ -491,10 +494,10 @@ class HKMCBarcodeUtils:
                 'equipment_info': barcode_data.equipment_info
             }
             
-            print(f"DEBUG: hkmc_barcode_utils - 바코드 검증 성공: {barcode_info}")
+            logger.debug("hkmc_barcode_utils - 바코드 검증 성공: %s", barcode_info)
             return True, [], barcode_info
             
         except Exception as e:
             error_msg = f"하위부품 바코드 검증 오류: {str(e)}"
-            print(f"DEBUG: hkmc_barcode_utils - {error_msg}")
+            logger.debug("hkmc_barcode_utils - %s", error_msg)
             return False, [error_msg], {}
\ No newline at end of file
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+너트런너 체결 결과 수집
+- 장비별 읽기 스레드가 시리얼 수신 → 프레임 분리/해석(프로토콜) → 저장소 기록까지 처리
+- 화면(GUI 스레드)은 drain() 으로 해석된 결과만 받아 작업 흐름 엔진에 전달 (스캔 처리 경로에 부담 없음)
+- 수신 오류(케이블 분리 등) 시 포트를 닫고 스레드 종료 → 메인 화면 연결 감시가 재연결 후 start() 로 다시 시작
+- 설정 (admin_panel_config.json nutrunner 항목):
+    protocol: "line" / "open_protocol" (장비별: nutrunner1_protocol, nutrunner2_protocol)
+    block_on_nok: true 면 체결 NOK 가 남은 패널의 작업완료(출력)를 보류
+"""
+
+import time
+import threading
+from collections import deque
+
+from .nutrunner_protocols import create_protocol, DEFAULT_PROTOCOL
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+NUTRUNNER_DEVICES = {"너트1": "nutrunner1", "너트2": "nutrunner2"}
+READ_TIMEOUT = 0.2          # 읽기 대기 (초) - 종료 요청 확인 간격
+KEEPALIVE_INTERVAL = 10.0   # 유휴 시 keepalive 전송 간격 (초, 프로토콜이 지원할 때)
+MAX_QUEUED_RESULTS = 1000   # 화면이 가져가지 않은 결과 최대 보관 수
+
+
+class NutrunnerReader(threading.Thread):
+    """너트런너 1대 읽기 스레드 - 수신/해석/응답/저장"""
+
+    def __init__(self, tool, connection, protocol, on_result):
+        super().__init__(name=f"nutrunner-{NUTRUNNER_DEVICES.get(tool, tool)}", daemon=True)
+        self.tool = tool
+        self.connection = connection
+        self.protocol = protocol
+        self.on_result = on_result
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _write(self, data):
+        if data:
+            try:
+                self.connection.write(data)
+            except Exception as e:
+                logger.warning("%s 너트런너 전송 실패: %s", self.tool, e)
+
+    def _close(self):
+        """포트 닫기 - 연결 감시가 끊김(is_open False)으로 보고 재연결하도록"""
+        try:
+            self.connection.close()
+        except Exception as e:
+            logger.debug("%s 너트런너 포트 닫기 실패: %s", self.tool, e)
+
+    def run(self):
+        logger.info("%s 체결 결과 수집 시작 (%s)", self.tool, self.protocol.name)
+        try:
+            # 짧은 읽기 대기로 바꿔 종료 요청에 바로 반응 (이 포트는 읽기 스레드만 사용)
+            self.connection.timeout = READ_TIMEOUT
+        except Exception as e:
+            logger.debug("%s 읽기 대기 설정 실패: %s", self.tool, e)
+        self._write(self.protocol.handshake())
+        last_activity = time.monotonic()
+
+        while not self._stop_event.is_set():
+            try:
+                data = self.connection.read(max(1, self.connection.in_waiting))
+            except Exception as e:
+                if not self._stop_event.is_set():
+                    logger.error("%s 너트런너 수신 오류 - 포트 닫고 재연결 대기: %s", self.tool, e)
+                    self._close()
+                break
+            now = time.monotonic()
+            if not data:
+                if now - last_activity >= KEEPALIVE_INTERVAL:
+                    self._write(self.protocol.keepalive())
+                    last_activity = now
+                continue
+            last_activity = now
+            for result in self.protocol.feed(data):
+                self._write(self.protocol.acknowledge(result))
+                try:
+                    self.on_result(result)
+                except Exception as e:
+                    logger.error("%s 체결 결과 처리 오류: %s - %s", self.tool, result, e)
+        logger.info("%s 체결 결과 수집 종료", self.tool)
+
+
+class NutrunnerIngestService:
+    """너트런너 체결 결과 수집 서비스 - 읽기 스레드 관리 + 화면 전달 대기열"""
+
+    def __init__(self, store=None, protocols=None, block_on_nok=False):
+        self.store = store
+        self.protocols = protocols or {}        # 장비명 → 프로토콜 이름
+        self.block_on_nok = block_on_nok
+        self.readers = {}
+        self._results = deque(maxlen=MAX_QUEUED_RESULTS)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config, store=None):
+        """admin_panel_config.json 의 nutrunner 항목으로 생성"""
+        settings = (config or {}).get("nutrunner", {})
+        default_protocol = settings.get("protocol", DEFAULT_PROTOCOL)
+        protocols = {tool: settings.get(f"{key}_protocol", default_protocol)
+                     for tool, key in NUTRUNNER_DEVICES.items()}
+        return cls(store, protocols, block_on_nok=bool(settings.get("block_on_nok", False)))
+
+    def start(self, serial_connections):
+        """연결된 너트런너마다 읽기 스레드 시작 (이미 실행 중인 장비는 유지)"""
+        for tool in NUTRUNNER_DEVICES:
+            connection = serial_connections.get(tool)
+            if connection is None or not getattr(connection, 'is_open', False):
+                continue
+            reader = self.readers.get(tool)
+            if reader is not None and reader.is_alive() and reader.connection is connection:
+                continue
+            if reader is not None:
+                reader.stop()
+            reader = NutrunnerReader(tool, connection, create_protocol(self.protocols.get(tool), tool),
+                                     self._on_result)
+            self.readers[tool] = reader
+            reader.start()
+        return len(self.readers)
+
+    def _on_result(self, result):
+        """읽기 스레드 - 저장 후 화면 전달 대기열에 추가"""
+        if self.store is not None:
+            self.store.record(result)
+        log = logger.info if result.ok else logger.warning
+        log("%s 체결 %s - 토크 %s, 각도 %s, PSET %s", result.tool, result.status,
+            result.torque, result.angle, result.pset)
+        with self._lock:
+            if len(self._results) == self._results.maxlen:
+                logger.warning("체결 결과 대기열 초과 - 가장 오래된 결과를 화면에 전달하지 못함")
+            self._results.append(result)
+
+    def drain(self):
+        """화면 전달 대기 중인 결과 전체 (GUI 스레드에서 주기적으로 호출)"""
+        if not self._results:
+            return []
+        with self._lock:
+            results = list(self._results)
+            self._results.clear()
+        return results
+
+    def stop(self, timeout=1.0):
+        for reader in self.readers.values():
+            reader.stop()
+        for reader in self.readers.values():
+            reader.join(timeout)
+        self.readers.clear()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+너트런너(체결 컨트롤러) 통신 프로토콜
+수신 바이트를 프레임 단위로 자르고 체결 결과(TighteningResult)로 변환한다 - 읽기 스레드에서 호출.
+- "line": 줄 단위 ASCII 결과 (키=값 또는 CSV) - 범용 컨트롤러 / 시리얼 출력 설정
+- "open_protocol": Atlas Copco Open Protocol (NUL 종료 프레임, MID 0061 체결 결과)
+- 다른 컨트롤러는 NutrunnerProtocol 상속 후 register_protocol() 로 추가 (설정 nutrunner.protocol)
+"""
+
+import re
+from datetime import datetime
+
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PROTOCOL = "line"
+MAX_BUFFER = 64 * 1024      # 종료 문자 없이 이만큼 쌓이면 버림 (잘못된 설정/노이즈)
+
+
+class TighteningResult:
+    """체결 결과 1건 (토크 Nm, 각도 deg)"""
+
+    __slots__ = ('tool', 'torque', 'angle', 'ok', 'pset', 'bolt', 'torque_ok', 'angle_ok',
+                 'tightening_id', 'vin', 'raw', 'received_at', 'row_id')
+
+    def __init__(self, tool, torque=None, angle=None, ok=False, pset="", bolt="", torque_ok=None,
+                 angle_ok=None, tightening_id="", vin="", raw=""):
+        self.tool = tool                    # 장비명 (너트1/너트2)
+        self.torque = torque
+        self.angle = angle
+        self.ok = bool(ok)
+        self.pset = pset
+        self.bolt = bolt                    # 볼트(배치 카운터/채널) 구분 - 재체결 판정용 (없으면 빈 값)
+        self.torque_ok = torque_ok
+        self.angle_ok = angle_ok
+        self.tightening_id = tightening_id  # 컨트롤러 체결 번호
+        self.vin = vin                      # 컨트롤러가 보낸 제품 식별값 (있으면)
+        self.raw = raw
+        self.received_at = datetime.now()
+        self.row_id = None                  # 저장소 행 번호 (저장 후)
+
+    @property
+    def status(self):
+        return "OK" if self.ok else "NOK"
+
+    @property
+    def key(self):
+        """같은 볼트 재체결 판정 키 - 볼트 구분이 없으면 체결 1건마다 다른 키
+        (어느 볼트인지 모르는 OK 로 다른 볼트의 NOK 가 해소되지 않도록)"""
+        if self.bolt:
+            return (self.tool, self.bolt)
+        return (self.tool, "", self.tightening_id or id(self))
+
+    def __repr__(self):
+        return f"TighteningResult({self.tool}, {self.status}, torque={self.torque}, angle={self.angle})"
+
+
+def _to_float(value):
+    try:
+        return float(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_ok(value):
+    """OK/NG/NOK/1/0 → True/False (알 수 없으면 None)"""
+    text = str(value).strip().upper()
+    if text in ("OK", "1", "PASS", "GOOD", "O"):
+        return True
+    if text in ("NG", "NOK", "0", "FAIL", "NOT OK", "X"):
+        return False
+    return None
+
+
+class NutrunnerProtocol:
+    """프로토콜 기본 클래스 - feed() 로 받은 바이트를 버퍼링하여 완성된 결과만 반환"""
+
+    name = ""
+    terminators = b"\n"
+
+    def __init__(self, tool):
+        self.tool = tool
+        self._buffer = bytearray()
+
+    def feed(self, data):
+        """수신 바이트 추가 → 완성된 체결 결과 목록"""
+        self._buffer += data
+        results = []
+        for frame in self._frames():
+            try:
+                result = self.parse(frame)
+            except Exception as e:
+                logger.warning("%s 체결 결과 해석 실패: %r - %s", self.tool, frame[:80], e)
+                continue
+            if result is not None:
+                results.append(result)
+        if len(self._buffer) > MAX_BUFFER:
+            logger.warning("%s 수신 버퍼 초과 - %s바이트 버림 (프로토콜 설정 확인)", self.tool, len(self._buffer))
+            self._buffer.clear()
+        return results
+
+    def _frames(self):
+        pattern = re.compile(b"[" + re.escape(self.terminators) + b"]")
+        while True:
+            match = pattern.search(self._buffer)
+            if match is None:
+                return
+            frame = bytes(self._buffer[:match.start()])
+            del self._buffer[:match.end()]
+            if frame.strip():
+                yield frame
+
+    def parse(self, frame):
+        """프레임 1개 → TighteningResult (결과가 아닌 프레임은 None)"""
+        raise NotImplementedError
+
+    def handshake(self):
+        """연결 직후 컨트롤러로 보낼 바이트 (없으면 빈 값)"""
+        return b""
+
+    def keepalive(self):
+        """유휴 시 주기적으로 보낼 바이트 (없으면 빈 값)"""
+        return b""
+
+    def acknowledge(self, result):
+        """결과 수신 응답 바이트 (없으면 빈 값)"""
+        return b""
+
+
+class LineProtocol(NutrunnerProtocol):
+    """줄 단위 ASCII 결과
+    - 키=값: 'TQ=12.5,ANG=35.2,RESULT=OK,PSET=1' (구분자 , ; 공백 탭, 키 대소문자 무시)
+    - CSV: '12.5,35.2,OK' (토크, 각도, 판정[, PSET])"""
+
+    name = "line"
+    terminators = b"\r\n\x03"
+
+    KEYS = {
+        "torque": ("T", "TQ", "TOR", "TORQUE"),
+        "angle": ("A", "ANG", "ANGLE"),
+        "result": ("R", "RES", "RESULT", "JUDGE", "STATUS", "OKNG"),
+        "pset": ("P", "PSET", "PRG", "PROGRAM"),
+        "bolt": ("B", "BOLT", "NO", "COUNT", "BATCH"),
+        "torque_result": ("TR", "TQR", "TORQUE_RESULT"),
+        "angle_result": ("AR", "ANGR", "ANGLE_RESULT"),
+        "id": ("ID", "TID", "TIGHTENING_ID"),
+        "vin": ("VIN", "SERIAL", "SN"),
+    }
+    _ALIASES = {alias: field for field, aliases in KEYS.items() for alias in aliases}
+    _PAIR = re.compile(r'([A-Za-z_]+)\s*[=:]\s*([^,;\s]+)')
+
+    def parse(self, frame):
+        text = frame.decode('ascii', errors='ignore').strip().strip("\x02")
+        fields = {}
+        for key, value in self._PAIR.findall(text):
+            field = self._ALIASES.get(key.upper())
+            if field:
+                fields.setdefault(field, value)
+        if not fields:
+            parts = [part.strip() for part in re.split(r'[,;\t]', text)]
+            if len(parts) >= 3:
+                fields = {"torque": parts[0], "angle": parts[1], "result": parts[2]}
+                if len(parts) >= 4:
+                    fields["pset"] = parts[3]
+
+        ok = _to_ok(fields.get("result", ""))
+        if ok is None:
+            logger.debug("%s 체결 결과 아님 - 무시: %s", self.tool, text)
+            return None
+        return TighteningResult(
+            self.tool, _to_float(fields.get("torque")), _to_float(fields.get("angle")), ok,
+            pset=fields.get("pset", ""), bolt=fields.get("bolt", ""),
+            torque_ok=_to_ok(fields["torque_result"]) if "torque_result" in fields else None,
+            angle_ok=_to_ok(fields["angle_result"]) if "angle_result" in fields else None,
+            tightening_id=fields.get("id", ""), vin=fields.get("vin", ""), raw=text)
+
+
+class OpenProtocol(NutrunnerProtocol):
+    """Atlas Copco Open Protocol - 헤더 20자(길이4 + MID4 + 리비전3 + 예비) + 데이터 + NUL
+    연결 시 통신 시작(MID 0001) + 체결 결과 구독(MID 0060), 결과(MID 0061)마다 응답(MID 0062)"""
+
+    name = "open_protocol"
+    terminators = b"\x00"
+
+    # MID 0061 리비전 1 데이터 항목: 번호 → (이름, 길이)
+    RESULT_FIELDS = {
+        1: ("cell_id", 4), 2: ("channel_id", 2), 3: ("controller_name", 25), 4: ("vin", 25),
+        5: ("job_id", 2), 6: ("pset", 3), 7: ("batch_size", 4), 8: ("batch_counter", 4),
+        9: ("tightening_status", 1), 10: ("torque_status", 1), 11: ("angle_status", 1),
+        12: ("torque_min", 6), 13: ("torque_max", 6), 14: ("torque_target", 6), 15: ("torque", 6),
+        16: ("angle_min", 5), 17: ("angle_max", 5), 18: ("angle_target", 5), 19: ("angle", 5),
+        20: ("timestamp", 19), 21: ("pset_changed", 19), 22: ("batch_status", 1), 23: ("tightening_id", 10),
+    }
+
+    @staticmethod
+    def message(mid, revision=1, data=""):
+        """Open Protocol 메시지 1개 (NUL 포함)"""
+        body = f"{mid:04d}{revision:03d}" + " " * 9 + data
+        return f"{len(body) + 4:04d}{body}".encode('ascii') + b"\x00"
+
+    def handshake(self):
+        return self.message(1) + self.message(60)
+
+    def keepalive(self):
+        return self.message(9999)
+
+    def acknowledge(self, result):
+        return self.message(62)
+
+    def parse(self, frame):
+        text = frame.decode('ascii', errors='ignore')
+        if len(text) < 20 or not text[4:8].isdigit():
+            logger.debug("%s Open Protocol 프레임 형식 아님: %r", self.tool, text[:40])
+            return None
+        mid = int(text[4:8])
+        if mid != 61:
+            if mid in (4, 5, 9999):
+                logger.debug("%s Open Protocol MID %04d: %s", self.tool, mid, text[20:].strip())
+            else:
+                logger.debug("%s Open Protocol MID %04d 무시", self.tool, mid)
+            return None
+        fields = self.parse_fields(text[20:])
+        torque = _to_float(fields.get("torque"))
+        return TighteningResult(
+            self.tool, torque / 100 if torque is not None else None, _to_float(fields.get("angle")),
+            fields.get("tightening_status") == "1",
+            pset=fields.get("pset", "").lstrip("0"), bolt=fields.get("batch_counter", "").lstrip("0"),
+            torque_ok=fields["torque_status"] == "1" if "torque_status" in fields else None,
+            angle_ok=fields["angle_status"] == "1" if "angle_status" in fields else None,
+            tightening_id=fields.get("tightening_id", "").lstrip("0"), vin=fields.get("vin", ""), raw=text)
+
+    @classmethod
+    def parse_fields(cls, data):
+        """'01xxxx02xx...' 형식 데이터 → {이름: 값} (알 수 없는 항목에서 중단)"""
+        fields = {}
+        position = 0
+        while position + 2 <= len(data):
+            number = data[position:position + 2]
+            if not number.isdigit() or int(number) not in cls.RESULT_FIELDS:
+                break
+            name, length = cls.RESULT_FIELDS[int(number)]
+            fields[name] = data[position + 2:position + 2 + length].strip()
+            position += 2 + length
+        return fields
+
+
+PROTOCOLS = {
+    LineProtocol.name: LineProtocol,
+    OpenProtocol.name: OpenProtocol,
+}
+
+
+def register_protocol(name, protocol_class):
+    """컨트롤러 프로토콜 추가 (NutrunnerProtocol 하위 클래스)"""
+    PROTOCOLS[name] = protocol_class
+
+
+def create_protocol(name, tool):
+    """설정 이름으로 프로토콜 생성 - 모르는 이름이면 기본(line)"""
+    protocol_class = PROTOCOLS.get(name or DEFAULT_PROTOCOL)
+    if protocol_class is None:
+        logger.warning("%s 알 수 없는 너트런너 프로토콜 '%s' - %s 사용", tool, name, DEFAULT_PROTOCOL)
+        protocol_class = PROTOCOLS[DEFAULT_PROTOCOL]
+    return protocol_class(tool)
@@ -12,6 +12,9 @@ import os
 import time
 from datetime import datetime
 import io
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
 
 
 class PrintModule(QObject):
@@ -130,11 +133,11 @@ class PrintModule(QObject):
                     'timeout': serial_config.get('timeout', 1)
                 })
                 
-                print(f"프린터 설정 로드 완료: {self.serial_config['port']}")
+                logger.info("프린터 설정 로드 완료: %s", self.serial_config['port'])
             else:
-                print(f"설정 파일을 찾을 수 없습니다: {config_file}")
+                logger.info("설정 파일을 찾을 수 없습니다: %s", config_file)
         except Exception as e:
-            print(f"시리얼 설정 로드 오류: {e}")
+            logger.error("시리얼 설정 로드 오류: %s", e)
     
     def load_zpl_config(self):
         """ZPL 설정 로드"""
@@ -144,7 +147,7 @@ class PrintModule(QObject):
                     config = json.load(f)
                     self.zpl_template_config.update(config)
         except Exception as e:
-            print(f"ZPL 설정 로드 오류: {e}")
+            logger.error("ZPL 설정 로드 오류: %s", e)
     
     def init_serial_connection(self):
         """프린터 연결 초기화"""
@@ -159,18 +162,18 @@ class PrintModule(QObject):
             )
             
             self.print_status_changed.emit("프린터 연결됨")
-            print(f"프린터 연결 성공: {self.serial_config['port']}")
+            logger.info("프린터 연결 성공: %s", self.serial_config['port'])
             return True
             
         except serial.SerialException as e:
             self.serial_port = None
             self.print_status_changed.emit("프린터 연결 실패")
-            print(f"프린터 연결 실패: {e}")
+            logger.error("프린터 연결 실패: %s", e)
             return False
         except Exception as e:
             self.serial_port = None
             self.print_status_changed.emit("프린터 연결 오류")
-            print(f"프린터 연결 오류: {e}")
+            logger.error("프린터 연결 오류: %s", e)
             return False
     
     def create_barcode_data(self, main_part_number, child_parts_list, production_date="", tracking_number=""):
@@ -190,18 +193,18 @@ class PrintModule(QObject):
             # # 구분자로 결합
             barcode_data = "#".join(barcode_parts)
             
-            print(f"바코드 데이터 생성: {barcode_data}")
+            logger.debug("바코드 데이터 생성: %s", barcode_data)
             return barcode_data
             
         except Exception as e:
-            print(f"바코드 데이터 생성 오류: {e}")
+            logger.error("바코드 데이터 생성 오류: %s", e)
             return None
     
     def generate_data_matrix(self, barcode_data, size=(100, 100)):
         """Data Matrix 바코드 이미지 생성"""
         if not PYLIBDMTX_AVAILABLE:
-            print("오류: pylibdmtx가 설치되지 않았거나 DLL을 찾을 수 없습니다.")
-            print("Data Matrix 바코드 생성이 불가능합니다. ZPL 프린터를 사용하는 것을 권장합니다.")
+            logger.error("오류: pylibdmtx가 설치되지 않았거나 DLL을 찾을 수 없습니다.")
+            logger.info("Data Matrix 바코드 생성이 불가능합니다. ZPL 프린터를 사용하는 것을 권장합니다.")
             return None
             
         try:
@@ -215,8 +218,8 @@ class PrintModule(QObject):
             return qr_img
             
         except Exception as e:
-            print(f"Data Matrix 생성 오류: {e}")
-            print("Data Matrix 바코드 생성에 실패했습니다. ZPL 프린터를 사용하는 것을 권장합니다.")
+            logger.error("Data Matrix 생성 오류: %s", e)
+            logger.error("Data Matrix 바코드 생성에 실패했습니다. ZPL 프린터를 사용하는 것을 권장합니다.")
             return None
     
     def create_label_image(self, barcode_data, part_number, part_name="", production_date="", tracking_number=""):
@@ -265,7 +268,7 @@ class PrintModule(QObject):
             return final_img
             
         except Exception as e:
-            print(f"라벨 이미지 생성 오류: {e}")
+            logger.error("라벨 이미지 생성 오류: %s", e)
             return None
     
     def create_zpl_data(self, barcode_data, part_number, part_name="", production_date="", tracking_number="",
@@ -345,7 +348,7 @@ class PrintModule(QObject):
             return zpl_data
             
         except Exception as e:
-            print(f"ZPL 데이터 생성 오류: {e}")
+            logger.error("ZPL 데이터 생성 오류: %s", e)
             return None
     
     def print_barcode(self, main_part_number, child_parts_list, part_name="", production_date="", tracking_number="",
@@ -390,13 +393,13 @@ class PrintModule(QObject):
             self.print_completed.emit(main_part_number, barcode_data)
             self.print_status_changed.emit("프린트 완료")
             
-            print(f"프린트 완료: {main_part_number} - {barcode_data}")
+            logger.info("프린트 완료: %s - %s", main_part_number, barcode_data)
             return True
             
         except Exception as e:
             error_msg = f"프린트 오류: {str(e)}"
             self.print_error.emit(error_msg)
-            print(error_msg)
+            logger.error("%s", error_msg)
             return False
     
     def save_barcode_image(self, barcode_data, part_number, part_name="", production_date="", tracking_number="", save_path=None):
@@ -424,11 +427,11 @@ class PrintModule(QObject):
             
             # 이미지 저장
             label_img.save(full_path)
-            print(f"바코드 이미지 저장: {full_path}")
+            logger.info("바코드 이미지 저장: %s", full_path)
             return True
             
         except Exception as e:
-            print(f"바코드 이미지 저장 오류: {e}")
+            logger.error("바코드 이미지 저장 오류: %s", e)
             return False
     
     def get_connection_status(self):
@@ -446,7 +449,7 @@ class PrintModule(QObject):
             return self.init_serial_connection()
             
         except Exception as e:
-            print(f"프린터 재연결 오류: {e}")
+            logger.error("프린터 재연결 오류: %s", e)
             return False
     
     def close_connection(self):
@@ -456,7 +459,7 @@ class PrintModule(QObject):
                 self.serial_port.close()
                 self.print_status_changed.emit("프린터 연결 종료")
         except Exception as e:
-            print(f"프린터 연결 종료 오류: {e}")
+            logger.error("프린터 연결 종료 오류: %s", e)
 
 
 class PrintManager:
@@ -476,12 +479,12 @@ class PrintManager:
     
     def on_print_status_changed(self, status):
         """프린트 상태 변경 처리"""
-        print(f"프린트 상태: {status}")
+        logger.debug("프린트 상태: %s", status)
         # 메인화면에 상태 표시 (필요시)
     
     def on_print_completed(self, part_number, barcode_data):
         """프린트 완료 처리"""
-        print(f"프린트 완료 - 부품번호: {part_number}, 바코드: {barcode_data}")
+        logger.info("프린트 완료 - 부품번호: %s, 바코드: %s", part_number, barcode_data)
         
         # 출력 로그 저장
         if part_number in self.current_print_info:
@@ -523,14 +526,14 @@ class PrintManager:
                     success=True,
                     printed_child_parts=printed_child_parts if printed_child_parts else None
                 )
-                print(f"DEBUG: PrintManager - 출력 로그 저장 완료: {panel_name} - {part_number}")
+                logger.debug("PrintManager - 출력 로그 저장 완료: %s - %s", panel_name, part_number)
             
             # 저장된 정보 삭제
             del self.current_print_info[part_number]
     
     def on_print_error(self, error_msg):
         """프린트 오류 처리"""
-        print(f"프린트 오류: {error_msg}")
+        logger.error("프린트 오류: %s", error_msg)
         # 메인화면에 오류 알림 (필요시)
         if hasattr(self.main_window, 'show_message'):
             self.main_window.show_message("프린트 오류", error_msg)
@@ -540,9 +543,9 @@ class PrintManager:
         try:
             if hasattr(self, 'print_module') and self.print_module:
                 self.print_module.close_connection()
-                print("DEBUG: PrintManager 연결 종료 완료")
+                logger.debug("PrintManager 연결 종료 완료")
         except Exception as e:
-            print(f"DEBUG: PrintManager 연결 종료 오류: {e}")
+            logger.error("PrintManager 연결 종료 오류: %s", e)
     
     def print_auto(self, panel_name, part_number, part_name, child_parts_list):
         """자동 프린트 (PLC 완료신호 수신 시)"""
@@ -602,21 +605,21 @@ class PrintManager:
                     # 사용유무가 Y이고 출력포함여부가 Y인 하위부품만 포함
                     if use_status == 'Y' and print_include == 'Y':
                         print_include_parts.append(child.get('part_number', ''))
-                        print(f"DEBUG: - {child.get('part_number', '')} (사용유무: {use_status}, 출력포함: {print_include})")
+                        logger.debug("- %s (사용유무: %s, 출력포함: %s)", child.get('part_number', ''), use_status, print_include)
                     else:
-                        print(f"DEBUG: - {child.get('part_number', '')} 제외 (사용유무: {use_status}, 출력포함: {print_include})")
+                        logger.debug("- %s 제외 (사용유무: %s, 출력포함: %s)", child.get('part_number', ''), use_status, print_include)
                 
                 # child_parts_list에서 출력포함여부 Y인 하위부품만 필터링
                 for child_part in child_parts_list:
                     if child_part in print_include_parts:
                         filtered_child_parts_list.append(child_part)
-                        print(f"DEBUG: 하위부품 {child_part} 출력포함 - 바코드에 포함")
+                        logger.debug("하위부품 %s 출력포함 - 바코드에 포함", child_part)
                     else:
-                        print(f"DEBUG: 하위부품 {child_part} 출력포함여부 N - 바코드에서 제외")
+                        logger.debug("하위부품 %s 출력포함여부 N - 바코드에서 제외", child_part)
             else:
                 filtered_child_parts_list = child_parts_list
             
-            print(f"DEBUG: 필터링된 하위부품: {filtered_child_parts_list} (원본: {child_parts_list})")
+            logger.debug("필터링된 하위부품: %s (원본: %s)", filtered_child_parts_list, child_parts_list)
 
             # 출력 정보 저장 (로그 저장용)
             self.current_print_info[part_number] = {
@@ -655,7 +658,7 @@ class PrintManager:
             return success
             
         except Exception as e:
-            print(f"자동 프린트 오류: {e}")
+            logger.error("자동 프린트 오류: %s", e)
             return False
     
     def print_manual(self, part_number, part_name, child_parts_list, production_date="", tracking_number=""):
@@ -673,7 +676,7 @@ class PrintManager:
             return success
             
         except Exception as e:
-            print(f"수동 프린트 오류: {e}")
+            logger.error("수동 프린트 오류: %s", e)
             return False
     
     def get_connection_status(self):
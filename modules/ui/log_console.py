@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+관리자 패널 탭 공용 로그 창
+- QPlainTextEdit + maximumBlockCount: 오래된 줄은 자동 삭제 (장시간 열어 두어도 메모리/추가 비용 일정)
+- 추가는 모아서 한 번에 반영 (짧은 타이머, 프레임당 1회) - 어느 스레드에서 호출해도 됨
+- 자동 스크롤: 맨 아래에 있을 때만 따라감, 위로 스크롤하면 멈춤 (우클릭 메뉴로 일시정지/재개)
+- overflow_path 지정 시 화면에서 밀려난 줄은 파일에 이어서 기록
+"""
+
+import os
+import threading
+from collections import deque
+
+from PyQt5.QtWidgets import QPlainTextEdit
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QTextCursor
+
+from ..utils.log_manager import get_logger, LOG_DIR
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_LINES = 2000
+FLUSH_INTERVAL_MS = 16              # 추가 반영 간격 (약 1프레임)
+OVERFLOW_MAX_BYTES = 5 * 1024 * 1024  # 넘치면 .1 로 교체 (1개만 보관)
+
+
+def console_overflow_path(name):
+    """탭 로그 창 overflow 파일 경로 (logs/app/console_<이름>.log)"""
+    return os.path.join(LOG_DIR, f"console_{name}.log")
+
+
+class LogConsole(QPlainTextEdit):
+    """줄 수 제한 로그 창 - 기존 QTextEdit 로그와 같은 append()/clear() 사용"""
+
+    _wake = pyqtSignal()
+
+    def __init__(self, max_lines=DEFAULT_MAX_LINES, overflow_path=None, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(max_lines)
+        self.setUndoRedoEnabled(False)
+        self.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.overflow_path = overflow_path
+        self.paused = False
+        self._pending = deque()
+        self._pending_lock = threading.Lock()
+        self._scheduled = False
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+        self._wake.connect(self._schedule_flush, Qt.QueuedConnection)
+
+    def append(self, text):
+        """줄 추가 예약 (즉시 반환) - 다음 프레임에 한 번에 반영"""
+        with self._pending_lock:
+            self._pending.append(str(text))
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._wake.emit()
+
+    def _schedule_flush(self):
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def set_paused(self, paused):
+        """자동 스크롤 일시정지/재개 (재개 시 맨 아래로 이동)"""
+        self.paused = paused
+        if not paused:
+            self._scroll_to_end()
+
+    def is_following(self):
+        scrollbar = self.verticalScrollBar()
+        return not self.paused and scrollbar.value() >= scrollbar.maximum()
+
+    def flush(self):
+        """모인 줄을 한 번에 반영"""
+        with self._pending_lock:
+            lines = list(self._pending)
+            self._pending.clear()
+            self._scheduled = False
+        if not lines:
+            return
+        limit = self.maximumBlockCount()
+        overflow = []
+        if self.overflow_path and limit > 0:
+            # 이번 추가로 화면에서 밀려날 기존 줄 (빈 문서도 blockCount 는 1)
+            existing = self.blockCount() if self.document().characterCount() > 1 else 0
+            overflow = self._head_lines(min(existing, existing + len(lines) - limit))
+        if len(lines) > limit > 0:
+            # 한 번에 최대 줄 수보다 많이 들어오면 앞부분은 화면에 넣지 않음
+            overflow += lines[:-limit]
+            lines = lines[-limit:]
+        self._write_overflow(overflow)
+
+        following = self.is_following()
+        scrollbar = self.verticalScrollBar()
+        position = scrollbar.value()
+        self.appendPlainText("\n".join(lines))
+        if following:
+            self._scroll_to_end()
+        else:
+            scrollbar.setValue(min(position, scrollbar.maximum()))
+
+    def clear(self):
+        with self._pending_lock:
+            self._pending.clear()
+        super().clear()
+
+    def _scroll_to_end(self):
+        self.moveCursor(QTextCursor.End)
+        scrollbar = self.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+    def _head_lines(self, count):
+        """문서 앞쪽 count 줄 텍스트"""
+        lines = []
+        block = self.document().begin()
+        while count > 0 and block.isValid():
+            lines.append(block.text())
+            block = block.next()
+            count -= 1
+        return lines
+
+    def _write_overflow(self, lines):
+        if not self.overflow_path or not lines:
+            return
+        try:
+            directory = os.path.dirname(self.overflow_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            if os.path.exists(self.overflow_path) and os.path.getsize(self.overflow_path) > OVERFLOW_MAX_BYTES:
+                os.replace(self.overflow_path, self.overflow_path + ".1")
+            with open(self.overflow_path, 'a', encoding='utf-8') as f:
+                f.write("\n".join(lines) + "\n")
+        except Exception as e:
+            logger.error("로그 창 overflow 기록 실패: %s - %s", self.overflow_path, e)
+            self.overflow_path = None
+
+    def contextMenuEvent(self, event):
+        menu = self.createStandardContextMenu()
+        menu.addSeparator()
+        pause_action = menu.addAction("자동 스크롤 일시정지")
+        pause_action.setCheckable(True)
+        pause_action.setChecked(self.paused)
+        pause_action.toggled.connect(self.set_paused)
+        menu.exec_(event.globalPos())
+        menu.deleteLater()
@@ -23,27 +23,30 @@ from PyQt5.QtGui import QFont, QColor
 
 from ..utils.font_manager import FontManager
 from ..ui.styles import *
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
 
 class SimpleScanStatusDialog(QDialog):
     """간단한 스캔 현황 다이얼로그"""
     
     def __init__(self, main_window, child_parts_info, panel_title="스캔 현황"):
         super().__init__()
-        print(f"DEBUG: SimpleScanStatusDialog - 생성자 시작")
-        print(f"DEBUG: SimpleScanStatusDialog - main_window: {main_window}")
-        print(f"DEBUG: SimpleScanStatusDialog - child_parts_info: {len(child_parts_info) if child_parts_info else 0}개")
-        print(f"DEBUG: SimpleScanStatusDialog - panel_title: {panel_title}")
+        logger.debug("SimpleScanStatusDialog - 생성자 시작")
+        logger.debug("SimpleScanStatusDialog - main_window: %s", main_window)
+        logger.debug("SimpleScanStatusDialog - child_parts_info: %s개", len(child_parts_info) if child_parts_info else 0)
+        logger.debug("SimpleScanStatusDialog - panel_title: %s", panel_title)
         
         self.main_window = main_window
         self.child_parts_info = child_parts_info
         self.panel_title = panel_title
         self.scanned_data = []  # 스캔된 하위부품 데이터
         
-        print(f"DEBUG: SimpleScanStatusDialog - setup_ui 시작")
+        logger.debug("SimpleScanStatusDialog - setup_ui 시작")
         self.setup_ui()
-        print(f"DEBUG: SimpleScanStatusDialog - load_existing_data 시작")
+        logger.debug("SimpleScanStatusDialog - load_existing_data 시작")
         self.load_existing_data()
-        print(f"DEBUG: SimpleScanStatusDialog - 생성자 완료")
+        logger.debug("SimpleScanStatusDialog - 생성자 완료")
         
     def setup_ui(self):
         """UI 설정 - ScanStatusDialog 스타일 적용"""
@@ -182,26 +185,26 @@ class SimpleScanStatusDialog(QDialog):
         
     def load_existing_data(self):
         """기존 데이터 로드 - 안전한 로드"""
-        print(f"DEBUG: SimpleScanStatusDialog - load_existing_data 시작")
+        logger.debug("SimpleScanStatusDialog - load_existing_data 시작")
         
         # 1. 메인 윈도우 확인
         if not hasattr(self, 'main_window') or not self.main_window:
-            print(f"DEBUG: SimpleScanStatusDialog - 메인 윈도우가 없음")
+            logger.debug("SimpleScanStatusDialog - 메인 윈도우가 없음")
             return
         
         # 2. 메모리에서 로드 시도
         if hasattr(self.main_window, 'temp_scan_data') and self.main_window.temp_scan_data:
-            print(f"DEBUG: SimpleScanStatusDialog - 메모리에서 데이터 로드: {len(self.main_window.temp_scan_data)}개 항목")
-            print(f"DEBUG: SimpleScanStatusDialog - 메모리 데이터 구조: {self.main_window.temp_scan_data}")
+            logger.debug("SimpleScanStatusDialog - 메모리에서 데이터 로드: %s개 항목", len(self.main_window.temp_scan_data))
+            logger.debug("SimpleScanStatusDialog - 메모리 데이터 구조: %s", self.main_window.temp_scan_data)
             self.scanned_data = self.main_window.temp_scan_data.copy()
             
             # 메모리 데이터에서 HKMC 추적정보 파싱
-            print(f"DEBUG: SimpleScanStatusDialog - 메모리 데이터에서 HKMC 추적정보 파싱")
+            logger.debug("SimpleScanStatusDialog - 메모리 데이터에서 HKMC 추적정보 파싱")
             for i, data in enumerate(self.scanned_data):
-                print(f"DEBUG: SimpleScanStatusDialog - 메모리 데이터[{i}]: {data}")
+                logger.debug("SimpleScanStatusDialog - 메모리 데이터[%s]: %s", i, data)
                 if 'raw_data' in data and data['raw_data']:
                     raw_data = data['raw_data']
-                    print(f"DEBUG: SimpleScanStatusDialog - 메모리 raw_data: {raw_data}")
+                    logger.debug("SimpleScanStatusDialog - 메모리 raw_data: %s", raw_data)
                     if 'T' in raw_data:
                         # T 이후의 데이터 추출
                         t_index = raw_data.find('T')
@@ -212,36 +215,36 @@ class SimpleScanStatusDialog(QDialog):
                             if m_index != -1:
                                 hkmc_data = hkmc_data[:m_index]
                             
-                            print(f"DEBUG: SimpleScanStatusDialog - 메모리 HKMC 데이터 파싱: {hkmc_data}")
+                            logger.debug("SimpleScanStatusDialog - 메모리 HKMC 데이터 파싱: %s", hkmc_data)
                             # HKMC 데이터 파싱
                             parsed_info = self.parse_hkmc_barcode(hkmc_data)
                             if parsed_info:
                                 data.update(parsed_info)
-                                print(f"DEBUG: SimpleScanStatusDialog - 메모리 HKMC 파싱 결과: {parsed_info}")
+                                logger.debug("SimpleScanStatusDialog - 메모리 HKMC 파싱 결과: %s", parsed_info)
                 else:
-                    print(f"DEBUG: SimpleScanStatusDialog - 메모리 데이터[{i}]에 raw_data가 없음")
+                    logger.debug("SimpleScanStatusDialog - 메모리 데이터[%s]에 raw_data가 없음", i)
             
             self.update_ui()
             return
         else:
-            print(f"DEBUG: SimpleScanStatusDialog - 메모리 데이터가 없음 - 파일에서 로드 시도")
+            logger.debug("SimpleScanStatusDialog - 메모리 데이터가 없음 - 파일에서 로드 시도")
         
         # 3. 파일에서 로드 시도
         temp_file = "temp_scan_data.json"
         if os.path.exists(temp_file):
             try:
-                print(f"DEBUG: SimpleScanStatusDialog - 파일에서 데이터 로드 시도: {temp_file}")
+                logger.debug("SimpleScanStatusDialog - 파일에서 데이터 로드 시도: %s", temp_file)
                 with open(temp_file, 'r', encoding='utf-8') as f:
                     self.scanned_data = json.load(f)
-                print(f"DEBUG: SimpleScanStatusDialog - 파일에서 데이터 로드 성공: {len(self.scanned_data)}개 항목")
+                logger.debug("SimpleScanStatusDialog - 파일에서 데이터 로드 성공: %s개 항목", len(self.scanned_data))
                 
                 # 파일 데이터에서 HKMC 추적정보 파싱
-                print(f"DEBUG: SimpleScanStatusDialog - 파일 데이터에서 HKMC 추적정보 파싱")
+                logger.debug("SimpleScanStatusDialog - 파일 데이터에서 HKMC 추적정보 파싱")
                 for i, data in enumerate(self.scanned_data):
-                    print(f"DEBUG: SimpleScanStatusDialog - 파일 데이터[{i}]: {data}")
+                    logger.debug("SimpleScanStatusDialog - 파일 데이터[%s]: %s", i, data)
                     if 'raw_data' in data and data['raw_data']:
                         raw_data = data['raw_data']
-                        print(f"DEBUG: SimpleScanStatusDialog - 파일 raw_data: {raw_data}")
+                        logger.debug("SimpleScanStatusDialog - 파일 raw_data: %s", raw_data)
                         if 'T' in raw_data:
                             # T 이후의 데이터 추출
                             t_index = raw_data.find('T')
@@ -252,29 +255,29 @@ class SimpleScanStatusDialog(QDialog):
                                 if m_index != -1:
                                     hkmc_data = hkmc_data[:m_index]
                                 
-                                print(f"DEBUG: SimpleScanStatusDialog - 파일 HKMC 데이터 파싱: {hkmc_data}")
+                                logger.debug("SimpleScanStatusDialog - 파일 HKMC 데이터 파싱: %s", hkmc_data)
                                 # HKMC 데이터 파싱
                                 parsed_info = self.parse_hkmc_barcode(hkmc_data)
                                 if parsed_info:
                                     data.update(parsed_info)
-                                    print(f"DEBUG: SimpleScanStatusDialog - 파일 HKMC 파싱 결과: {parsed_info}")
+                                    logger.debug("SimpleScanStatusDialog - 파일 HKMC 파싱 결과: %s", parsed_info)
                     else:
-                        print(f"DEBUG: SimpleScanStatusDialog - 파일 데이터[{i}]에 raw_data가 없음")
+                        logger.debug("SimpleScanStatusDialog - 파일 데이터[%s]에 raw_data가 없음", i)
                 
                 self.update_ui()
             except Exception as e:
-                print(f"DEBUG: SimpleScanStatusDialog - 파일 로드 오류: {e}")
+                logger.error("SimpleScanStatusDialog - 파일 로드 오류: %s", e)
         else:
-            print(f"DEBUG: SimpleScanStatusDialog - 임시 파일이 없음: {temp_file}")
+            logger.debug("SimpleScanStatusDialog - 임시 파일이 없음: %s", temp_file)
         
         # 4. 데이터가 없으면 기존 temp_scan_data.json에서 HKMC 추적정보 파싱
         if not self.scanned_data:
-            print(f"DEBUG: SimpleScanStatusDialog - 기존 temp_scan_data.json에서 HKMC 추적정보 파싱")
+            logger.debug("SimpleScanStatusDialog - 기존 temp_scan_data.json에서 HKMC 추적정보 파싱")
             # 루트 디렉토리의 temp_scan_data.json 파일 경로
             # Program/ui/scan_status_dialog_simple.py -> Program -> 루트 디렉토리
             temp_file = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "temp_scan_data.json")
-            print(f"DEBUG: SimpleScanStatusDialog - temp_scan_data.json 경로: {temp_file}")
-            print(f"DEBUG: SimpleScanStatusDialog - 파일 존재 여부: {os.path.exists(temp_file)}")
+            logger.debug("SimpleScanStatusDialog - temp_scan_data.json 경로: %s", temp_file)
+            logger.debug("SimpleScanStatusDialog - 파일 존재 여부: %s", os.path.exists(temp_file))
             if os.path.exists(temp_file):
                 try:
                     with open(temp_file, 'r', encoding='utf-8') as f:
@@ -295,16 +298,16 @@ class SimpleScanStatusDialog(QDialog):
                                 if m_index != -1:
                                     hkmc_data = hkmc_data[:m_index]
                                 
-                                print(f"DEBUG: SimpleScanStatusDialog - HKMC 데이터 파싱: {hkmc_data}")
+                                logger.debug("SimpleScanStatusDialog - HKMC 데이터 파싱: %s", hkmc_data)
                                 # HKMC 데이터가 있으면 파싱 시도
                                 if hkmc_data:
                                     self.add_scan_data(part_number, hkmc_data, True)
                     
-                    print(f"DEBUG: SimpleScanStatusDialog - HKMC 파싱 완료: {len(self.scanned_data)}개 항목")
+                    logger.debug("SimpleScanStatusDialog - HKMC 파싱 완료: %s개 항목", len(self.scanned_data))
                 except Exception as e:
-                    print(f"DEBUG: SimpleScanStatusDialog - HKMC 파싱 오류: {e}")
+                    logger.error("SimpleScanStatusDialog - HKMC 파싱 오류: %s", e)
             else:
-                print(f"DEBUG: SimpleScanStatusDialog - temp_scan_data.json 파일이 없음")
+                logger.debug("SimpleScanStatusDialog - temp_scan_data.json 파일이 없음")
     
     def update_ui(self):
         """UI 업데이트"""
@@ -402,25 +405,25 @@ class SimpleScanStatusDialog(QDialog):
     def parse_hkmc_barcode(self, barcode):
         """HKMC 바코드에서 추적정보 파싱"""
         try:
-            print(f"DEBUG: HKMC 바코드 파싱 시작: {barcode}")
+            logger.debug("HKMC 바코드 파싱 시작: %s", barcode)
             
             # HKMC 바코드 형식: T + 식별자(6자리) + 4M기초정보 + 시리얼구분 + 시리얼번호
             # 예: T251016S1B2A0476217
             if not barcode or len(barcode) < 6:
-                print(f"DEBUG: HKMC 바코드 길이 부족: {len(barcode) if barcode else 0}")
+                logger.debug("HKMC 바코드 길이 부족: %s", len(barcode) if barcode else 0)
                 return {}
             
             # T가 이미 제거된 상태로 들어오므로 바로 파싱
             data = barcode
-            print(f"DEBUG: 파싱할 데이터: {data}")
+            logger.debug("파싱할 데이터: %s", data)
             
             # 식별자 (6자리): YYDDMM
             identifier = data[:6] if len(data) >= 6 else ''
-            print(f"DEBUG: 식별자: {identifier}")
+            logger.debug("식별자: %s", identifier)
             
             # 나머지 데이터에서 4M기초정보, 시리얼구분, 시리얼번호 추출
             remaining = data[6:] if len(data) > 6 else ''
-            print(f"DEBUG: 나머지 데이터: {remaining}")
+            logger.debug("나머지 데이터: %s", remaining)
             
             # 시리얼구분 찾기 (A 또는 @)
             serial_type = ''
@@ -442,11 +445,11 @@ class SimpleScanStatusDialog(QDialog):
                 'serial_number': serial_number
             }
             
-            print(f"DEBUG: HKMC 파싱 결과: {result}")
+            logger.debug("HKMC 파싱 결과: %s", result)
             return result
             
         except Exception as e:
-            print(f"DEBUG: HKMC 바코드 파싱 오류: {e}")
+            logger.error("HKMC 바코드 파싱 오류: %s", e)
             return {}
     
     
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스캔현황 다이얼로그 테이블 모델
+- 하위부품 테이블: 스캔 1건 = 해당 행 상태 셀 1개만 dataChanged (전체 재구성/강제 repaint 없음)
+- 스캔 데이터(디버그용) 테이블: 스캔 세션 저장소 뷰를 그대로 표시 (복사 없음)
+"""
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QFont
+
+STATUS_WAITING = "대기"
+SCANNED_STATUSES = ("OK", "NG")
+
+COL_PART_NUMBER = 0
+COL_PART_NAME = 1
+COL_STATUS = 2
+
+
+def _status_font():
+    font = QFont()
+    font.setBold(True)
+    font.setPointSize(12)
+    return font
+
+
+class ChildPartsStatusModel(QAbstractTableModel):
+    """하위부품 목록 + 행별 스캔상태 모델"""
+
+    HEADERS = ["하위부품 Part_No", "하위부품 Part_Name", "스캔상태"]
+
+    def __init__(self, child_parts_info=None, font=None, parent=None):
+        super().__init__(parent)
+        self._font = font
+        self._status_font = _status_font()
+        self.set_child_parts(child_parts_info or [])
+
+    def set_child_parts(self, child_parts_info):
+        """하위부품 목록 설정 (모든 행 대기 상태로 시작)"""
+        self.beginResetModel()
+        self._parts = [(str(part.get("part_number", "")).strip(), part.get("part_name", ""))
+                       for part in child_parts_info]
+        self._statuses = [STATUS_WAITING] * len(self._parts)
+        self._row_by_part = {}
+        for row, (part_number, _) in enumerate(self._parts):
+            self._row_by_part.setdefault(part_number, row)
+        self._scanned_count = 0
+        self.endResetModel()
+
+    # ===== Qt 모델 인터페이스 =====
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._parts)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            if column == COL_STATUS:
+                return self._statuses[row]
+            return self._parts[row][column]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.FontRole:
+            return self._status_font if column == COL_STATUS else self._font
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    # ===== 상태 변경 =====
+
+    @property
+    def scanned_count(self):
+        """OK/NG 판정된 행 수 (상수 시간)"""
+        return self._scanned_count
+
+    def part_number(self, row):
+        return self._parts[row][0]
+
+    def status(self, row):
+        return self._statuses[row]
+
+    def find_row(self, part_number):
+        """스캔 부품번호에 해당하는 행 (정확 일치는 상수 시간, 없으면 부분 일치 검색)"""
+        part_number = (part_number or "").strip()
+        row = self._row_by_part.get(part_number)
+        if row is not None:
+            return row
+        for row, (table_part_number, _) in enumerate(self._parts):
+            if table_part_number in part_number or part_number in table_part_number:
+                return row
+        return -1
+
+    def set_status(self, row, status):
+        """한 행의 상태 변경 - 값이 바뀐 경우에만 해당 셀 1개 갱신"""
+        old = self._statuses[row]
+        if old == status:
+            return False
+        self._statuses[row] = status
+        self._scanned_count += (status in SCANNED_STATUSES) - (old in SCANNED_STATUSES)
+        cell = self.index(row, COL_STATUS)
+        self.dataChanged.emit(cell, cell, [Qt.DisplayRole])
+        return True
+
+    def apply_scans(self, scans):
+        """스캔 기록(최신순)으로 전체 행 상태 재계산 - 복원 시 1회, 상태 열만 갱신"""
+        latest = {}
+        for scan_data in scans:
+            latest.setdefault(scan_data.get('part_number'), scan_data.get('status', 'OK'))
+        statuses = [latest.get(part_number, STATUS_WAITING) for part_number, _ in self._parts]
+        if statuses == self._statuses:
+            return
+        self._statuses = statuses
+        self._scanned_count = sum(1 for status in statuses if status in SCANNED_STATUSES)
+        if self._parts:
+            self.dataChanged.emit(self.index(0, COL_STATUS),
+                                  self.index(len(self._parts) - 1, COL_STATUS), [Qt.DisplayRole])
+
+
+class ScanLogModel(QAbstractTableModel):
+    """스캔 데이터(디버그용) 테이블 모델 - 최신순 스캔 목록 뷰를 표시"""
+
+    HEADERS = ["스캔된 데이터 (디버그용)"]
+
+    def __init__(self, source, font=None, parent=None):
+        super().__init__(parent)
+        self._source_getter = source   # 호출 시 최신순 스캔 목록 반환
+        self._font = font
+        self._row_count = len(source())
+        self._latest = self._first(source())
+
+    @staticmethod
+    def _first(items):
+        return items[0] if len(items) else None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        items = self._source_getter()
+        if index.row() >= len(items):
+            return None
+        if role == Qt.DisplayRole:
+            scan_data = items[index.row()]
+            raw_data = scan_data.get('raw_data') or scan_data.get('part_number')
+            return f"[{scan_data.get('time')}] {scan_data.get('status')}: {raw_data}"
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignLeft | Qt.AlignVCenter)
+        if role == Qt.FontRole:
+            return self._font
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def sync(self):
+        """원본 목록 변경 반영 - 맨 앞에 추가된 행만 삽입하고 최신 행만 갱신"""
+        items = self._source_getter()
+        count = len(items)
+        latest = self._first(items)
+        added = count - self._row_count
+        if latest is self._latest and added == 0:
+            # 최신 레코드 판정 수정(amend)만 있었을 수 있음
+            if count:
+                self.dataChanged.emit(self.index(0, 0), self.index(0, 0), [Qt.DisplayRole])
+            return
+        if added > 0 and (self._latest is None or (added < count and items[added] is self._latest)):
+            self.beginInsertRows(QModelIndex(), 0, added - 1)
+            self._row_count = count
+            self._latest = latest
+            self.endInsertRows()
+            return
+        if added == 0 and count > 1 and items[1] is self._latest:
+            # 최대 개수에 도달한 상태에서 1건 추가 - 맨 뒤 1행 제거 후 맨 앞 1행 삽입
+            self.beginRemoveRows(QModelIndex(), count - 1, count - 1)
+            self._row_count = count - 1
+            self.endRemoveRows()
+            self.beginInsertRows(QModelIndex(), 0, 0)
+            self._row_count = count
+            self._latest = latest
+            self.endInsertRows()
+            return
+        # 초기화/최대 개수 초과로 뒤쪽이 밀려난 경우 등 - 전체 재설정
+        self.beginResetModel()
+        self._row_count = count
+        self._latest = latest
+        self.endResetModel()
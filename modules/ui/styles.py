@@ -822,6 +822,25 @@ def get_info_label_style():
         }
     """
 
+def get_history_detail_title_style():
+    """이력 상세보기 제목 스타일"""
+    return get_tab_title_style()
+
+def get_history_detail_text_style():
+    """이력 상세보기 텍스트 스타일"""
+    return """
+        QTextEdit {
+            background-color: #f8f9fa;
+            border: 1px solid #dee2e6;
+            border-radius: 4px;
+            font-size: 12px;
+        }
+    """
+
+def get_history_detail_close_btn_style():
+    """이력 상세보기 닫기 버튼 스타일"""
+    return get_button_style()
+
 def get_bold_combo_style():
     """굵은 글씨 콤보박스 스타일"""
     return """
@@ -1023,9 +1042,9 @@ def get_main_part_label_style():
     """
 
 def get_main_division_frame_style():
-    """메인 화면 구분 프레임 스타일"""
+    """메인 화면 구분 프레임 스타일 (프레임 자신만 - 안쪽 상태 라벨은 상태 테마 적용)"""
     return """
-        QFrame {
+        QFrame#mainDivisionFrame {
             background-color: #3498DB;
             border: 0.5px solid #2980B9;
             border-radius: 3px;
@@ -1071,6 +1090,19 @@ def get_main_uph_label_style():
         }
     """
 
+def get_main_cycle_label_style(slow=False):
+    """메인 화면 사이클타임 라벨 스타일 (목표 택트 초과 시 적색)"""
+    background, border = ("#DC3545", "#C82333") if slow else ("#6C757D", "#5A6268")
+    return f"""
+        QLabel {{
+            background-color: {background};
+            color: white;
+            border: 1px solid {border};
+            border-radius: 3px;
+            padding: 5px;
+        }}
+    """
+
 def get_main_scan_button_style():
     """메인 화면 스캔 버튼 스타일"""
     return """
@@ -1317,6 +1349,77 @@ def get_main_plc_data_error_style():
         }
     """
 
+# ===== 메인 화면 상태 테마 (동적 속성 기반) =====
+# 상태가 자주 바뀌는 라벨은 위젯마다 setStyleSheet 하지 않고 role/state 속성만 바꿈
+# 규칙은 메인 윈도우 스타일시트에 한 번만 포함 → 상태 변경 시 스타일시트 재파싱 없음
+
+# 색상 이름 → (배경색, 테두리색) - 위 get_main_*_style 과 같은 색상
+MAIN_STATE_COLORS = {
+    "green": ("#28A745", "#1E7E34"),
+    "red": ("#DC3545", "#C82333"),
+    "gray": ("#6C757D", "#5A6268"),
+    "blue": ("#3498DB", "#2980B9"),
+    "teal": ("#17A2B8", "#138496"),
+    "yellow": ("#FFC107", "#E0A800"),
+}
+
+# role → {state: 색상 이름}
+MAIN_STATE_THEME = {
+    "device_status": {"connected": "green", "disconnected": "red"},
+    "work_status": {"completed": "green", "in_progress": "gray", "plc_link_off": "red",
+                    "plc_connected": "teal", "plc_data_error": "yellow"},
+    "division": {"default": "blue", "normal": "green", "error": "red", "plc_link_off": "red",
+                 "plc_connected": "teal", "plc_data_error": "yellow"},
+    "child_part": {"idle": "gray", "matched": "green", "unmatched": "red"},
+    "cycle": {"normal": "gray", "slow": "red"},
+}
+
+_main_state_theme_style = None
+
+
+def get_main_state_theme_style():
+    """메인 화면 상태 테마 스타일시트 (role/state 속성 선택자) - 한 번만 생성"""
+    global _main_state_theme_style
+    if _main_state_theme_style is None:
+        roles = ", ".join(f'QLabel[role="{role}"]' for role in MAIN_STATE_THEME)
+        rules = [f"""
+        {roles} {{
+            color: white;
+            border-radius: 3px;
+            padding: 5px;
+            font-weight: bold;
+        }}
+        QLabel[role="cycle"] {{
+            font-weight: normal;
+        }}"""]
+        for role, states in MAIN_STATE_THEME.items():
+            for state, color in states.items():
+                background, border = MAIN_STATE_COLORS[color]
+                rules.append(f"""
+        QLabel[role="{role}"][state="{state}"] {{
+            background-color: {background};
+            border: 1px solid {border};
+        }}""")
+        _main_state_theme_style = "".join(rules) + "\n"
+    return _main_state_theme_style
+
+
+def set_style_state(widget, state):
+    """위젯 상태(state 속성) 변경 - 바뀐 경우에만 해당 위젯만 다시 polish"""
+    if widget.property("state") == state:
+        return False
+    widget.setProperty("state", state)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    return True
+
+
+def apply_style_role(widget, role, state):
+    """상태 테마 대상 위젯 등록 (role 지정 + 초기 state)"""
+    widget.setProperty("role", role)
+    set_style_state(widget, state)
+
 def get_main_date_label_style():
     """메인 화면 날짜 라벨 스타일"""
     return """
@@ -6,5 +6,7 @@ from .barcode_scanner_tab import BarcodeScannerTab
 from .nutrunner_tab import NutRunnerTab
 from .barcode_printer_tab import BarcodePrinterTab
 from .master_data_tab import MasterDataTab
+from .production_report_tab import ProductionReportTab
 
-__all__ = ['PLCCommunicationTab', 'BarcodeScannerTab', 'NutRunnerTab', 'BarcodePrinterTab', 'MasterDataTab']
+__all__ = ['PLCCommunicationTab', 'BarcodeScannerTab', 'NutRunnerTab', 'BarcodePrinterTab', 'MasterDataTab',
+           'ProductionReportTab']
@@ -5,7 +5,7 @@ import sys
 import os
 from datetime import datetime
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QComboBox, QPushButton, QTextEdit, QGroupBox, 
+                             QComboBox, QPushButton, QGroupBox, 
                              QGridLayout, QMessageBox, QLineEdit)
 from PyQt5.QtCore import QThread, pyqtSignal, Qt
 from PyQt5.QtGui import QFont
@@ -16,9 +16,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 #                    get_clean_button_style, get_quality_test_button_style, get_port_status_connected_style,
 #                    get_port_status_disconnected_style)
 from ...ui.styles import *
+from ...ui.log_console import LogConsole, console_overflow_path
 from ...utils.font_manager import FontManager
 from ...utils.utils import SettingsManager, SerialConnectionThread
 from ...utils.modules import SerialConnectionManager
+from ...utils.modules.port_inventory import (PortInventoryService, fill_port_combo,
+                                                  NO_PORTS_TEXT, SCANNING_TEXT)
 
 class BarcodePrinterTab(QWidget):
     """바코드 프린터 테스트 탭"""
@@ -32,6 +35,10 @@ class BarcodePrinterTab(QWidget):
         self.connection_manager.connection_status_changed.connect(self.on_connection_status)
         self.connection_manager.data_received.connect(self.on_plc_data_received)
         
+        # 공용 포트 목록 서비스 (조회는 작업 스레드, 결과는 시그널로 모든 탭에 전달)
+        self.port_inventory = PortInventoryService.shared()
+        self.port_inventory.ports_updated.connect(self.on_ports_updated)
+        
         self.init_ui()
         self.load_settings()
         
@@ -146,7 +153,8 @@ class BarcodePrinterTab(QWidget):
         log_group = QGroupBox("📋 로그")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        # 줄 수 제한 로그 창 (오래된 줄은 파일로 밀어냄 - 장시간 열어 두어도 메모리 일정)
+        self.log_text = LogConsole(overflow_path=console_overflow_path("printer"))
         self.log_text.setMaximumHeight(100)
         self.log_text.setReadOnly(True)
         log_layout.addWidget(self.log_text)
@@ -157,236 +165,36 @@ class BarcodePrinterTab(QWidget):
         
         layout.addWidget(log_group)
         
-        self.refresh_ports()
+        self.simple_refresh_ports()
     
     def refresh_ports(self):
-        """사용 가능한 시리얼 포트 새로고침"""
-        import serial.tools.list_ports
-        import time
-        import gc
-        
-        # print("DEBUG: 포트 새로고침 시작")
-        
-        # 기존 시리얼 연결 완전 정리
-        if hasattr(self, 'serial_thread') and self.serial_thread:
-            try:
-                # print("DEBUG: 기존 시리얼 스레드 정리 중...")
-                self.serial_thread.stop()
-                if not self.serial_thread.wait(1000):
-                    self.serial_thread.terminate()
-                    self.serial_thread.wait()
-                self.serial_thread = None
-                # print("DEBUG: 시리얼 스레드 정리 완료")
-            except Exception as e:
-                # print(f"DEBUG: 시리얼 스레드 정리 중 오류: {e}")
-                pass
-        
-        # 가비지 컬렉션으로 메모리 정리
-        gc.collect()
-        
-        # 포트 해제 후 충분한 대기 시간 (더 길게)
-        time.sleep(3.0)  # 3초로 더 연장
-        
-        self.port_combo.clear()
-        
-        # 포트 목록 새로고침 (여러 번 시도)
-        ports = []
-        for attempt in range(3):
-            try:
-                ports = serial.tools.list_ports.comports()
-                if ports:
-                    break
-                time.sleep(0.5)
-            except Exception as e:
-                # print(f"DEBUG: 포트 목록 조회 시도 {attempt + 1} 실패: {e}")
-                time.sleep(0.5)
-        
-        available_ports = []
-        unavailable_ports = []
-        
-        # print(f"DEBUG: 발견된 포트 수: {len(ports)}")
-        
-        for port in ports:
-            try:
-                # print(f"DEBUG: 포트 테스트 중: {port.device}")
-                # 포트가 사용 중인지 확인 (매우 짧은 타임아웃)
-                test_ser = serial.Serial(port.device, timeout=0.01)
-                test_ser.close()
-                available_ports.append(port)
-                print(f"DEBUG: 프린터 포트 사용 가능: {port.device}")
-                # print(f"DEBUG: 포트 사용 가능: {port.device}")
-            except (serial.SerialException, OSError) as e:
-                # 포트가 사용 중이거나 접근할 수 없음
-                unavailable_ports.append((port, str(e)))
-                print(f"DEBUG: 프린터 포트 사용 불가: {port.device} - {e}")
-                # print(f"DEBUG: 포트 사용 불가: {port.device} - {e}")
-                # 포트 테스트 후 잠시 대기
-                time.sleep(0.2)
-                continue
-            except Exception as e:
-                # 기타 예외 처리
-                unavailable_ports.append((port, str(e)))
-                print(f"DEBUG: 프린터 포트 테스트 중 예외: {port.device} - {e}")
-                # print(f"DEBUG: 포트 테스트 중 예외: {port.device} - {e}")
-                time.sleep(0.2)
-                continue
-        
-        print(f"DEBUG: 프린터 사용 가능한 포트 수: {len(available_ports)}")
-        
-        # 사용 가능한 포트 먼저 추가
-        if available_ports:
-            for port in available_ports:
-                port_info = f"{port.device} - {port.description}"
-                
-                # AdminPanel에서 포트 사용 중인지 확인
-                is_in_use = False
-                using_tab = None
-                if hasattr(self, 'admin_panel') and self.admin_panel:
-                    is_in_use, using_tab = self.admin_panel.is_port_in_use(port.device, getattr(self, 'tab_name', '바코드 프린터'))
-                
-                # 사용 중인 포트는 "-사용중-" 표시
-                if is_in_use:
-                    port_info += f" -사용중-"
-                
-                self.port_combo.addItem(port_info)
-                print(f"DEBUG: 프린터 포트 추가 (사용가능): {port_info}")
-        
-        # 사용 불가능한 포트도 표시 (참고용)
-        if unavailable_ports:
-            for port, error in unavailable_ports:
-                port_info = f"{port.device} - {port.description} (사용불가)"
-                
-                # AdminPanel에서 포트 사용 중인지 확인
-                is_in_use = False
-                using_tab = None
-                if hasattr(self, 'admin_panel') and self.admin_panel:
-                    is_in_use, using_tab = self.admin_panel.is_port_in_use(port.device, getattr(self, 'tab_name', '바코드 프린터'))
-                
-                # 사용 중인 포트는 "-사용중-" 표시
-                if is_in_use:
-                    port_info = f"{port.device} - {port.description} -사용중-"
-                
-                self.port_combo.addItem(port_info)
-                print(f"DEBUG: 프린터 포트 추가 (사용불가): {port_info}")
-        
-        if not available_ports and not unavailable_ports:
-            self.port_combo.addItem("감지된 포트 없음")
-            print("DEBUG: 프린터 감지된 포트 없음")
-        
-        # 연결 상태에 따라 포트 표시 업데이트
-        if hasattr(self, 'is_connected_from_main') and self.is_connected_from_main:
-            self.update_port_combo_for_connection(True)
-        
-        self.log_message("포트 목록을 새로고침했습니다.")
-        print("DEBUG: 프린터 포트 새로고침 완료 - 콤보박스 업데이트됨")
+        """사용 가능한 시리얼 포트 새로고침 (열기 테스트 포함) - 조회는 작업 스레드에서, 결과는 on_ports_updated"""
+        self.port_inventory.refresh(probe=True, force=True)
+        self.log_message("포트 목록을 새로고침합니다...")
     
     def force_refresh_ports(self):
-        """강제 포트 새로고침 - 연결 해제 후 즉시 실행"""
-        import serial.tools.list_ports
-        import time
-        import gc
-        
-        print("DEBUG: 강제 포트 새로고침 시작")
-        
-        # 모든 리소스 강제 정리
-        gc.collect()
-        time.sleep(1.0)  # 1초 대기
-        
-        # 콤보박스 즉시 클리어
-        self.port_combo.clear()
-        
-        # 포트 목록 즉시 조회
-        try:
-            ports = serial.tools.list_ports.comports()
-            available_ports = []
-            
-            for port in ports:
-                try:
-                    # 포트 테스트 (매우 짧은 타임아웃)
-                    test_ser = serial.Serial(port.device, timeout=0.01)
-                    test_ser.close()
-                    available_ports.append(port)
-                except:
-                    continue
-            
-            # 콤보박스 즉시 업데이트
-            if not available_ports:
-                self.port_combo.addItem("사용 가능한 포트 없음")
-            else:
-                for port in available_ports:
-                    port_info = f"{port.device} - {port.description}"
-                    
-                    # AdminPanel에서 포트 사용 중인지 확인
-                    is_in_use = False
-                    using_tab = None
-                    if hasattr(self, 'admin_panel') and self.admin_panel:
-                        is_in_use, using_tab = self.admin_panel.is_port_in_use(port.device, getattr(self, 'tab_name', '바코드 프린터'))
-                    
-                    # 사용 중인 포트는 "-사용중-" 표시
-                    if is_in_use:
-                        port_info += f" -사용중-"
-                    
-                    self.port_combo.addItem(port_info)
-            
-            print(f"DEBUG: 강제 새로고침 완료 - {len(available_ports)}개 포트 발견")
-            
-        except Exception as e:
-            print(f"DEBUG: 강제 새로고침 오류: {e}")
-            self.port_combo.addItem("사용 가능한 포트 없음")
+        """강제 포트 새로고침 - 연결 해제 후 즉시 실행 (캐시 무시, 작업 스레드에서 조회)"""
+        self.port_inventory.refresh(force=True)
     
     def simple_refresh_ports(self):
-        """간단한 포트 새로고침 - 포트 테스트 없이"""
-        import serial.tools.list_ports
-        
-        print(f"DEBUG: 프린터 simple_refresh_ports 시작 - admin_panel: {hasattr(self, 'admin_panel') and self.admin_panel is not None}")
-        
-        # 현재 연결된 포트 정보 저장
-        current_connected_port = None
-        if hasattr(self, 'serial_thread') and self.serial_thread and hasattr(self.serial_thread, 'port_name'):
-            current_connected_port = self.serial_thread.port_name
-            print(f"DEBUG: 현재 연결된 포트: {current_connected_port}")
-        
-        # 콤보박스 클리어
-        self.port_combo.clear()
+        """간단한 포트 새로고침 - 캐시된 목록으로 즉시 표시 (캐시가 오래됐으면 작업 스레드에서 재조회)"""
+        self.on_ports_updated(self.port_inventory.entries())
+        self.port_inventory.refresh()
+    
+    def on_ports_updated(self, entries):
+        """포트 목록 서비스 조회 결과 반영 (현재 연결된 포트 선택 유지)"""
+        current_connected_port = getattr(self.serial_thread, 'port_name', None)
+        admin_panel = getattr(self, 'admin_panel', None)
+        fill_port_combo(self.port_combo, entries, admin_panel.port_usage if admin_panel else None,
+                        current_connected_port)
         
-        try:
-            # 포트 목록만 조회 (테스트 없이)
-            ports = serial.tools.list_ports.comports()
-            
-            if not ports:
-                self.port_combo.addItem("사용 가능한 포트 없음")
-                print("DEBUG: 포트 없음")
-            else:
-                ports.sort(key=lambda x: x.device)
-                for port in ports:
-                    port_info = f"{port.device} - {port.description}"
-                    
-                    # AdminPanel에서 포트 사용 중인지 확인
-                    is_in_use = False
-                    using_tab = None
-                    if hasattr(self, 'admin_panel') and self.admin_panel:
-                        is_in_use, using_tab = self.admin_panel.is_port_in_use(port.device, getattr(self, 'tab_name', '바코드 프린터'))
-                    
-                    # 사용 중인 포트는 "-사용중-" 표시
-                    if is_in_use:
-                        port_info += f" -사용중-"
-                    
-                    self.port_combo.addItem(port_info)
-                    
-                    # 현재 연결된 포트가 있으면 선택
-                    if current_connected_port and port.device == current_connected_port:
-                        self.port_combo.setCurrentText(port_info)
-                        print(f"DEBUG: 연결된 포트 선택됨: {port_info}")
-                
-                print(f"DEBUG: {len(ports)}개 포트 발견")
-            
-        except Exception as e:
-            print(f"DEBUG: 포트 조회 오류: {e}")
-            self.port_combo.addItem("사용 가능한 포트 없음")
+        # 연결 상태에 따라 포트 표시 업데이트
+        if getattr(self, 'is_connected_from_main', False):
+            self.update_port_combo_for_connection(True)
     
     def connect_serial(self):
         """시리얼 포트 연결"""
-        if self.port_combo.currentText() == "사용 가능한 포트 없음":
+        if self.port_combo.currentText() in (NO_PORTS_TEXT, SCANNING_TEXT):
             QMessageBox.warning(self, "경고", "연결할 포트를 선택하세요.")
             self.connect_btn.setChecked(False)
             return
@@ -673,6 +481,7 @@ class BarcodePrinterTab(QWidget):
         # 포트 설정
         if printer_settings.get("port"):
             self.port_combo.setCurrentText(printer_settings["port"])
+            self.port_combo.setProperty("preferred_port", printer_settings["port"])  # 포트 목록 조회 후에도 선택 유지
         
         # 보드레이트 설정
         if printer_settings.get("baudrate"):
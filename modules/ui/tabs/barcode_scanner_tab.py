@@ -17,10 +17,12 @@ from datetime import datetime
 #                    get_save_button_style, get_status_check_button_style, get_test_print_button_style,
 #                    get_port_status_connected_style, get_port_status_disconnected_style)
 from ...ui.styles import *
+from ...ui.log_console import LogConsole, console_overflow_path
 from ...utils.font_manager import FontManager
 
 from ...utils.utils import SerialConnectionThread
 from ...utils.modules import SerialConnectionManager
+from ...utils.modules.port_inventory import PortInventoryService, fill_port_combo
 from ...hardware.hkmc_barcode_utils import HKMCBarcodeUtils
 from ...ui.dialogs import BarcodeAnalysisDialog
 
@@ -41,6 +43,10 @@ class BarcodeScannerTab(QWidget):
         self.connection_manager.connection_status_changed.connect(self.on_connection_status)
         self.connection_manager.data_received.connect(self.on_barcode_received)
         
+        # 공용 포트 목록 서비스 (조회는 작업 스레드, 결과는 시그널로 모든 탭에 전달)
+        self.port_inventory = PortInventoryService.shared()
+        self.port_inventory.ports_updated.connect(self.on_ports_updated)
+        
         self.init_ui()
         self.load_settings()
         self.ensure_scan_logs_directory()  # 스캔 로그 디렉토리 확인
@@ -179,7 +185,8 @@ class BarcodeScannerTab(QWidget):
         log_group = QGroupBox("📋 로그")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        # 줄 수 제한 로그 창 (오래된 줄은 파일로 밀어냄 - 장시간 열어 두어도 메모리 일정)
+        self.log_text = LogConsole(overflow_path=console_overflow_path("scanner"))
         self.log_text.setMaximumHeight(150)
         self.log_text.setReadOnly(True)
         log_layout.addWidget(self.log_text)
@@ -190,109 +197,28 @@ class BarcodeScannerTab(QWidget):
         
         layout.addWidget(log_group)
         
-        self.refresh_ports()
+        self.simple_refresh_ports()
     
     def refresh_ports(self):
-        """사용 가능한 시리얼 포트 새로고침"""
-        import serial
-        import serial.tools.list_ports
-        
-        self.port_combo.clear()
-        ports = serial.tools.list_ports.comports()
-        available_ports = []
-        unavailable_ports = []
-        
-        for port in ports:
-            try:
-                # 포트가 사용 중인지 확인
-                test_ser = serial.Serial(port.device, timeout=0.1)
-                test_ser.close()
-                available_ports.append(port)
-                print(f"DEBUG: 포트 사용 가능: {port.device}")
-            except (serial.SerialException, OSError) as e:
-                # 포트가 사용 중이거나 접근할 수 없음
-                unavailable_ports.append((port, str(e)))
-                print(f"DEBUG: 포트 사용 불가: {port.device} - {e}")
-                continue
-        
-        # 사용 가능한 포트 먼저 추가
-        if available_ports:
-            for port in available_ports:
-                port_info = f"{port.device} - {port.description}"
-                self.port_combo.addItem(port_info)
-                print(f"DEBUG: 포트 추가 (사용가능): {port_info}")
-        
-        # 사용 불가능한 포트도 표시 (참고용)
-        if unavailable_ports:
-            for port, error in unavailable_ports:
-                port_info = f"{port.device} - {port.description} (사용불가)"
-                self.port_combo.addItem(port_info)
-                print(f"DEBUG: 포트 추가 (사용불가): {port_info}")
-        
-        if not available_ports and not unavailable_ports:
-            self.port_combo.addItem("감지된 포트 없음")
-            print("DEBUG: 감지된 포트 없음")
-        
-        # 연결 상태에 따라 포트 표시 업데이트
-        if hasattr(self, 'is_connected_from_main') and self.is_connected_from_main:
-            self.update_port_combo_for_connection(True)
-        
-        self.log_message("포트 목록을 새로고침했습니다.")
+        """사용 가능한 시리얼 포트 새로고침 (열기 테스트 포함) - 조회는 작업 스레드에서, 결과는 on_ports_updated"""
+        self.port_inventory.refresh(probe=True, force=True)
+        self.log_message("포트 목록을 새로고침합니다...")
     
     def simple_refresh_ports(self):
-        """간단한 포트 새로고침 - 포트 테스트 없이"""
-        import serial.tools.list_ports
-        
-        print("DEBUG: 스캐너 간단한 포트 새로고침 시작")
-        
-        # 현재 연결된 포트 정보 저장
-        current_connected_port = None
-        if hasattr(self, 'serial_thread') and self.serial_thread and hasattr(self.serial_thread, 'port_name'):
-            current_connected_port = self.serial_thread.port_name
-            print(f"DEBUG: 스캐너 현재 연결된 포트: {current_connected_port}")
-        
-        # 콤보박스 클리어
-        self.port_combo.clear()
+        """간단한 포트 새로고침 - 캐시된 목록으로 즉시 표시 (캐시가 오래됐으면 작업 스레드에서 재조회)"""
+        self.on_ports_updated(self.port_inventory.entries())
+        self.port_inventory.refresh()
+    
+    def on_ports_updated(self, entries):
+        """포트 목록 서비스 조회 결과 반영 (현재 연결된 포트 선택 유지)"""
+        current_connected_port = getattr(self.serial_thread, 'port_name', None)
+        admin_panel = getattr(self, 'admin_panel', None)
+        fill_port_combo(self.port_combo, entries, admin_panel.port_usage if admin_panel else None,
+                        current_connected_port)
         
-        try:
-            # 포트 목록만 조회 (테스트 없이)
-            ports = serial.tools.list_ports.comports()
-            
-            if not ports:
-                self.port_combo.addItem("사용 가능한 포트 없음")
-                print("DEBUG: 스캐너 포트 없음")
-            else:
-                ports.sort(key=lambda x: x.device)
-                for port in ports:
-                    port_info = f"{port.device} - {port.description}"
-                    
-                    # AdminPanel에서 포트 사용 중인지 확인
-                    is_in_use = False
-                    using_tab = None
-                    if hasattr(self, 'admin_panel') and self.admin_panel:
-                        is_in_use, using_tab = self.admin_panel.is_port_in_use(port.device, getattr(self, 'tab_name', '바코드 스캐너'))
-                        if is_in_use:
-                            print(f"DEBUG: 스캐너 simple_refresh_ports - {port.device}는 {using_tab}에서 사용 중 (등록된 포트: {self.admin_panel.port_usage})")
-                    else:
-                        print(f"DEBUG: 스캐너 simple_refresh_ports - admin_panel 없음")
-                    
-                    # 사용 중인 포트는 "-사용중-" 표시
-                    if is_in_use:
-                        port_info += f" -사용중-"
-                        print(f"DEBUG: 스캐너 포트 추가 (사용중): {port_info}")
-                    
-                    self.port_combo.addItem(port_info)
-                    
-                    # 현재 연결된 포트가 있으면 선택
-                    if current_connected_port and port.device == current_connected_port:
-                        self.port_combo.setCurrentText(port_info)
-                        print(f"DEBUG: 스캐너 연결된 포트 선택됨: {port_info}")
-                
-                print(f"DEBUG: 스캐너 {len(ports)}개 포트 발견")
-            
-        except Exception as e:
-            # print(f"DEBUG: 스캐너 포트 조회 오류: {e}")
-            self.port_combo.addItem("사용 가능한 포트 없음")
+        # 연결 상태에 따라 포트 표시 업데이트
+        if getattr(self, 'is_connected_from_main', False):
+            self.update_port_combo_for_connection(True)
     
     def notify_main_screen_connection(self, device_name, is_connected):
         """메인화면에 연결 상태 알림"""
@@ -815,6 +741,7 @@ class BarcodeScannerTab(QWidget):
         # 포트 설정
         if scanner_settings.get("port"):
             self.port_combo.setCurrentText(scanner_settings["port"])
+            self.port_combo.setProperty("preferred_port", scanner_settings["port"])  # 포트 목록 조회 후에도 선택 유지
         
         # 보드레이트 설정
         if scanner_settings.get("baudrate"):
@@ -18,6 +18,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # 스타일 임포트
 from ..styles import *
+from ...core.traceability_index import TraceabilityIndex
+from ...core.line_aggregator import AggregatorQuery
 
 class HistoryTab(QWidget):
     """프린트 이력 관리 탭"""
@@ -26,6 +28,8 @@ class HistoryTab(QWidget):
         super().__init__()
         self.settings_manager = settings_manager
         self.admin_panel = None
+        # 라인 집계 서버 (설정 시 라인 전체 이력/추적 조회, 없으면 이 PC 로그)
+        self.aggregator = AggregatorQuery.from_config(settings_manager.settings)
         self.init_ui()
         
     def init_ui(self):
@@ -193,8 +197,10 @@ class HistoryTab(QWidget):
             selected_part = self.part_number_combo.currentText()
             initial_filter = self.initial_filter_combo.currentText()
             
-            # 이력 데이터 로드
-            history_data = self.load_history_data()
+            # 이력 데이터 로드 (집계 서버를 쓰면 라인 전체 이력을 기간으로 조회)
+            history_data = self.load_aggregated_history() if self.aggregator else None
+            if history_data is None:
+                history_data = self.load_history_data()
             
             # 필터링
             filtered_data = []
@@ -301,6 +307,60 @@ class HistoryTab(QWidget):
             print(f"이력 데이터 로드 오류: {e}")
             return []
     
+    def load_aggregated_history(self):
+        """집계 서버에서 기간 내 라인 전체 라벨 출력 이력 조회 (서버 연결 실패 시 None → 로컬 로그)"""
+        try:
+            rows = self.aggregator.labels(self.start_date.date().toString('yyyy-MM-dd'),
+                                          self.end_date.date().toString('yyyy-MM-dd'))
+        except Exception as e:
+            print(f"집계 서버 이력 조회 실패 - 로컬 로그 사용: {e}")
+            return None
+        
+        history_data = []
+        for row in rows:
+            record = {'tracking_number': ''}
+            record.update(self.parse_parent_barcode(row.get('barcode') or ''))
+            record.update({
+                'timestamp': row['printed_at'],
+                'date': row['printed_at'][:10].replace('-', ''),  # 검색 조건(yyyyMMdd)과 같은 형식
+                'part_number': row['part_number'],
+                'output_result': 'SUCCESS' if row['result'] == 'OK' else 'FAILED',
+                'panel_name': f"[{row['station']}] {row.get('panel') or ''}",
+                'supplier_code': '2812',
+                'is_initial': False,
+                'free_field': '',
+            })
+            history_data.append(record)
+        print(f"집계 서버 이력 조회: {len(history_data)}개 레코드")
+        return history_data
+    
+    @staticmethod
+    def parse_parent_barcode(barcode_data):
+        """부모바코드 데이터 → 추적번호/4M정보/날짜(YYMMDD)"""
+        fields = {}
+        
+        # 바코드에서 추적번호 추출 (A 뒤의 숫자들)
+        if 'A' in barcode_data:
+            tracking_start = barcode_data.find('A') + 1
+            tracking_end = barcode_data.find('M', tracking_start)
+            if tracking_end == -1:
+                tracking_end = len(barcode_data)
+            fields['tracking_number'] = barcode_data[tracking_start:tracking_end]
+        else:
+            fields['tracking_number'] = '0000001'
+        
+        # 바코드에서 4M 정보 추출 (T 뒤, A 앞의 부분)
+        if 'T' in barcode_data and 'A' in barcode_data:
+            t_start = barcode_data.find('T') + 1
+            a_start = barcode_data.find('A')
+            traceability_part = barcode_data[t_start:a_start]
+            
+            # 날짜(6자리) + 4M 정보 추출
+            if len(traceability_part) >= 6:
+                fields['date'] = traceability_part[:6]      # 251023
+                fields['m4_info'] = traceability_part[6:]   # 0000 또는 S1B2
+        return fields
+    
     def parse_print_log_file(self, log_file_path):
         """프린트 로그 파일을 파싱하여 이력 데이터로 변환"""
         try:
@@ -341,29 +401,7 @@ class HistoryTab(QWidget):
                 # 부모바코드_데이터에서 추적번호와 4M 정보 추출
                 elif line.startswith('부모바코드_데이터:'):
                     barcode_data = line.replace('부모바코드_데이터:', '').strip()
-                    
-                    # 바코드에서 추적번호 추출 (A 뒤의 숫자들)
-                    if 'A' in barcode_data:
-                        tracking_start = barcode_data.find('A') + 1
-                        tracking_end = barcode_data.find('M', tracking_start)
-                        if tracking_end == -1:
-                            tracking_end = len(barcode_data)
-                        current_record['tracking_number'] = barcode_data[tracking_start:tracking_end]
-                    else:
-                        current_record['tracking_number'] = '0000001'
-                    
-                    # 바코드에서 4M 정보 추출 (T 뒤, A 앞의 부분)
-                    if 'T' in barcode_data and 'A' in barcode_data:
-                        t_start = barcode_data.find('T') + 1
-                        a_start = barcode_data.find('A')
-                        traceability_part = barcode_data[t_start:a_start]
-                        
-                        # 날짜(6자리) + 4M 정보 추출
-                        if len(traceability_part) >= 6:
-                            date_part = traceability_part[:6]  # 251023
-                            m4_part = traceability_part[6:]    # 0000 또는 S1B2
-                            current_record['m4_info'] = m4_part
-                            current_record['date'] = date_part  # 날짜도 업데이트
+                    current_record.update(self.parse_parent_barcode(barcode_data))
                 
                 # 출력결과
                 elif line.startswith('출력결과:'):
@@ -551,24 +589,48 @@ class HistoryTab(QWidget):
                     record_data[header] = item.text()
             
             # 상세 정보 다이얼로그 표시
-            detail_dialog = HistoryDetailDialog(record_data, self)
+            detail_dialog = HistoryDetailDialog(record_data, self, trace_index=self.aggregator)
             detail_dialog.exec_()
         else:
             QMessageBox.warning(self, '경고', '상세보기할 레코드를 선택하세요.')
 
 
 class HistoryDetailDialog(QDialog):
-    """이력 상세보기 다이얼로그"""
+    """이력 상세보기 다이얼로그 - 부모 라벨 ↔ 하위부품 양방향 추적 조회"""
     
-    def __init__(self, record_data, parent=None):
+    PARENT_HEADERS = ["출력시간", "부품번호", "추적정보", "패널"]
+    PARENT_KEYS = ["printed_at", "part_number", "parent_trace", "panel"]
+    CHILD_HEADERS = ["부품번호", "추적정보", "바코드"]
+    
+    def __init__(self, record_data, parent=None, trace_index=None):
         super().__init__(parent)
         self.record_data = record_data
+        # 조회 대상: 집계 서버(라인 전체, 스테이션 열 표시) 또는 이 PC 추적 인덱스
+        self.trace_index = trace_index or TraceabilityIndex.shared()
+        self.owns_trace_index = trace_index is None
+        self.parent_headers = self.PARENT_HEADERS + (["스테이션"] if trace_index else [])
+        self.parent_keys = self.PARENT_KEYS + (["station"] if trace_index else [])
+        self.parent_rows = []
+        self.child_rows = []
         self.init_ui()
         
+        # 선택한 이력의 추적번호로 바로 조회
+        tracking_number = self.record_data.get('추적번호', '')
+        if tracking_number:
+            self.search_input.setText(tracking_number)
+            self.search_trace()
+        
+    def done(self, result):
+        # 공용 추적 인덱스 반납 (마지막 사용자일 때만 실제로 닫힘)
+        if self.owns_trace_index:
+            self.owns_trace_index = False
+            self.trace_index.release()
+        super().done(result)
+    
     def init_ui(self):
         """UI 초기화"""
         self.setWindowTitle("이력 상세보기")
-        self.setGeometry(300, 300, 500, 400)
+        self.setGeometry(300, 300, 800, 650)
         
         layout = QVBoxLayout()
         
@@ -579,30 +641,51 @@ class HistoryDetailDialog(QDialog):
         title.setStyleSheet(get_history_detail_title_style())
         layout.addWidget(title)
         
-        # 상세 정보 표시
-        detail_text = QTextEdit()
-        detail_text.setReadOnly(True)
-        detail_text.setStyleSheet(get_history_detail_text_style())
-        
-        # 상세 정보 텍스트 생성
-        detail_info = f"""
-발행일자: {self.record_data.get('발행일자', 'N/A')}
-부품번호: {self.record_data.get('부품번호', 'N/A')}
-부품명: {self.record_data.get('부품명', 'N/A')}
-업체코드: {self.record_data.get('업체코드', 'N/A')}
-추적번호: {self.record_data.get('추적번호', 'N/A')}
-초도품여부: {self.record_data.get('초도품여부', 'N/A')}
-발행시간: {self.record_data.get('발행시간', 'N/A')}
-비고: {self.record_data.get('비고', 'N/A')}
-
-=== 추가 정보 ===
-• 이 레코드는 프린트 시스템에서 생성된 이력입니다.
-• 초도품 여부는 생산 초기 검증용 부품을 의미합니다.
-• 추적번호는 날짜별, 부품별로 순차적으로 생성됩니다.
-        """
-        
-        detail_text.setPlainText(detail_info)
-        layout.addWidget(detail_text)
+        # 상세 정보 표시 (이력 목록에서 연 경우)
+        if self.record_data:
+            detail_text = QTextEdit()
+            detail_text.setReadOnly(True)
+            detail_text.setMaximumHeight(150)
+            detail_text.setStyleSheet(get_history_detail_text_style())
+            detail_text.setPlainText(
+                f"발행일자: {self.record_data.get('발행일자', 'N/A')}\n"
+                f"부품번호: {self.record_data.get('부품번호', 'N/A')}\n"
+                f"부품명: {self.record_data.get('부품명', 'N/A')}\n"
+                f"업체코드: {self.record_data.get('업체코드', 'N/A')}\n"
+                f"추적번호: {self.record_data.get('추적번호', 'N/A')}\n"
+                f"초도품여부: {self.record_data.get('초도품여부', 'N/A')}\n"
+                f"발행시간: {self.record_data.get('발행시간', 'N/A')}\n"
+                f"비고: {self.record_data.get('비고', 'N/A')}")
+            layout.addWidget(detail_text)
+        
+        # 추적 조회 입력 (부모 추적정보/일련번호 또는 하위부품 바코드/추적정보)
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(QLabel("추적 조회:"))
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("부모 추적번호 또는 하위부품 바코드/추적정보")
+        self.search_input.returnPressed.connect(self.search_trace)
+        search_layout.addWidget(self.search_input)
+        search_btn = QPushButton("🔍 조회")
+        search_btn.clicked.connect(self.search_trace)
+        search_layout.addWidget(search_btn)
+        layout.addLayout(search_layout)
+        
+        # 추적 경로 표시
+        self.path_label = QLabel("")
+        self.path_label.setWordWrap(True)
+        layout.addWidget(self.path_label)
+        
+        # 부모 라벨 목록 - 선택하면 사용된 하위부품 표시
+        layout.addWidget(QLabel("부모 라벨"))
+        self.parent_table = self._create_table(self.parent_headers)
+        self.parent_table.itemSelectionChanged.connect(self.on_parent_selected)
+        layout.addWidget(self.parent_table)
+        
+        # 하위부품 목록 - 더블클릭하면 이 하위부품을 사용한 부모 라벨 조회
+        layout.addWidget(QLabel("사용된 하위부품 (더블클릭: 이 하위부품이 들어간 부모 조회)"))
+        self.child_table = self._create_table(self.CHILD_HEADERS)
+        self.child_table.cellDoubleClicked.connect(self.on_child_activated)
+        layout.addWidget(self.child_table)
         
         # 닫기 버튼
         close_btn = QPushButton("닫기")
@@ -611,3 +694,80 @@ class HistoryDetailDialog(QDialog):
         layout.addWidget(close_btn)
         
         self.setLayout(layout)
+    
+    @staticmethod
+    def _create_table(headers):
+        table = QTableWidget()
+        table.setColumnCount(len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setSelectionBehavior(QTableWidget.SelectRows)
+        table.setSelectionMode(QTableWidget.SingleSelection)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        return table
+    
+    @staticmethod
+    def _fill_table(table, rows, keys):
+        table.setRowCount(len(rows))
+        for row, record in enumerate(rows):
+            for column, key in enumerate(keys):
+                table.setItem(row, column, QTableWidgetItem(str(record.get(key) or '')))
+    
+    def show_parents(self, parents):
+        """부모 라벨 목록 표시 (첫 행 자동 선택 → 하위부품 표시)"""
+        self.parent_rows = parents
+        self.child_rows = []
+        self.child_table.setRowCount(0)
+        self._fill_table(self.parent_table, parents, self.parent_keys)
+        if parents:
+            self.parent_table.selectRow(0)
+    
+    def search_trace(self):
+        """입력값으로 부모 → 하위부품, 하위부품 → 부모 양방향 조회"""
+        text = self.search_input.text().strip()
+        if not text:
+            return
+        try:
+            result = self.trace_index.lookup(text)
+            parents = result["parents"]
+            # 이력 목록에서 연 경우 같은 부품번호의 라벨만 표시 (일련번호는 품번마다 겹침)
+            part_number = self.record_data.get('부품번호', '')
+            if part_number and any(p["part_number"] == part_number for p in parents):
+                parents = [p for p in parents if p["part_number"] == part_number]
+            if parents:
+                self.path_label.setText(f"부모 라벨 {len(parents)}건: {text}")
+                self.show_parents(parents)
+            elif result["child_of"]:
+                self.path_label.setText(f"하위부품 {text} → 사용된 부모 라벨 {len(result['child_of'])}건")
+                self.show_parents(result["child_of"])
+            else:
+                self.path_label.setText(f"'{text}' 추적 이력이 없습니다.")
+                self.show_parents([])
+        except Exception as e:
+            QMessageBox.critical(self, '오류', f'추적 조회 중 오류가 발생했습니다: {str(e)}')
+    
+    def on_parent_selected(self):
+        """부모 라벨 선택 → 사용된 하위부품 표시"""
+        row = self.parent_table.currentRow()
+        if not 0 <= row < len(self.parent_rows):
+            return
+        try:
+            self.child_rows = self.trace_index.children_of(self.parent_rows[row]["id"])
+        except Exception as e:
+            QMessageBox.critical(self, '오류', f'하위부품 조회 중 오류가 발생했습니다: {str(e)}')
+            return
+        self._fill_table(self.child_table, self.child_rows, ["child_part", "child_trace", "barcode"])
+    
+    def on_child_activated(self, row, column):
+        """하위부품 → 이 하위부품을 사용한 부모 라벨 조회"""
+        if not 0 <= row < len(self.child_rows):
+            return
+        child = self.child_rows[row]
+        try:
+            parents = self.trace_index.parents_of_child(child["child_trace"] or '', child["child_part"])
+        except Exception as e:
+            QMessageBox.critical(self, '오류', f'추적 조회 중 오류가 발생했습니다: {str(e)}')
+            return
+        self.path_label.setText(f"하위부품 {child['child_part']} / {child['child_trace']} → "
+                                f"사용된 부모 라벨 {len(parents)}건")
+        self.show_parents(parents)
@@ -3,12 +3,13 @@
 """
 import sys
 import os
+import json
 from datetime import datetime
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QComboBox, QPushButton, QTextEdit, QGroupBox, 
                              QGridLayout, QMessageBox, QLineEdit, QTableWidget,
                              QTableWidgetItem, QListWidget, QListWidgetItem,
-                             QDialog, QCheckBox)
+                             QDialog, QCheckBox, QFileDialog)
 from PyQt5.QtCore import QThread, pyqtSignal, Qt
 from PyQt5.QtGui import QFont
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -28,8 +29,8 @@ class MasterDataTab(QWidget):
     def __init__(self, settings_manager):
         super().__init__()
         self.settings_manager = settings_manager
-        self.master_data_manager = MasterDataManager()
         self.backup_manager = BackupManager()
+        self.master_data_manager = MasterDataManager(backup_manager=self.backup_manager)
         self.edit_mode = False  # 수정 모드 상태
         self.is_loading_data = False  # 데이터 로딩 중 플래그
         self.init_ui()
@@ -209,6 +210,11 @@ class MasterDataTab(QWidget):
         self.cleanup_btn.setStyleSheet(get_cleanup_button_style())
         backup_layout.addWidget(self.cleanup_btn)
         
+        self.import_btn = QPushButton("📥 일괄 가져오기")
+        self.import_btn.clicked.connect(self.import_master_data)
+        self.import_btn.setStyleSheet(get_backup_button_style())
+        backup_layout.addWidget(self.import_btn)
+        
         input_layout.addLayout(backup_layout, 7, 0, 1, 4)
         
         layout.addWidget(input_group)
@@ -353,8 +359,6 @@ class MasterDataTab(QWidget):
                     item.setTextAlignment(alignment)
                 self.master_table.setItem(row, col, item)
             
-            from PyQt5.QtCore import Qt
-            
             set_item_safe(row, 0, data.get('supplier_code', ''), Qt.AlignCenter)  # 업체코드
             set_item_safe(row, 1, data.get('division', ''), Qt.AlignCenter)       # 구분
             set_item_safe(row, 2, data.get('part_number', ''))                    # 부품번호
@@ -504,14 +508,10 @@ class MasterDataTab(QWidget):
                         current_item_original_index = i
                         break
             
-            for i, data in enumerate(master_data):
-                # 수정 모드인 경우 현재 항목은 제외 (원본 데이터 인덱스 사용)
-                if (self.edit_mode and current_item_original_index is not None and i == current_item_original_index):
-                    continue
-                if (data.get('division', '').strip() == division.strip() and 
-                    data.get('use_status') == 'Y'):
-                    QMessageBox.warning(self, "경고", f"구분값 '{division}'은 이미 사용 중입니다. (사용유무 Y인 항목과 중복) 다른 값을 입력하세요.")
-                    return
+            # 수정 모드인 경우 현재 항목은 제외 (원본 데이터 인덱스 사용) - 저장소 유일 인덱스 조회
+            if self.master_data_manager.is_division_in_use(division, current_item_original_index):
+                QMessageBox.warning(self, "경고", f"구분값 '{division}'은 이미 사용 중입니다. (사용유무 Y인 항목과 중복) 다른 값을 입력하세요.")
+                return
         
         # 하위 부품번호 가져오기
         try:
@@ -521,7 +521,6 @@ class MasterDataTab(QWidget):
             print(f"DEBUG: 하위 부품번호 가져오기 오류: {e}")
             child_parts = []
         
-        from datetime import datetime
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # 필드 순서: use_status 다음에 initial_sample 위치
@@ -558,10 +557,7 @@ class MasterDataTab(QWidget):
                 QMessageBox.warning(self, "오류", "수정할 데이터를 찾을 수 없습니다.")
                 return
             
-            # 수정 전 데이터 백업 (원본 데이터 인덱스 사용)
-            old_data = master_data[current_item_original_index].copy()
-            self.backup_manager.create_backup(old_data, 'update', current_item_original_index)
-            
+            # 수정 전/후 데이터는 MasterDataManager 가 백업 변경분으로 기록 (원본 데이터 인덱스 사용)
             if self.master_data_manager.update_master_data(current_item_original_index, data):
                 # 저장한 데이터의 initial_sample 값 사용 (파일에 저장된 값)
                 saved_initial_sample = data.get('initial_sample', 'N')
@@ -650,10 +646,7 @@ class MasterDataTab(QWidget):
                                    QMessageBox.Yes | QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            # 삭제 전 데이터 백업
-            deleted_data = self.master_data_manager.master_list[current_row].copy()
-            self.backup_manager.create_backup(deleted_data, 'delete', current_row)
-            
+            # 삭제된 데이터는 MasterDataManager 가 백업 변경분으로 기록
             if self.master_data_manager.delete_master_data(current_row):
                 self.load_master_data()
                 self.clear_inputs()
@@ -740,7 +733,6 @@ class MasterDataTab(QWidget):
             print(f"DEBUG: 저장할 데이터 - initial_sample: {ordered_data.get('initial_sample')}")
             
             # modified_time 업데이트
-            from datetime import datetime
             ordered_data['modified_time'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
             data = ordered_data
@@ -1058,23 +1050,24 @@ class MasterDataTab(QWidget):
         
         # 백업 목록
         self.backup_list = QListWidget()
-        backup_files = self.backup_manager.get_backup_list()
-        
-        for backup_file in backup_files:
-            backup_data = self.backup_manager.load_backup(backup_file)
-            if backup_data:
-                timestamp = backup_data.get('timestamp', '')
-                operation = backup_data.get('operation_type', '')
-                data = backup_data.get('data', {})
-                
+        backup_entries = self.backup_manager.get_backup_list()
+        
+        # 색인(index.jsonl)만으로 목록 표시 - 백업 파일을 하나씩 열지 않음
+        for entry in backup_entries:
+            operation = entry.get('operation_type', '')
+            operation_label = BackupManager.OPERATION_LABELS.get(operation, operation.upper())
+            
+            if entry.get('segment'):
                 # 하위 부품번호 개수 확인
-                child_parts = data.get('child_parts', [])
-                child_count = len(child_parts) if child_parts else 0
+                child_count = entry.get('child_count', 0)
                 child_info = f" (하위{child_count}개)" if child_count > 0 else ""
-                
-                # 표시 형식: 날짜_시간 | 작업유형 | 업체코드-부품번호 (하위N개)
-                display_text = f"{timestamp} | {operation.upper()} | {data.get('supplier_code', 'N/A')}-{data.get('part_number', 'N/A')}{child_info}"
-                self.backup_list.addItem(display_text)
+                target = f"{entry.get('supplier_code') or 'N/A'}-{entry.get('part_number') or 'N/A'}{child_info}"
+            else:
+                target = "전체 목록"
+            
+            # 표시 형식: 날짜_시간 | 작업유형 | 업체코드-부품번호 (하위N개)
+            display_text = f"{entry.get('timestamp', '')} | {operation_label} | {target}"
+            self.backup_list.addItem(display_text)
         
         layout.addWidget(self.backup_list)
         
@@ -1107,19 +1100,20 @@ class MasterDataTab(QWidget):
             QMessageBox.warning(dialog, "경고", "복구할 백업을 선택하세요.")
             return
         
-        backup_files = self.backup_manager.get_backup_list()
-        if current_row >= len(backup_files):
+        backup_entries = self.backup_manager.get_backup_list()
+        if current_row >= len(backup_entries):
             QMessageBox.warning(dialog, "오류", "선택한 백업이 유효하지 않습니다.")
             return
         
-        backup_file = backup_files[current_row]
+        entry = backup_entries[current_row]
         
         reply = QMessageBox.question(dialog, "확인", 
-                                   f"선택한 백업을 복구하시겠습니까?\n\n파일: {backup_file}",
+                                   f"선택한 작업 이전 상태로 전체 기준정보를 복구하시겠습니까?\n\n"
+                                   f"백업 번호: {entry['id']} ({entry.get('timestamp', '')})",
                                    QMessageBox.Yes | QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            success, message = self.backup_manager.restore_backup(backup_file, self.master_data_manager)
+            success, message = self.backup_manager.restore_backup(entry['id'], self.master_data_manager)
             if success:
                 self.load_master_data()
                 QMessageBox.information(dialog, "성공", f"백업이 복구되었습니다.\n\n{message}")
@@ -1134,12 +1128,12 @@ class MasterDataTab(QWidget):
             QMessageBox.warning(self, "경고", "상세정보를 볼 백업을 선택하세요.")
             return
         
-        backup_files = self.backup_manager.get_backup_list()
-        if current_row >= len(backup_files):
+        backup_entries = self.backup_manager.get_backup_list()
+        if current_row >= len(backup_entries):
             return
         
-        backup_file = backup_files[current_row]
-        backup_data = self.backup_manager.load_backup(backup_file)
+        entry = backup_entries[current_row]
+        backup_data = self.backup_manager.load_backup(entry['id'])
         
         if not backup_data:
             QMessageBox.warning(self, "오류", "백업 데이터를 로드할 수 없습니다.")
@@ -1147,15 +1141,15 @@ class MasterDataTab(QWidget):
         
         # 상세정보 표시
         info_text = f"""
-백업 파일: {backup_file}
+백업 번호: {entry['id']}
 생성 시간: {backup_data.get('timestamp', 'N/A')}
-작업 유형: {backup_data.get('operation_type', 'N/A').upper()}
-인덱스: {backup_data.get('index', 'N/A')}
+작업 유형: {BackupManager.OPERATION_LABELS.get(backup_data.get('operation_type'), 'N/A')}
+인덱스: {backup_data.get('index') if backup_data.get('index') is not None else 'N/A'}
 
 데이터 정보:
 """
         
-        data = backup_data.get('data', {})
+        data = backup_data.get('data')
         if data:
             info_text += f"업체코드: {data.get('supplier_code', 'N/A')}\n"
             info_text += f"구분: {data.get('division', 'N/A')}\n"
@@ -1182,6 +1176,8 @@ class MasterDataTab(QWidget):
                 info_text += "=" * 40 + "\n"
             else:
                 info_text += "하위 Part_No: 없음\n"
+        elif not backup_data.get('segment'):
+            info_text += "전체 목록 저장 (스냅샷)"
         else:
             info_text += "데이터 없음"
         
@@ -1190,12 +1186,40 @@ class MasterDataTab(QWidget):
     def cleanup_old_backups(self):
         """오래된 백업 정리"""
         reply = QMessageBox.question(self, "확인", 
-                                   "30일 이상 된 백업 파일들을 정리하시겠습니까?",
+                                   "30일 이상 된 백업 기록을 정리하시겠습니까?",
                                    QMessageBox.Yes | QMessageBox.No)
         
         if reply == QMessageBox.Yes:
             cleaned_count = self.backup_manager.cleanup_old_backups(30)
-            QMessageBox.information(self, "정리 완료", f"{cleaned_count}개의 오래된 백업 파일이 정리되었습니다.")
+            QMessageBox.information(self, "정리 완료", f"{cleaned_count}개의 오래된 백업 기록이 정리되었습니다.")
+    
+    def import_master_data(self):
+        """기준정보 일괄 가져오기 (master_data.json 과 같은 형식의 JSON 목록, 한 번에 저장)"""
+        file_path, _ = QFileDialog.getOpenFileName(self, "기준정보 일괄 가져오기", "", "JSON 파일 (*.json)")
+        if not file_path:
+            return
+        
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                items = json.load(f)
+            if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+                raise ValueError("항목 목록(JSON 배열) 형식이 아닙니다.")
+        except Exception as e:
+            QMessageBox.warning(self, "오류", f"가져올 파일을 읽을 수 없습니다.\n\n{e}")
+            return
+        
+        reply = QMessageBox.question(self, "확인", 
+                                   f"{len(items)}건을 가져오시겠습니까?\n\n"
+                                   f"업체코드/구분/Part_No 가 같은 항목은 교체되고, 나머지는 추가됩니다.",
+                                   QMessageBox.Yes | QMessageBox.No)
+        
+        if reply == QMessageBox.Yes:
+            success, message = self.master_data_manager.import_master_data(items)
+            if success:
+                self.load_master_data()
+                QMessageBox.information(self, "가져오기 완료", message)
+            else:
+                QMessageBox.warning(self, "오류", message)
     
     def on_cell_changed(self, row, column):
         """테이블 셀 변경 시 데이터 자동 저장"""
@@ -1255,18 +1279,15 @@ class MasterDataTab(QWidget):
         # 구분값 중복 검증 (사용유무가 Y일 때만, 현재 항목 제외)
         # 단, 구분값을 변경하는 경우에만 검증 (4M정보나 다른 필드 수정 시에는 구분값이 같으므로 검증 불필요)
         if use_status == 'Y' and column == 1:  # 구분값 컬럼(1)을 변경할 때만 검증
-            for i, data in enumerate(master_data):
-                if (current_item_original_index is not None and i != current_item_original_index and
-                    data.get('division', '').strip() == division.strip() and 
-                    data.get('use_status') == 'Y'):
-                    QMessageBox.warning(self, "경고", f"구분값 '{division}'은 이미 사용 중입니다. (사용유무 Y인 항목과 중복) 다른 값을 입력하세요.")
-                    # 변경 취소를 위해 원래 값으로 되돌리기
-                    if current_item_original_index is not None:
-                        original_division = master_data[current_item_original_index].get('division', '')
-                        division_item = QTableWidgetItem(original_division)
-                        division_item.setTextAlignment(Qt.AlignCenter)
-                        self.master_table.setItem(row, 1, division_item)
-                    return
+            if (current_item_original_index is not None and
+                self.master_data_manager.is_division_in_use(division, current_item_original_index)):
+                QMessageBox.warning(self, "경고", f"구분값 '{division}'은 이미 사용 중입니다. (사용유무 Y인 항목과 중복) 다른 값을 입력하세요.")
+                # 변경 취소를 위해 원래 값으로 되돌리기
+                original_division = master_data[current_item_original_index].get('division', '')
+                division_item = QTableWidgetItem(original_division)
+                division_item.setTextAlignment(Qt.AlignCenter)
+                self.master_table.setItem(row, 1, division_item)
+                return
         
         # 기존 하위 부품번호 유지 (원본 데이터에서 가져오기)
         if current_item_original_index is not None:
@@ -1281,7 +1302,6 @@ class MasterDataTab(QWidget):
             initial_sample = 'N'
         
         # 수정된 시간 업데이트
-        from datetime import datetime
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # 업데이트할 데이터 구성
@@ -1327,9 +1347,6 @@ class MasterDataTab(QWidget):
                 if fourm_item:
                     fourm_item.setTextAlignment(Qt.AlignCenter)
                 
-                # 백업 생성
-                self.backup_manager.create_backup(data, 'update', current_item_original_index)
-                
                 print(f"DEBUG: 테이블에서 직접 수정된 데이터 저장 완료: {data}")
         else:
             QMessageBox.warning(self, "오류", "수정할 데이터를 찾을 수 없습니다.")
@@ -1376,25 +1393,19 @@ class MasterDataTab(QWidget):
             return
         
         # 구분값 중복 검증 (사용유무가 Y일 때만, 현재 항목 제외)
-        if new_status == 'Y':
-            master_data = self.master_data_manager.get_master_data()
-            for i, data in enumerate(master_data):
-                if (i != row and 
-                    data.get('division', '').strip() == division.strip() and 
-                    data.get('use_status') == 'Y'):
-                    QMessageBox.warning(self, "경고", f"구분값 '{division}'은 이미 사용 중입니다. (사용유무 Y인 항목과 중복) 다른 값을 입력하세요.")
-                    # 콤보박스를 이전 값으로 되돌리기
-                    combo = self.master_table.cellWidget(row, 7)
-                    if combo:
-                        combo.setCurrentText('N')
-                    return
+        if new_status == 'Y' and self.master_data_manager.is_division_in_use(division, row):
+            QMessageBox.warning(self, "경고", f"구분값 '{division}'은 이미 사용 중입니다. (사용유무 Y인 항목과 중복) 다른 값을 입력하세요.")
+            # 콤보박스를 이전 값으로 되돌리기
+            combo = self.master_table.cellWidget(row, 7)
+            if combo:
+                combo.setCurrentText('N')
+            return
         
         # 기존 하위 부품번호 유지
         master_data = self.master_data_manager.get_master_data()
         child_parts = master_data[row].get('child_parts', []) if row < len(master_data) else []
         
         # 수정된 시간 업데이트
-        from datetime import datetime
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # 업데이트할 데이터 구성
@@ -1438,9 +1449,6 @@ class MasterDataTab(QWidget):
             if fourm_item:
                 fourm_item.setTextAlignment(Qt.AlignCenter)
             
-            # 백업 생성
-            self.backup_manager.create_backup(data, 'update', row)
-            
             print(f"DEBUG: 사용유무 변경으로 인한 데이터 저장 완료: {data}")
         else:
             QMessageBox.warning(self, "오류", "데이터 저장에 실패했습니다.")
@@ -5,7 +5,7 @@ import sys
 import os
 from datetime import datetime
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QComboBox, QPushButton, QTextEdit, QGroupBox, 
+                             QComboBox, QPushButton, QGroupBox, 
                              QGridLayout, QMessageBox)
 from PyQt5.QtCore import QThread, pyqtSignal, Qt
 from PyQt5.QtGui import QFont
@@ -13,8 +13,12 @@ from PyQt5.QtGui import QFont
 # from styles import (get_tab_title_style, get_port_status_connected_style, get_port_status_disconnected_style,
 #                     get_connect_button_style, get_disconnect_button_style, get_save_button_style)
 from ...ui.styles import *
+from ...ui.log_console import LogConsole, console_overflow_path
 from ...utils.font_manager import FontManager
 from ...utils.utils import SettingsManager, SerialConnectionThread
+from ...utils.modules.port_inventory import (PortInventoryService, fill_port_combo,
+                                                  NO_PORTS_TEXT, SCANNING_TEXT)
+from ...hardware.nutrunner_protocols import create_protocol
 
 
 class NutRunnerTab(QWidget):
@@ -24,6 +28,11 @@ class NutRunnerTab(QWidget):
         self.settings_manager = settings_manager
         self.nutrunner1_thread = None
         self.nutrunner2_thread = None
+        
+        # 공용 포트 목록 서비스 (조회는 작업 스레드, 결과는 시그널로 모든 탭에 전달)
+        self.port_inventory = PortInventoryService.shared()
+        self.port_inventory.ports_updated.connect(self.on_ports_updated)
+        
         self.init_ui()
         self.load_settings()
         
@@ -155,7 +164,8 @@ class NutRunnerTab(QWidget):
         log_group = QGroupBox("📋 로그")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        # 줄 수 제한 로그 창 (오래된 줄은 파일로 밀어냄 - 장시간 열어 두어도 메모리 일정)
+        self.log_text = LogConsole(overflow_path=console_overflow_path("nutrunner"))
         self.log_text.setMaximumHeight(100)
         self.log_text.setReadOnly(True)
         log_layout.addWidget(self.log_text)
@@ -166,132 +176,29 @@ class NutRunnerTab(QWidget):
         
         layout.addWidget(log_group)
         
-        self.refresh_ports()
+        self.simple_refresh_ports()
     
     def refresh_ports(self):
-        """사용 가능한 시리얼 포트 새로고침"""
-        import serial.tools.list_ports
-        
-        for i, combo in enumerate([self.nutrunner1_port_combo, self.nutrunner2_port_combo]):
-            combo.clear()
-            ports = serial.tools.list_ports.comports()
-            available_ports = []
-            unavailable_ports = []
-            
-            for port in ports:
-                try:
-                    # 포트가 사용 중인지 확인
-                    test_ser = serial.Serial(port.device, timeout=0.1)
-                    test_ser.close()
-                    available_ports.append(port)
-                    print(f"DEBUG: 너트{i+1} 포트 사용 가능: {port.device}")
-                except (serial.SerialException, OSError) as e:
-                    # 포트가 사용 중이거나 접근할 수 없음
-                    unavailable_ports.append((port, str(e)))
-                    print(f"DEBUG: 너트{i+1} 포트 사용 불가: {port.device} - {e}")
-                    continue
-            
-            # 사용 가능한 포트 먼저 추가
-            if available_ports:
-                for port in available_ports:
-                    port_info = f"{port.device} - {port.description}"
-                    
-                    # AdminPanel에서 포트 사용 중인지 확인
-                    is_in_use = False
-                    using_tab = None
-                    if hasattr(self, 'admin_panel') and self.admin_panel:
-                        is_in_use, using_tab = self.admin_panel.is_port_in_use(port.device, getattr(self, 'tab_name', '너트 런너'))
-                    
-                    # 사용 중인 포트는 "-사용중-" 표시
-                    if is_in_use:
-                        port_info += f" -사용중-"
-                    
-                    combo.addItem(port_info)
-                    print(f"DEBUG: 너트{i+1} 포트 추가 (사용가능): {port_info}")
-            
-            # 사용 불가능한 포트도 표시 (참고용)
-            if unavailable_ports:
-                for port, error in unavailable_ports:
-                    port_info = f"{port.device} - {port.description} (사용불가)"
-                    
-                    # AdminPanel에서 포트 사용 중인지 확인 (사용불가여도 다른 탭에서 사용 중일 수 있음)
-                    is_in_use = False
-                    using_tab = None
-                    if hasattr(self, 'admin_panel') and self.admin_panel:
-                        is_in_use, using_tab = self.admin_panel.is_port_in_use(port.device, getattr(self, 'tab_name', '너트 런너'))
-                    
-                    # 사용 중인 포트는 "-사용중-" 표시 추가
-                    if is_in_use:
-                        port_info = port_info.replace(" (사용불가)", "") + f" -사용중-"
-                    
-                    combo.addItem(port_info)
-                    print(f"DEBUG: 너트{i+1} 포트 추가 (사용불가): {port_info}")
-            
-            if not available_ports and not unavailable_ports:
-                combo.addItem("감지된 포트 없음")
-                print(f"DEBUG: 너트{i+1} 감지된 포트 없음")
-            
-            # 연결 상태에 따라 포트 표시 업데이트
-            device_name = "너트1" if i == 0 else "너트2"
-            is_connected = getattr(self, f"nutrunner{i+1}_is_connected_from_main", False)
-            if is_connected:
-                self.update_nutrunner_port_combo_for_connection(device_name, True)
-        
-        self.log_message("포트 목록을 새로고침했습니다.")
+        """사용 가능한 시리얼 포트 새로고침 (열기 테스트 포함) - 조회는 작업 스레드에서, 결과는 on_ports_updated"""
+        self.port_inventory.refresh(probe=True, force=True)
+        self.log_message("포트 목록을 새로고침합니다...")
     
     def simple_refresh_ports(self):
-        """간단한 포트 새로고침 - 포트 테스트 없이"""
-        import serial.tools.list_ports
-        
-        print("DEBUG: 너트러너 간단한 포트 새로고침 시작")
-        
-        # 현재 연결된 포트 정보 저장
-        current_connected_ports = {}
-        for i in range(1, 3):  # 너트러너 1, 2
-            thread_attr = f'nutrunner{i}_thread'
-            if hasattr(self, thread_attr):
-                thread = getattr(self, thread_attr)
-                if thread and hasattr(thread, 'port_name'):
-                    current_connected_ports[i] = thread.port_name
-                    print(f"DEBUG: 너트러너 {i} 현재 연결된 포트: {thread.port_name}")
-        
-        # 두 개의 포트 콤보박스 모두 새로고침
+        """간단한 포트 새로고침 - 캐시된 목록으로 즉시 표시 (캐시가 오래됐으면 작업 스레드에서 재조회)"""
+        self.on_ports_updated(self.port_inventory.entries())
+        self.port_inventory.refresh()
+    
+    def on_ports_updated(self, entries):
+        """포트 목록 서비스 조회 결과 반영 - 두 콤보박스 모두 (현재 연결된 포트 선택 유지)"""
+        admin_panel = getattr(self, 'admin_panel', None)
+        in_use = admin_panel.port_usage if admin_panel else None
         for i, port_combo in enumerate([self.nutrunner1_port_combo, self.nutrunner2_port_combo], 1):
-            port_combo.clear()
+            current_connected_port = getattr(getattr(self, f'nutrunner{i}_thread', None), 'port_name', None)
+            fill_port_combo(port_combo, entries, in_use, current_connected_port)
             
-            try:
-                # 포트 목록만 조회 (테스트 없이)
-                ports = serial.tools.list_ports.comports()
-                
-                if not ports:
-                    port_combo.addItem("사용 가능한 포트 없음")
-                else:
-                    ports.sort(key=lambda x: x.device)
-                    for port in ports:
-                        port_info = f"{port.device} - {port.description}"
-                        
-                        # AdminPanel에서 포트 사용 중인지 확인
-                        is_in_use = False
-                        using_tab = None
-                        if hasattr(self, 'admin_panel') and self.admin_panel:
-                            is_in_use, using_tab = self.admin_panel.is_port_in_use(port.device, getattr(self, 'tab_name', '너트 런너'))
-                        
-                        # 사용 중인 포트는 "-사용중-" 표시
-                        if is_in_use:
-                            port_info += f" -사용중-"
-                        
-                        port_combo.addItem(port_info)
-                        
-                        # 현재 연결된 포트가 있으면 선택
-                        if i in current_connected_ports and port.device == current_connected_ports[i]:
-                            port_combo.setCurrentText(port_info)
-                            print(f"DEBUG: 너트러너 {i} 연결된 포트 선택됨: {port_info}")
-                
-            except Exception as e:
-                print(f"DEBUG: 너트러너 포트 조회 오류: {e}")
-                port_combo.addItem("사용 가능한 포트 없음")
-        
-        print(f"DEBUG: 너트러너 포트 새로고침 완료")
+            # 연결 상태에 따라 포트 표시 업데이트
+            if getattr(self, f"nutrunner{i}_is_connected_from_main", False):
+                self.update_nutrunner_port_combo_for_connection(f"너트{i}", True)
     
     def notify_main_screen_connection(self, device_name, is_connected):
         """메인화면에 연결 상태 알림"""
@@ -324,7 +231,7 @@ class NutRunnerTab(QWidget):
             disconnect_btn = self.nutrunner2_disconnect_btn
             thread_attr = 'nutrunner2_thread'
         
-        if port_combo.currentText() == "사용 가능한 포트 없음":
+        if port_combo.currentText() in (NO_PORTS_TEXT, SCANNING_TEXT):
             QMessageBox.warning(self, "경고", "연결할 포트를 선택하세요.")
             connect_btn.setChecked(False)
             return
@@ -475,21 +382,38 @@ class NutRunnerTab(QWidget):
         from datetime import datetime
         timestamp = datetime.now().strftime("%H:%M:%S")
         
-        # 데이터 표시 업데이트
-        if nutrunner_num == 1:
-            self.nutrunner1_data_label.setText(f"데이터: {data.strip()}")
-            self.nutrunner1_data_label.setStyleSheet("QLabel { background-color: #e8f5e8; padding: 5px; border: 1px solid #4CAF50; }")
+        # 데이터 표시 업데이트 (체결 결과로 해석되면 판정/토크/각도 표시)
+        data_label = self.nutrunner1_data_label if nutrunner_num == 1 else self.nutrunner2_data_label
+        result = self.parse_tightening_result(nutrunner_num, data)
+        if result is not None:
+            data_label.setText(f"체결 {result.status} - 토크: {result.torque} Nm, 각도: {result.angle}°, PSET: {result.pset or '-'}")
+        else:
+            data_label.setText(f"데이터: {data.strip()}")
+        if result is None or result.ok:
+            data_label.setStyleSheet("QLabel { background-color: #e8f5e8; padding: 5px; border: 1px solid #4CAF50; }")
         else:
-            self.nutrunner2_data_label.setText(f"데이터: {data.strip()}")
-            self.nutrunner2_data_label.setStyleSheet("QLabel { background-color: #e8f5e8; padding: 5px; border: 1px solid #4CAF50; }")
+            data_label.setStyleSheet("QLabel { background-color: #fdecea; padding: 5px; border: 1px solid #f44336; }")
         
         # 상세 로그 메시지
         self.log_message(f"📨 시스템툴 {nutrunner_num} [{timestamp}]: {data}")
+        if result is not None:
+            self.log_message(f"🔩 체결 결과: {result.status} (토크 {result.torque}, 각도 {result.angle})")
         
         # 데이터 길이와 타입 정보 추가
         data_length = len(data.strip())
         self.log_message(f"📊 데이터 길이: {data_length} bytes")
     
+    def parse_tightening_result(self, nutrunner_num, data):
+        """수신 줄 1개 → 체결 결과 (설정 nutrunner.protocol, 결과가 아니면 None)"""
+        try:
+            settings = self.settings_manager.settings.get("nutrunner", {})
+            protocol = create_protocol(settings.get(f"nutrunner{nutrunner_num}_protocol", settings.get("protocol")),
+                                       f"너트{nutrunner_num}")
+            return protocol.parse(data.strip().encode('ascii', errors='ignore'))
+        except Exception as e:
+            self.log_message(f"⚠️ 체결 결과 해석 오류: {e}")
+            return None
+    
     def on_nutrunner_connection_status(self, nutrunner_num, success, message):
         """너트 런너 연결 상태 변경 처리"""
         if nutrunner_num == 1:
@@ -561,12 +485,14 @@ class NutRunnerTab(QWidget):
         # 너트 런너 1 설정
         if nutrunner_settings.get("nutrunner1_port"):
             self.nutrunner1_port_combo.setCurrentText(nutrunner_settings["nutrunner1_port"])
+            self.nutrunner1_port_combo.setProperty("preferred_port", nutrunner_settings["nutrunner1_port"])  # 포트 목록 조회 후에도 선택 유지
         if nutrunner_settings.get("nutrunner1_baudrate"):
             self.nutrunner1_baudrate_combo.setCurrentText(str(nutrunner_settings["nutrunner1_baudrate"]))
         
         # 너트 런너 2 설정
         if nutrunner_settings.get("nutrunner2_port"):
             self.nutrunner2_port_combo.setCurrentText(nutrunner_settings["nutrunner2_port"])
+            self.nutrunner2_port_combo.setProperty("preferred_port", nutrunner_settings["nutrunner2_port"])  # 포트 목록 조회 후에도 선택 유지
         if nutrunner_settings.get("nutrunner2_baudrate"):
             self.nutrunner2_baudrate_combo.setCurrentText(str(nutrunner_settings["nutrunner2_baudrate"]))
     
@@ -577,13 +503,13 @@ class NutRunnerTab(QWidget):
         nutrunner2_port = self.nutrunner2_port_combo.currentText()
         nutrunner2_baudrate = self.nutrunner2_baudrate_combo.currentText()
         
-        # 설정 업데이트
-        self.settings_manager.settings["nutrunner"] = {
+        # 설정 업데이트 (프로토콜/NOK 보류 등 다른 항목은 유지)
+        self.settings_manager.settings.setdefault("nutrunner", {}).update({
             "nutrunner1_port": nutrunner1_port,
             "nutrunner1_baudrate": int(nutrunner1_baudrate),
             "nutrunner2_port": nutrunner2_port,
             "nutrunner2_baudrate": int(nutrunner2_baudrate)
-        }
+        })
         
         if self.settings_manager.save_settings():
             self.log_message("⚙️ 시스템툴 설정이 저장되었습니다.")
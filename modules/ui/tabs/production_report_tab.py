@@ -0,0 +1,161 @@
+"""
+생산 실적 보고서 탭
+- 근무조/시간대별 OK·NG 수량을 집계 저장소(production_rollup)에서 바로 조회
+"""
+from datetime import datetime, timedelta
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                             QComboBox, QPushButton, QGroupBox, QMessageBox,
+                             QTableWidget, QTableWidgetItem, QDateEdit, QHeaderView)
+from PyQt5.QtCore import Qt, QDate
+
+from ...ui.styles import *
+from ...utils.font_manager import FontManager
+from ...core.station_config import StationLayout
+from ...core.production_rollup import (ProductionRollupStore, RESULT_OK, RESULT_NG,
+                                       RESULT_SCAN_OK, RESULT_SCAN_NG)
+from ...core.line_aggregator import AggregatorQuery
+from .history_tab import HistoryDetailDialog
+from ...utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+ALL_PANELS = "전체"
+VIEW_SHIFT = "근무조별"
+VIEW_HOURLY = "시간대별"
+VIEW_LINE = "라인 전체 (근무조별)"
+
+
+class ProductionReportTab(QWidget):
+    """생산 실적 보고서 탭"""
+
+    HEADERS = ["구분", "근무조", "패널", "Part_No", "OK", "NG", "스캔 OK", "스캔 NG"]
+
+    def __init__(self, settings_manager):
+        super().__init__()
+        self.settings_manager = settings_manager
+        self.rollup = ProductionRollupStore.shared(settings_manager.settings)
+        self.aggregator = AggregatorQuery.from_config(settings_manager.settings)
+        self.init_ui()
+        self.load_report()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        # 제목
+        title = QLabel("📈 생산 실적")
+        title.setFont(FontManager.get_dialog_title_font())
+        title.setAlignment(Qt.AlignCenter)
+        title.setStyleSheet(get_tab_title_style())
+        layout.addWidget(title)
+
+        # 조회 조건
+        condition_group = QGroupBox("조회 조건")
+        condition_layout = QHBoxLayout(condition_group)
+
+        condition_layout.addWidget(QLabel("작업일:"))
+        self.work_date_edit = QDateEdit()
+        self.work_date_edit.setCalendarPopup(True)
+        self.work_date_edit.setDate(QDate.currentDate())
+        condition_layout.addWidget(self.work_date_edit)
+
+        condition_layout.addWidget(QLabel("패널:"))
+        self.panel_combo = QComboBox()
+        self.panel_combo.addItems([ALL_PANELS] + StationLayout.from_config(self.settings_manager.settings).names())
+        condition_layout.addWidget(self.panel_combo)
+
+        condition_layout.addWidget(QLabel("보기:"))
+        self.view_combo = QComboBox()
+        self.view_combo.addItems([VIEW_SHIFT, VIEW_HOURLY] + ([VIEW_LINE] if self.aggregator else []))
+        condition_layout.addWidget(self.view_combo)
+
+        search_btn = QPushButton("🔍 조회")
+        search_btn.setStyleSheet(get_button_style())
+        search_btn.clicked.connect(self.load_report)
+        condition_layout.addWidget(search_btn)
+
+        rebuild_btn = QPushButton("🔄 로그에서 재구성")
+        rebuild_btn.setStyleSheet(get_button_style())
+        rebuild_btn.clicked.connect(self.rebuild_from_logs)
+        condition_layout.addWidget(rebuild_btn)
+
+        trace_btn = QPushButton("🔎 추적 조회")
+        trace_btn.setStyleSheet(get_button_style())
+        trace_btn.clicked.connect(self.open_trace_lookup)
+        condition_layout.addWidget(trace_btn)
+        condition_layout.addStretch()
+        layout.addWidget(condition_group)
+
+        # 합계
+        self.summary_label = QLabel("")
+        self.summary_label.setStyleSheet(get_info_label_style())
+        layout.addWidget(self.summary_label)
+
+        # 실적 테이블
+        self.report_table = QTableWidget()
+        self.report_table.setColumnCount(len(self.HEADERS))
+        self.report_table.setHorizontalHeaderLabels(self.HEADERS)
+        self.report_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.report_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.report_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        layout.addWidget(self.report_table)
+
+    def _selected_panel(self):
+        panel_name = self.panel_combo.currentText()
+        return None if panel_name == ALL_PANELS else panel_name
+
+    def load_report(self):
+        """선택한 작업일 실적 표시 (집계 저장소 조회 - 원본 로그를 읽지 않음)"""
+        try:
+            work_date = self.work_date_edit.date().toPyDate()
+            panel_name = self._selected_panel()
+            if self.view_combo.currentText() == VIEW_LINE:
+                # 집계 서버의 전 스테이션 라벨 OK/NG 합계 (스캔 판정은 스테이션별 집계에만 있음)
+                rows = [(row["shift"] or "-", row["shift"], f"[{row['station']}] {row['panel'] or ''}",
+                         row["part_number"], {RESULT_OK: row["OK"], RESULT_NG: row["NG"]})
+                        for row in self.aggregator.shift_totals(work_date.isoformat())
+                        if panel_name is None or row["panel"] == panel_name]
+            elif self.view_combo.currentText() == VIEW_HOURLY:
+                day_start = (datetime.combine(work_date, datetime.min.time())
+                             + timedelta(minutes=self.rollup.calendar.day_start))
+                rows = [(hour.strftime("%H:00"), shift, panel, part_number, counts)
+                        for hour, shift, panel, part_number, counts in
+                        self.rollup.hourly(day_start, day_start + timedelta(days=1), panel_name)]
+            else:
+                rows = [(shift or "-", shift, panel, part_number, counts)
+                        for shift, panel, part_number, counts in self.rollup.shift_report(work_date, panel_name)]
+            self.fill_table(rows)
+        except Exception as e:
+            logger.error("생산 실적 조회 오류: %s", e)
+            QMessageBox.critical(self, "오류", f"생산 실적 조회 중 오류가 발생했습니다: {e}")
+
+    def fill_table(self, rows):
+        totals = {RESULT_OK: 0, RESULT_NG: 0, RESULT_SCAN_OK: 0, RESULT_SCAN_NG: 0}
+        self.report_table.setRowCount(len(rows))
+        for row, (label, shift, panel, part_number, counts) in enumerate(rows):
+            values = [label, shift, panel, part_number] + [counts.get(result, 0) for result in totals]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                item.setTextAlignment(Qt.AlignCenter)
+                self.report_table.setItem(row, column, item)
+            for result in totals:
+                totals[result] += counts.get(result, 0)
+        self.summary_label.setText(
+            f"합계 - OK: {totals[RESULT_OK]}  NG: {totals[RESULT_NG]}  "
+            f"스캔 OK: {totals[RESULT_SCAN_OK]}  스캔 NG: {totals[RESULT_SCAN_NG]}")
+
+    def rebuild_from_logs(self):
+        """기존 로그 파일에서 집계 다시 만들기 (집계가 어긋났을 때)"""
+        reply = QMessageBox.question(self, "로그에서 재구성",
+                                     "기존 스캔/출력 로그 파일을 모두 읽어 생산 실적 집계를 다시 만듭니다.\n"
+                                     "메인 화면이 별도 프로그램으로 실행 중이면 종료한 뒤 진행하세요 (실적 중복 방지).\n"
+                                     "계속하시겠습니까?",
+                                     QMessageBox.Yes | QMessageBox.No)
+        if reply != QMessageBox.Yes:
+            return
+        count = self.rollup.rebuild()
+        self.load_report()
+        QMessageBox.information(self, "로그에서 재구성", f"{count}건의 로그로 생산 실적을 다시 만들었습니다.")
+
+    def open_trace_lookup(self):
+        """부모 라벨 ↔ 하위부품 추적 조회 창"""
+        HistoryDetailDialog({}, self, trace_index=self.aggregator).exec_()
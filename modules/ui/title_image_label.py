@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+메인 화면 타이틀 이미지 라벨
+- 원본 이미지는 경로별로 한 번만 로드
+- 라벨 크기(+ devicePixelRatio)별 축소 이미지를 캐시하여 재사용
+- 창 크기 변경 시 바로 다시 그리지 않고 잠시 멈춘 뒤 한 번만 다시 그림 (이동/크기 조절이 부드럽게)
+"""
+
+from collections import OrderedDict
+
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtCore import Qt, QSize, QTimer
+from PyQt5.QtGui import QPixmap
+
+from .styles import get_main_scan_title_style
+from ..utils.font_manager import FontManager
+from ..utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+RESIZE_DEBOUNCE_MS = 150    # 크기 변경 후 다시 그리기까지 대기 (ms)
+SCALED_CACHE_SIZE = 8       # 보관할 축소 이미지 수 (크기별)
+MIN_SCALE = 0.25            # 최소 표시 배율 (레이아웃 최소 크기)
+
+_source_cache = {}          # 이미지 경로 → 원본 QPixmap
+
+
+def load_source_pixmap(image_path):
+    """원본 이미지 로드 (경로별 1회)"""
+    pixmap = _source_cache.get(image_path)
+    if pixmap is None:
+        pixmap = QPixmap(image_path)
+        if pixmap.isNull():
+            logger.warning("타이틀 이미지 로드 실패: %s", image_path)
+        _source_cache[image_path] = pixmap
+    return pixmap
+
+
+class TitleImageLabel(QLabel):
+    """라벨 크기에 맞춰 축소한 타이틀 이미지 표시 (원본보다 크게 확대하지 않음)"""
+
+    def __init__(self, image_path, fallback_text="", parent=None):
+        super().__init__(parent)
+        self._source = load_source_pixmap(image_path)
+        self._scaled = OrderedDict()            # (너비, 높이, dpr) → 축소 QPixmap
+        self._rendered_key = None
+        self.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._render_scaled)
+
+        if self._source.isNull():
+            # 이미지 로드 실패 시 텍스트로 대체
+            self.setText(fallback_text)
+            self.setFont(FontManager.get_dialog_title_font())
+            self.setStyleSheet(get_main_scan_title_style())
+
+    def has_image(self):
+        return not self._source.isNull()
+
+    def sizeHint(self):
+        # 크기 힌트는 항상 원본 크기 - 축소 이미지를 넣어도 레이아웃이 다시 바뀌지 않음
+        if self.has_image():
+            return self._source.size() / self._source.devicePixelRatio()
+        return super().sizeHint()
+
+    def minimumSizeHint(self):
+        if self.has_image():
+            return self.sizeHint() * MIN_SCALE
+        return super().minimumSizeHint()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if not self.has_image():
+            return
+        if self._rendered_key is None:
+            self._render_scaled()       # 최초 표시는 바로
+        else:
+            self._resize_timer.start()  # 이후 크기 변경은 모아서 한 번
+
+    def _render_scaled(self):
+        """현재 라벨 크기에 맞는 이미지 표시 (캐시 우선)"""
+        if not self.has_image():
+            return
+        dpr = self.devicePixelRatioF()
+        source_size = self.sizeHint()
+        target = source_size.scaled(self.contentsRect().size().boundedTo(source_size), Qt.KeepAspectRatio)
+        if target.isEmpty():
+            return
+        key = (target.width(), target.height(), dpr)
+        if key == self._rendered_key:
+            return
+        pixmap = self._scaled.get(key)
+        if pixmap is None:
+            pixmap = self._source.scaled(QSize(round(target.width() * dpr), round(target.height() * dpr)),
+                                         Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            pixmap.setDevicePixelRatio(dpr)
+            self._scaled[key] = pixmap
+            if len(self._scaled) > SCALED_CACHE_SIZE:
+                self._scaled.popitem(last=False)
+        else:
+            self._scaled.move_to_end(key)
+        self._rendered_key = key
+        self.setPixmap(pixmap)
@@ -1,9 +1,12 @@
 """
 폰트 관리 모듈
 프로그램 전체에서 사용하는 폰트를 중앙에서 관리
+- 폰트는 (패밀리, 크기, 굵기) 별로 한 번만 생성하여 공유 (다이얼로그/테이블 행마다 새로 만들지 않음)
+- 설치된 폰트 패밀리는 처음 한 번만 조회하여 대체 폰트 결정
+- DPI/화면 배율이 바뀌면 캐시를 비우고 다시 생성
 """
 
-from PyQt5.QtGui import QFont
+from PyQt5.QtGui import QFont, QFontDatabase, QGuiApplication
 
 class FontManager:
     """폰트 관리 클래스 - 모든 폰트를 중앙에서 관리"""
@@ -11,6 +14,18 @@ class FontManager:
     # 기본 폰트 패밀리
     DEFAULT_FONT_FAMILY = "Arial"
     
+    # 패밀리별 대체 순서 (설치된 첫 번째 폰트 사용, 모두 없으면 Qt 기본 대체 규칙)
+    FAMILY_FALLBACKS = {
+        "Arial": ("Arial", "Segoe UI", "Malgun Gothic", "DejaVu Sans"),
+        "Courier New": ("Courier New", "Consolas", "DejaVu Sans Mono"),
+        "Digital-7": ("Digital-7", "Consolas", "Courier New", "DejaVu Sans Mono"),
+    }
+    
+    _font_cache = {}            # (패밀리, 크기, 굵기) → 공유 QFont
+    _family_cache = {}          # 요청 패밀리 → 실제 사용할 패밀리
+    _installed_families = None  # 설치된 폰트 패밀리 (최초 1회 조회)
+    _screen_hooks_installed = False
+    
     # 폰트 크기 정의
     class Size:
         TINY = 8
@@ -32,14 +47,66 @@ class FontManager:
     
     @classmethod
     def get_font(cls, size=None, weight=None, family=None):
-        """기본 폰트 생성"""
-        font = QFont(family or cls.DEFAULT_FONT_FAMILY)
-        if size is not None:
-            font.setPointSize(size)
-        if weight is not None:
-            font.setWeight(weight)
+        """공유 폰트 반환 - (패밀리, 크기, 굵기) 별로 한 번만 생성
+        여러 위젯이 같은 인스턴스를 쓰므로 수정하지 말 것 (수정이 필요하면 QFont(font) 로 복사)"""
+        key = (family or cls.DEFAULT_FONT_FAMILY, size, weight)
+        font = cls._font_cache.get(key)
+        if font is None:
+            font = QFont(cls.resolve_family(key[0]))
+            if size is not None:
+                font.setPointSize(size)
+            if weight is not None:
+                font.setWeight(weight)
+            cls._font_cache[key] = font
+            cls._install_screen_hooks()
         return font
     
+    @classmethod
+    def resolve_family(cls, family):
+        """설치된 폰트 패밀리로 변환 (대체 순서 적용) - 결과 캐시"""
+        resolved = cls._family_cache.get(family)
+        if resolved is not None:
+            return resolved
+        if cls._installed_families is None:
+            if QGuiApplication.instance() is None:
+                return family  # QApplication 생성 전 - 확인 불가 (캐시하지 않음)
+            cls._installed_families = set(QFontDatabase().families())
+        resolved = family
+        for candidate in cls.FAMILY_FALLBACKS.get(family, (family,)):
+            if candidate in cls._installed_families:
+                resolved = candidate
+                break
+        cls._family_cache[family] = resolved
+        return resolved
+    
+    @classmethod
+    def invalidate(cls, *args):
+        """폰트 캐시 비우기 - DPI/배율/기본 폰트 변경 시 (이후 생성되는 위젯부터 적용)"""
+        cls._font_cache.clear()
+        cls._family_cache.clear()
+        cls._installed_families = None
+    
+    @classmethod
+    def _install_screen_hooks(cls):
+        """화면 DPI/배율 변경 시 캐시 비우기 - QApplication 생성 후 한 번만 연결"""
+        if cls._screen_hooks_installed:
+            return
+        app = QGuiApplication.instance()
+        if app is None:
+            return
+        cls._screen_hooks_installed = True
+        
+        def watch_screen(screen):
+            screen.logicalDotsPerInchChanged.connect(cls.invalidate)
+            screen.physicalDotsPerInchChanged.connect(cls.invalidate)
+        
+        for screen in app.screens():
+            watch_screen(screen)
+        app.screenAdded.connect(watch_screen)
+        app.primaryScreenChanged.connect(cls.invalidate)
+        if hasattr(app, 'fontDatabaseChanged'):
+            app.fontDatabaseChanged.connect(cls.invalidate)
+    
     # 메인 화면 폰트들
     @classmethod
     def get_main_title_font(cls):
@@ -185,9 +252,7 @@ class FontManager:
     @classmethod
     def get_digital_font(cls):
         """디지털 표시 폰트 (생산 수량용)"""
-        font = cls.get_font(cls.Size.XXLARGE, cls.Weight.BOLD)
-        font.setFamily("Digital-7")  # 디지털 폰트
-        return font
+        return cls.get_font(cls.Size.XXLARGE, cls.Weight.BOLD, "Digital-7")  # 디지털 폰트
     
     @classmethod
     def get_monospace_font(cls):
@@ -199,6 +264,7 @@ class FontManager:
     def set_default_font_family(cls, family):
         """기본 폰트 패밀리 변경"""
         cls.DEFAULT_FONT_FAMILY = family
+        cls.invalidate()
     
     @classmethod
     def update_all_fonts(cls, new_family=None, size_multiplier=1.0):
@@ -211,3 +277,4 @@ class FontManager:
             if not attr_name.startswith('_'):
                 current_size = getattr(cls.Size, attr_name)
                 setattr(cls.Size, attr_name, int(current_size * size_multiplier))
+        cls.invalidate()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로그 파일 핸들러 모듈
+- 용량/일자 기준 로그 파일 교체 (rotation)
+- 교체된 파일은 백그라운드 스레드에서 gzip 압축
+- 보관 기간/개수를 넘는 파일 자동 삭제
+- 로그 큐가 가득 차면 기록을 버리고 호출 스레드는 절대 대기하지 않음
+"""
+
+import os
+import glob
+import gzip
+import time
+import queue
+import shutil
+import threading
+import datetime
+import logging
+import logging.handlers
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 기록을 버리는 QueueHandler (장비/GUI 스레드 대기 방지)"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class SegmentCompressor:
+    """교체된 로그 파일을 gzip으로 압축하는 백그라운드 작업자 (단일 스레드)"""
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, path, on_done=None):
+        """압축 작업 등록 - 즉시 반환"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="LogCompressor", daemon=True)
+                self._thread.start()
+        self._jobs.put((path, on_done))
+
+    def join(self, timeout=None):
+        """남은 압축 작업이 끝날 때까지 대기 (종료 시 사용)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._jobs.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def _run(self):
+        while True:
+            path, on_done = self._jobs.get()
+            try:
+                self._compress(path)
+                if on_done:
+                    on_done()
+            except Exception as e:
+                # 로깅 시스템 내부 오류는 로거로 보낼 수 없으므로 콘솔에만 출력
+                print(f"⚠️ 로그 압축 실패: {path} - {e}")
+            finally:
+                self._jobs.task_done()
+
+    @staticmethod
+    def _compress(path):
+        if not os.path.exists(path):
+            return
+        temp_path = path + ".gz.tmp"
+        with open(path, 'rb') as src, gzip.open(temp_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(temp_path, path + ".gz")
+        os.remove(path)
+
+
+# 모든 핸들러가 공유하는 압축 작업자
+_compressor = SegmentCompressor()
+
+
+def get_compressor():
+    return _compressor
+
+
+class CompressingRotatingFileHandler(logging.handlers.BaseRotatingHandler):
+    """용량 또는 자정 기준으로 교체하고, 교체된 파일은 압축/보관 정책을 적용하는 핸들러
+
+    교체 파일명: <이름>.<YYYYMMDD-HHMMSS>.log → 압축 후 <이름>.<YYYYMMDD-HHMMSS>.log.gz
+    QueueListener 스레드에서만 호출되므로 교체/압축이 장비 스레드를 막지 않는다.
+    """
+
+    def __init__(self, filename, max_bytes=5 * 1024 * 1024, backup_count=60,
+                 retention_days=90, encoding='utf-8', compressor=None):
+        directory = os.path.dirname(os.path.abspath(filename))
+        os.makedirs(directory, exist_ok=True)
+        super().__init__(filename, 'a', encoding=encoding, delay=True)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.retention_days = retention_days
+        self.compressor = compressor or _compressor
+
+        # 기존 파일이 있으면 마지막 기록 시각 기준으로 다음 교체 시점 계산
+        # (어제 파일이 남아 있으면 첫 기록 시 바로 교체됨)
+        if os.path.exists(self.baseFilename):
+            start = os.path.getmtime(self.baseFilename)
+        else:
+            start = time.time()
+        self.rollover_at = self._next_midnight(start)
+
+        # 이전 실행에서 압축되지 못한 교체 파일 정리
+        for path in self._segments(compressed=False):
+            self.compressor.submit(path, self.apply_retention)
+        self.apply_retention()
+
+    @staticmethod
+    def _next_midnight(timestamp):
+        day = datetime.date.fromtimestamp(timestamp) + datetime.timedelta(days=1)
+        return datetime.datetime.combine(day, datetime.time.min).timestamp()
+
+    def _segment_prefix(self):
+        stem, _ = os.path.splitext(self.baseFilename)
+        return stem + "."
+
+    def _segments(self, compressed=True):
+        _, ext = os.path.splitext(self.baseFilename)
+        pattern = glob.escape(self._segment_prefix()) + "*" + ext + (".gz" if compressed else "")
+        return glob.glob(pattern)
+
+    def shouldRollover(self, record):
+        if time.time() >= self.rollover_at:
+            return True
+        if self.max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            if self.stream.tell() >= self.max_bytes:
+                return True
+        return False
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            # 파일 내용이 속한 시점(마지막 기록 시각)으로 이름을 붙임
+            stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(os.path.getmtime(self.baseFilename)))
+            _, ext = os.path.splitext(self.baseFilename)
+            rotated = f"{self._segment_prefix()}{stamp}{ext}"
+            index = 1
+            while os.path.exists(rotated) or os.path.exists(rotated + ".gz"):
+                rotated = f"{self._segment_prefix()}{stamp}_{index}{ext}"
+                index += 1
+            os.replace(self.baseFilename, rotated)
+            self.compressor.submit(rotated, self.apply_retention)
+
+        self.rollover_at = self._next_midnight(time.time())
+        self.stream = self._open()
+
+    def apply_retention(self):
+        """보관 기간 초과 또는 보관 개수 초과 압축 파일 삭제"""
+        try:
+            segments = sorted(self._segments(compressed=True), key=os.path.getmtime, reverse=True)
+            cutoff = time.time() - self.retention_days * 86400 if self.retention_days > 0 else None
+            for i, path in enumerate(segments):
+                expired = cutoff is not None and os.path.getmtime(path) < cutoff
+                overflow = self.backup_count > 0 and i >= self.backup_count
+                if expired or overflow:
+                    os.remove(path)
+        except Exception as e:
+            print(f"⚠️ 로그 보관 정책 적용 실패: {e}")
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프로젝트 공통 로깅 모듈
+모듈별 로거를 'barcode' 루트 로거 아래에 두고 레벨 하나로 전체 출력을 제어한다.
+운영은 INFO, 현장 점검 시에는 관리자 패널/환경변수로 DEBUG 전환
+
+사용 예:
+    from ..utils.log_manager import get_logger
+    logger = get_logger(__name__)
+    logger.debug("PLC 수신 데이터: %r", data)   # 지연 포매팅 - 레벨이 꺼져 있으면 문자열을 만들지 않음
+
+기록은 큐에만 넣고 파일/콘솔 쓰기는 별도 리스너 스레드가 처리한다 (log_handlers 참고).
+"""
+
+import os
+import sys
+import json
+import queue
+import atexit
+import logging
+import logging.handlers
+import threading
+
+from .log_handlers import CompressingRotatingFileHandler, NonBlockingQueueHandler, get_compressor
+
+ROOT_LOGGER_NAME = "barcode"
+
+# 관리자 패널 콤보박스 표시 순서
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
+DEFAULT_LOG_LEVEL = "INFO"
+
+# 환경변수로 설정 파일보다 우선 적용 (예: set BARCODE_LOG_LEVEL=DEBUG)
+LOG_LEVEL_ENV = "BARCODE_LOG_LEVEL"
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+DATE_FORMAT = "%H:%M:%S"
+
+# 파일 로그 (설정 파일 logging 섹션으로 변경 가능)
+LOG_DIR = os.path.join("logs", "app")
+APP_LOG_FILE = "barcode.log"
+CONNECTION_ERROR_LOG_FILE = "connection_errors.log"
+CONNECTION_ERROR_LOGGER = "connection_errors"
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024   # 파일당 최대 5MB (자정에도 교체)
+DEFAULT_BACKUP_COUNT = 60             # 압축 보관 파일 최대 개수
+DEFAULT_RETENTION_DAYS = 90           # 압축 보관 기간 (일)
+DEFAULT_QUEUE_SIZE = 10000            # 큐가 가득 차면 기록을 버림 (호출 스레드 대기 없음)
+
+_configure_lock = threading.Lock()
+_configured = False
+_queue_handler = None
+_listener = None
+
+
+def _default_config_file():
+    return os.path.join("config", "admin_panel_config.json")
+
+
+def _normalize_level(level):
+    """레벨명/숫자를 로깅 레벨 숫자로 변환 (잘못된 값이면 None)"""
+    if isinstance(level, int):
+        return level
+    if not level:
+        return None
+    value = logging.getLevelName(str(level).strip().upper())
+    return value if isinstance(value, int) else None
+
+
+def _load_logging_settings(config_file=None):
+    """설정 파일의 logging 섹션 로드 (없거나 깨져 있으면 빈 dict)"""
+    config_file = config_file or _default_config_file()
+    try:
+        if os.path.exists(config_file):
+            with open(config_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get("logging", {}) or {}
+    except Exception:
+        # 설정 파일이 깨져 있어도 로깅은 기본값으로 동작해야 함
+        pass
+    return {}
+
+
+def _resolve_level(logging_settings):
+    """환경변수 → 설정 파일(logging.level) → 기본값 순으로 레벨 결정"""
+    for candidate in (os.environ.get(LOG_LEVEL_ENV), logging_settings.get("level")):
+        level = _normalize_level(candidate)
+        if level is not None:
+            return level
+    return _normalize_level(DEFAULT_LOG_LEVEL)
+
+
+def _build_handlers(logging_settings):
+    """큐 리스너가 실제로 기록할 핸들러 목록 생성 (콘솔 + 파일)"""
+    formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+    file_formatter = logging.Formatter(LOG_FORMAT)
+    handlers = []
+
+    # pythonw 등 콘솔이 없는 실행 환경에서는 콘솔 출력 생략
+    if sys.stdout is not None:
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(formatter)
+        handlers.append(console)
+
+    log_dir = logging_settings.get("log_dir", LOG_DIR)
+    rotation = {
+        "max_bytes": int(logging_settings.get("max_bytes", DEFAULT_MAX_BYTES)),
+        "backup_count": int(logging_settings.get("backup_count", DEFAULT_BACKUP_COUNT)),
+        "retention_days": int(logging_settings.get("retention_days", DEFAULT_RETENTION_DAYS)),
+    }
+    try:
+        app_file = CompressingRotatingFileHandler(os.path.join(log_dir, APP_LOG_FILE), **rotation)
+        app_file.setFormatter(file_formatter)
+        handlers.append(app_file)
+
+        # 연결 오류는 별도 파일에도 모아서 현장 점검 시 바로 확인
+        error_file = CompressingRotatingFileHandler(os.path.join(log_dir, CONNECTION_ERROR_LOG_FILE), **rotation)
+        error_file.setFormatter(file_formatter)
+        error_file.addFilter(logging.Filter(f"{ROOT_LOGGER_NAME}.{CONNECTION_ERROR_LOGGER}"))
+        handlers.append(error_file)
+    except Exception as e:
+        print(f"⚠️ 로그 파일 핸들러 생성 실패 - 콘솔 로그만 사용: {e}")
+    return handlers
+
+
+def setup_logging(level=None, config_file=None):
+    """루트 로거 초기화 (여러 번 호출해도 큐/리스너는 한 번만 생성)
+
+    모든 로거는 큐에 기록만 하고, 콘솔/파일 쓰기와 파일 교체는 리스너 스레드가 담당한다.
+    """
+    global _configured, _queue_handler, _listener
+    with _configure_lock:
+        root = logging.getLogger(ROOT_LOGGER_NAME)
+        if not _configured:
+            logging_settings = _load_logging_settings(config_file)
+            log_queue = queue.Queue(int(logging_settings.get("queue_size", DEFAULT_QUEUE_SIZE)))
+            _queue_handler = NonBlockingQueueHandler(log_queue)
+            root.addHandler(_queue_handler)
+            # 다른 모듈의 logging.basicConfig 핸들러로 중복 출력되지 않도록 전파 차단
+            root.propagate = False
+
+            _listener = logging.handlers.QueueListener(
+                log_queue, *_build_handlers(logging_settings), respect_handler_level=True
+            )
+            _listener.start()
+            atexit.register(shutdown_logging)
+            _configured = True
+            if level is None:
+                level = _resolve_level(logging_settings)
+
+        level = _normalize_level(level)
+        if level is not None:
+            root.setLevel(level)
+        return root
+
+
+def shutdown_logging(timeout=5.0):
+    """남은 로그 기록 및 압축 작업 마무리 (프로그램 종료 시 자동 호출)"""
+    global _listener
+    with _configure_lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        try:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        except Exception as e:
+            print(f"⚠️ 로그 리스너 종료 실패: {e}")
+    get_compressor().join(timeout)
+
+
+def get_dropped_count():
+    """큐가 가득 차서 버려진 로그 기록 수"""
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+def get_logger(name=None):
+    """모듈별 로거 반환 - 'barcode.<모듈명>' 계층으로 생성"""
+    if not _configured:
+        setup_logging()
+    if not name or name == "__main__":
+        name = os.path.splitext(os.path.basename(sys.argv[0] or "main"))[0] or "main"
+    if name != ROOT_LOGGER_NAME and not name.startswith(ROOT_LOGGER_NAME + "."):
+        name = f"{ROOT_LOGGER_NAME}.{name}"
+    return logging.getLogger(name)
+
+
+def get_log_level():
+    """현재 전체 로그 레벨명 반환"""
+    if not _configured:
+        setup_logging()
+    return logging.getLevelName(logging.getLogger(ROOT_LOGGER_NAME).level)
+
+
+def set_log_level(level, settings_manager=None):
+    """실행 중 전체 로그 레벨 변경 (settings_manager가 있으면 설정 파일에도 저장)"""
+    value = _normalize_level(level)
+    if value is None:
+        raise ValueError(f"알 수 없는 로그 레벨: {level}")
+
+    setup_logging(value)
+    level_name = logging.getLevelName(value)
+
+    if settings_manager is not None:
+        settings_manager.settings.setdefault("logging", {})["level"] = level_name
+        settings_manager.save_settings()
+
+    get_logger(__name__).info("로그 레벨 변경: %s", level_name)
+    return level_name
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공용 시리얼 포트 목록 서비스
+- 포트 열거/열기 테스트는 작업 스레드에서 실행 (GUI 스레드에서 sleep/포트 열기 없음)
+- 결과는 짧은 TTL 동안 캐시하여 여러 탭이 같은 결과를 공유
+- 실행 중인 연결(관리자 탭/메인 화면)이 점유한 포트는 열기 테스트하지 않음
+- 조회가 끝나면 ports_updated 시그널로 모든 탭에 전달
+"""
+
+import time
+import threading
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+try:
+    import serial
+    from serial.tools import list_ports
+except ImportError:  # pyserial 미설치 환경
+    serial = None
+    list_ports = None
+
+from ..log_manager import get_logger
+from .port_resolver import normalize_port_name, port_key
+
+logger = get_logger(__name__)
+
+CACHE_TTL = 5.0                         # 캐시 유효 시간 (초)
+NO_PORTS_TEXT = "사용 가능한 포트 없음"
+SCANNING_TEXT = "포트 검색 중..."
+
+
+class PortEntry:
+    """포트 한 개의 조회 결과 - available: True/False (열기 테스트 결과), None (테스트 안 함)"""
+
+    __slots__ = ("device", "description", "available", "error", "owner")
+
+    def __init__(self, device, description="", available=None, error="", owner=None):
+        self.device = device
+        self.description = description or ""
+        self.available = available
+        self.error = error
+        self.owner = owner              # 점유 중인 연결 이름 (탭명/장비명)
+
+    def label(self, in_use=False):
+        """콤보박스 표시 문자열 - 기존 탭 표시 형식 유지"""
+        text = f"{self.device} - {self.description}"
+        if in_use:
+            return text + " -사용중-"
+        if self.available is False:
+            return text + " (사용불가)"
+        return text
+
+    def __repr__(self):
+        return f"PortEntry({self.device!r}, available={self.available}, owner={self.owner!r})"
+
+
+class PortInventoryService(QObject):
+    """포트 목록 조회 서비스 (프로세스 공용 인스턴스는 shared())"""
+
+    ports_updated = pyqtSignal(list)    # [PortEntry] - 작업 스레드에서 발생, 탭에서는 GUI 스레드로 전달됨
+
+    _shared = None
+
+    def __init__(self, ttl=CACHE_TTL):
+        super().__init__()
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = None            # 한 번도 조회하지 않았으면 None
+        self._probed = False            # 캐시가 열기 테스트까지 한 결과인지
+        self._scanned_at = None
+        self._worker = None
+        self._pending = None            # 작업 중 들어온 추가 요청 (probe 여부, 점유 포트)
+        self._owner_sources = []
+
+    @classmethod
+    def shared(cls):
+        """관리자 탭과 메인 화면이 함께 쓰는 인스턴스 (GUI 스레드에서 처음 생성)"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def add_owner_source(self, source):
+        """점유 포트 제공 함수 등록 - source() → {포트명: 점유자}"""
+        if source not in self._owner_sources:
+            self._owner_sources.append(source)
+
+    def remove_owner_source(self, source):
+        if source in self._owner_sources:
+            self._owner_sources.remove(source)
+
+    def owned_ports(self):
+        """현재 점유 포트 {포트 키(port_key): 점유자} (GUI 스레드에서 호출)"""
+        owners = {}
+        for source in list(self._owner_sources):
+            try:
+                for port, owner in (source() or {}).items():
+                    if port:
+                        owners.setdefault(port_key(port), owner)
+            except Exception as e:
+                logger.debug("점유 포트 조회 오류: %s", e)
+        return owners
+
+    def entries(self):
+        """캐시된 포트 목록 (조회 전이면 None) - 블로킹 없음"""
+        with self._lock:
+            return list(self._entries) if self._entries is not None else None
+
+    def is_fresh(self, probe=False):
+        with self._lock:
+            if self._scanned_at is None or (probe and not self._probed):
+                return False
+            return time.monotonic() - self._scanned_at < self.ttl
+
+    def is_scanning(self):
+        worker = self._worker
+        return worker is not None and worker.is_alive()
+
+    def refresh(self, probe=False, force=False):
+        """캐시가 오래됐으면(또는 force) 작업 스레드에서 재조회 - 즉시 반환
+        이미 조회 중이면 끝난 뒤 한 번 더 조회하도록 예약 (probe 요청은 유지)"""
+        if not force and self.is_fresh(probe):
+            return False
+        owners = self.owned_ports()
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                if force or probe:
+                    pending_probe = bool(self._pending and self._pending[0])
+                    self._pending = (probe or pending_probe, owners)
+                return False
+            self._worker = threading.Thread(target=self._run, args=(probe, owners),
+                                            name="port-inventory", daemon=True)
+            self._worker.start()
+        return True
+
+    def _run(self, probe, owners):
+        while True:
+            try:
+                entries = self.scan(probe, owners)
+            except Exception as e:
+                logger.error("포트 목록 조회 실패: %s", e)
+                entries = []
+            with self._lock:
+                self._entries = entries
+                self._probed = probe
+                self._scanned_at = time.monotonic()
+                pending, self._pending = self._pending, None
+            try:
+                self.ports_updated.emit(list(entries))
+            except RuntimeError as e:  # 종료 중 QObject 삭제
+                logger.debug("포트 목록 알림 실패: %s", e)
+                return
+            if pending is None:
+                return
+            # 조회 중 새로고침 요청(연결/해제 등)이 있었으면 그 시점 점유 정보로 한 번 더 조회
+            probe, owners = pending
+
+    @staticmethod
+    def scan(probe=False, owners=None):
+        """포트 열거 (+ 점유되지 않은 포트만 열기 테스트) - 작업 스레드에서 호출"""
+        owners = owners or {}
+        if list_ports is None:
+            return []
+        entries = []
+        for info in sorted(list_ports.comports(), key=lambda port: port.device):
+            owner = owners.get(port_key(info.device))
+            entry = PortEntry(info.device, info.description, owner=owner)
+            if probe and owner is None and serial is not None:
+                try:
+                    # timeout=0: 열고 바로 닫기만 함 (대기 없음)
+                    serial.Serial(info.device, timeout=0).close()
+                    entry.available = True
+                except Exception as e:
+                    entry.available = False
+                    entry.error = str(e)
+            entries.append(entry)
+        logger.debug("포트 목록 조회 (probe=%s): %s", probe, entries)
+        return entries
+
+
+def fill_port_combo(combo, entries, in_use=None, selected_port=None):
+    """포트 콤보박스 채우기 - 선택 포트 유지
+    entries: PortEntry 목록 (None 이면 조회 중), in_use: {포트명: 탭명} ("-사용중-" 표시)"""
+    in_use = in_use or {}
+    selected = normalize_port_name(selected_port or combo.currentText())
+    if selected in (NO_PORTS_TEXT, SCANNING_TEXT, ""):
+        selected = normalize_port_name(combo.property("preferred_port"))  # 저장된 설정 포트
+
+    combo.blockSignals(True)
+    try:
+        combo.clear()
+        if entries is None:
+            combo.addItem(SCANNING_TEXT)
+        elif not entries:
+            combo.addItem(NO_PORTS_TEXT)
+        else:
+            for entry in sorted(entries, key=lambda item: item.device):
+                combo.addItem(entry.label(entry.device in in_use))
+                if entry.device == selected:
+                    combo.setCurrentIndex(combo.count() - 1)
+    finally:
+        combo.blockSignals(False)
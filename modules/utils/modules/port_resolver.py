@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+USB 시리얼 장비 포트 해석 모듈
+COM 포트명 대신 VID/PID/시리얼번호/USB 위치로 장비를 식별하여
+재연결 후 포트 번호가 바뀌어도 같은 장비를 자동으로 찾아 연결한다
+"""
+
+import time
+import threading
+
+try:
+    from serial.tools import list_ports
+except ImportError:  # pyserial 미설치 환경
+    list_ports = None
+
+from ..log_manager import get_logger
+
+logger = get_logger(__name__)
+
+# 장비명 → (설정 섹션, 포트 키, 프로파일 키)
+DEVICE_CONFIG_KEYS = {
+    "PLC": ("plc", "port", "usb_profile"),
+    "스캐너": ("scanner", "port", "usb_profile"),
+    "프린터": ("printer", "port", "usb_profile"),
+    "너트1": ("nutrunner", "nutrunner1_port", "nutrunner1_usb_profile"),
+    "너트2": ("nutrunner", "nutrunner2_port", "nutrunner2_usb_profile"),
+}
+
+
+def normalize_port_name(port):
+    """콤보박스 표시 문자열에서 실제 포트명만 추출
+    예: "COM6 - USB-Enhanced-SERIAL CH343(COM6) -사용중-" → "COM6"
+    """
+    if not port:
+        return ""
+    return str(port).split(" - ")[0].strip()
+
+
+def port_key(port):
+    r"""포트 비교용 키 - Windows 장치 경로 접두사(\\.\) 제거, COM 포트는 대소문자 무시
+    예: "\\.\com3" → "COM3", "/dev/ttyUSB0" → "/dev/ttyUSB0" (그대로)"""
+    name = normalize_port_name(port)
+    if name.startswith("\\\\.\\"):
+        name = name[4:]
+    return name.upper() if name.upper().startswith("COM") else name
+
+
+def build_profile(port_info):
+    """list_ports 항목에서 장비 프로파일 생성 (USB 장비가 아니면 None)"""
+    if port_info is None or getattr(port_info, 'vid', None) is None:
+        return None
+    return {
+        "vid": port_info.vid,
+        "pid": port_info.pid,
+        "serial_number": port_info.serial_number or "",
+        "location": port_info.location or ""
+    }
+
+
+class DevicePortResolver:
+    """장비 프로파일 → 실제 포트명 해석기
+
+    포트 목록(list_ports.comports)은 한 번 조회한 결과를 캐시하여 재사용하고,
+    장비가 사라졌을 때(연결 실패/끊김)만 재조회한다.
+    """
+
+    def __init__(self, rescan_interval=2.0):
+        self._lock = threading.Lock()
+        self._ports = {}  # 포트명 → ListPortInfo
+        self._scanned_at = None
+        self._rescan_interval = rescan_interval  # 재조회 최소 간격 (초)
+
+    def get_ports(self):
+        """캐시된 포트 목록 반환 (최초 호출 시에만 조회)"""
+        with self._lock:
+            if self._scanned_at is None:
+                self._scan_locked()
+            return dict(self._ports)
+
+    def rescan(self, force=False):
+        """포트 목록 재조회 - 장비가 사라졌을 때 호출 (최소 간격 제한)"""
+        with self._lock:
+            now = time.monotonic()
+            if (not force and self._scanned_at is not None
+                    and now - self._scanned_at < self._rescan_interval):
+                return False
+            self._scan_locked()
+            return True
+
+    def _scan_locked(self):
+        """실제 포트 열거 (락 보유 상태에서 호출)"""
+        self._scanned_at = time.monotonic()
+        if list_ports is None:
+            self._ports = {}
+            return
+        try:
+            self._ports = {info.device: info for info in list_ports.comports()}
+            logger.debug("포트 목록 조회: %s", sorted(self._ports))
+        except Exception as e:
+            logger.error("포트 목록 조회 실패: %s", e)
+            self._ports = {}
+
+    def describe(self, port):
+        """포트명에 해당하는 ListPortInfo 반환 (캐시 기준)"""
+        return self.get_ports().get(normalize_port_name(port))
+
+    def find_port(self, profile, preferred_port=None):
+        """프로파일과 일치하는 포트명 반환 (없거나 판별 불가하면 None)
+
+        - VID/PID는 반드시 일치해야 함
+        - 시리얼번호가 있으면 시리얼번호로 식별
+        - 시리얼번호가 없는 저가형 어댑터는 USB 위치로 식별
+        """
+        if not profile or profile.get("vid") is None:
+            return None
+
+        candidates = [
+            info for info in self.get_ports().values()
+            if info.vid == profile.get("vid") and info.pid == profile.get("pid")
+        ]
+        if not candidates:
+            return None
+
+        serial_number = profile.get("serial_number") or ""
+        if serial_number:
+            candidates = [info for info in candidates if (info.serial_number or "") == serial_number]
+            if not candidates:
+                return None
+
+        location = profile.get("location") or ""
+        if len(candidates) > 1 and location:
+            same_location = [info for info in candidates if (info.location or "") == location]
+            if same_location:
+                candidates = same_location
+
+        if len(candidates) == 1:
+            return candidates[0].device
+
+        # 동일 장비가 여러 개라 판별 불가 - 기존 설정 포트가 후보에 있으면 그대로 사용
+        preferred = normalize_port_name(preferred_port)
+        for info in candidates:
+            if info.device == preferred:
+                return info.device
+        logger.warning("프로파일과 일치하는 포트가 여러 개라 판별 불가: %s", [info.device for info in candidates])
+        return None
+
+    def resolve(self, profile, configured_port):
+        """연결/재연결 시점의 포트명 결정 (프로파일 우선, 없으면 설정 포트)"""
+        configured = normalize_port_name(configured_port)
+        if not profile:
+            return configured
+        port = self.find_port(profile, configured)
+        return port or configured
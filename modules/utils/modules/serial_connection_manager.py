@@ -6,27 +6,21 @@
 안정성과 오류 처리를 강화한 버전
 """
 
+import os
 import serial
 import time
-import datetime
 import threading
-import logging
 import traceback
 from typing import Dict, Optional, Tuple, List
 from PyQt5.QtWidgets import QMessageBox
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer
-from ..utils import SerialConnectionThread
+from ..utils import SerialConnectionThread, SettingsManager
+from ..log_manager import get_logger, CONNECTION_ERROR_LOGGER
+from .port_resolver import DevicePortResolver, DEVICE_CONFIG_KEYS, build_profile, normalize_port_name
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('serial_connection.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+# 연결 실패 이력 - logs/app/connection_errors.log 에 별도 기록 (용량/일자 교체, 압축 보관)
+connection_error_logger = get_logger(CONNECTION_ERROR_LOGGER)
 
 
 class SerialConnectionManager(QObject):
@@ -336,20 +330,32 @@ class SerialConnectionManager(QObject):
 class AutoSerialConnector:
     """자동 시리얼 연결 관리자 - main_screen.py용 - 안정성 강화"""
     
-    def __init__(self, config):
+    def __init__(self, config, config_file=None):
         self.config = config
+        self.config_file = config_file or os.path.join("config", "admin_panel_config.json")
         self.serial_connections = {}
         self.device_connection_status = {}
         self.connection_retry_count = {}
+        self.resolved_ports = {}  # 장비명 → 실제 연결된 포트명
+        self.port_resolver = DevicePortResolver()  # VID/PID/시리얼번호 기반 포트 해석
+        self.device_keys = dict(DEVICE_CONFIG_KEYS)  # 장비명 → (설정 섹션, 포트 키, 프로파일 키)
+        self.extra_devices = []  # 스테이션 구성으로 추가된 장비 (예: 스테이션별 프린터)
         self._lock = threading.Lock()  # 스레드 안전성
         self._connection_timeout = 1  # 연결 타임아웃 (초) - 1초로 단축
         self._max_retry_attempts = 0  # 재시도 없음 - 1회만 시도
         self._retry_delay = 0  # 재시도 간격 없음
         
+    def add_printer_device(self, device_name):
+        """스테이션별 추가 프린터 등록 - 포트/프로파일은 printer 섹션의 '<장비명>_port', '<장비명>_usb_profile'"""
+        if device_name in self.device_keys:
+            return
+        self.device_keys[device_name] = ("printer", f"{device_name}_port", f"{device_name}_usb_profile")
+        self.extra_devices.append(device_name)
+    
     def auto_connect_all_devices(self):
         """모든 장비 자동 연결"""
         try:
-            print("🔌 시리얼 포트 자동 연결 시작...")
+            logger.info("시리얼 포트 자동 연결 시작")
             
             # 연결 결과 추적
             connection_results = {
@@ -362,44 +368,55 @@ class AutoSerialConnector:
             
             # 각 장비별 연결 시도 - 실제 설정 파일 구조에 맞춤
             devices = [
-                ("PLC", self.config.get("plc", {}).get("port", "COM6")),
-                ("스캐너", self.config.get("scanner", {}).get("port", "COM3")),
-                ("프린터", self.config.get("printer", {}).get("port", "COM4")),
-                ("너트1", self.config.get("nutrunner", {}).get("nutrunner1_port", "COM7")),
-                ("너트2", self.config.get("nutrunner", {}).get("nutrunner2_port", "COM8"))
+                ("PLC", self._get_configured_port("PLC", "COM6")),
+                ("스캐너", self._get_configured_port("스캐너", "COM3")),
+                ("프린터", self._get_configured_port("프린터", "COM4")),
+                ("너트1", self._get_configured_port("너트1", "COM7")),
+                ("너트2", self._get_configured_port("너트2", "COM8"))
             ]
+            for device_name in self.extra_devices:
+                connection_results[device_name] = False
+                devices.append((device_name, self._get_configured_port(device_name)))
             
             for device_name, default_port in devices:
                 try:
-                    print(f"DEBUG: {device_name} 연결 시도 - 포트: {default_port}")
+                    logger.debug("%s 연결 시도 - 포트: %s", device_name, default_port)
                     connection_results[device_name] = self.connect_serial_port(device_name, default_port)
                 except Exception as e:
-                    print(f"⚠️ {device_name} 연결 실패: {e}")
+                    logger.warning("%s 연결 실패: %s", device_name, e)
             
             # 연결 결과 요약
             successful_connections = sum(1 for result in connection_results.values() if result)
             total_devices = len(connection_results)
             
-            print(f"📊 연결 결과 요약: {successful_connections}/{total_devices} 장비 연결 성공")
+            logger.info("연결 결과 요약: %s/%s 장비 연결 성공", successful_connections, total_devices)
             
             if successful_connections == 0:
-                print("⚠️ 모든 장비 연결 실패 - 나중에 수동으로 연결하세요")
+                logger.warning("모든 장비 연결 실패 - 나중에 수동으로 연결하세요")
             elif successful_connections < total_devices:
                 failed_devices = [device for device, connected in connection_results.items() if not connected]
-                print(f"⚠️ 일부 장비 연결 실패: {', '.join(failed_devices)} - 나중에 수동으로 연결하세요")
+                logger.warning("일부 장비 연결 실패: %s - 나중에 수동으로 연결하세요", ", ".join(failed_devices))
             else:
-                print("✅ 모든 장비 연결 성공")
+                logger.info("모든 장비 연결 성공")
                 
             return connection_results
                 
         except Exception as e:
-            print(f"❌ 시리얼 포트 자동 연결 전체 실패: {e}")
-            import traceback
+            logger.error("시리얼 포트 자동 연결 전체 실패: %s", e)
             traceback.print_exception(type(e), e, e.__traceback__)
             return {}
     
     def connect_serial_port(self, device_name, port, retry_count=0, max_retries=None):
-        """개별 시리얼포트 연결 - admin_panel_config.json 설정 기반 - 안정성 강화"""
+        """개별 시리얼포트 연결 - admin_panel_config.json 설정 기반 - 안정성 강화
+        USB 프로파일이 있으면 포트명 대신 프로파일로 실제 포트를 찾아 연결하고,
+        실패하면 포트 목록을 재조회하여 바뀐 포트로 한 번 더 시도한다"""
+        success = self._connect_once(device_name, port, retry_count, max_retries)
+        if not success:
+            success = self._try_alternative_ports(device_name)
+        return success
+    
+    def _connect_once(self, device_name, port, retry_count=0, max_retries=None):
+        """단일 포트 연결 시도"""
         if max_retries is None:
             max_retries = self._max_retry_attempts
             
@@ -407,16 +424,13 @@ class AutoSerialConnector:
             try:
                 logger.info(f"{device_name} 연결 시도 시작 - 포트: {port}")
                 
-                # 포트명에서 실제 포트 번호만 추출 (예: "COM6 - USB-Enhanced-SERIAL CH343(COM6)" -> "COM6")
-                if "COM" in port:
-                    port_num = port.split("COM")[1].split(" ")[0]
-                    port = f"COM{port_num}"
+                # 포트명 해석 (USB 프로파일 우선, 없으면 "COM6 - ..." 표시 문자열에서 포트명만 추출)
+                port = self.port_resolver.resolve(self._get_device_profile(device_name), port)
                 
                 # 설정에서 baudrate 가져오기
                 baudrate = self._get_device_baudrate(device_name)
                 
                 logger.info(f"{device_name} 연결 시도 ({retry_count + 1}/{max_retries + 1}) - 포트: {port}, 보드레이트: {baudrate}")
-                print(f"DEBUG: {device_name} 연결 시도 ({retry_count + 1}/{max_retries + 1}) - 포트: {port}, 보드레이트: {baudrate}")
                 
                 # 시리얼 연결 시도 (타임아웃 증가)
                 ser = serial.Serial(
@@ -437,13 +451,16 @@ class AutoSerialConnector:
                 
                 self.serial_connections[device_name] = ser
                 self.device_connection_status[device_name] = True
+                self.resolved_ports[device_name] = port
                 
                 # 연결 성공 시 재연결 시도 카운터 리셋
                 if device_name in self.connection_retry_count:
                     self.connection_retry_count[device_name] = 0
                 
                 logger.info(f"{device_name} 연결 성공 - {port} ({baudrate}bps)")
-                print(f"✅ {device_name} 연결 성공 - {port} ({baudrate}bps)")
+                
+                # 연결된 장비의 USB 프로파일 기억 (다음 연결부터 포트명 변경에 대응)
+                self._remember_device_profile(device_name, port)
                 return True
                 
             except serial.SerialException as e:
@@ -453,7 +470,6 @@ class AutoSerialConnector:
                 
                 # 재연결 시도 없음 - 즉시 포기
                 logger.error(f"{device_name} 연결 실패 - {port}: {e}")
-                print(f"⚠️ {device_name} 연결 실패 - {port}: {e}")
                 self._handle_connection_error(device_name, port, str(e))
                 return False
                     
@@ -461,10 +477,60 @@ class AutoSerialConnector:
                 logger.error(f"{device_name} 연결 오류 - {port}: {e}")
                 self.serial_connections[device_name] = None
                 self.device_connection_status[device_name] = False
-                print(f"⚠️ {device_name} 연결 오류 - {port}: {e}")
                 self._handle_connection_error(device_name, port, str(e))
                 return False
     
+    def _get_configured_port(self, device_name, default_port=""):
+        """설정 파일에 저장된 장비 포트 반환"""
+        section, port_key, _ = self.device_keys.get(device_name, (None, None, None))
+        if not section:
+            return default_port
+        return self.config.get(section, {}).get(port_key, default_port)
+    
+    def _get_device_profile(self, device_name):
+        """설정 파일에 저장된 장비 USB 프로파일 반환 (VID/PID/시리얼번호/위치)"""
+        section, _, profile_key = self.device_keys.get(device_name, (None, None, None))
+        if not section:
+            return None
+        return self.config.get(section, {}).get(profile_key)
+    
+    def _remember_device_profile(self, device_name, port):
+        """연결 성공한 포트의 USB 프로파일을 설정에 저장 (변경된 경우에만)"""
+        try:
+            section, port_key, profile_key = self.device_keys.get(device_name, (None, None, None))
+            if not section:
+                return
+            
+            profile = build_profile(self.port_resolver.describe(port))
+            if not profile:
+                return  # USB 장비가 아니면 기존처럼 포트명으로만 연결
+            
+            device_config = self.config.setdefault(section, {})
+            if (device_config.get(profile_key) == profile and
+                    normalize_port_name(device_config.get(port_key)) == port):
+                return
+            
+            device_config[profile_key] = profile
+            device_config[port_key] = port
+            
+            # 설정 파일에도 반영 (AdminPanel 탭에서도 바뀐 포트가 보이도록)
+            settings_manager = SettingsManager(self.config_file)
+            file_config = settings_manager.settings.setdefault(section, {})
+            file_config[profile_key] = profile
+            file_config[port_key] = port
+            settings_manager.save_settings()
+            logger.info(f"{device_name} USB 프로파일 저장 - {port}: {profile}")
+        except Exception as e:
+            logger.error(f"{device_name} USB 프로파일 저장 실패: {e}")
+    
+    def is_device_present(self, device_name):
+        """프로파일이 있는 장비가 현재 포트 목록에 있는지 확인 (끊긴 장비 재삽입 감지용)"""
+        profile = self._get_device_profile(device_name)
+        if not profile:
+            return False
+        self.port_resolver.rescan()
+        return self.port_resolver.find_port(profile, self._get_configured_port(device_name)) is not None
+    
     def _get_device_baudrate(self, device_name):
         """장비별 baudrate 가져오기 - 실제 설정 파일 구조에 맞춤"""
         baudrate = 9600
@@ -478,6 +544,8 @@ class AutoSerialConnector:
             baudrate = self.config.get("nutrunner", {}).get("nutrunner1_baudrate", 9600)
         elif device_name == "너트2":
             baudrate = self.config.get("nutrunner", {}).get("nutrunner2_baudrate", 9600)
+        elif device_name in self.extra_devices:
+            baudrate = self.config.get("printer", {}).get("baudrate", 9600)
         return baudrate
     
     def _handle_connection_error(self, device_name, port, error_message):
@@ -490,28 +558,29 @@ class AutoSerialConnector:
             pass
             
         except Exception as e:
-            print(f"❌ 연결 오류 처리 중 예외 발생: {e}")
+            logger.error("연결 오류 처리 중 예외 발생: %s", e)
     
     def _log_connection_error(self, device_name, port, error_message):
         """연결 오류 로그 저장"""
-        try:
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log_entry = f"[{timestamp}] {device_name} 연결 실패 - 포트: {port}, 오류: {error_message}\n"
-            
-            # 오류 로그 파일에 저장
-            with open("connection_errors.log", "a", encoding="utf-8") as f:
-                f.write(log_entry)
-                
-            print(f"📝 연결 오류 로그 저장: connection_errors.log")
-            
-        except Exception as e:
-            print(f"❌ 오류 로그 저장 실패: {e}")
+        # 파일 쓰기는 로그 리스너 스레드에서 처리 (호출 스레드는 대기하지 않음)
+        connection_error_logger.warning("%s 연결 실패 - 포트: %s, 오류: %s", device_name, port, error_message)
     
     def _try_alternative_ports(self, device_name):
-        """대체 포트 시도 - 비활성화됨"""
-        # 대체 포트 시도 기능 비활성화
-        print(f"⚠️ {device_name} 대체 포트 시도 비활성화됨")
-        return False
+        """대체 포트 시도 - 장비가 사라진 경우에만 포트 목록을 재조회하여 프로파일로 다시 찾기"""
+        profile = self._get_device_profile(device_name)
+        if not profile:
+            # 프로파일이 없는 장비는 설정된 포트에서만 시도
+            return False
+        
+        failed_port = self.port_resolver.resolve(profile, self._get_configured_port(device_name))
+        self.port_resolver.rescan(force=True)
+        new_port = self.port_resolver.find_port(profile, failed_port)
+        if not new_port or new_port == failed_port:
+            logger.info(f"{device_name} 재조회 결과 대체 포트 없음")
+            return False
+        
+        logger.info(f"{device_name} 포트 변경 감지 - {failed_port} → {new_port}")
+        return self._connect_once(device_name, new_port)
     
     def get_connection_status(self, device_name):
         """장비 연결 상태 확인"""
@@ -521,6 +590,16 @@ class AutoSerialConnector:
         """장비 시리얼 연결 객체 반환"""
         return self.serial_connections.get(device_name)
     
+    def owned_ports(self):
+        """현재 열려 있는 포트 {포트명: 장비명} - 포트 목록 서비스가 열기 테스트에서 제외"""
+        owned = {}
+        for device_name, ser in list(self.serial_connections.items()):
+            if ser is not None and getattr(ser, 'is_open', False):
+                port = self.resolved_ports.get(device_name) or getattr(ser, 'port', None)
+                if port:
+                    owned[port] = device_name
+        return owned
+    
     def disconnect_device(self, device_name):
         """특정 장비 연결 해제 - 안정성 강화"""
         with self._lock:
@@ -537,7 +616,6 @@ class AutoSerialConnector:
                     self.device_connection_status[device_name] = False
                     
                     logger.info(f"{device_name} 연결 해제 완료")
-                    print(f"✅ {device_name} 연결 해제 완료")
                     return True
                 else:
                     logger.warning(f"{device_name} 연결되지 않은 상태")
@@ -545,7 +623,6 @@ class AutoSerialConnector:
                     
             except Exception as e:
                 logger.error(f"{device_name} 연결 해제 실패: {e}")
-                print(f"❌ {device_name} 연결 해제 실패: {e}")
                 return False
     
     def disconnect_all_devices(self):
@@ -559,11 +636,9 @@ class AutoSerialConnector:
                     disconnected_count += 1
             
             logger.info(f"모든 장비 연결 해제 완료 - {disconnected_count}개 장비")
-            print(f"✅ 모든 장비 연결 해제 완료 ({disconnected_count}개 장비)")
             
         except Exception as e:
             logger.error(f"모든 장비 연결 해제 실패: {e}")
-            print(f"❌ 모든 장비 연결 해제 실패: {e}")
     
     def get_connection_summary(self):
         """연결 상태 요약 정보 반환"""
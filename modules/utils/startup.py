@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프로그램 시작 과정 측정 / 병렬 초기화
+- 단계별 시작 시간(어느 스레드에서 몇 ms) 기록 → logs/app/startup_report.txt
+- 환경변수 BARCODE_STARTUP_REPORT=1 (또는 실행 인자 --startup-report) 이면 모듈 import 시간도 기록
+  (python -X importtime 과 같은 self/누적 표 - 느린 import 를 찾을 때 사용)
+- run_parallel(): 서로 의존하지 않는 초기화 작업을 작업 스레드에서 동시에 실행하고 완료될 때마다 진행 콜백 호출
+
+사용 예:
+    startup_report = StartupReport.begin()          # 무거운 import 보다 먼저
+    with startup_report.phase("설정 로드"):
+        config = load_config()
+    results = startup_report.run_parallel({"기준정보": load_master_data, ...}, progress=splash_message)
+    startup_report.finish()                         # 메인 화면 표시 후
+"""
+
+import os
+import sys
+import time
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .log_manager import get_logger, LOG_DIR
+
+logger = get_logger(__name__)
+
+STARTUP_REPORT_ENV = "BARCODE_STARTUP_REPORT"
+STARTUP_REPORT_ARG = "--startup-report"
+REPORT_FILE = os.path.join(LOG_DIR, "startup_report.txt")
+MAX_WORKERS = 6
+SLOW_IMPORT_LIMIT = 40      # 보고서 요약에 표시할 느린 import 개수
+
+
+class _TimedLoader:
+    """모듈 로더 감싸기 - create/exec 시간 측정 후 원래 로더로 되돌림"""
+
+    def __init__(self, loader, timer):
+        self._loader = loader
+        self._timer = timer
+
+    def create_module(self, spec):
+        create = getattr(self._loader, "create_module", None)
+        return create(spec) if create else None
+
+    def exec_module(self, module):
+        name = module.__name__
+        self._timer.enter(name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.exit(name)
+            # 로드가 끝난 모듈은 원래 로더를 가리키도록 (importlib.resources 등 호환)
+            module.__loader__ = self._loader
+            if getattr(module, "__spec__", None) is not None:
+                module.__spec__.loader = self._loader
+
+    def __getattr__(self, item):
+        return getattr(self._loader, item)
+
+
+class ImportTimer:
+    """sys.meta_path 파인더 - 모듈별 import 소요시간(self/누적, us) 수집"""
+
+    def __init__(self):
+        self.records = []           # (스레드명, 깊이, 모듈명, self_us, 누적_us) - import 완료 순서
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._installed = False
+
+    def install(self):
+        if not self._installed:
+            sys.meta_path.insert(0, self)
+            self._installed = True
+
+    def uninstall(self):
+        if self._installed:
+            try:
+                sys.meta_path.remove(self)
+            except ValueError:
+                pass
+            self._installed = False
+
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def enter(self, name):
+        # [모듈명, 시작 시각, 하위 import 누적 시간]
+        self._stack().append([name, time.perf_counter_ns(), 0])
+
+    def exit(self, name):
+        stack = self._stack()
+        if not stack:
+            return
+        entry_name, start, children_ns = stack.pop()
+        cumulative_ns = time.perf_counter_ns() - start
+        if stack:
+            stack[-1][2] += cumulative_ns
+        with self._lock:
+            self.records.append((threading.current_thread().name, len(stack), entry_name,
+                                 (cumulative_ns - children_ns) // 1000, cumulative_ns // 1000))
+
+    def format_table(self):
+        """python -X importtime 형식 표"""
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for thread_name, depth, name, self_us, cumulative_us in self.records:
+            thread = "" if thread_name == "MainThread" else f"  [{thread_name}]"
+            lines.append(f"import time: {self_us:>9} | {cumulative_us:>10} | {'  ' * depth}{name}{thread}")
+        return lines
+
+
+class StartupReport:
+    """프로그램 시작 단계 기록 (프로세스 공용 인스턴스는 begin()/current())"""
+
+    _current = None
+
+    def __init__(self, import_timing=False):
+        self.started = time.perf_counter()
+        self.phases = []            # (단계명, 시작 ms, 소요 ms, 스레드명)
+        self.marks = []             # (이정표, 경과 ms)
+        self.finished = False
+        self._lock = threading.Lock()
+        self.import_timer = ImportTimer() if import_timing else None
+        if self.import_timer:
+            self.import_timer.install()
+
+    @classmethod
+    def begin(cls, argv=None):
+        """시작 기록 시작 - 환경변수/실행 인자로 import 시간 측정 여부 결정"""
+        if cls._current is None:
+            argv = sys.argv if argv is None else argv
+            import_timing = (os.environ.get(STARTUP_REPORT_ENV, "").lower() in ("1", "true", "yes")
+                             or STARTUP_REPORT_ARG in argv)
+            cls._current = cls(import_timing)
+        return cls._current
+
+    @classmethod
+    def current(cls):
+        return cls._current or cls.begin()
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    @contextmanager
+    def phase(self, name):
+        """단계 소요시간 기록 (어느 스레드에서든 사용 가능)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.phases.append((name, (start - self.started) * 1000, (end - start) * 1000,
+                                    threading.current_thread().name))
+
+    def mark(self, name):
+        """이정표 기록 (예: 메인 화면 표시)"""
+        with self._lock:
+            self.marks.append((name, self.elapsed_ms()))
+
+    def run_parallel(self, tasks, progress=None, max_workers=MAX_WORKERS):
+        """독립 초기화 작업 동시 실행 - {이름: 함수} → {이름: 결과 (실패 시 None)}
+        progress(완료 수, 전체 수, 이름) 는 호출한 스레드에서 호출 (스플래시 화면 갱신용)"""
+        results = {}
+        if not tasks:
+            return results
+
+        def run(name, func):
+            with self.phase(name):
+                return func()
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks)), thread_name_prefix="startup") as pool:
+            futures = {pool.submit(run, name, func): name for name, func in tasks.items()}
+            for done, future in enumerate(as_completed(futures), 1):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.error("시작 초기화 실패: %s - %s", name, e)
+                    results[name] = None
+                if progress:
+                    try:
+                        progress(done, len(tasks), name)
+                    except Exception as e:
+                        logger.debug("시작 진행 표시 오류: %s", e)
+        return results
+
+    def report_lines(self):
+        lines = [f"프로그램 시작 보고서 - 총 {self.elapsed_ms():.0f} ms", "", "[단계]"]
+        for name, start_ms, duration_ms, thread_name in sorted(self.phases, key=lambda phase: phase[1]):
+            lines.append(f"  {start_ms:>8.1f} ms  +{duration_ms:>8.1f} ms  {name}  ({thread_name})")
+        if self.marks:
+            lines += ["", "[이정표]"]
+            lines += [f"  {elapsed_ms:>8.1f} ms  {name}" for name, elapsed_ms in self.marks]
+        if self.import_timer and self.import_timer.records:
+            slowest = sorted(self.import_timer.records, key=lambda record: record[3], reverse=True)
+            lines += ["", f"[느린 import 상위 {SLOW_IMPORT_LIMIT}개 (self ms)]"]
+            lines += [f"  {record[3] / 1000:>8.1f} ms  {record[2]}" for record in slowest[:SLOW_IMPORT_LIMIT]]
+            lines += ["", "[import 전체]"] + self.import_timer.format_table()
+        return lines
+
+    def finish(self, path=REPORT_FILE):
+        """측정 종료 - 보고서 파일 저장 + 요약 로그 (한 번만)"""
+        if self.finished:
+            return
+        self.finished = True
+        if self.import_timer:
+            self.import_timer.uninstall()
+        lines = self.report_lines()
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("\n".join(lines) + "\n")
+        except Exception as e:
+            logger.error("시작 보고서 저장 실패: %s - %s", path, e)
+        slowest = sorted(self.phases, key=lambda phase: phase[2], reverse=True)[:3]
+        logger.info("프로그램 시작 완료 - %.0f ms (느린 단계: %s) 보고서: %s", self.elapsed_ms(),
+                    ", ".join(f"{name} {duration:.0f}ms" for name, _, duration, _ in slowest), path)
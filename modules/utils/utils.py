@@ -4,14 +4,18 @@
 import json
 import os
 from PyQt5.QtCore import QThread, pyqtSignal
+from .log_manager import get_logger
+from ..core.master_data_store import MasterDataStore, MASTER_DATA_DB
+
+logger = get_logger(__name__)
 
 def parse_barcode_data(barcode_data: str):
     """바코드 데이터를 파싱하여 BarcodeData 객체로 변환 (공통 함수)"""
     try:
         from modules.hardware.hkmc_barcode_utils import HKMCBarcodeUtils, BarcodeData, BarcodeType
         
-        print(f"DEBUG: parse_barcode_data 입력 바코드: {barcode_data}")
-        print(f"DEBUG: 바코드 데이터 파싱 시작: {barcode_data[:100]}...")
+        logger.debug("parse_barcode_data 입력 바코드: %s", barcode_data)
+        logger.debug("바코드 데이터 파싱 시작: %s...", barcode_data[:100])
         
         # HKMC 바코드 유틸리티 사용
         barcode_utils = HKMCBarcodeUtils()
@@ -19,13 +23,13 @@ def parse_barcode_data(barcode_data: str):
         # HKMC 바코드 파싱 (올바른 메서드 사용)
         parsed_data = barcode_utils.parse_barcode(barcode_data)
         
-        print(f"DEBUG: HKMC 파싱 결과 - 업체코드: {parsed_data.supplier_code}, 부품번호: {parsed_data.part_number}")
-        print(f"DEBUG: HKMC 파싱 결과 - 생산일자: {parsed_data.manufacturing_date}, 추적코드구분값: {parsed_data.traceability_type_char}")
-        print(f"DEBUG: HKMC 파싱 결과 - 추적번호: {parsed_data.traceability_number}")
+        logger.debug("HKMC 파싱 결과 - 업체코드: %s, 부품번호: %s", parsed_data.supplier_code, parsed_data.part_number)
+        logger.debug("HKMC 파싱 결과 - 생산일자: %s, 추적코드구분값: %s", parsed_data.manufacturing_date, parsed_data.traceability_type_char)
+        logger.debug("HKMC 파싱 결과 - 추적번호: %s", parsed_data.traceability_number)
         
         # 파싱 결과 검증
         if not parsed_data.supplier_code or parsed_data.supplier_code == "UNKNOWN":
-            print("DEBUG: 파싱 결과가 올바르지 않음, 기본값 사용")
+            logger.debug("파싱 결과가 올바르지 않음, 기본값 사용")
             return BarcodeData(
                 supplier_code="2812",
                 part_number="UNKNOWN",
@@ -38,9 +42,9 @@ def parse_barcode_data(barcode_data: str):
         return parsed_data
         
     except Exception as e:
-        print(f"ERROR: 바코드 데이터 파싱 오류: {e}")
+        logger.error("바코드 데이터 파싱 오류: %s", e)
         import traceback
-        print(f"DEBUG: 상세 오류: {traceback.format_exc()}")
+        logger.error("상세 오류: %s", traceback.format_exc())
         
         # 기본 BarcodeData 객체 반환
         from modules.hardware.hkmc_barcode_utils import BarcodeData, BarcodeType
@@ -139,7 +143,7 @@ class SerialConnectionThread(QThread):
             try:
                 self.serial_conn.write(data.encode())
             except Exception as e:
-                print(f"데이터 전송 오류: {e}")
+                logger.error("데이터 전송 오류: %s", e)
     
     def get_connection(self):
         """시리얼 연결 객체 반환"""
@@ -165,7 +169,7 @@ class SettingsManager:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     return json.load(f)
             except Exception as e:
-                print(f"설정 파일 로드 오류: {e}")
+                logger.error("설정 파일 로드 오류: %s", e)
                 return self.get_default_settings()
         else:
             return self.get_default_settings()
@@ -177,7 +181,7 @@ class SettingsManager:
                 json.dump(self.settings, f, ensure_ascii=False, indent=2)
             return True
         except Exception as e:
-            print(f"설정 파일 저장 오류: {e}")
+            logger.error("설정 파일 저장 오류: %s", e)
             return False
     
     def get_default_settings(self):
@@ -276,16 +280,55 @@ class SettingsManager:
 class MasterDataManager:
     """마스터 데이터 관리 클래스"""
     
-    def __init__(self, data_file=None):
+    def __init__(self, data_file=None, backup_manager=None, store_path=None):
         if data_file is None:
             # 상대경로로 config 폴더의 master_data.json 사용
             self.data_file = os.path.join("config", "master_data.json")
         else:
             self.data_file = data_file
+        if store_path is None:
+            store_path = MASTER_DATA_DB if data_file is None else os.path.splitext(data_file)[0] + ".db"
+        self.backup_manager = None
+        self.record_ids = []    # master_list 순서대로 저장소 항목 id
+        self.store = self._open_store(store_path)
         self.master_list = self.load_master_data()
+        
+        # 변경 이력 백업 (추가/수정/삭제는 항목 단위 변경분으로 자동 기록)
+        self.backup_manager = backup_manager
+        if backup_manager is not None:
+            backup_manager.ensure_base(self.master_list)
+    
+    def _open_store(self, store_path):
+        """항목 단위 저장소 열기 - 처음이면 JSON 파일을 한 트랜잭션으로 가져옴
+        (기존 데이터에 사용유무 Y 구분값 중복이 있으면 가져오지 않고 JSON 파일 저장 유지)"""
+        store = None
+        try:
+            store = MasterDataStore(store_path)
+            if store.get_meta('imported_from') is None:
+                master_data = self._load_json_file()
+                store.replace_all(master_data)
+                store.set_meta('imported_from', self.data_file)
+                logger.info("기준정보 %s건을 저장소로 가져왔습니다: %s → %s", len(master_data), self.data_file, store_path)
+            return store
+        except Exception as e:
+            logger.error("기준정보 저장소 사용 불가 - %s 파일에 전체 저장: %s", self.data_file, e)
+            if store is not None:
+                store.close()
+            return None
     
     def load_master_data(self):
-        """마스터 데이터 로드 및 표준 형식으로 마이그레이션"""
+        """마스터 데이터 로드 (저장소가 있으면 저장소, 없으면 JSON 파일)"""
+        if self.store is not None:
+            try:
+                self.record_ids, master_data = self.store.load()
+                return master_data
+            except Exception as e:
+                logger.error("마스터 데이터 로드 오류: %s", e)
+                return []
+        return self._load_json_file()
+    
+    def _load_json_file(self):
+        """JSON 파일 로드 및 표준 형식으로 마이그레이션"""
         if os.path.exists(self.data_file):
             try:
                 with open(self.data_file, 'r', encoding='utf-8') as f:
@@ -299,13 +342,13 @@ class MasterDataManager:
                 
                 # 마이그레이션이 필요했으면 저장
                 if migrated:
-                    print("DEBUG: master_data.json을 표준 형식으로 마이그레이션합니다.")
+                    logger.debug("master_data.json을 표준 형식으로 마이그레이션합니다.")
                     self.master_list = master_data
-                    self.save_master_data()
+                    self._write_master_data()
                 
                 return master_data
             except Exception as e:
-                print(f"마스터 데이터 로드 오류: {e}")
+                logger.error("마스터 데이터 로드 오류: %s", e)
                 return []
         else:
             return []
@@ -354,41 +397,141 @@ class MasterDataManager:
         
         return needs_reorder
     
-    def save_master_data(self):
-        """마스터 데이터 저장"""
-        print(f"DEBUG: save_master_data 호출됨 - 파일: {self.data_file}")
-        print(f"DEBUG: 저장할 데이터 개수: {len(self.master_list)}")
+    def save_master_data(self, operation_type='save'):
+        """마스터 데이터 전체 저장 (백업은 전체 스냅샷으로 기록)"""
+        if self.store is not None:
+            try:
+                self.record_ids = self.store.replace_all(self.master_list)
+            except Exception as e:
+                logger.error("마스터 데이터 저장 오류: %s", e)
+                # 저장소는 변경 없음 - 메모리 목록도 저장소 기준으로 되돌림
+                self.record_ids, self.master_list[:] = self.store.load()
+                return False
+        elif not self._write_master_data():
+            return False
+        if self.backup_manager is not None:
+            self.backup_manager.record_snapshot(operation_type, self.master_list)
+        return True
+    
+    def _save_record(self, operation_type, index, data):
+        """변경된 항목 1건 저장 - 저장소는 해당 행만 한 트랜잭션 (목록 크기와 무관), 없으면 JSON 파일 전체
+        구분값 중복 등으로 실패하면 저장소는 변경 없음"""
+        if self.store is None:
+            return self._write_master_data()
+        try:
+            if operation_type == 'add':
+                self.record_ids.insert(index, self.store.upsert(data))
+            elif operation_type == 'update':
+                self.store.upsert(data, self.record_ids[index])
+            else:
+                self.store.delete(self.record_ids[index])
+                del self.record_ids[index]
+            return True
+        except Exception as e:
+            logger.error("마스터 데이터 저장 오류: %s", e)
+            return False
+    
+    def _write_master_data(self):
+        """마스터 데이터 파일 쓰기 (저장소를 쓰지 못할 때)"""
+        logger.debug("save_master_data 호출됨 - 파일: %s", self.data_file)
+        logger.debug("저장할 데이터 개수: %s", len(self.master_list))
         try:
             with open(self.data_file, 'w', encoding='utf-8') as f:
                 json.dump(self.master_list, f, ensure_ascii=False, indent=2)
-            print("DEBUG: 파일 저장 성공")
+            logger.debug("파일 저장 성공")
             return True
         except Exception as e:
-            print(f"마스터 데이터 저장 오류: {e}")
+            logger.error("마스터 데이터 저장 오류: %s", e)
             return False
     
     def add_master_data(self, data):
         """마스터 데이터 추가"""
-        print(f"DEBUG: MasterDataManager.add_master_data 호출됨 - 데이터: {data}")
+        logger.debug("MasterDataManager.add_master_data 호출됨 - 데이터: %s", data)
         self.master_list.append(data)
-        result = self.save_master_data()
-        print(f"DEBUG: 저장 결과: {result}")
+        result = self._save_record('add', len(self.master_list) - 1, data)
+        logger.debug("저장 결과: %s", result)
+        if result:
+            self._record_change('add', len(self.master_list) - 1, None, data)
+        else:
+            self.master_list.pop()
         return result
     
     def update_master_data(self, index, data):
         """마스터 데이터 업데이트"""
         if 0 <= index < len(self.master_list):
+            before = self.master_list[index]
             self.master_list[index] = data
-            return self.save_master_data()
+            if self._save_record('update', index, data):
+                self._record_change('update', index, before, data)
+                return True
+            self.master_list[index] = before
         return False
     
     def delete_master_data(self, index):
         """마스터 데이터 삭제"""
         if 0 <= index < len(self.master_list):
-            del self.master_list[index]
-            return self.save_master_data()
+            before = self.master_list.pop(index)
+            if self._save_record('delete', index, None):
+                self._record_change('delete', index, before, None)
+                return True
+            self.master_list.insert(index, before)
+        return False
+    
+    def import_master_data(self, items):
+        """일괄 가져오기 - 업체코드+구분+Part_No 가 같으면 교체, 아니면 추가 (한 트랜잭션) → (성공 여부, 메시지)"""
+        for data in items:
+            self._migrate_to_standard_format(data)
+        if self.store is not None:
+            try:
+                added, replaced = self.store.bulk_import(items)
+                self.record_ids, self.master_list[:] = self.store.load()
+            except Exception as e:
+                logger.error("기준정보 일괄 가져오기 오류: %s", e)
+                return False, f"가져오기에 실패했습니다. (변경 없음)\n{e}"
+        else:
+            added = replaced = 0
+            positions = {self._item_key(data): i for i, data in enumerate(self.master_list)}
+            for data in items:
+                index = positions.get(self._item_key(data))
+                if index is None:
+                    positions[self._item_key(data)] = len(self.master_list)
+                    self.master_list.append(data)
+                    added += 1
+                else:
+                    self.master_list[index] = data
+                    replaced += 1
+            if not self._write_master_data():
+                return False, "가져오기 결과 저장에 실패했습니다."
+        if self.backup_manager is not None:
+            self.backup_manager.record_snapshot('import', self.master_list)
+        return True, f"{added}건 추가, {replaced}건 교체되었습니다. (전체 {len(self.master_list)}건)"
+    
+    @staticmethod
+    def _item_key(data):
+        return tuple(str(data.get(key) or '').strip() for key in ('supplier_code', 'division', 'part_number'))
+    
+    def is_division_in_use(self, division, exclude_index=None):
+        """사용유무 Y 항목이 구분값을 쓰고 있는지 (exclude_index 항목 제외) - 저장소는 유일 인덱스 조회"""
+        division = str(division or '').strip()
+        if self.store is not None:
+            try:
+                owner = self.store.active_division_owner(division)
+                excluded = None
+                if exclude_index is not None and 0 <= exclude_index < len(self.record_ids):
+                    excluded = self.record_ids[exclude_index]
+                return owner is not None and owner != excluded
+            except Exception as e:
+                logger.error("구분값 조회 오류: %s", e)
+        for i, data in enumerate(self.master_list):
+            if (i != exclude_index and str(data.get('division') or '').strip() == division and
+                data.get('use_status') == 'Y'):
+                return True
         return False
     
+    def _record_change(self, operation_type, index, before, after):
+        if self.backup_manager is not None:
+            self.backup_manager.record_change(operation_type, index, before, after, self.master_list)
+    
     def get_master_data(self):
         """마스터 데이터 반환"""
         return self.master_list
@@ -402,7 +545,18 @@ class MasterDataManager:
 
 
 class BackupManager:
-    """백업 데이터 관리 클래스"""
+    """기준정보 변경 이력 백업 - 기준 스냅샷 + 작업별 변경분(delta)
+    - delta_<기준번호>.jsonl: 작업 1건 = 1줄 (작업 전/후 항목만 기록 → 저장 비용은 변경 크기만큼)
+    - base_<번호>.json: 해당 작업 직후 전체 목록 (변경분이 쌓이면 주기적으로 새로 만들어 압축)
+    - index.jsonl: 작업 목록 (목록 표시는 이 파일만 읽음), 특정 작업 이전 시점으로 복구 가능
+    """
+    
+    INDEX_FILE = "index.jsonl"
+    COMPACT_EVERY = 500             # 기준 스냅샷 이후 변경분이 이만큼 쌓이면 새 스냅샷
+    COMPACT_MAX_DAYS = 7            # 기준 스냅샷이 이보다 오래되면 다음 변경 시 새 스냅샷
+    TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+    OPERATION_LABELS = {'add': "추가", 'update': "수정", 'delete': "삭제", 'save': "전체 저장", 'restore': "복구",
+                        'import': "일괄 가져오기"}
     
     def __init__(self, backup_dir=None):
         if backup_dir is None:
@@ -411,107 +565,243 @@ class BackupManager:
         else:
             self.backup_dir = backup_dir
         self.ensure_backup_dir()
+        self.index_path = os.path.join(self.backup_dir, self.INDEX_FILE)
+        self._entries = []      # 작업 목록 (오래된 순)
+        self._bases = []        # [(작업 번호, 스냅샷 파일, 시각)] - 해당 작업 직후 전체 목록
+        self._load_index()
     
     def ensure_backup_dir(self):
         """백업 디렉토리 생성"""
         if not os.path.exists(self.backup_dir):
             os.makedirs(self.backup_dir)
     
-    def create_backup(self, master_data, operation_type, index=None):
-        """백업 생성"""
+    # ===== 색인 =====
+    
+    def _load_index(self):
+        """index.jsonl 로드 (비정상 종료로 잘린 마지막 줄은 무시)"""
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning("백업 색인 손상된 줄 무시: %r", line[:80])
+                    continue
+                if 'base' in entry:
+                    self._bases.append((entry['base'], entry['file'], entry['timestamp']))
+                else:
+                    self._entries.append(entry)
+    
+    def _append_index(self, entry):
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    
+    def _next_id(self):
+        last_entry = self._entries[-1]['id'] if self._entries else 0
+        last_base = self._bases[-1][0] if self._bases else 0
+        return max(last_entry, last_base) + 1
+    
+    @staticmethod
+    def _now():
         from datetime import datetime
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        backup_data = {
-            'timestamp': timestamp,
-            'operation_type': operation_type,  # 'add', 'update', 'delete'
+        return datetime.now()
+    
+    # ===== 기록 =====
+    
+    def _write_base(self, entry_id, master_list):
+        """작업 entry_id 직후 전체 목록 스냅샷 (임시 파일에 쓴 뒤 교체)"""
+        file_name = f"base_{entry_id:06d}.json"
+        path = os.path.join(self.backup_dir, file_name)
+        with open(path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(master_list, f, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+        base = (entry_id, file_name, self._now().strftime(self.TIME_FORMAT))
+        self._append_index({'base': base[0], 'file': base[1], 'timestamp': base[2]})
+        self._bases.append(base)
+    
+    def ensure_base(self, master_list):
+        """첫 사용 시 현재 목록을 기준 스냅샷(0번)으로 저장"""
+        if not self._bases:
+            try:
+                self._write_base(0, master_list)
+            except Exception as e:
+                logger.error("백업 기준 스냅샷 생성 오류: %s", e)
+    
+    def _new_entry(self, operation_type, index, record):
+        record = record or {}
+        return {
+            'id': self._next_id(),
+            'timestamp': self._now().strftime(self.TIME_FORMAT),
+            'operation_type': operation_type,
             'index': index,
-            'data': master_data.copy() if master_data else None,
-            'backup_id': f"{operation_type}_{timestamp}"
+            'supplier_code': record.get('supplier_code', ''),
+            'part_number': record.get('part_number', ''),
+            'child_count': len(record.get('child_parts') or []),
         }
-        
-        backup_file = os.path.join(self.backup_dir, f"backup_{timestamp}.json")
-        
+    
+    def record_change(self, operation_type, index, before, after, master_list):
+        """항목 1건 추가/수정/삭제 기록 (master_list: 변경 후 전체 목록 - 압축할 때만 사용)"""
+        try:
+            entry = self._new_entry(operation_type, index, after or before)
+            base_id, _, base_time = self._bases[-1]
+            segment = f"delta_{base_id:06d}.jsonl"
+            line = json.dumps({'id': entry['id'], 'op': operation_type, 'index': index,
+                               'before': before, 'after': after}, ensure_ascii=False) + "\n"
+            with open(os.path.join(self.backup_dir, segment), 'ab') as f:
+                f.seek(0, os.SEEK_END)
+                entry['segment'], entry['offset'] = segment, f.tell()
+                f.write(line.encode('utf-8'))
+            self._append_index(entry)
+            self._entries.append(entry)
+            
+            # 압축: 변경분이 많이 쌓였거나 기준 스냅샷이 오래됐으면 새 스냅샷 (이후 변경분은 새 파일)
+            from datetime import datetime, timedelta
+            since_base = entry['id'] - base_id
+            base_age = self._now() - datetime.strptime(base_time, self.TIME_FORMAT)
+            if since_base >= self.COMPACT_EVERY or base_age > timedelta(days=self.COMPACT_MAX_DAYS):
+                self._write_base(entry['id'], master_list)
+                logger.info("기준정보 백업 압축 - 작업 %s 기준 스냅샷 (변경분 %s건)", entry['id'], since_base)
+            return entry['id']
+        except Exception as e:
+            logger.error("백업 생성 오류: %s", e)
+            return None
+    
+    def record_snapshot(self, operation_type, master_list):
+        """전체 목록 저장/복구 기록 - 변경분 대신 스냅샷"""
         try:
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, ensure_ascii=False, indent=2)
-            return backup_file
+            entry = self._new_entry(operation_type, None, None)
+            entry['segment'] = None
+            self._write_base(entry['id'], master_list)
+            self._append_index(entry)
+            self._entries.append(entry)
+            return entry['id']
         except Exception as e:
-            print(f"백업 생성 오류: {e}")
+            logger.error("백업 생성 오류: %s", e)
             return None
     
+    # ===== 조회 =====
+    
     def get_backup_list(self):
-        """백업 목록 가져오기"""
-        backup_files = []
-        if os.path.exists(self.backup_dir):
-            for filename in os.listdir(self.backup_dir):
-                if filename.startswith("backup_") and filename.endswith(".json"):
-                    backup_files.append(filename)
-        return sorted(backup_files, reverse=True)  # 최신순 정렬
-    
-    def load_backup(self, backup_filename):
-        """백업 파일 로드"""
-        backup_file = os.path.join(self.backup_dir, backup_filename)
+        """백업(작업) 목록 - 최신순 (색인만 사용)"""
+        return list(reversed(self._entries))
+    
+    def _find_entry(self, backup_id):
+        for entry in reversed(self._entries):
+            if entry['id'] == backup_id:
+                return entry
+        return None
+    
+    def _read_delta(self, entry):
+        with open(os.path.join(self.backup_dir, entry['segment']), 'rb') as f:
+            f.seek(entry['offset'])
+            return json.loads(f.readline())
+    
+    def load_backup(self, backup_id):
+        """작업 1건 상세 (data: 추가/수정 후 항목, 삭제는 삭제된 항목)"""
+        entry = self._find_entry(backup_id)
+        if entry is None:
+            return None
+        backup_data = dict(entry, data=None, before=None, after=None)
         try:
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            if entry.get('segment'):
+                delta = self._read_delta(entry)
+                backup_data.update(before=delta['before'], after=delta['after'],
+                                   data=delta['after'] or delta['before'])
         except Exception as e:
-            print(f"백업 로드 오류: {e}")
+            logger.error("백업 로드 오류: %s", e)
             return None
+        return backup_data
     
-    def restore_backup(self, backup_filename, master_data_manager):
-        """백업 복구"""
-        backup_data = self.load_backup(backup_filename)
-        if not backup_data:
-            return False, "백업 파일을 로드할 수 없습니다."
-        
-        operation_type = backup_data.get('operation_type')
-        index = backup_data.get('index')
-        data = backup_data.get('data')
-        
+    def state_after(self, entry_id):
+        """작업 entry_id 직후 전체 목록 (가장 가까운 이전 스냅샷 + 변경분 재생)"""
+        bases = [base for base in self._bases if base[0] <= entry_id]
+        if not bases:
+            return None
+        base_id, file_name, _ = bases[-1]
+        with open(os.path.join(self.backup_dir, file_name), 'r', encoding='utf-8') as f:
+            master_list = json.load(f)
+        # 스냅샷 이후 변경분은 모두 delta_<기준번호>.jsonl 에 있음 - 색인에 기록된 위치만 읽음
+        # (비정상 종료로 색인에 없는 줄은 건너뜀)
+        offsets = [entry['offset'] for entry in self._entries
+                   if base_id < entry['id'] <= entry_id and entry.get('segment')]
+        if not offsets:
+            return master_list
+        with open(os.path.join(self.backup_dir, f"delta_{base_id:06d}.jsonl"), 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                delta = json.loads(f.readline())
+                index = delta['index']
+                if delta['op'] == 'add':
+                    master_list.insert(index, delta['after'])
+                elif delta['op'] == 'update':
+                    master_list[index] = delta['after']
+                elif delta['op'] == 'delete':
+                    del master_list[index]
+        return master_list
+    
+    def restore_backup(self, backup_id, master_data_manager):
+        """선택한 작업 직전 시점으로 기준정보 전체 복구 (복구도 작업 1건으로 기록)"""
+        entry = self._find_entry(backup_id)
+        if entry is None:
+            return False, "백업을 찾을 수 없습니다."
         try:
-            if operation_type == 'add':
-                # 추가된 항목 삭제
-                if index is not None and index < len(master_data_manager.master_list):
-                    del master_data_manager.master_list[index]
-                    return master_data_manager.save_master_data(), "추가된 항목이 삭제되었습니다."
-            
-            elif operation_type == 'update':
-                # 수정된 항목 복구
-                if index is not None and data and index < len(master_data_manager.master_list):
-                    master_data_manager.master_list[index] = data
-                    return master_data_manager.save_master_data(), "수정된 항목이 복구되었습니다."
-            
-            elif operation_type == 'delete':
-                # 삭제된 항목 복구
-                if data:
-                    master_data_manager.master_list.insert(index, data)
-                    return master_data_manager.save_master_data(), "삭제된 항목이 복구되었습니다."
-            
-            return False, "알 수 없는 작업 유형입니다."
-            
+            master_list = self.state_after(backup_id - 1)
+            if master_list is None:
+                return False, "정리된 백업이라 이 시점으로는 복구할 수 없습니다."
+            master_data_manager.master_list[:] = master_list
+            if not master_data_manager.save_master_data(operation_type='restore'):
+                return False, "복구한 기준정보를 저장하지 못했습니다."
+            label = self.OPERATION_LABELS.get(entry['operation_type'], entry['operation_type'])
+            return True, f"{entry['timestamp']} {label} 작업 이전 상태로 복구되었습니다. (항목 {len(master_list)}개)"
         except Exception as e:
             return False, f"복구 중 오류가 발생했습니다: {e}"
     
+    # ===== 정리 =====
+    
     def cleanup_old_backups(self, keep_days=30):
-        """오래된 백업 파일 정리"""
-        import time
-        from datetime import datetime, timedelta
+        """keep_days 보다 오래된 스냅샷/변경분 정리 (남은 작업은 모두 복구 가능하게 기준 스냅샷 1개는 유지)"""
+        from datetime import timedelta
+        cutoff = (self._now() - timedelta(days=keep_days)).strftime(self.TIME_FORMAT)
+        old_bases = [base for base in self._bases if base[2] < cutoff]
+        cleaned_count = self._cleanup_legacy_files(cutoff)
+        if not old_bases:
+            return cleaned_count
         
-        cutoff_date = datetime.now() - timedelta(days=keep_days)
-        cleaned_count = 0
+        # 기준 이전 시점 복구에 필요 없는 스냅샷/변경분 파일과 작업 색인 삭제
+        keep_id = old_bases[-1][0]
+        removed = [entry for entry in self._entries if entry['id'] <= keep_id]
+        for base_id, file_name, _ in self._bases:
+            if base_id < keep_id:
+                for name in (file_name, f"delta_{base_id:06d}.jsonl"):
+                    path = os.path.join(self.backup_dir, name)
+                    if os.path.exists(path):
+                        os.remove(path)
+        self._bases = [base for base in self._bases if base[0] >= keep_id]
+        self._entries = [entry for entry in self._entries if entry['id'] > keep_id]
         
-        for filename in self.get_backup_list():
+        # 색인 다시 쓰기 (임시 파일에 쓴 뒤 교체)
+        with open(self.index_path + ".tmp", 'w', encoding='utf-8') as f:
+            for base_id, file_name, timestamp in self._bases:
+                f.write(json.dumps({'base': base_id, 'file': file_name, 'timestamp': timestamp},
+                                   ensure_ascii=False) + "\n")
+            for entry in self._entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(self.index_path + ".tmp", self.index_path)
+        return cleaned_count + len(removed)
+    
+    def _cleanup_legacy_files(self, cutoff):
+        """이전 방식 백업 파일(backup_YYYYMMDD_HHMMSS.json, 항목 1건씩) 중 오래된 것 삭제"""
+        from datetime import datetime
+        cleaned_count = 0
+        for filename in os.listdir(self.backup_dir):
+            if not (filename.startswith("backup_") and filename.endswith(".json")):
+                continue
             try:
-                # 파일명에서 날짜 추출 (backup_YYYYMMDD_HHMMSS.json)
-                date_str = filename.replace("backup_", "").replace(".json", "")
-                file_date = datetime.strptime(date_str.split("_")[0], "%Y%m%d")
-                
-                if file_date < cutoff_date:
-                    file_path = os.path.join(self.backup_dir, filename)
-                    os.remove(file_path)
+                file_date = datetime.strptime(filename[len("backup_"):-len(".json")], "%Y%m%d_%H%M%S")
+                if file_date.strftime(self.TIME_FORMAT) < cutoff:
+                    os.remove(os.path.join(self.backup_dir, filename))
                     cleaned_count += 1
-            except:
+            except Exception:
                 continue
-        
         return cleaned_count
@@ -0,0 +1,171 @@
+"""
+생산 1사이클 통합 테스트 - 메인 화면 → 작업 흐름 엔진 → 자동 출력 매니저 → 프린터
+(공정부품 스캔 → 하위부품 스캔 → PLC 완료신호 → 라벨 출력/출력 로그 → 사이클 종료)
+"""
+import json
+import os
+import sys
+from datetime import date
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from benchmarks.fake_devices import FakePrinter, FakeScanner, synthetic_master_data  # noqa: E402
+from modules.core.production_engine import STATE_IDLE  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def make_screen(app, tmp_path, monkeypatch):
+    """작업 폴더를 임시 폴더로 바꾸고 가짜 기준정보/프린터로 메인 화면 생성"""
+    monkeypatch.chdir(tmp_path)
+    import main_screen
+    from modules.ui import scan_status_dialog
+    monkeypatch.setattr(scan_status_dialog.ScanStatusDialog, "exec_", lambda self: 0)
+    monkeypatch.setattr(main_screen.BarcodeMainScreen, "_instance", None)
+    windows = []
+
+    def make(children_per_parent=2, master_data=None):
+        if master_data is None:
+            master_data = synthetic_master_data(parent_count=2, children_per_parent=children_per_parent)
+        os.makedirs("config", exist_ok=True)
+        with open(os.path.join("config", "master_data.json"), "w", encoding="utf-8") as f:
+            json.dump(master_data, f)
+        window = main_screen.BarcodeMainScreen()
+        printer = FakePrinter()
+        window.get_serial_connection = lambda device_name: printer
+        window.auto_print_manager.print_config["settle_seconds"] = 0
+        window.printer = printer
+        windows.append(window)
+        return window
+
+    yield make
+    for window in windows:
+        window.close()   # 저널/생산수량/집계 저장을 임시 폴더에서 마무리
+
+
+def run_cycle(window, app, division):
+    """구분값 선택 → 공정부품/하위부품 스캔 → 완료신호 (0 → 1)"""
+    engine = window.production_engine
+    station = window.station_layout.stations[0]
+    window.update_division_status(station.name, division)
+    part = next(data for data in window.master_data if data["division"] == division)
+    scanner = FakeScanner()
+
+    window.on_barcode_scanned(part["part_number"])
+    app.processEvents()
+    for child in part["child_parts"]:
+        window.on_barcode_scanned(scanner.scan_child(child["part_number"]).strip())
+    engine.on_plc(0)
+    engine.on_plc(station.completion_signal)
+    app.processEvents()
+    return station, part
+
+
+def read_print_logs():
+    """오늘 연도 출력 로그 텍스트 전체"""
+    log_dir = os.path.join("logs", str(date.today().year), "print_logs")
+    text = ""
+    for name in os.listdir(log_dir):
+        with open(os.path.join(log_dir, name), encoding="utf-8") as f:
+            text += f.read()
+    return text
+
+
+def test_full_cycle_prints_label_and_finishes(make_screen, app):
+    screen = make_screen()
+    station, part = run_cycle(screen, app, "1")
+    engine = screen.production_engine
+
+    assert screen.printer.labels == 1
+    assert part["part_number"].encode() in screen.printer.last_labels[-1]
+    assert engine.states[station.name] == STATE_IDLE
+    assert engine.stats["cycles"] == 1
+    assert not screen.scan_session.current
+
+    printed = screen.auto_print_manager.printed_child_parts[station.name]
+    assert [child["part_number"] for child in printed] == [child["part_number"] for child in part["child_parts"]]
+
+    log_text = read_print_logs()
+    assert "출력결과: SUCCESS" in log_text
+    assert part["child_parts"][0]["part_number"] in log_text
+
+
+def test_cycle_without_children_prints_and_logs(make_screen, app):
+    screen = make_screen(children_per_parent=0)
+    station, part = run_cycle(screen, app, "1")
+
+    assert screen.printer.labels == 1
+    assert screen.production_engine.states[station.name] == STATE_IDLE
+    assert screen.production_engine.stats["cycles"] == 1
+
+    log_text = read_print_logs()
+    assert "하위부품: 없음" in log_text
+
+
+def test_print_failure_reports_to_engine(make_screen, app):
+    screen = make_screen()
+    screen.printer.is_open = False
+    station, _ = run_cycle(screen, app, "1")
+
+    assert screen.printer.labels == 0
+    assert screen.production_engine.states[station.name] == STATE_IDLE
+    assert screen.production_engine.stats["print_failed"] == 1
+
+
+def test_same_part_number_uses_division_children(make_screen, app):
+    master_data = synthetic_master_data(parent_count=2, children_per_parent=2)
+    master_data[0]["child_parts"] = []
+    master_data[1]["part_number"] = master_data[0]["part_number"]
+    screen = make_screen(master_data=master_data)
+    engine = screen.production_engine
+
+    station, part = run_cycle(screen, app, "2")
+    printed = screen.auto_print_manager.printed_child_parts[station.name]
+    assert [child["part_number"] for child in printed] == [child["part_number"] for child in part["child_parts"]]
+    assert engine.stats["cycles"] == 1
+
+    screen.update_division_status(station.name, "1")
+    engine.on_scan(part["part_number"])
+    assert engine.cycles[station.name].expected == []
+
+
+def test_restart_resumes_journaled_cycle(make_screen, app):
+    screen = make_screen()
+    engine = screen.production_engine
+    station = screen.station_layout.stations[0]
+    screen.update_division_status(station.name, "1")
+    part = next(data for data in screen.master_data if data["division"] == "1")
+    scanner = FakeScanner()
+    first, second = [scanner.scan_child(child["part_number"]).strip() for child in part["child_parts"]]
+
+    screen.on_barcode_scanned(part["part_number"])
+    app.processEvents()
+    screen.on_barcode_scanned(first)
+    screen.close()
+
+    # 재시작 - 저널 재생으로 스캔 현황과 엔진 사이클이 함께 복원됨
+    screen = make_screen()
+    engine = screen.production_engine
+    cycle = engine.cycles[station.name]
+    assert cycle is not None and cycle.part_number == part["part_number"]
+    assert list(cycle.matched) == [part["child_parts"][0]["part_number"]]
+
+    screen.update_division_status(station.name, "1")
+    screen.on_barcode_scanned(second)
+    engine.on_plc(0)
+    engine.on_plc(station.completion_signal)
+    app.processEvents()
+
+    assert screen.printer.labels == 1
+    printed = screen.auto_print_manager.printed_child_parts[station.name]
+    assert [child["raw_data"] for child in printed] == [first, second]
+    assert engine.stats["cycles"] == 1